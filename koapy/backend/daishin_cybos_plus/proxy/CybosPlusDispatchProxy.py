@@ -75,6 +75,8 @@ class CybosPlusDispatchProxy(Logging):
         stub: DispatchProxyService_pb2_grpc.DispatchProxyServiceStub,
         timeout: Optional[int] = None,
         max_workers: Optional[int] = None,
+        event_window: int = 0,
+        coalesce_events: bool = False,
     ):
         self._iid = iid
         self._stub = stub
@@ -82,6 +84,9 @@ class CybosPlusDispatchProxy(Logging):
         self._timeout = timeout
         self._max_workers = max_workers
 
+        self._event_window = event_window
+        self._coalesce_events = coalesce_events
+
         self._class = CLSIDToClassMap[self._iid]
 
         self._properties = [
@@ -189,6 +194,8 @@ class CybosPlusDispatchProxy(Logging):
         request = DispatchProxyService_pb2.ConnectEventRequest()
         request.establish_request.iid = self._iid
         request.establish_request.name = name
+        request.establish_request.initial_credits = self._event_window
+        request.establish_request.coalesce = self._coalesce_events
         event_instance = self._event_instances[name]
         request_queue = Queue()
         sentinel = object()
@@ -201,11 +208,21 @@ class CybosPlusDispatchProxy(Logging):
         response_iterator = self._stub.ConnectEvent(request_iterator)
 
         def submit():
+            window = self._event_window
+            grant_size = max(window // 2, 1)
+            handled_count = 0
             for response in response_iterator:
                 args = [ExtractValue(arg.value) for arg in response.arguments]
                 event_instance(*args)
                 request = DispatchProxyService_pb2.ConnectEventRequest()
-                request.ack_request  # pylint: disable=pointless-statement
+                if window > 0:
+                    handled_count += 1
+                    if handled_count < grant_size:
+                        continue
+                    request.grant_request.credits = handled_count
+                    handled_count = 0
+                else:
+                    request.ack_request.SetInParent()
                 request_queue.put(request)
 
         future = self._executor.submit(submit)
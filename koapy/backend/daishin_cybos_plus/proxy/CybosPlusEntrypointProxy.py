@@ -12,7 +12,7 @@ from koapy.common import DispatchProxyService_pb2, DispatchProxyService_pb2_grpc
 
 
 class CybosPlusEntrypointProxy(CybosPlusEntrypointMixin):
-    def __init__(self, host=None, port=None):
+    def __init__(self, host=None, port=None, event_window=0, coalesce_events=False):
         if host is None:
             host = "localhost"
         if port is None:
@@ -21,6 +21,9 @@ class CybosPlusEntrypointProxy(CybosPlusEntrypointMixin):
         self._host = host
         self._port = port
 
+        self._event_window = event_window
+        self._coalesce_events = coalesce_events
+
         self._address = self._host + ":" + str(self._port)
         self._channel = grpc.insecure_channel(self._address)
         self._stub = DispatchProxyService_pb2_grpc.DispatchProxyServiceStub(
@@ -40,7 +43,12 @@ class CybosPlusEntrypointProxy(CybosPlusEntrypointMixin):
                     request.iid = name
                     response = self._stub.GetDispatch(request)
                     iid = response.iid
-                    proxy = CybosPlusDispatchProxy(iid, self._stub)
+                    proxy = CybosPlusDispatchProxy(
+                        iid,
+                        self._stub,
+                        event_window=self._event_window,
+                        coalesce_events=self._coalesce_events,
+                    )
                     self._dispatch_proxies[name] = proxy
         proxy = self._dispatch_proxies[name]
         return proxy
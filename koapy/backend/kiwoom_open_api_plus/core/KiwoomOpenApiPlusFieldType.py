@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import re
+
+from enum import Enum
+from typing import List, Optional, Sequence
+
+from koapy.backend.kiwoom_open_api_plus.core.KiwoomOpenApiPlusRealType import (
+    KiwoomOpenApiPlusRealType,
+)
+from koapy.backend.kiwoom_open_api_plus.core.KiwoomOpenApiPlusTrInfo import (
+    KiwoomOpenApiPlusTrInfo,
+)
+
+# 코드, 번호, 날짜/시간 등은 숫자로만 이루어져 있더라도 앞자리 0 이 의미를 가지거나
+# 문자열 비교가 필요하기 때문에 문자열로 유지합니다.
+_string_name_suffixes = (
+    "코드",
+    "번호",
+    "명",
+    "구분",
+    "기호",
+    "일자",
+    "일",
+    "날짜",
+    "시간",
+    "시각",
+    "정보",
+    "상태",
+    "유형",
+    "여부",
+    "종류",
+    "분류",
+    "이벤트",
+    "거래원",
+    "sign",
+)
+
+
+class KiwoomOpenApiPlusFieldType(Enum):
+
+    STRING = "string"
+    NUMBER = "number"
+
+    @classmethod
+    def _canonicalize_name(cls, name: str) -> str:
+        # infer_fids_by_tr_outputs() 에서 fid.csv 를 만들 때 사용한 규칙과 동일합니다
+        if name.startswith("풋_"):
+            name = name[2:]
+        name = re.sub(r"[0-9]+$", "", name)
+        if name and not name[0].isascii() and name[-1] in "ns":
+            name = name[:-1]
+        return name
+
+    @classmethod
+    def from_name(cls, name: str) -> KiwoomOpenApiPlusFieldType:
+        name = cls._canonicalize_name(name)
+        if not name or name.endswith(_string_name_suffixes):
+            return cls.STRING
+        return cls.NUMBER
+
+    @classmethod
+    def from_field(
+        cls, field: KiwoomOpenApiPlusTrInfo.Field
+    ) -> KiwoomOpenApiPlusFieldType:
+        name = None
+        if field.fid is not None and field.fid != -1:
+            fid = KiwoomOpenApiPlusRealType.Fid.from_fid(field.fid)
+            if fid is not None:
+                name = fid.name
+        if name is None:
+            name = field.name
+        return cls.from_name(name)
+
+    @classmethod
+    def from_fields(
+        cls, fields: Sequence[KiwoomOpenApiPlusTrInfo.Field]
+    ) -> List[KiwoomOpenApiPlusFieldType]:
+        return [cls.from_field(field) for field in fields]
+
+    @classmethod
+    def from_trinfo(
+        cls, trinfo: Optional[KiwoomOpenApiPlusTrInfo], multi: bool = True
+    ) -> List[KiwoomOpenApiPlusFieldType]:
+        if trinfo is None:
+            return []
+        fields = trinfo.multi_outputs if multi else trinfo.single_outputs
+        return cls.from_fields(fields)
@@ -25,7 +25,7 @@ from koapy.backend.kiwoom_open_api_plus.utils.list_conversion import string_to_l
 from koapy.backend.kiwoom_open_api_plus.utils.pyside2.QRateLimitedExecutor import (
     QRateLimitedExecutor,
 )
-from koapy.config import config
+from koapy.config import config, home_directory
 from koapy.utils.ctypes import is_admin
 from koapy.utils.logging import get_verbosity
 from koapy.utils.logging.Logging import Logging
@@ -39,6 +39,14 @@ class KiwoomOpenApiPlusQAxWidgetUniversalMixin(KiwoomOpenApiPlusDispatchFunction
     단순하면서도 유니버셜한 메소드들이 구현되어 있는 Mixin 입니다.
     """
 
+    def BatchCall(self, calls):
+        """
+        (함수 이름, 파라미터 목록) 쌍의 목록을 받아 순서대로 호출하고 결과 목록을 반환합니다.
+
+        로컬에서는 단순히 하나씩 호출하지만 gRPC 클라이언트에서는 한번의 왕복으로 처리됩니다.
+        """
+        return [getattr(self, name)(*args) for name, args in calls]
+
     def IsConnected(self):
         """
         키움증권 서버에 접속되었는지 여부를 반환합니다.
@@ -344,7 +352,7 @@ class KiwoomOpenApiPlusQAxWidgetUniversalMixin(KiwoomOpenApiPlusDispatchFunction
 
         # 장내 시장에서 ETN 이 섞여 있는데 시장구분값으로 뺄 수가 없어서 이름을 보고 대충 제외
         if not include_etn:
-            names = [self.GetMasterCodeName(code) for code in codes]
+            names = self.BatchCall([("GetMasterCodeName", (code,)) for code in codes])
             etn_suffixes = ["ETN", "ETN(H)", "ETN B", "ETN(H) B"]
             is_not_etn_name = [
                 not any(name.endswith(suffix) for suffix in etn_suffixes)
@@ -1194,7 +1202,18 @@ class KiwoomOpenApiPlusQAxWidgetServerSideMixin(
           조건검색(실시간 조건검색 포함)은 시세조회와 관심종목조회와 합산해서 1초에 5회만 요청 가능하며 1분에 1회로 조건검색 제한됩니다.
         """
 
-        self._comm_rate_limiter = KiwoomOpenApiPlusCommRqDataRateLimiter()
+        comm_rate_limiter_state_filename = config.get_string(
+            "koapy.backend.kiwoom_open_api_plus.rate_limiter.comm_rq_data.state_filename",
+            None,
+        )
+        if comm_rate_limiter_state_filename is None:
+            comm_rate_limiter_state_filename = (
+                home_directory / ".koapy" / "comm_rq_data_rate_limiter_state.json"
+            )
+
+        self._comm_rate_limiter = KiwoomOpenApiPlusCommRqDataRateLimiter(
+            comm_rate_limiter_state_filename
+        )
         self._cond_rate_limiter = KiwoomOpenApiPlusSendConditionRateLimiter(
             self._comm_rate_limiter
         )
@@ -1233,6 +1252,19 @@ class KiwoomOpenApiPlusQAxWidgetServerSideMixin(
         self.destroyed.connect(self._cond_rate_limited_executor.shutdown)
         self.destroyed.connect(self._order_rate_limited_executor.shutdown)
 
+    def EstimateCommRqDataWaitMillis(self, priority: int = 1, key: str = "") -> int:
+        """
+        지금 주어진 우선순위로 CommRqData() 요청을 제출했을때 실제 호출까지 걸릴 것으로 예상되는 시간을
+        밀리초 단위로 반환합니다.
+
+        우선순위는 0:주문관련, 1:일반조회, 2:대량조회 입니다.
+        키가 주어지지 않으면 새로운 클라이언트가 요청을 제출하는 경우를 기준으로 계산합니다.
+        """
+        wait_seconds = self.RateLimitedCommRqData.estimateWaitSeconds(
+            priority, key or None
+        )
+        return int(round(max(0, wait_seconds) * 1000))
+
     def LoadCondition(self) -> int:
         """
         조건검색 관련 조건식을 불러옵니다.
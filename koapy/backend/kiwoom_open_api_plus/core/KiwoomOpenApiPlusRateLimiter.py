@@ -6,6 +6,7 @@ from koapy.utils.rate_limiting.RateLimiter import (
     RateLimiter,
     TimeWindowRateLimiter,
 )
+from koapy.utils.rate_limiting.RateLimiterStateFile import RateLimiterStateFile
 
 
 class KiwoomOpenApiPlusCommRqDataRateLimiter(CompositeTimeWindowRateLimiter):
@@ -15,6 +16,8 @@ class KiwoomOpenApiPlusCommRqDataRateLimiter(CompositeTimeWindowRateLimiter):
     # 이후 1시간에 1000회로 제한한다는 추측이 있는데 일리 있어 보여서 도입 (http://blog.quantylab.com/htsapi.html)
     # 1초당 1회로 계산했을때 1시간이면 3600 회, 주기를 1초씩 늘려보면
     # 2초당 1회 => 1800 > 1000, 3초당 1회 => 1200 > 1000, 4초당 1회 => 900 < 1000
+    # GCRA (토큰 버킷) 방식은 5회 연속 조회 이후 3.6초만에 다시 조회를 허용해서 위의 17초 대기 규칙에 걸리므로
+    # 정확한 슬라이딩 윈도우 방식인 TimeWindowRateLimiter 를 그대로 사용함
 
     """
     [조회횟수 제한 관련 가이드]
@@ -23,7 +26,7 @@ class KiwoomOpenApiPlusCommRqDataRateLimiter(CompositeTimeWindowRateLimiter):
       - 1초당 5회 조회를 10연속 발생시킨 경우 : 3분(180초)대기
     """
 
-    def __init__(self):
+    def __init__(self, state_filename=None):
         limiters = [
             TimeWindowRateLimiter(18, 5),
             TimeWindowRateLimiter(90, 25),
@@ -32,6 +35,28 @@ class KiwoomOpenApiPlusCommRqDataRateLimiter(CompositeTimeWindowRateLimiter):
         ]
         super().__init__(limiters)
 
+        # 서버 재시작시 호출기록이 초기화되면 곧바로 제한에 걸려 긴 대기가 발생하므로
+        # 호출기록을 파일에 저장해두고 다시 시작할때 불러와서 남은 조회횟수를 그대로 이어감
+        self._state_file = None
+
+        if state_filename is not None:
+            self._state_file = RateLimiterStateFile(state_filename)
+            self._state_file.load(self)
+
+    def _save_state(self):
+        if self._state_file is not None:
+            self._state_file.save(self)
+
+    def add_call_history(self, *args, **kwargs):
+        super().add_call_history(*args, **kwargs)
+        self._save_state()
+
+    def try_acquire(self, *args, **kwargs):
+        acquired = super().try_acquire(*args, **kwargs)
+        if acquired:
+            self._save_state()
+        return acquired
+
 
 class KiwoomOpenApiPlusSendOrderRateLimiter(TimeWindowRateLimiter):
     def __init__(self):
@@ -0,0 +1,135 @@
+import gzip
+import json
+import os
+import queue
+import threading
+import time
+
+from typing import Iterator, List, NamedTuple, Optional
+
+from koapy.utils.logging.Logging import Logging
+
+
+class KiwoomOpenApiPlusRealDataRecord(NamedTuple):
+    """
+    기록된 이벤트 하나 입니다.
+
+    OnReceiveRealData 의 경우 arguments 는 (code, realtype, realdata) 이며,
+    OnReceiveChejanData 의 경우 (gubun, itemcnt, fidlist) 에 더해 당시 GetChejanData() 로 읽은 {fid: value} 를 갖습니다.
+    """
+
+    timestamp: float
+    name: str
+    arguments: List
+
+
+class KiwoomOpenApiPlusRealDataRecordReader:
+    """
+    KiwoomOpenApiPlusRealDataRecorder 로 기록한 파일을 순서대로 읽습니다.
+
+    기록 중에 비정상 종료된 경우 마지막 불완전한 부분은 무시합니다.
+    """
+
+    def __init__(self, filename: str):
+        self._filename = filename
+
+    def __iter__(self) -> Iterator[KiwoomOpenApiPlusRealDataRecord]:
+        with gzip.open(self._filename, "rt", encoding="utf-8") as f:
+            try:
+                for line in f:
+                    try:
+                        timestamp, name, *arguments = json.loads(line)
+                    except ValueError:
+                        break
+                    yield KiwoomOpenApiPlusRealDataRecord(timestamp, name, arguments)
+            except (EOFError, gzip.BadGzipFile):
+                pass
+
+
+class KiwoomOpenApiPlusRealDataRecorder(Logging):
+    """
+    OnReceiveRealData() 및 OnReceiveChejanData() 이벤트를 원본 그대로 압축된 파일에 이어서 기록합니다.
+
+    이벤트 스레드에서는 큐에 넣기만 하고 압축과 쓰기는 별도의 스레드에서 처리합니다.
+    파일은 gzip 멤버 단위로 이어붙이는 방식이므로 기존 파일에 계속해서 기록할 수 있습니다.
+    """
+
+    _flush_interval = 1.0
+
+    def __init__(self, control, filename: str, compresslevel: int = 6):
+        self._control = control
+        self._filename = filename
+        self._compresslevel = compresslevel
+
+        self._queue = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._started = False
+
+    @property
+    def control(self):
+        return self._control
+
+    @property
+    def filename(self):
+        return self._filename
+
+    def OnReceiveRealData(self, code, realtype, realdata):
+        self._queue.put((time.time(), "OnReceiveRealData", code, realtype, realdata))
+
+    def OnReceiveChejanData(self, gubun, itemcnt, fidlist):
+        values = {}
+        for fid in fidlist.split(";"):
+            if fid:
+                values[fid] = self.control.GetChejanData(int(fid))
+        self._queue.put(
+            (time.time(), "OnReceiveChejanData", gubun, itemcnt, fidlist, values)
+        )
+
+    def _run(self):
+        directory = os.path.dirname(self._filename)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with gzip.open(
+            self._filename, "at", encoding="utf-8", compresslevel=self._compresslevel
+        ) as f:
+            last_flush = time.monotonic()
+            while True:
+                try:
+                    record = self._queue.get(timeout=self._flush_interval)
+                except queue.Empty:
+                    record = ()
+                if record is None:
+                    break
+                if record:
+                    f.write(json.dumps(record, ensure_ascii=False))
+                    f.write("\n")
+                now = time.monotonic()
+                if now - last_flush >= self._flush_interval:
+                    f.flush()
+                    last_flush = now
+
+    def start(self):
+        if self._started:
+            return
+        self.logger.info("Recording real data to %s", self._filename)
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        self.control.OnReceiveRealData.connect(self.OnReceiveRealData)
+        self.control.OnReceiveChejanData.connect(self.OnReceiveChejanData)
+        self._started = True
+
+    def stop(self):
+        if not self._started:
+            return
+        self.control.OnReceiveRealData.disconnect(self.OnReceiveRealData)
+        self.control.OnReceiveChejanData.disconnect(self.OnReceiveChejanData)
+        self._queue.put(None)
+        self._thread.join()
+        self._started = False
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
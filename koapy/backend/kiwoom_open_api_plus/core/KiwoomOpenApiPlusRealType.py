@@ -1,14 +1,14 @@
 from __future__ import annotations
 
 import contextlib
+import csv
 import json
+import threading
 
 from os import PathLike
 from pathlib import Path
 from typing import BinaryIO, Dict, List, Optional, TextIO, Union
 
-import pandas as pd
-
 from koapy.config import debug, default_encoding
 from koapy.utils.logging.Logging import Logging
 from koapy.utils.serialization import JsonSerializable
@@ -22,11 +22,13 @@ class KiwoomOpenApiPlusRealType(JsonSerializable, Logging):
         FID_DUMP_FILEDIR = Path(__file__).parent.parent / "data/metadata"
         FID_DUMP_FILENAME = "fid.csv"
         FID_DUMP_FILEPATH = FID_DUMP_FILEDIR / FID_DUMP_FILENAME
-        FID_DUMP_PROCESSOR = pd.read_csv
 
         FID_BY_FID: Dict[int, KiwoomOpenApiPlusRealType.Fid] = {}
         FID_BY_NAME: Dict[str, KiwoomOpenApiPlusRealType.Fid] = {}
 
+        _FID_LOCK = threading.Lock()
+        _FID_LOADED = False
+
         def __init__(self, fid: Optional[int] = None, name: Optional[str] = None):
             if fid is not None and name is None:
                 name = self.get_name_by_fid(fid)
@@ -55,9 +57,11 @@ class KiwoomOpenApiPlusRealType(JsonSerializable, Logging):
             if dump_file is None:
                 dump_file = cls.FID_DUMP_FILEPATH
             if encoding is None:
-                encoding = "utf-8"
-            df = cls.FID_DUMP_PROCESSOR(dump_file, encoding=encoding)
-            fids = [cls(pair[0], pair[1]) for pair in zip(df["fid"], df["name"])]
+                encoding = "utf-8-sig"
+            # pandas 를 불러오지 않고 읽을 수 있도록 csv 모듈을 사용
+            with open(dump_file, "r", encoding=encoding, newline="") as f:
+                reader = csv.DictReader(f)
+                fids = [cls(int(row["fid"]), row["name"]) for row in reader]
             return fids
 
         @classmethod
@@ -65,17 +69,28 @@ class KiwoomOpenApiPlusRealType(JsonSerializable, Logging):
             fids = cls.fids_from_dump_file(dump_file)
             cls.FID_BY_FID = {fid.fid: fid for fid in fids}
             cls.FID_BY_NAME = {fid.name: fid for fid in fids}
+            cls._FID_LOADED = True
+
+        @classmethod
+        def _ensure_loaded(cls):
+            if cls._FID_LOADED:
+                return
+            with cls._FID_LOCK:
+                if not cls._FID_LOADED:
+                    cls.load_from_dump_file()
 
         @classmethod
         def from_fid(
             cls, fid: Union[str, int]
         ) -> Optional[KiwoomOpenApiPlusRealType.Fid]:
+            cls._ensure_loaded()
             fid = int(fid)
             fid = cls.FID_BY_FID.get(fid)
             return fid
 
         @classmethod
         def from_name(cls, name: str) -> Optional[KiwoomOpenApiPlusRealType.Fid]:
+            cls._ensure_loaded()
             fid = cls.FID_BY_NAME.get(name)
             return fid
 
@@ -94,6 +109,9 @@ class KiwoomOpenApiPlusRealType(JsonSerializable, Logging):
 
     REALTYPE_BY_DESC: Dict[str, KiwoomOpenApiPlusRealType] = {}
 
+    _REALTYPE_LOCK = threading.Lock()
+    _REALTYPE_LOADED = False
+
     def __init__(
         self,
         gidc: Optional[str] = None,
@@ -127,16 +145,19 @@ class KiwoomOpenApiPlusRealType(JsonSerializable, Logging):
 
     @classmethod
     def get_realtype_name_list(cls):
+        cls._ensure_loaded()
         return list(cls.REALTYPE_BY_DESC.keys())
 
     @classmethod
     def get_realtype_info_list(cls):
+        cls._ensure_loaded()
         return list(cls.REALTYPE_BY_DESC.values())
 
     @classmethod
     def get_realtype_info_by_desc(
         cls, desc: str
     ) -> Optional[KiwoomOpenApiPlusRealType]:
+        cls._ensure_loaded()
         return cls.REALTYPE_BY_DESC.get(desc)
 
     @classmethod
@@ -309,25 +330,33 @@ class KiwoomOpenApiPlusRealType(JsonSerializable, Logging):
         cls, dump_file: Optional[Union[str, PathLike, TextIO]] = None
     ):
         cls.REALTYPE_BY_DESC = cls.realtype_by_desc_from_dump_file(dump_file)
-        cls.Fid.load_from_dump_file()
+        cls._REALTYPE_LOADED = True
 
     @classmethod
     def load_from_datfile(
         cls, dat_file: Optional[Union[str, PathLike, BinaryIO]] = None
     ):
         cls.REALTYPE_BY_DESC = cls.realtype_by_desc_from_datfile(dat_file)
-        cls.Fid.load_from_dump_file()
+        cls._REALTYPE_LOADED = True
 
     @classmethod
     def load(cls):
         try:
             cls.load_from_datfile()
-        except FileNotFoundError:
+        except (ImportError, FileNotFoundError):
             cls.load_from_dump_file()
 
+    @classmethod
+    def _ensure_loaded(cls):
+        # 임포트 시점이 아닌 처음 조회하는 시점에 읽어옴
+        if cls._REALTYPE_LOADED:
+            return
+        with cls._REALTYPE_LOCK:
+            if not cls._REALTYPE_LOADED:
+                cls.load()
+
 
 KiwoomOpenApiPlusRealType.Fid.__outer_class__ = KiwoomOpenApiPlusRealType
-KiwoomOpenApiPlusRealType.load()
 
 
 def main():
@@ -0,0 +1,260 @@
+import threading
+import time
+
+from concurrent.futures import Future
+from typing import Dict, Iterable, List, Optional, Set
+
+from koapy.backend.kiwoom_open_api_plus.core.KiwoomOpenApiPlusEventHandlerFunctions import (
+    KiwoomOpenApiPlusEventHandlerFunctions,
+)
+from koapy.backend.kiwoom_open_api_plus.core.KiwoomOpenApiPlusRealDataRecorder import (
+    KiwoomOpenApiPlusRealDataRecord,
+    KiwoomOpenApiPlusRealDataRecordReader,
+)
+from koapy.backend.kiwoom_open_api_plus.core.KiwoomOpenApiPlusRealType import (
+    KiwoomOpenApiPlusRealType,
+)
+from koapy.utils.logging.Logging import Logging
+
+
+class KiwoomOpenApiPlusReplaySignal:
+    """
+    Qt 없이 사용할 수 있는 이벤트 시그널 입니다. 연결된 슬롯들을 호출한 스레드에서 그대로 호출합니다.
+    """
+
+    def __init__(self, name: str):
+        self._name = name
+        self._lock = threading.Lock()
+        self._slots = ()
+
+    def connect(self, slot):
+        with self._lock:
+            if slot not in self._slots:
+                self._slots = self._slots + (slot,)
+
+    def disconnect(self, slot=None):
+        with self._lock:
+            if slot is None:
+                self._slots = ()
+            else:
+                self._slots = tuple(s for s in self._slots if s != slot)
+
+    def __call__(self, *args):
+        for slot in self._slots:
+            slot(*args)
+
+
+class KiwoomOpenApiPlusReplayFunction:
+    """
+    실제 컨트롤의 함수들처럼 queuedCall() 을 지원하는 함수 입니다. 별도의 이벤트 스레드가 없으므로 바로 호출합니다.
+    """
+
+    def __init__(self, function, instance=None):
+        self._function = function
+        self._instance = instance
+        self.__name__ = function.__name__
+        self.__doc__ = function.__doc__
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        return KiwoomOpenApiPlusReplayFunction(self._function, instance)
+
+    def __call__(self, *args):
+        return self._function(self._instance, *args)
+
+    def queuedCall(self, *args):
+        future = Future()
+        try:
+            future.set_result(self(*args))
+        except Exception as e:  # pylint: disable=broad-except
+            future.set_exception(e)
+        return future
+
+
+class KiwoomOpenApiPlusReplayControl(Logging):
+    """
+    KiwoomOpenApiPlusRealDataRecorder 로 기록한 이벤트들을 다시 재생하는 가짜 컨트롤 입니다.
+
+    OCX 없이도 KiwoomOpenApiPlusServiceServicer 에 그대로 넘겨서 서버를 띄울 수 있으며,
+    실시간 등록과 관련된 함수들과 GetCommRealData(), GetChejanData() 등 이벤트 처리에 필요한 함수들을 지원합니다.
+
+    speed 가 1 인 경우 기록된 시간 간격 그대로, N 인 경우 N 배 빠르게, 0 인 경우 최대한 빠르게 재생합니다.
+    wait_for_registration 이 참인 경우 처음 SetRealReg() 가 호출되는 시점에 재생을 시작하며,
+    실제 OCX 처럼 등록된 종목에 대한 실시간 데이터만 전달합니다.
+    """
+
+    def __init__(
+        self,
+        filename: Optional[str] = None,
+        records: Optional[Iterable[KiwoomOpenApiPlusRealDataRecord]] = None,
+        speed: float = 1.0,
+        wait_for_registration: bool = True,
+    ):
+        if records is None:
+            if filename is None:
+                raise ValueError("Either filename or records should be given")
+            records = KiwoomOpenApiPlusRealDataRecordReader(filename)
+
+        self._records = records
+        self._speed = speed
+        self._wait_for_registration = wait_for_registration
+
+        for name in dir(KiwoomOpenApiPlusEventHandlerFunctions):
+            if name.startswith("On"):
+                setattr(self, name, KiwoomOpenApiPlusReplaySignal(name))
+
+        self._lock = threading.RLock()
+        self._codes_by_screen: Dict[str, List[str]] = {}
+        self._registered_codes: Set[str] = set()
+
+        self._current_realtype = None
+        self._current_realdata = None
+        self._current_values = None
+        self._current_chejan_values = {}
+        self._fid_index_by_realtype = {}
+
+        self._thread = None
+        self._should_stop = threading.Event()
+        self._finished = threading.Event()
+
+        self._replayed_count = 0
+        self._skipped_count = 0
+
+    @property
+    def replayed_count(self) -> int:
+        return self._replayed_count
+
+    @property
+    def skipped_count(self) -> int:
+        return self._skipped_count
+
+    # 1. 재생
+
+    def _dispatch(self, record: KiwoomOpenApiPlusRealDataRecord):
+        if record.name == "OnReceiveRealData":
+            code, realtype, realdata = record.arguments
+            if self._wait_for_registration and code not in self._registered_codes:
+                self._skipped_count += 1
+                return
+            self._current_realtype = realtype
+            self._current_realdata = realdata
+            self._current_values = None
+            self.OnReceiveRealData(code, realtype, realdata)
+        elif record.name == "OnReceiveChejanData":
+            gubun, itemcnt, fidlist, values = record.arguments
+            self._current_chejan_values = values
+            self.OnReceiveChejanData(gubun, itemcnt, fidlist)
+        else:
+            self.logger.warning("Unknown record %s", record.name)
+            return
+        self._replayed_count += 1
+
+    def _run(self):
+        first_timestamp = None
+        started_at = None
+        for record in self._records:
+            if self._should_stop.is_set():
+                break
+            if self._speed and self._speed > 0:
+                if first_timestamp is None:
+                    first_timestamp = record.timestamp
+                    started_at = time.monotonic()
+                target = started_at + (record.timestamp - first_timestamp) / self._speed
+                remaining = target - time.monotonic()
+                if remaining > 0 and self._should_stop.wait(remaining):
+                    break
+            self._dispatch(record)
+        self.logger.info(
+            "Replay finished, %d events replayed and %d skipped",
+            self._replayed_count,
+            self._skipped_count,
+        )
+        self._finished.set()
+
+    def start(self):
+        with self._lock:
+            if self._thread is None:
+                self.logger.info("Starting replay with speed %s", self._speed)
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+
+    def stop(self):
+        self._should_stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        return self._finished.wait(timeout)
+
+    # 2. 컨트롤 함수들
+
+    @KiwoomOpenApiPlusReplayFunction
+    def GetConnectState(self):
+        return 1
+
+    @KiwoomOpenApiPlusReplayFunction
+    def CommConnect(self):
+        self.OnEventConnect(0)
+        return 0
+
+    @KiwoomOpenApiPlusReplayFunction
+    def SetRealReg(self, scrno, codes, fids, opt_type):
+        codes = [code for code in codes.split(";") if code]
+        with self._lock:
+            screen_codes = self._codes_by_screen.setdefault(scrno, [])
+            if opt_type == "0":
+                screen_codes.clear()
+            for code in codes:
+                if code not in screen_codes:
+                    screen_codes.append(code)
+            self._update_registered_codes()
+        if self._wait_for_registration:
+            self.start()
+        return 0
+
+    @KiwoomOpenApiPlusReplayFunction
+    def SetRealRemove(self, scrno, code):
+        with self._lock:
+            for screen_no, screen_codes in list(self._codes_by_screen.items()):
+                if scrno not in ("ALL", screen_no):
+                    continue
+                if code == "ALL":
+                    screen_codes.clear()
+                elif code in screen_codes:
+                    screen_codes.remove(code)
+                if not screen_codes:
+                    del self._codes_by_screen[screen_no]
+            self._update_registered_codes()
+
+    @KiwoomOpenApiPlusReplayFunction
+    def DisconnectRealData(self, scrno):
+        with self._lock:
+            self._codes_by_screen.pop(scrno, None)
+            self._update_registered_codes()
+
+    @KiwoomOpenApiPlusReplayFunction
+    def GetCommRealData(self, code, fid):  # pylint: disable=unused-argument
+        realtype = self._current_realtype
+        try:
+            fid_index = self._fid_index_by_realtype[realtype]
+        except KeyError:
+            fids = KiwoomOpenApiPlusRealType.get_fids_by_realtype_name(realtype) or []
+            fid_index = {fid: i for i, fid in enumerate(fids)}
+            self._fid_index_by_realtype[realtype] = fid_index
+        if self._current_values is None:
+            self._current_values = self._current_realdata.split("\t")
+        i = fid_index.get(int(fid))
+        if i is None or i >= len(self._current_values):
+            return ""
+        return self._current_values[i]
+
+    @KiwoomOpenApiPlusReplayFunction
+    def GetChejanData(self, fid):
+        return self._current_chejan_values.get(str(fid), "")
+
+    def _update_registered_codes(self):
+        registered_codes = set()
+        for screen_codes in self._codes_by_screen.values():
+            registered_codes.update(screen_codes)
+        self._registered_codes = registered_codes
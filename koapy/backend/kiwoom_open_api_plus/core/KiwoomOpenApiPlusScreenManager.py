@@ -1,8 +1,7 @@
 import collections
-import random
 import threading
 
-from typing import Collection, List, Optional, Union
+from typing import Collection, Dict, List, Optional, Union
 
 from koapy.backend.kiwoom_open_api_plus.core.KiwoomOpenApiPlusDispatchFunctions import (
     KiwoomOpenApiPlusDispatchFunctions,
@@ -14,16 +13,43 @@ from koapy.utils.logging.Logging import Logging
 
 
 class KiwoomOpenApiPlusScreenManager(Logging):
+    """
+    화면번호를 빌려주고 돌려받는 관리자 입니다.
+
+    사용 가능한 화면번호들은 큐에 담아두고 앞에서부터 빌려주며, 반납된 화면번호는 큐의 맨 뒤에 다시 넣습니다.
+    따라서 빌리고 반납하는 비용은 화면번호 개수와 관계없이 O(1) 이며, 방금 반납된 화면번호는
+    가장 늦게 재사용되므로 이전 요청에 대한 늦은 이벤트와 섞일 가능성을 줄입니다.
+
+    큐에는 화면번호마다 최대 하나의 항목만 들어가도록 비트셋으로 관리하며,
+    화면번호를 직접 지정해서 빌리는 경우 큐의 항목은 그대로 두었다가 꺼내는 시점에 건너뜁니다.
+
+    사용중인 화면번호는 빌린 순서대로 관리하며, 최대 개수를 넘는 경우 가장 오래된 화면번호를 사용중 목록에서 제외합니다.
+    get_metrics() 로 사용중인 화면 수, 최대 사용량, 제외된 (evicted) 화면 수 등을 확인할 수 있습니다.
+    """
 
     MAXIMUM_NUMBER_OF_SCREENS = 200
 
+    MINIMUM_SCREEN_NUMBER = 1
+    MAXIMUM_SCREEN_NUMBER = 9999
+
     def __init__(self, control: Optional[KiwoomOpenApiPlusDispatchFunctions] = None):
         self._control = control
         self._lock = threading.RLock()
-        self._occupied_screen_nos = collections.deque(
-            maxlen=self.MAXIMUM_NUMBER_OF_SCREENS
+
+        # 빌린 순서대로 정렬된 사용중인 화면번호별 대여 횟수
+        self._borrow_count_by_screen_no: Dict[int, int] = {}
+
+        self._free_screen_nos = collections.deque(
+            range(self.MINIMUM_SCREEN_NUMBER, self.MAXIMUM_SCREEN_NUMBER + 1)
         )
-        self._borrow_count_by_screen_no = {}
+        self._queued = bytearray(self.MAXIMUM_SCREEN_NUMBER + 1)
+        for screen_no in self._free_screen_nos:
+            self._queued[screen_no] = 1
+
+        self._borrowed_count = 0
+        self._returned_count = 0
+        self._evicted_count = 0
+        self._peak_count = 0
 
     @staticmethod
     def number_to_screen_no(number: int) -> str:
@@ -36,9 +62,45 @@ class KiwoomOpenApiPlusScreenManager(Logging):
     def is_inuse(self, screen_no: str) -> bool:
         return (
             screen_no is not None
-            and self.screen_no_to_number(screen_no) in self._occupied_screen_nos
+            and self.screen_no_to_number(screen_no) in self._borrow_count_by_screen_no
         )
 
+    def get_metrics(self) -> Dict[str, Union[int, float]]:
+        with self._lock:
+            inuse_count = len(self._borrow_count_by_screen_no)
+            return {
+                "inuse": inuse_count,
+                "peak": self._peak_count,
+                "maximum": self.MAXIMUM_NUMBER_OF_SCREENS,
+                "pressure": inuse_count / self.MAXIMUM_NUMBER_OF_SCREENS,
+                "borrowed": self._borrowed_count,
+                "returned": self._returned_count,
+                "evicted": self._evicted_count,
+            }
+
+    def _enqueue_free_screen(self, screen_no: int):
+        if (
+            self.MINIMUM_SCREEN_NUMBER <= screen_no <= self.MAXIMUM_SCREEN_NUMBER
+            and not self._queued[screen_no]
+        ):
+            self._queued[screen_no] = 1
+            self._free_screen_nos.append(screen_no)
+
+    def _get_free_screen_number(self, exclude: Collection[int]) -> int:
+        free_screen_nos = self._free_screen_nos
+        occupied = self._borrow_count_by_screen_no
+        # 앞쪽의 이미 사용중인 화면번호들은 반납될때 다시 들어오므로 버림
+        while free_screen_nos and free_screen_nos[0] in occupied:
+            self._queued[free_screen_nos.popleft()] = 0
+        if not exclude:
+            if free_screen_nos:
+                return free_screen_nos[0]
+        else:
+            for screen_no in free_screen_nos:
+                if screen_no not in occupied and screen_no not in exclude:
+                    return screen_no
+        raise KiwoomOpenApiPlusError("No free screen available")
+
     def get_single_free_screen(self, exclude: Optional[Collection[str]] = None) -> str:
         if exclude is None:
             exclude = []
@@ -46,17 +108,11 @@ class KiwoomOpenApiPlusScreenManager(Logging):
             exclude = [self.screen_no_to_number(scrnno) for scrnno in exclude]
         exclude = set(exclude)
         with self._lock:
-            if len(self._occupied_screen_nos) == self.MAXIMUM_NUMBER_OF_SCREENS:
+            if len(self._borrow_count_by_screen_no) >= self.MAXIMUM_NUMBER_OF_SCREENS:
                 self.logger.warning(
                     "Requesting free screen, but already using maximum number of screens."
                 )
-            screen_no = random.choice(
-                [
-                    i
-                    for i in range(1, 10000)
-                    if i not in self._occupied_screen_nos and i not in exclude
-                ]
-            )
+            screen_no = self._get_free_screen_number(exclude)
             screen_no = self.number_to_screen_no(screen_no)
             return screen_no
 
@@ -72,6 +128,16 @@ class KiwoomOpenApiPlusScreenManager(Logging):
         else:
             return self.get_multiple_free_screens(count)
 
+    def _evict_oldest_screen(self):
+        oldest = next(iter(self._borrow_count_by_screen_no))
+        del self._borrow_count_by_screen_no[oldest]
+        self._enqueue_free_screen(oldest)
+        self._evicted_count += 1
+        self.logger.warning(
+            "Oldest screen %s popped.",
+            self.number_to_screen_no(oldest),
+        )
+
     def borrow_screen(
         self, screen_no: Optional[str] = None, reuse: bool = True, pop: bool = True
     ) -> str:
@@ -83,27 +149,32 @@ class KiwoomOpenApiPlusScreenManager(Logging):
                     raise KiwoomOpenApiPlusError(
                         "Borrowing screen %s, but it's already is use." % screen_no
                     )
-                if len(self._occupied_screen_nos) == self.MAXIMUM_NUMBER_OF_SCREENS:
+                if (
+                    len(self._borrow_count_by_screen_no)
+                    >= self.MAXIMUM_NUMBER_OF_SCREENS
+                ):
                     self.logger.warning(
                         "Borrowing a screen, but already using maximum number of screens."
                     )
-                    if pop:
-                        oldest = self._occupied_screen_nos.popleft()
-                        del self._borrow_count_by_screen_no[oldest]
-                        self.logger.warning(
-                            "Oldest screen %s popped.",
-                            self.number_to_screen_no(oldest),
-                        )
-                    else:
+                    if not pop:
                         raise KiwoomOpenApiPlusError("Cannot allocate more screen")
             screen_no_int = self.screen_no_to_number(screen_no)
-            if not self.is_inuse(screen_no):
-                self._occupied_screen_nos.append(screen_no_int)
-            self._borrow_count_by_screen_no[screen_no_int] = (
-                self._borrow_count_by_screen_no.get(screen_no_int, 0) + 1
-            )
-            if len(self._occupied_screen_nos) == self.MAXIMUM_NUMBER_OF_SCREENS:
-                self.logger.warning("Maximum number of screens reached.")
+            borrow_count = self._borrow_count_by_screen_no.get(screen_no_int, 0)
+            if borrow_count == 0:
+                if (
+                    len(self._borrow_count_by_screen_no)
+                    >= self.MAXIMUM_NUMBER_OF_SCREENS
+                ):
+                    self._evict_oldest_screen()
+                self._borrow_count_by_screen_no[screen_no_int] = 1
+                inuse_count = len(self._borrow_count_by_screen_no)
+                if inuse_count > self._peak_count:
+                    self._peak_count = inuse_count
+                if inuse_count == self.MAXIMUM_NUMBER_OF_SCREENS:
+                    self.logger.warning("Maximum number of screens reached.")
+            else:
+                self._borrow_count_by_screen_no[screen_no_int] = borrow_count + 1
+            self._borrowed_count += 1
             return screen_no
 
     def return_screen(self, screen_no: str) -> bool:
@@ -112,8 +183,9 @@ class KiwoomOpenApiPlusScreenManager(Logging):
                 screen_no_int = self.screen_no_to_number(screen_no)
                 self._borrow_count_by_screen_no[screen_no_int] -= 1
                 if self._borrow_count_by_screen_no[screen_no_int] == 0:
-                    self._occupied_screen_nos.remove(screen_no_int)
                     del self._borrow_count_by_screen_no[screen_no_int]
+                    self._enqueue_free_screen(screen_no_int)
+                self._returned_count += 1
             return True
         except (KeyError, ValueError):
             self.logger.warning("Returned screen %s, but not found.", screen_no)
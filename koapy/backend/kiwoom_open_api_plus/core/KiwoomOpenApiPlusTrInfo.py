@@ -3,11 +3,12 @@ from __future__ import annotations
 import contextlib
 import io
 import json
+import threading
 import zipfile
 
 from os import PathLike
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence, TextIO, Union
+from typing import Any, Callable, Dict, List, Optional, Sequence, TextIO, Union
 
 from koapy.config import debug, default_encoding
 from koapy.utils.logging.Logging import Logging
@@ -22,8 +23,18 @@ class KiwoomOpenApiPlusTrInfo(JsonSerializable, Logging):
         TRINFO_BY_CODE_DUMP_FILEDIR / TRINFO_BY_CODE_DUMP_FILENAME
     )
 
+    TRINFO_BY_CODE_INDEXED_DUMP_FILENAME = "trinfo_by_code.indexed.jsonl"
+    TRINFO_BY_CODE_INDEXED_DUMP_FILEPATH = (
+        TRINFO_BY_CODE_DUMP_FILEDIR / TRINFO_BY_CODE_INDEXED_DUMP_FILENAME
+    )
+
+    # 실제로 조회된 TR 정보들만 담고 있는 캐시, 전체 정보는 처음 조회되는 시점에 코드별로 읽어옴
     TRINFO_BY_CODE: Dict[str, KiwoomOpenApiPlusTrInfo] = {}
 
+    _TRINFO_LOCK = threading.RLock()
+    _TRINFO_CODES: Optional[List[str]] = None
+    _TRINFO_READER: Optional[Callable[[str], Optional[KiwoomOpenApiPlusTrInfo]]] = None
+
     class Field(JsonSerializable):
         def __init__(
             self,
@@ -197,15 +208,26 @@ class KiwoomOpenApiPlusTrInfo(JsonSerializable, Logging):
 
     @classmethod
     def get_trcode_list(cls) -> List[str]:
-        return list(cls.TRINFO_BY_CODE.keys())
+        cls._ensure_loaded()
+        return list(cls._TRINFO_CODES)
 
     @classmethod
     def get_trinfo_list(cls) -> List[KiwoomOpenApiPlusTrInfo]:
-        return list(cls.TRINFO_BY_CODE.values())
+        return [cls.get_trinfo_by_code(trcode) for trcode in cls.get_trcode_list()]
 
     @classmethod
     def get_trinfo_by_code(cls, trcode: str) -> Optional[KiwoomOpenApiPlusTrInfo]:
-        return cls.TRINFO_BY_CODE.get(trcode.lower())
+        trcode = trcode.lower()
+        trinfo = cls.TRINFO_BY_CODE.get(trcode)
+        if trinfo is None:
+            cls._ensure_loaded()
+            with cls._TRINFO_LOCK:
+                trinfo = cls.TRINFO_BY_CODE.get(trcode)
+                if trinfo is None:
+                    trinfo = cls._TRINFO_READER(trcode)
+                    if trinfo is not None:
+                        cls.TRINFO_BY_CODE[trcode] = trinfo
+        return trinfo
 
     @classmethod
     def of(cls, trcode: str) -> Optional[KiwoomOpenApiPlusTrInfo]:
@@ -347,12 +369,11 @@ class KiwoomOpenApiPlusTrInfo(JsonSerializable, Logging):
             )
 
     @classmethod
-    def infos_from_data_dir(
+    def _get_data_dir(
         cls,
         data_dir: Optional[Union[str, PathLike]] = None,
-        encoding: Optional[str] = None,
         module_path: Optional[str] = None,
-    ) -> List[KiwoomOpenApiPlusTrInfo]:
+    ) -> Path:
         if data_dir is None:
             if module_path is None:
                 from koapy.backend.kiwoom_open_api_plus.core.KiwoomOpenApiPlusTypeLibSpec import (
@@ -365,18 +386,73 @@ class KiwoomOpenApiPlusTrInfo(JsonSerializable, Logging):
         if isinstance(data_dir, str):
             data_dir = Path(data_dir)
 
-        if encoding is None:
-            encoding = "euc-kr"
-
-        if debug:
-            cls.logger.debug("Reading files under %s", data_dir)
+        return data_dir
 
+    @classmethod
+    def enc_filenames_from_data_dir(
+        cls,
+        data_dir: Optional[Union[str, PathLike]] = None,
+        module_path: Optional[str] = None,
+    ) -> List[str]:
+        data_dir = cls._get_data_dir(data_dir, module_path)
         enc_filenames = [filename.name.lower() for filename in data_dir.iterdir()]
         enc_filenames = [
             filename
             for filename in enc_filenames
             if filename.startswith("o") and filename.endswith(".enc")
         ]
+        return enc_filenames
+
+    @classmethod
+    def info_from_data_dir(
+        cls,
+        tr_code: str,
+        data_dir: Optional[Union[str, PathLike]] = None,
+        encoding: Optional[str] = None,
+        module_path: Optional[str] = None,
+    ) -> Optional[KiwoomOpenApiPlusTrInfo]:
+        data_dir = cls._get_data_dir(data_dir, module_path)
+
+        if encoding is None:
+            encoding = "euc-kr"
+
+        tr_code = tr_code.lower()
+        full_filename = data_dir / (tr_code + ".enc")
+
+        if not full_filename.exists():
+            return None
+
+        with zipfile.ZipFile(full_filename) as z:
+            for info in z.infolist():
+                inner_filename = info.filename
+                if Path(inner_filename).stem.lower() != tr_code:
+                    continue
+                if debug:
+                    cls.logger.debug(
+                        "Reading file %s inside %s", inner_filename, full_filename
+                    )
+                with z.open(info) as b:
+                    with io.TextIOWrapper(b, encoding=encoding) as f:
+                        return cls.from_encfile(f, tr_code)
+
+        return None
+
+    @classmethod
+    def infos_from_data_dir(
+        cls,
+        data_dir: Optional[Union[str, PathLike]] = None,
+        encoding: Optional[str] = None,
+        module_path: Optional[str] = None,
+    ) -> List[KiwoomOpenApiPlusTrInfo]:
+        data_dir = cls._get_data_dir(data_dir, module_path)
+
+        if encoding is None:
+            encoding = "euc-kr"
+
+        if debug:
+            cls.logger.debug("Reading files under %s", data_dir)
+
+        enc_filenames = cls.enc_filenames_from_data_dir(data_dir)
         results = []
         for filename in enc_filenames:
             full_filename = data_dir / filename
@@ -459,29 +535,159 @@ class KiwoomOpenApiPlusTrInfo(JsonSerializable, Logging):
             result[tr_code] = item
         return result
 
+    @classmethod
+    def dump_trinfo_by_code_indexed(
+        cls,
+        dump_file: Optional[Union[str, PathLike]] = None,
+        trinfo_by_code: Optional[Dict[str, KiwoomOpenApiPlusTrInfo]] = None,
+    ):
+        """
+        TR 정보를 코드별로 한줄씩 기록하고 첫줄에 각 코드별 위치를 담은 인덱스를 기록합니다.
+
+        인덱스의 위치값은 첫줄 이후부터의 바이트 단위 (offset, length) 입니다.
+        이후 조회시에는 인덱스만 읽어두고 필요한 TR 정보만 해당 위치에서 읽어와 객체로 만들 수 있습니다.
+        """
+        if dump_file is None:
+            dump_file = cls.TRINFO_BY_CODE_INDEXED_DUMP_FILEPATH
+        if trinfo_by_code is None:
+            trinfo_by_code = cls.trinfo_by_code_from_data_dir()
+        index = {}
+        lines = []
+        offset = 0
+        for tr_code in sorted(trinfo_by_code):
+            line = json.dumps(
+                trinfo_by_code[tr_code].to_dict(),
+                sort_keys=True,
+                ensure_ascii=False,
+                separators=(",", ":"),
+            )
+            line = line.encode(default_encoding) + b"\n"
+            index[tr_code] = [offset, len(line)]
+            lines.append(line)
+            offset += len(line)
+        header = json.dumps(index, sort_keys=True, separators=(",", ":"))
+        header = header.encode(default_encoding) + b"\n"
+        cls.logger.debug("Saving indexed trinfo to %s", dump_file)
+        with open(dump_file, "wb") as f:
+            f.write(header)
+            f.writelines(lines)
+
+    @classmethod
+    def trinfo_index_from_indexed_dump_file(
+        cls, dump_file: Optional[Union[str, PathLike]] = None
+    ) -> Optional[Dict[str, List[int]]]:
+        if dump_file is None:
+            dump_file = cls.TRINFO_BY_CODE_INDEXED_DUMP_FILEPATH
+        dump_file = Path(dump_file)
+        if not dump_file.exists() or dump_file.stat().st_size == 0:
+            return None
+        with open(dump_file, "rb") as f:
+            header = f.readline()
+        index = json.loads(header.decode(default_encoding))
+        header_length = len(header)
+        for position in index.values():
+            position[0] += header_length
+        return index
+
+    @classmethod
+    def trinfo_from_indexed_dump_file(
+        cls,
+        tr_code: str,
+        index: Dict[str, List[int]],
+        dump_file: Optional[Union[str, PathLike]] = None,
+    ) -> Optional[KiwoomOpenApiPlusTrInfo]:
+        if dump_file is None:
+            dump_file = cls.TRINFO_BY_CODE_INDEXED_DUMP_FILEPATH
+        position = index.get(tr_code.lower())
+        if position is None:
+            return None
+        offset, length = position
+        with open(dump_file, "rb") as f:
+            f.seek(offset)
+            line = f.read(length)
+        return cls.from_dict(json.loads(line.decode(default_encoding)))
+
+    @classmethod
+    def _set_loaded(
+        cls,
+        trcodes: List[str],
+        reader: Callable[[str], Optional[KiwoomOpenApiPlusTrInfo]],
+        trinfo_by_code: Optional[Dict[str, KiwoomOpenApiPlusTrInfo]] = None,
+    ):
+        with cls._TRINFO_LOCK:
+            cls.TRINFO_BY_CODE = trinfo_by_code or {}
+            cls._TRINFO_CODES = trcodes
+            cls._TRINFO_READER = reader
+
     @classmethod
     def load_from_dump_file(
         cls, dump_file: Optional[Union[str, PathLike, TextIO]] = None
     ):
-        cls.TRINFO_BY_CODE = cls.trinfo_by_code_from_dump_file(dump_file)
+        trinfo_by_code = cls.trinfo_by_code_from_dump_file(dump_file)
+        cls._set_loaded(list(trinfo_by_code), trinfo_by_code.get, trinfo_by_code)
 
     @classmethod
     def load_from_data_dir(cls, data_dir: Optional[Union[str, PathLike]] = None):
-        cls.TRINFO_BY_CODE = cls.trinfo_by_code_from_data_dir(data_dir)
+        trinfo_by_code = cls.trinfo_by_code_from_data_dir(data_dir)
+        cls._set_loaded(list(trinfo_by_code), trinfo_by_code.get, trinfo_by_code)
 
     @classmethod
-    def load(cls):
-        try:
-            cls.load_from_data_dir()
-        except FileNotFoundError:
-            cls.load_from_dump_file()
+    def load_lazily_from_data_dir(cls, data_dir: Optional[Union[str, PathLike]] = None):
+        data_dir = cls._get_data_dir(data_dir)
+        trcodes = [
+            Path(filename).stem
+            for filename in cls.enc_filenames_from_data_dir(data_dir)
+        ]
+
+        def reader(tr_code):
+            return cls.info_from_data_dir(tr_code, data_dir)
 
+        cls._set_loaded(trcodes, reader)
+
+    @classmethod
+    def load_lazily_from_indexed_dump_file(
+        cls, dump_file: Optional[Union[str, PathLike]] = None
+    ) -> bool:
+        index = cls.trinfo_index_from_indexed_dump_file(dump_file)
+        if index is None:
+            return False
+
+        def reader(tr_code):
+            return cls.trinfo_from_indexed_dump_file(tr_code, index, dump_file)
+
+        cls._set_loaded(sorted(index), reader)
+        return True
+
+    @classmethod
+    def _ensure_loaded(cls):
+        if cls._TRINFO_READER is not None:
+            return
+        with cls._TRINFO_LOCK:
+            if cls._TRINFO_READER is not None:
+                return
+            try:
+                cls.load_lazily_from_data_dir()
+            except (ImportError, FileNotFoundError):
+                if not cls.load_lazily_from_indexed_dump_file():
+                    cls.load_from_dump_file()
+
+    @classmethod
+    def load(cls):
+        """
+        TR 정보를 다시 읽어오도록 초기화합니다. 실제 파일은 각 TR 정보가 처음 조회될때 읽습니다.
 
-KiwoomOpenApiPlusTrInfo.load()
+        설치된 OpenAPI 의 data 디렉토리가 있으면 해당 디렉토리의 .enc 파일을,
+        없는 경우 미리 만들어진 인덱스 파일을 사용합니다.
+        """
+        with cls._TRINFO_LOCK:
+            cls.TRINFO_BY_CODE = {}
+            cls._TRINFO_CODES = None
+            cls._TRINFO_READER = None
 
 
 def main():
     KiwoomOpenApiPlusTrInfo.dump_trinfo_by_code()
+    KiwoomOpenApiPlusTrInfo.dump_trinfo_by_code_indexed()
 
 
 def infer_fids_by_tr_outputs(output_filename=None):
@@ -0,0 +1,234 @@
+import datetime
+import threading
+
+from pathlib import Path
+
+import pandas as pd
+import pytz
+
+from koapy.config import config, home_directory
+from koapy.utils.logging.Logging import Logging
+from koapy.utils.store import SQLiteStore
+
+
+class KiwoomOpenApiPlusChartDataCache(Logging):
+    """
+    차트 데이터 조회 결과를 로컬 SQLite 파일에 저장해두는 캐시입니다.
+
+    (종목코드, TR 코드, 틱범위, 수정주가구분) 단위로 데이터를 저장합니다.
+    이후 동일한 조회 요청에 대해서는 캐시된 가장 최근 일자 (high-water mark) 보다 새로운 페이지들과
+    캐시된 가장 오래된 일자보다 오래된 페이지들만 stop_condition 을 활용해 추가로 조회하여 병합하고,
+    캐시만으로 충분한 경우에는 RPC 호출 없이 바로 반환합니다.
+    """
+
+    _default_filename = home_directory / ".koapy" / "chart_data_cache.sqlite3"
+    _default_library = "KIWOOM-CHART"
+
+    # 일봉보다 긴 주기의 차트들은 현재 진행중인 봉이 포함하는 기간이 더 길어짐
+    _period_by_trcode = {
+        "opt10082": "week",
+        "opt10083": "month",
+        "opt10094": "year",
+    }
+
+    def __init__(self, filename=None, library=None):
+        if filename is None:
+            filename = config.get_string(
+                "koapy.backend.kiwoom_open_api_plus.grpc.client.chart_data_cache.filename",
+                None,
+            )
+        if filename is None:
+            filename = self._default_filename
+        if library is None:
+            library = self._default_library
+
+        filename = Path(filename)
+        filename.parent.mkdir(parents=True, exist_ok=True)
+
+        self._filename = filename
+        self._store = SQLiteStore(str(filename))
+        self._library = self._store.get_or_create_library(library)
+        self._lock = threading.RLock()
+
+    @classmethod
+    def _make_symbol(cls, code, trcode, interval=None, adjusted_price=False):
+        return ":".join(
+            [
+                trcode.lower(),
+                code,
+                str(interval or ""),
+                "1" if adjusted_price else "0",
+            ]
+        )
+
+    def read(self, code, trcode, interval=None, adjusted_price=False):
+        symbol = self._make_symbol(code, trcode, interval, adjusted_price)
+        with self._lock:
+            if not self._library.has_symbol(symbol):
+                return None, {}
+            item = self._library.read(symbol)
+        data = item.data
+        if data is not None:
+            data = data.reset_index(drop=True)
+        return data, item.metadata or {}
+
+    def write(self, code, trcode, data, metadata, interval=None, adjusted_price=False):
+        symbol = self._make_symbol(code, trcode, interval, adjusted_price)
+        with self._lock:
+            self._library.write(symbol, data, metadata=metadata)
+
+    def delete(self, code, trcode, interval=None, adjusted_price=False):
+        symbol = self._make_symbol(code, trcode, interval, adjusted_price)
+        with self._lock:
+            if self._library.has_symbol(symbol):
+                self._library.delete(symbol)
+
+    @classmethod
+    def _merge(cls, cached, fetched, date_column_name):
+        # 새로 조회한 데이터는 최소/최대 일자 사이의 모든 행을 빠짐없이 포함하므로
+        # 해당 구간 밖의 캐시 데이터만 남기고 새 데이터로 대체합니다 (동일 시간의 틱 데이터가 여러개인 경우 포함)
+        if cached is None or cached.empty:
+            return fetched
+        if fetched is None or fetched.empty:
+            return cached
+        fetched_dates = fetched[date_column_name]
+        cached_dates = cached[date_column_name]
+        newer = cached[cached_dates > fetched_dates.max()]
+        older = cached[cached_dates < fetched_dates.min()]
+        merged = pd.concat([newer, fetched, older], ignore_index=True)
+        return merged
+
+    @classmethod
+    def _slice(cls, data, date_column_name, start_date, end_date, include_end):
+        if data is None or data.empty:
+            return data
+        dates = data[date_column_name]
+        mask = pd.Series(True, index=data.index)
+        if start_date is not None:
+            mask &= dates <= start_date
+        if end_date is not None:
+            if include_end:
+                mask &= dates >= end_date
+            else:
+                mask &= dates > end_date
+        return data[mask].reset_index(drop=True)
+
+    @classmethod
+    def get_session_start(cls, trcode, now=None):
+        """
+        아직 완성되지 않았을 수 있는 현재 봉이 시작되는 일자를 %Y%m%d 형식으로 반환합니다.
+        """
+        if now is None:
+            now = datetime.datetime.now(pytz.timezone("Asia/Seoul"))
+        date = now.date()
+        period = cls._period_by_trcode.get(trcode)
+        if period == "week":
+            date -= datetime.timedelta(days=date.weekday())
+        elif period == "month":
+            date = date.replace(day=1)
+        elif period == "year":
+            date = date.replace(month=1, day=1)
+        return date.strftime("%Y%m%d")
+
+    @classmethod
+    def _get_final_date(cls, fetched, date_column_name, start_date, session_start):
+        # start_date 까지 조회한 경우 start_date 가 현재 봉 이전이라면 그때까지의 데이터는 모두 완성된 데이터임
+        if start_date is not None and start_date[:8] < session_start:
+            return start_date
+        if fetched is None or fetched.empty:
+            return None
+        dates = fetched[date_column_name]
+        dates = dates[dates.str[:8] < session_start]
+        if dates.empty:
+            return None
+        return dates.max()
+
+    def get_or_fetch(
+        self,
+        fetch,
+        code,
+        trcode,
+        date_column_name,
+        start_date=None,
+        end_date=None,
+        include_end=False,
+        interval=None,
+        adjusted_price=False,
+    ):
+        """
+        캐시된 데이터를 활용해 요청된 구간의 차트 데이터를 반환합니다.
+
+        fetch 는 fetch(start_date, end_date) 형태로 호출 가능해야 하며,
+        end_date 에 해당하는 데이터를 포함하여 (include_end=True) 최신순으로 정렬된 pd.DataFrame 을 반환해야 합니다.
+
+        캐시된 데이터가 빠짐없이 포함하는 구간을 메타데이터의 covered_range 에 [가장 오래된 일자, 가장 최근 일자] 로 저장하며,
+        가장 오래된 일자가 None 인 경우 상장 이후 전체 데이터를 포함한다는 의미입니다.
+        가장 최근 일자는 완성된 봉들까지만 기록하므로 현재 진행중인 봉을 포함하는 요청은 항상 다시 조회합니다.
+        요청된 구간이 해당 구간을 벗어나는 경우 캐시된 구간의 경계까지 이어서 조회하므로 캐시된 데이터에는 빈 구간이 생기지 않습니다.
+        """
+        session_start = self.get_session_start(trcode)
+
+        with self._lock:
+            cached, metadata = self.read(code, trcode, interval, adjusted_price)
+            covered_range = metadata.get("covered_range")
+
+            if cached is None or cached.empty or covered_range is None:
+                # 구간 정보가 없는 캐시는 빈 구간이 있을 수 있으므로 사용하지 않음
+                fetched = fetch(start_date, end_date)
+                high = self._get_final_date(
+                    fetched, date_column_name, start_date, session_start
+                )
+                if high is not None and not fetched.empty:
+                    metadata = dict(metadata)
+                    metadata["covered_range"] = [end_date, high]
+                    self.write(
+                        code, trcode, fetched, metadata, interval, adjusted_price
+                    )
+                return self._slice(
+                    fetched, date_column_name, start_date, end_date, include_end
+                )
+
+            low, high = covered_range
+
+            old_side_covered = low is None or (end_date is not None and low <= end_date)
+            new_side_covered = start_date is not None and start_date <= high
+
+            if old_side_covered and new_side_covered:
+                self.logger.debug("Cache hit for %s %s", trcode, code)
+                return self._slice(
+                    cached, date_column_name, start_date, end_date, include_end
+                )
+
+            merged = cached
+
+            if not new_side_covered:
+                # high-water mark 이후로 새로 추가된 페이지들만 조회
+                self.logger.debug(
+                    "Fetching pages newer than %s for %s %s", high, trcode, code
+                )
+                fetched = fetch(start_date, high)
+                merged = self._merge(merged, fetched, date_column_name)
+                high = max(
+                    high,
+                    self._get_final_date(
+                        fetched, date_column_name, start_date, session_start
+                    )
+                    or high,
+                )
+
+            if not old_side_covered:
+                # 요청된 구간이 캐시된 구간보다 오래된 경우에도 캐시된 구간의 경계부터 이어서 조회
+                self.logger.debug(
+                    "Fetching pages older than %s for %s %s", low, trcode, code
+                )
+                fetched = fetch(low, end_date)
+                merged = self._merge(merged, fetched, date_column_name)
+                low = end_date
+
+            metadata = dict(metadata)
+            metadata["covered_range"] = [low, high]
+            self.write(code, trcode, merged, metadata, interval, adjusted_price)
+
+            return self._slice(
+                merged, date_column_name, start_date, end_date, include_end
+            )
@@ -0,0 +1,130 @@
+import asyncio
+import inspect
+
+import grpc
+
+from koapy.backend.kiwoom_open_api_plus.grpc import KiwoomOpenApiPlusService_pb2_grpc
+from koapy.backend.kiwoom_open_api_plus.grpc.KiwoomOpenApiPlusServiceAsyncClientStubWrapper import (
+    KiwoomOpenApiPlusServiceAsyncClientStubWrapper,
+)
+from koapy.backend.kiwoom_open_api_plus.grpc.KiwoomOpenApiPlusServiceChannelOptions import (
+    KiwoomOpenApiPlusServiceChannelOptions,
+)
+from koapy.backend.kiwoom_open_api_plus.grpc.KiwoomOpenApiPlusServiceCompression import (
+    KiwoomOpenApiPlusServiceClientSideCompressedStub,
+)
+from koapy.config import config
+
+
+class KiwoomOpenApiPlusServiceAsyncClient:
+    """
+    grpc.aio 채널을 사용하는 KiwoomOpenApiPlusServiceClient 입니다.
+
+    실행중인 이벤트 루프 안에서 생성하고 사용해야 합니다.
+
+    >>> async with KiwoomOpenApiPlusServiceAsyncClient(port=port) as client:
+    ...     name = await client.GetMasterCodeName("005930")
+    """
+
+    def __init__(
+        self,
+        host=None,
+        port=None,
+        credentials=None,
+        check_timeout=None,
+        **kwargs,
+    ):
+        if host is None:
+            host = config.get_string(
+                "koapy.backend.kiwoom_open_api_plus.grpc.host", "localhost"
+            )
+            host = config.get_string(
+                "koapy.backend.kiwoom_open_api_plus.grpc.client.host", host
+            )
+        if port is None:
+            port = config.get_int("koapy.backend.kiwoom_open_api_plus.grpc.port")
+            port = config.get_int(
+                "koapy.backend.kiwoom_open_api_plus.grpc.client.port", port
+            )
+
+        if check_timeout is None:
+            check_timeout = config.get_int(
+                "koapy.backend.kiwoom_open_api_plus.grpc.client.is_ready.timeout", 10
+            )
+
+        self._host = host
+        self._port = port
+        self._credentials = credentials
+        self._check_timeout = check_timeout
+        self._kwargs = kwargs
+
+        self._target = self._host + ":" + str(self._port)
+
+        # 설정 파일의 채널 옵션과 압축 방식 적용
+        channel_options = KiwoomOpenApiPlusServiceChannelOptions("client")
+
+        if self._credentials is None:
+            channel_signature = inspect.signature(grpc.aio.insecure_channel)
+            channel_params = list(channel_signature.parameters.keys())
+            channel_kwargs = {
+                k: v for k, v in self._kwargs.items() if k in channel_params
+            }
+            channel_bound_arguments = channel_signature.bind_partial(**channel_kwargs)
+            channel_bound_arguments.arguments["target"] = self._target
+            channel_options.update_arguments(channel_bound_arguments.arguments)
+            self._channel = grpc.aio.insecure_channel(
+                *channel_bound_arguments.args,
+                **channel_bound_arguments.kwargs,
+            )
+        else:
+            channel_signature = inspect.signature(grpc.aio.secure_channel)
+            channel_params = list(channel_signature.parameters.keys())
+            channel_kwargs = {
+                k: v for k, v in self._kwargs.items() if k in channel_params
+            }
+            channel_bound_arguments = channel_signature.bind_partial(**channel_kwargs)
+            channel_bound_arguments.arguments["target"] = self._target
+            channel_options.update_arguments(channel_bound_arguments.arguments)
+            channel_bound_arguments.arguments["credentials"] = self._credentials
+            self._channel = grpc.aio.secure_channel(
+                *channel_bound_arguments.args,
+                **channel_bound_arguments.kwargs,
+            )
+
+        self._stub = KiwoomOpenApiPlusService_pb2_grpc.KiwoomOpenApiPlusServiceStub(
+            self._channel
+        )
+        compression_by_method = channel_options.compression_by_method()
+        if compression_by_method:
+            self._stub = KiwoomOpenApiPlusServiceClientSideCompressedStub(
+                self._stub, compression_by_method
+            )
+        self._stub_wrapped = KiwoomOpenApiPlusServiceAsyncClientStubWrapper(self._stub)
+
+    async def is_ready(self, timeout=None):
+        if timeout is None:
+            timeout = self._check_timeout
+        try:
+            await asyncio.wait_for(self._channel.channel_ready(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    def get_grpc_stub(self):
+        return self._stub
+
+    def get_stub(self):
+        return self._stub_wrapped
+
+    async def close(self, grace=None):
+        return await self._channel.close(grace)
+
+    def __getattr__(self, name):
+        return getattr(self._stub_wrapped, name)
+
+    async def __aenter__(self):
+        assert await self.is_ready(), "Client is not ready"
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
@@ -0,0 +1,204 @@
+import functools
+
+from koapy.backend.kiwoom_open_api_plus.core.KiwoomOpenApiPlusDispatchSignature import (
+    KiwoomOpenApiPlusDispatchSignature,
+)
+from koapy.backend.kiwoom_open_api_plus.grpc import KiwoomOpenApiPlusService_pb2
+from koapy.backend.kiwoom_open_api_plus.grpc.KiwoomOpenApiPlusServiceClientSideDynamicCallable import (
+    KiwoomOpenApiPlusServiceClientSideDynamicCallable,
+)
+from koapy.backend.kiwoom_open_api_plus.grpc.KiwoomOpenApiPlusServiceClientSideRealDataRehydrator import (
+    KiwoomOpenApiPlusServiceClientSideRealDataRehydrator,
+)
+from koapy.backend.kiwoom_open_api_plus.grpc.KiwoomOpenApiPlusServiceClientStubWrapper import (
+    KiwoomOpenApiPlusServiceClientStubCoreWrapper,
+)
+
+
+class KiwoomOpenApiPlusServiceAsyncClientStubWrapper:
+    """
+    grpc.aio 채널로 생성한 Stub 을 asyncio 환경에서 좀 더 쉽게 사용하기 위한 래퍼 함수들을 제공합니다.
+
+    요청 메시지는 KiwoomOpenApiPlusServiceClientStubCoreWrapper 와 같은 방식으로 생성하며,
+    단건 응답 RPC 들은 await 로 결과를 받고 스트리밍 RPC 들은 async for 로 응답을 받습니다.
+
+    >>> errcode = await stub.LoginCall()
+    >>> async for response in stub.RealCall("0001", ["005930"], [], infer_fids=True):
+    ...     print(response.name)
+    """
+
+    METHOD_NAMES = KiwoomOpenApiPlusDispatchSignature.names()
+
+    def __init__(self, stub):
+        self._stub = stub
+
+    def __getattr__(self, name):
+        if name in self.METHOD_NAMES:
+            return functools.partial(self.Call, name)
+        return getattr(self._stub, name)
+
+    async def Call(self, name, *args):
+        """
+        임의의 함수 호출을 위한 RPC 입니다.
+
+        함수의 이름과 파라미터를 요청 메시지를 통해 전달받아 서버측에서 해당 함수를 호출하고
+        호출결과를 응답 메시지를 통해 전달합니다.
+        """
+        request = (
+            KiwoomOpenApiPlusServiceClientSideDynamicCallable._create_call_request(
+                name, args
+            )
+        )
+        response = await self._stub.Call(request)
+        return KiwoomOpenApiPlusServiceClientSideDynamicCallable._unpack_response(
+            response
+        )
+
+    async def LoginCall(self, credentials=None):
+        """
+        키움증권 서버 연결 시나리오에 해당하는 RPC 입니다.
+
+        CommConnect() 메소드 호출 이후 발생하는 OnEventConnect() 이벤트의 에러코드를 반환합니다.
+        """
+        request = KiwoomOpenApiPlusServiceClientStubCoreWrapper._CreateLoginRequest(
+            credentials
+        )
+        errcode = None
+        async for response in self._stub.LoginCall(request):
+            errcode = response.arguments[0].long_value
+        return errcode
+
+    async def TransactionCall(
+        self,
+        rqname,
+        trcode,
+        scrno,
+        inputs,
+        stop_condition=None,
+        columnar=False,
+        typed_values=False,
+        priority=None,
+    ):
+        """
+        TR 요청에 해당하는 RPC 입니다.
+
+        파라미터는 KiwoomOpenApiPlusServiceClientStubCoreWrapper.TransactionCall() 과 같으며,
+        연속조회를 포함한 모든 응답이 도착하면 응답 목록을 반환합니다.
+        """
+        request = (
+            KiwoomOpenApiPlusServiceClientStubCoreWrapper._CreateTransactionRequest(
+                rqname,
+                trcode,
+                scrno,
+                inputs,
+                stop_condition,
+                columnar,
+                typed_values,
+                priority,
+            )
+        )
+        return [response async for response in self._stub.TransactionCall(request)]
+
+    def RealCall(
+        self,
+        scrno,
+        codes,
+        fids,
+        opt_type=None,
+        infer_fids=False,
+        readable_names=False,
+        fast_parse=False,
+        compact_schema=False,
+        max_batch_size=0,
+        max_linger_ms=0,
+        conflate=False,
+        conflate_interval_ms=0,
+        lossless_realtypes=None,
+        queue_maxsize=0,
+        backpressure_policy=None,
+    ):
+        """
+        실시간 데이터 요청에 해당하는 RPC 입니다.
+
+        파라미터는 KiwoomOpenApiPlusServiceClientStubCoreWrapper.RealCall() 과 같으며,
+        async for 로 틱 단위의 응답을 받을 수 있습니다.
+
+        배치나 compact_schema 를 사용하지 않는 경우 grpc.aio 의 호출 객체를 그대로 반환하며,
+        그 외에는 배치를 풀고 필드 이름을 채워서 반환하는 비동기 제너레이터를 반환합니다.
+        이 경우 제너레이터를 닫으면 RPC 도 함께 취소됩니다.
+        """
+        request = KiwoomOpenApiPlusServiceClientStubCoreWrapper._CreateRealRequest(
+            scrno,
+            codes,
+            fids,
+            opt_type,
+            infer_fids,
+            readable_names,
+            fast_parse,
+            compact_schema,
+            max_batch_size,
+            max_linger_ms,
+            conflate,
+            conflate_interval_ms,
+            lossless_realtypes,
+            queue_maxsize,
+            backpressure_policy,
+        )
+        call = self._stub.RealCall(request)
+        batched = not conflate and (max_batch_size > 0 or max_linger_ms > 0)
+        if not batched and not compact_schema:
+            return call
+        rehydrator = None
+        if compact_schema:
+            rehydrator = KiwoomOpenApiPlusServiceClientSideRealDataRehydrator()
+        return self._IterateRealCallResponses(call, rehydrator)
+
+    async def _IterateRealCallResponses(self, call, rehydrator=None):
+        try:
+            async for response in call:
+                if len(response.events) > 0:
+                    events = response.events
+                else:
+                    events = [response]
+                for event in events:
+                    if rehydrator is not None:
+                        rehydrator.rehydrate(event)
+                    yield event
+        finally:
+            call.cancel()
+
+    def ConditionCall(
+        self,
+        scrno,
+        condition_name,
+        condition_index,
+        search_type,
+        with_info=False,
+        is_future_option=False,
+        request_name=None,
+    ):
+        """
+        조건검색 기능에 해당하는 RPC 입니다.
+
+        파라미터는 KiwoomOpenApiPlusServiceClientStubCoreWrapper.ConditionCall() 과 같으며,
+        async for 로 응답을 받을 수 있는 grpc.aio 의 호출 객체를 반환합니다.
+        """
+        request = KiwoomOpenApiPlusServiceClientStubCoreWrapper._CreateConditionRequest(
+            scrno,
+            condition_name,
+            condition_index,
+            search_type,
+            with_info,
+            is_future_option,
+            request_name,
+        )
+        return self._stub.ConditionCall(request)
+
+    async def SetLogLevel(self, level, logger=""):
+        """
+        서버에 존재하는 특정 로거의 로그레벨을 설정합니다.
+        """
+        request = KiwoomOpenApiPlusService_pb2.SetLogLevelRequest()
+        request.level = level
+        request.logger = logger
+        return await self._stub.SetLogLevel(request)
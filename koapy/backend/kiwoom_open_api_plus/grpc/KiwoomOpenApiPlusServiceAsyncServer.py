@@ -0,0 +1,214 @@
+import asyncio
+import inspect
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+
+import grpc
+
+from koapy.backend.kiwoom_open_api_plus.grpc import KiwoomOpenApiPlusService_pb2_grpc
+from koapy.backend.kiwoom_open_api_plus.grpc.KiwoomOpenApiPlusServiceAsyncServicer import (
+    KiwoomOpenApiPlusServiceAsyncServicer,
+)
+from koapy.backend.kiwoom_open_api_plus.grpc.KiwoomOpenApiPlusServiceChannelOptions import (
+    KiwoomOpenApiPlusServiceChannelOptions,
+)
+from koapy.backend.kiwoom_open_api_plus.grpc.KiwoomOpenApiPlusServiceCompression import (
+    KiwoomOpenApiPlusServiceCompressionAsyncServerInterceptor,
+)
+from koapy.config import config
+from koapy.utils.logging.Logging import Logging
+from koapy.utils.networking import find_free_port_for_host, is_in_private_network
+
+
+class KiwoomOpenApiPlusServiceAsyncServer(Logging):
+    """
+    grpc.aio 기반의 KiwoomOpenApiPlusServiceServer 입니다.
+
+    KiwoomOpenApiPlusServiceServer 와 같은 인터페이스를 제공하지만 서버는 별도 스레드의 이벤트 루프에서 동작합니다.
+    스트리밍 RPC 들은 코루틴으로 처리되므로 동시에 열려있는 스트림의 수가 스레드 풀의 크기에 제한되지 않으며,
+    thread_pool 은 컨트롤 함수 호출과 이벤트 핸들러의 생성/종료 처리에만 사용됩니다.
+    """
+
+    def __init__(
+        self,
+        control,
+        host=None,
+        port=None,
+        credentials=None,
+        thread_pool=None,
+        **kwargs,
+    ):
+        if host is None:
+            host = config.get_string(
+                "koapy.backend.kiwoom_open_api_plus.grpc.host", "localhost"
+            )
+            host = config.get_string(
+                "koapy.backend.kiwoom_open_api_plus.grpc.server.host", host
+            )
+        if port is None:
+            port = config.get_int("koapy.backend.kiwoom_open_api_plus.grpc.port", 0)
+            port = config.get_int(
+                "koapy.backend.kiwoom_open_api_plus.grpc.server.port", port
+            )
+
+        if port == 0:
+            port = find_free_port_for_host(host)
+            self.logger.info(
+                "Using one of the free ports, final address would be %s:%d", host, port
+            )
+
+        self._control = control
+        self._host = host
+        self._port = port
+        self._credentials = credentials
+        self._kwargs = dict(kwargs)
+
+        if thread_pool is None:
+            thread_pool_signature = inspect.signature(ThreadPoolExecutor)
+            thread_pool_params = list(thread_pool_signature.parameters.keys())
+            thread_pool_kwargs = {
+                k: v for k, v in self._kwargs.items() if k in thread_pool_params
+            }
+            thread_pool_bound_arguments = thread_pool_signature.bind(
+                **thread_pool_kwargs
+            )
+            if thread_pool_bound_arguments.arguments.get("max_workers") is None:
+                max_workers = config.get_int(
+                    "koapy.backend.kiwoom_open_api_plus.grpc.server.max_workers", 8
+                )
+                thread_pool_bound_arguments.arguments["max_workers"] = max_workers
+            thread_pool = ThreadPoolExecutor(
+                *thread_pool_bound_arguments.args,
+                **thread_pool_bound_arguments.kwargs,
+            )
+
+        self._thread_pool = thread_pool
+
+        self._servicer = KiwoomOpenApiPlusServiceAsyncServicer(
+            self._control, self._thread_pool
+        )
+        self._address = self._host + ":" + str(self._port)
+
+        grpc_server_signature = inspect.signature(grpc.aio.server)
+        grpc_server_params = list(grpc_server_signature.parameters.keys())
+        grpc_server_kwargs = {
+            k: v for k, v in self._kwargs.items() if k in grpc_server_params
+        }
+        grpc_server_bound_arguments = grpc_server_signature.bind_partial(
+            **grpc_server_kwargs
+        )
+
+        # 설정 파일의 채널 옵션과 압축 방식 적용
+        channel_options = KiwoomOpenApiPlusServiceChannelOptions("server")
+        channel_options.update_arguments(grpc_server_bound_arguments.arguments)
+        compression_by_method = channel_options.compression_by_method()
+        if compression_by_method:
+            interceptors = grpc_server_bound_arguments.arguments.get("interceptors")
+            interceptors = list(interceptors or [])
+            interceptors.append(
+                KiwoomOpenApiPlusServiceCompressionAsyncServerInterceptor(
+                    compression_by_method
+                )
+            )
+            grpc_server_bound_arguments.arguments["interceptors"] = interceptors
+
+        self._grpc_server_bound_arguments = grpc_server_bound_arguments
+
+        self._loop = None
+        self._thread = None
+        self._server = None
+        self._terminated = threading.Event()
+        self._terminated.set()
+
+    def _create_server(self):
+        server = grpc.aio.server(
+            *self._grpc_server_bound_arguments.args,
+            **self._grpc_server_bound_arguments.kwargs,
+        )
+
+        KiwoomOpenApiPlusService_pb2_grpc.add_KiwoomOpenApiPlusServiceServicer_to_server(
+            self._servicer, server
+        )
+
+        if self._credentials is None:
+            if not is_in_private_network(self._host):
+                self.logger.warning(
+                    "Adding insecure port %s to server, but the address is not private.",
+                    self._address,
+                )
+            server.add_insecure_port(self._address)
+        else:
+            server.add_secure_port(self._address, self._credentials)
+
+        return server
+
+    async def _start_server(self):
+        self._server = self._create_server()
+        await self._server.start()
+
+    def _run_loop(self, loop):
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_forever()
+        finally:
+            loop.close()
+            self._servicer.close()
+            self._terminated.set()
+
+    def _run_coroutine(self, coroutine):
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+    def get_host(self):
+        return self._host
+
+    def get_port(self):
+        return self._port
+
+    def get_loop(self):
+        return self._loop
+
+    def start(self):
+        if self.is_running():
+            return
+        self._terminated.clear()
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._run_loop, args=(self._loop,), daemon=True
+        )
+        self._thread.start()
+        try:
+            self._run_coroutine(self._start_server())
+        except Exception:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            raise
+        self._servicer.start()
+
+    def wait_for_termination(self, timeout=None):
+        return not self._terminated.wait(timeout)
+
+    def is_running(self):
+        return not self._terminated.is_set()
+
+    def stop(self, grace=None):
+        if not self.is_running():
+            return self._terminated
+        loop = self._loop
+        if self._thread is not threading.current_thread():
+            self._run_coroutine(self._server.stop(grace))
+            loop.call_soon_threadsafe(loop.stop)
+        else:
+            task = loop.create_task(self._server.stop(grace))
+            task.add_done_callback(lambda _task: loop.stop())
+        return self._terminated
+
+    def __getattr__(self, name):
+        return getattr(self._server, name)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+        self.wait_for_termination()
@@ -0,0 +1,254 @@
+import asyncio
+import contextlib
+import functools
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+from queue import Queue
+
+from koapy.backend.kiwoom_open_api_plus.grpc import KiwoomOpenApiPlusService_pb2
+from koapy.backend.kiwoom_open_api_plus.grpc.KiwoomOpenApiPlusServiceMessageUtils import (
+    convert_arguments_from_protobuf_to_python,
+)
+from koapy.backend.kiwoom_open_api_plus.grpc.KiwoomOpenApiPlusServiceServicer import (
+    KiwoomOpenApiPlusServiceServicer,
+)
+from koapy.config import config
+
+
+class KiwoomOpenApiPlusServiceAsyncContext:
+    """
+    grpc.aio 의 ServicerContext 를 기존 이벤트 핸들러들이 사용하는 동기 ServicerContext 처럼 감싸줍니다.
+
+    이벤트 핸들러들은 이벤트 루프가 아닌 스레드에서 생성되고 종료되므로
+    컨텍스트의 상태를 바꾸는 호출은 이벤트 루프로 넘겨서 처리합니다.
+    이벤트 루프 스레드에서 생성해야 합니다.
+    """
+
+    def __init__(self, context):
+        self._context = context
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread = threading.current_thread()
+
+    def _call_in_loop(self, function, *args):
+        if threading.current_thread() is self._loop_thread:
+            function(*args)
+        else:
+            self._loop.call_soon_threadsafe(function, *args)
+
+    def add_callback(self, callback):
+        self._call_in_loop(self._context.add_done_callback, lambda _context: callback())
+        return True
+
+    def set_trailing_metadata(self, trailing_metadata):
+        self._call_in_loop(self._context.set_trailing_metadata, trailing_metadata)
+
+    def __getattr__(self, name):
+        return getattr(self._context, name)
+
+
+class KiwoomOpenApiPlusServiceAsyncRequestIterator:
+    """
+    grpc.aio 의 요청 스트림을 기존 이벤트 핸들러들이 사용하는 동기 이터레이터로 바꿔줍니다.
+
+    요청은 이벤트 루프에서 읽어서 큐에 넣어두며, 이벤트 핸들러는 다른 스레드에서 큐를 읽습니다.
+    요청 스트림이 끝나거나 RPC 가 종료되면 StopIteration 으로 끝납니다.
+    """
+
+    def __init__(self, request_iterator):
+        self._queue = Queue()
+        self._sentinel = object()
+        self._task = asyncio.get_running_loop().create_task(
+            self._consume(request_iterator)
+        )
+
+    async def _consume(self, request_iterator):
+        try:
+            async for request in request_iterator:
+                self._queue.put(request)
+        finally:
+            self._queue.put(self._sentinel)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        request = self._queue.get()
+        if request is self._sentinel:
+            # 이후에 다시 읽는 경우에도 계속 종료되도록 함
+            self._queue.put(self._sentinel)
+            raise StopIteration
+        return request
+
+    def cancel(self):
+        self._task.cancel()
+
+
+class KiwoomOpenApiPlusServiceAsyncServicer(KiwoomOpenApiPlusServiceServicer):
+    """
+    grpc.aio 서버를 위한 KiwoomOpenApiPlusService RPC 의 구현체 입니다.
+
+    각 RPC 는 KiwoomOpenApiPlusServiceServicer 와 같은 이벤트 핸들러를 사용하지만,
+    스트리밍 RPC 가 응답을 기다리는 동안 스레드를 점유하지 않고 이벤트 루프에서 코루틴으로 기다립니다.
+    이벤트 핸들러가 전달하는 응답은 옵저버의 큐에 쌓이고, 큐에 값이 들어오면 이벤트 루프를 깨워서 전달합니다.
+
+    컨트롤 함수 호출과 이벤트 핸들러의 생성, 시작, 종료는 컨트롤을 통해 Qt 스레드와 통신하면서 블로킹될 수 있으므로
+    별도의 스레드 풀에서 처리합니다. 따라서 스레드 풀의 크기는 동시에 열려있는 스트림의 수가 아니라
+    동시에 처리중인 호출의 수만 제한하게 됩니다.
+    """
+
+    def __init__(self, control, executor=None):
+        super().__init__(control)
+
+        if executor is None:
+            max_workers = config.get_int(
+                "koapy.backend.kiwoom_open_api_plus.grpc.server.max_workers", 8
+            )
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+
+        self._executor = executor
+
+    @property
+    def executor(self):
+        return self._executor
+
+    async def _RunInExecutor(self, function, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(function, *args)
+        )
+
+    @contextlib.asynccontextmanager
+    async def _Entered(self, handler):
+        await self._RunInExecutor(handler.__enter__)
+        exc_info = (None, None, None)
+        try:
+            yield handler
+        except Exception as e:
+            exc_info = (type(e), e, e.__traceback__)
+            raise
+        finally:
+            await self._RunInExecutor(handler.__exit__, *exc_info)
+
+    async def _Serve(self, create_handler, request, context):
+        context = KiwoomOpenApiPlusServiceAsyncContext(context)
+        handler = await self._RunInExecutor(create_handler, request, context)
+        async with self._Entered(handler):
+            async for response in handler.observer:
+                yield response
+
+    async def _ServeBidirectional(self, create_handler, request_iterator, context):
+        request_iterator = KiwoomOpenApiPlusServiceAsyncRequestIterator(
+            request_iterator
+        )
+        try:
+            async for response in self._Serve(
+                create_handler, request_iterator, context
+            ):
+                yield response
+        finally:
+            request_iterator.cancel()
+
+    # 1. rpcs for general function calls
+
+    async def Call(self, request, context):
+        return await self._RunInExecutor(super().Call, request, context)
+
+    async def BatchCall(self, request, context):
+        return await self._RunInExecutor(super().BatchCall, request, context)
+
+    async def MasterSnapshotCall(self, request, context):
+        return await self._RunInExecutor(super().MasterSnapshotCall, request, context)
+
+    # 2. rpcs for listening and handling events
+
+    async def Listen(self, request, context):
+        async for response in self._Serve(self._CreateListenHandler, request, context):
+            yield response
+
+    async def BidirectionalListen(self, request_iterator, context):
+        async for response in self._ServeBidirectional(
+            self._CreateBidirectionalListenHandler, request_iterator, context
+        ):
+            yield response
+
+    # 3. rpcs for simple use cases that can be categorized into serveral distinct usage patterns
+
+    async def LoginCall(self, request, context):
+        async for response in self._Serve(
+            self._CreateLoginCallHandler, request, context
+        ):
+            yield response
+
+    async def TransactionCall(self, request, context):
+        async for response in self._Serve(
+            self._CreateTransactionCallHandler, request, context
+        ):
+            yield response
+
+    async def OrderCall(self, request, context):
+        async for response in self._Serve(
+            self._CreateOrderCallHandler, request, context
+        ):
+            yield response
+
+    async def RealCall(self, request, context):
+        async for response in self._Serve(
+            self._CreateRealCallHandler, request, context
+        ):
+            yield response
+
+    async def LoadConditionCall(self, request, context):
+        async for response in self._Serve(
+            self._CreateLoadConditionCallHandler, request, context
+        ):
+            yield response
+
+    async def ConditionCall(self, request, context):
+        async for response in self._Serve(
+            self._CreateConditionCallHandler, request, context
+        ):
+            yield response
+
+    # 4. rpcs for more complex use cases based on the previously categorized simple cases above
+
+    async def BidirectionalRealCall(self, request_iterator, context):
+        async for response in self._ServeBidirectional(
+            self._CreateBidirectionalRealCallHandler, request_iterator, context
+        ):
+            yield response
+
+    async def OrderListen(self, request, context):
+        async for response in self._Serve(
+            self._CreateOrderListenHandler, request, context
+        ):
+            yield response
+
+    # 5. rpcs for customized usage scenario (when there is no proper predefined interface to utilize)
+
+    async def CustomListen(self, request, context):
+        async for response in self._Serve(
+            self._CreateCustomListenHandler, request, context
+        ):
+            yield response
+
+    async def CustomCallAndListen(self, request, context):
+        context = KiwoomOpenApiPlusServiceAsyncContext(context)
+        name = request.name
+        arguments = convert_arguments_from_protobuf_to_python(request.arguments)
+        function = getattr(self.control, name)
+        handler = await self._RunInExecutor(
+            self._CreateCustomCallAndListenHandler, request, context
+        )
+        async with self._Entered(handler):
+            result = await self._RunInExecutor(function, *arguments)
+            yield self._MakeCallAndListenResponse(result)
+            async for listen_response in handler.observer:
+                response = KiwoomOpenApiPlusService_pb2.CallAndListenResponse()
+                response.listen_response.CopyFrom(listen_response)
+                yield response
+
+    # 6. rpcs for other mics scenarios
+
+    async def SetLogLevel(self, request, context):
+        return super().SetLogLevel(request, context)
@@ -0,0 +1,105 @@
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import grpc
+
+from koapy.config import config
+
+
+class KiwoomOpenApiPlusServiceChannelOptions:
+    """
+    설정 파일의 koapy.backend.kiwoom_open_api_plus.grpc.(server|client).channel 항목으로부터
+    grpc 서버/채널 생성시 넘겨줄 options 와 compression 값을 만들어줍니다.
+
+    설정값이 null 인 항목은 grpc 기본값을 그대로 사용하며, 별도로 이름이 정해지지 않은 grpc 채널 인자는
+    channel.options 아래에 grpc 인자 이름 그대로 (예를 들어 grpc.http2.max_frame_size = 16384) 지정할 수 있습니다.
+    compression_by_method 에는 RPC 이름별로 채널 기본값 대신 사용할 압축 방식을 지정할 수 있습니다.
+    """
+
+    CHANNEL_ARGUMENTS = {
+        "max_send_message_length": "grpc.max_send_message_length",
+        "max_receive_message_length": "grpc.max_receive_message_length",
+        "keepalive.time_ms": "grpc.keepalive_time_ms",
+        "keepalive.timeout_ms": "grpc.keepalive_timeout_ms",
+        "keepalive.permit_without_calls": "grpc.keepalive_permit_without_calls",
+        "keepalive.max_pings_without_data": "grpc.http2.max_pings_without_data",
+        "keepalive.min_ping_interval_ms": "grpc.http2.min_ping_interval_without_data_ms",
+        "http2.bdp_probe": "grpc.http2.bdp_probe",
+        "http2.lookahead_bytes": "grpc.http2.lookahead_bytes",
+        "http2.max_frame_size": "grpc.http2.max_frame_size",
+        "http2.write_buffer_size": "grpc.http2.write_buffer_size",
+    }
+
+    COMPRESSIONS = {
+        "none": grpc.Compression.NoCompression,
+        "deflate": grpc.Compression.Deflate,
+        "gzip": grpc.Compression.Gzip,
+    }
+
+    def __init__(self, side: str):
+        self._prefix = "koapy.backend.kiwoom_open_api_plus.grpc.%s.channel" % side
+
+    @classmethod
+    def get_compression(
+        cls, compression: Union[None, str, grpc.Compression]
+    ) -> Optional[grpc.Compression]:
+        if compression is None or isinstance(compression, grpc.Compression):
+            return compression
+        return cls.COMPRESSIONS[compression.lower()]
+
+    def compression(self) -> Optional[grpc.Compression]:
+        return self.get_compression(config.get(self._prefix + ".compression", None))
+
+    def compression_by_method(self) -> Dict[str, grpc.Compression]:
+        compression_by_method = (
+            config.get(self._prefix + ".compression_by_method", None) or {}
+        )
+        return {
+            method: self.get_compression(compression)
+            for method, compression in compression_by_method.items()
+            if compression is not None
+        }
+
+    @classmethod
+    def _flatten(cls, options, prefix=""):
+        # 따옴표 없이 적은 grpc 인자 이름은 점을 기준으로 중첩된 항목으로 읽히므로 다시 합쳐줌
+        for key, value in options.items():
+            if isinstance(value, dict):
+                yield from cls._flatten(value, prefix + key + ".")
+            else:
+                yield prefix + key, value
+
+    def options(self, options=None) -> List[Tuple[str, Any]]:
+        """
+        설정 파일의 채널 인자 목록에 주어진 options 를 덮어써서 반환합니다.
+        """
+        merged = {}
+        for key, argument in self.CHANNEL_ARGUMENTS.items():
+            value = config.get(self._prefix + "." + key, None)
+            if value is not None:
+                merged[argument] = value
+        extra_options = config.get(self._prefix + ".options", None) or {}
+        for argument, value in self._flatten(extra_options):
+            if value is not None:
+                merged[argument] = value
+        if options is not None:
+            merged.update(dict(options))
+        return [
+            (argument, int(value) if isinstance(value, bool) else value)
+            for argument, value in merged.items()
+        ]
+
+    def update_arguments(self, arguments):
+        """
+        grpc 서버/채널 생성 함수의 BoundArguments.arguments 에 설정값들을 채워넣습니다.
+
+        직접 넘겨받은 compression 은 그대로 두며, options 는 설정값 위에 덮어씁니다.
+        """
+        options = self.options(arguments.get("options"))
+        if options:
+            arguments["options"] = options
+        compression = self.get_compression(arguments.get("compression"))
+        if compression is None:
+            compression = self.compression()
+        if compression is not None:
+            arguments["compression"] = compression
+        return arguments
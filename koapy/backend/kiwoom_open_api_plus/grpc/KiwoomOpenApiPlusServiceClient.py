@@ -5,9 +5,15 @@ from concurrent.futures import ThreadPoolExecutor
 import grpc
 
 from koapy.backend.kiwoom_open_api_plus.grpc import KiwoomOpenApiPlusService_pb2_grpc
+from koapy.backend.kiwoom_open_api_plus.grpc.KiwoomOpenApiPlusServiceChannelOptions import (
+    KiwoomOpenApiPlusServiceChannelOptions,
+)
 from koapy.backend.kiwoom_open_api_plus.grpc.KiwoomOpenApiPlusServiceClientStubWrapper import (
     KiwoomOpenApiPlusServiceClientStubWrapper,
 )
+from koapy.backend.kiwoom_open_api_plus.grpc.KiwoomOpenApiPlusServiceCompression import (
+    KiwoomOpenApiPlusServiceClientSideCompressedStub,
+)
 from koapy.config import config
 
 
@@ -48,6 +54,9 @@ class KiwoomOpenApiPlusServiceClient:
 
         self._target = self._host + ":" + str(self._port)
 
+        # 설정 파일의 채널 옵션과 압축 방식 적용
+        channel_options = KiwoomOpenApiPlusServiceChannelOptions("client")
+
         if self._credentials is None:
             channel_signature = inspect.signature(grpc.insecure_channel)
             channel_params = list(channel_signature.parameters.keys())
@@ -56,6 +65,7 @@ class KiwoomOpenApiPlusServiceClient:
             }
             channel_bound_arguments = channel_signature.bind_partial(**channel_kwargs)
             channel_bound_arguments.arguments["target"] = self._target
+            channel_options.update_arguments(channel_bound_arguments.arguments)
             self._channel = grpc.insecure_channel(
                 *channel_bound_arguments.args,
                 **channel_bound_arguments.kwargs,
@@ -68,6 +78,7 @@ class KiwoomOpenApiPlusServiceClient:
             }
             channel_bound_arguments = channel_signature.bind_partial(**channel_kwargs)
             channel_bound_arguments.arguments["target"] = self._target
+            channel_options.update_arguments(channel_bound_arguments.arguments)
             channel_bound_arguments.arguments["credentials"] = self._credentials
             self._channel = grpc.secure_channel(
                 *channel_bound_arguments.args,
@@ -97,6 +108,11 @@ class KiwoomOpenApiPlusServiceClient:
         self._stub = KiwoomOpenApiPlusService_pb2_grpc.KiwoomOpenApiPlusServiceStub(
             self._channel
         )
+        compression_by_method = channel_options.compression_by_method()
+        if compression_by_method:
+            self._stub = KiwoomOpenApiPlusServiceClientSideCompressedStub(
+                self._stub, compression_by_method
+            )
         self._stub_wrapped = KiwoomOpenApiPlusServiceClientStubWrapper(
             self._stub, self._thread_pool
         )
@@ -0,0 +1,100 @@
+import threading
+
+from concurrent.futures import Future
+
+from koapy.backend.kiwoom_open_api_plus.grpc import KiwoomOpenApiPlusService_pb2
+from koapy.backend.kiwoom_open_api_plus.grpc.KiwoomOpenApiPlusServiceClientSideDynamicCallable import (
+    KiwoomOpenApiPlusServiceClientSideDynamicCallable,
+)
+
+
+class KiwoomOpenApiPlusServiceClientSideBatchResult(Future):
+    """
+    배치 안에서 호출된 함수의 결과 입니다.
+
+    결과를 요청하는 시점에 아직 서버로 전송되지 않은 호출들이 남아있다면 먼저 모아서 전송합니다.
+    """
+
+    def __init__(self, batch):
+        super().__init__()
+        self._batch = batch
+
+    def result(self, timeout=None):
+        if not self.done():
+            self._batch.flush()
+        return super().result(timeout)
+
+
+class KiwoomOpenApiPlusServiceClientSideBatch:
+    """
+    여러번의 함수 호출을 모아두었다가 한번의 BatchCall() RPC 로 전송합니다.
+
+    배치 안에서의 함수 호출은 결과 대신 KiwoomOpenApiPlusServiceClientSideBatchResult 를 반환하며
+    모인 호출들은 배치가 끝나거나, 어느 결과를 요청하거나, max_batch_size 만큼 쌓였을때 전송됩니다.
+    """
+
+    def __init__(self, stub, max_batch_size=None):
+        self._stub = stub
+        self._max_batch_size = max_batch_size
+
+        self._lock = threading.RLock()
+        self._requests = []
+        self._results = []
+
+    def submit(self, name, args):
+        request = (
+            KiwoomOpenApiPlusServiceClientSideDynamicCallable._create_call_request(
+                name, args
+            )
+        )
+        result = KiwoomOpenApiPlusServiceClientSideBatchResult(self)
+        with self._lock:
+            self._requests.append(request)
+            self._results.append(result)
+            should_flush = (
+                self._max_batch_size is not None
+                and len(self._requests) >= self._max_batch_size
+            )
+        if should_flush:
+            self.flush()
+        return result
+
+    def flush(self):
+        with self._lock:
+            requests = self._requests
+            results = self._results
+            self._requests = []
+            self._results = []
+            if not requests:
+                return
+            request = KiwoomOpenApiPlusService_pb2.BatchCallRequest()
+            request.calls.extend(requests)
+            try:
+                response = self._stub.BatchCall(request)
+            except Exception as e:  # pylint: disable=broad-except
+                for result in results:
+                    result.set_exception(e)
+                raise
+            for result, call_response in zip(results, response.responses):
+                result.set_result(
+                    KiwoomOpenApiPlusServiceClientSideDynamicCallable._unpack_response(
+                        call_response
+                    )
+                )
+
+    def cancel(self):
+        with self._lock:
+            results = self._results
+            self._requests = []
+            self._results = []
+        for result in results:
+            result.cancel()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.flush()
+        else:
+            self.cancel()
@@ -5,9 +5,10 @@ from koapy.backend.kiwoom_open_api_plus.grpc.KiwoomOpenApiPlusServiceMessageUtil
 
 
 class KiwoomOpenApiPlusServiceClientSideDynamicCallable:
-    def __init__(self, stub, name):
+    def __init__(self, stub, name, get_batch=None):
         self._stub = stub
         self._name = name
+        self._get_batch = get_batch
 
     @classmethod
     def _create_call_request(cls, name, args):
@@ -28,6 +29,10 @@ class KiwoomOpenApiPlusServiceClientSideDynamicCallable:
             return None
 
     def __call__(self, *args):
+        if self._get_batch is not None:
+            batch = self._get_batch()
+            if batch is not None:
+                return batch.submit(self._name, args)
         request = self._create_call_request(self._name, args)
         response = self._stub.Call(request)
         result = self._unpack_response(response)
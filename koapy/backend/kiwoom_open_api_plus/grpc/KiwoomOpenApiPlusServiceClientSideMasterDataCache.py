@@ -0,0 +1,95 @@
+import datetime
+import threading
+
+from concurrent.futures import Future
+
+import pytz
+
+from koapy.backend.kiwoom_open_api_plus.grpc import KiwoomOpenApiPlusService_pb2
+from koapy.backend.kiwoom_open_api_plus.grpc.KiwoomOpenApiPlusServiceMessageUtils import (
+    MASTER_SNAPSHOT_FUNCTION_NAMES,
+    convert_master_snapshot_from_protobuf_to_python,
+)
+from koapy.utils.logging.Logging import Logging
+
+
+class KiwoomOpenApiPlusServiceClientSideMasterDataCache(Logging):
+    """
+    MasterSnapshotCall() RPC 로 받아온 종목 마스터 데이터를 거래일 단위로 메모리에 캐싱합니다.
+
+    거래일이 바뀐 이후 처음 조회하는 시점에 서버로부터 전체 데이터를 다시 받아옵니다.
+    """
+
+    FUNCTION_NAMES = MASTER_SNAPSHOT_FUNCTION_NAMES
+
+    def __init__(self, stub):
+        self._stub = stub
+        self._lock = threading.Lock()
+        self._session = None
+        self._code_lists = {}
+        self._values = {}
+
+    @classmethod
+    def get_session(cls, now=None):
+        if now is None:
+            now = datetime.datetime.now(pytz.timezone("Asia/Seoul"))
+        return now.strftime("%Y%m%d")
+
+    def _ensure_loaded(self):
+        session = self.get_session()
+        with self._lock:
+            if self._session == session:
+                return
+            self.logger.debug("Loading master data snapshot for session %s", session)
+            request = KiwoomOpenApiPlusService_pb2.MasterSnapshotRequest()
+            response = self._stub.MasterSnapshotCall(request)
+            code_lists, values = convert_master_snapshot_from_protobuf_to_python(
+                response
+            )
+            self._code_lists = code_lists
+            self._values = values
+            # 서버가 아직 접속되지 않은 상태에서 받은 빈 데이터는 캐싱하지 않음
+            if any(code_lists.values()):
+                self._session = session
+
+    def invalidate(self):
+        with self._lock:
+            self._session = None
+
+    def get_code_list_by_market(self, market):
+        self._ensure_loaded()
+        return self._code_lists.get(market)
+
+    def get(self, name, code):
+        self._ensure_loaded()
+        return self._values.get(name, {}).get(code)
+
+
+class KiwoomOpenApiPlusServiceClientSideMasterDataCallable:
+    """
+    캐시에 값이 있으면 캐시에서, 없으면 fallback 을 통해 서버에서 값을 가져오는 함수 입니다.
+    """
+
+    def __init__(self, cache, name, fallback, get_batch=None):
+        self._cache = cache
+        self._name = name
+        self._fallback = fallback
+        self._get_batch = get_batch
+
+    def _get(self, arg):
+        if self._name == "GetCodeListByMarket":
+            return self._cache.get_code_list_by_market(arg)
+        return self._cache.get(self._name, arg)
+
+    def __call__(self, *args):
+        if len(args) != 1 or not isinstance(args[0], str):
+            return self._fallback(*args)
+        result = self._get(args[0])
+        if result is None:
+            return self._fallback(*args)
+        # 배치 안에서의 호출은 다른 호출들과 동일하게 Future 형태로 반환
+        if self._get_batch is not None and self._get_batch() is not None:
+            future = Future()
+            future.set_result(result)
+            return future
+        return result
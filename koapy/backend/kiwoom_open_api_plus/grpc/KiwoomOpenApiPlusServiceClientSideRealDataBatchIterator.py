@@ -0,0 +1,67 @@
+from collections import deque
+
+from koapy.backend.kiwoom_open_api_plus.grpc.KiwoomOpenApiPlusServiceClientSideRealDataDecoder import (
+    KiwoomOpenApiPlusServiceClientSideRealDataDecoder,
+)
+
+
+class KiwoomOpenApiPlusServiceClientSideRealDataBatchIterator:
+    """
+    배치로 묶여서 전달되는 실시간 데이터 응답 스트림을 감싸는 이터레이터 입니다.
+
+    기본적으로는 기존과 동일하게 틱 단위의 응답을 하나씩 반환하며,
+    batches() 를 사용하면 서버에서 묶어 보낸 단위 그대로 응답 목록을 받아볼 수 있습니다.
+    배치로 묶이지 않은 응답은 하나짜리 배치로 취급합니다.
+
+    compact_schema 모드를 함께 사용하는 경우 rehydrator 를 넘겨주면 각 응답의 필드 이름을 채워줍니다.
+    decoded_batches() 를 사용하면 배치 단위로 필드별 NumPy 배열로 변환된 결과를 받아볼 수 있습니다.
+    cancel() 등 나머지 속성들은 감싸고 있는 스트림의 것을 그대로 사용합니다.
+    """
+
+    def __init__(self, responses, rehydrator=None):
+        self._responses = responses
+        self._rehydrator = rehydrator
+        self._pending = deque()
+
+    @property
+    def rehydrator(self):
+        return self._rehydrator
+
+    def next_batch(self):
+        if self._pending:
+            events = list(self._pending)
+            self._pending.clear()
+            return events
+        response = next(self._responses)
+        if len(response.events) > 0:
+            events = list(response.events)
+        else:
+            events = [response]
+        if self._rehydrator is not None:
+            for event in events:
+                self._rehydrator.rehydrate(event)
+        return events
+
+    def batches(self):
+        while True:
+            try:
+                yield self.next_batch()
+            except StopIteration:
+                return
+
+    def decoded_batches(self, decoder=None):
+        if decoder is None:
+            decoder = KiwoomOpenApiPlusServiceClientSideRealDataDecoder()
+        for events in self.batches():
+            yield decoder.decode(events)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        while not self._pending:
+            self._pending.extend(self.next_batch())
+        return self._pending.popleft()
+
+    def __getattr__(self, name):
+        return getattr(self._responses, name)
@@ -0,0 +1,112 @@
+from operator import itemgetter
+from typing import Callable, Dict, Iterable, Mapping, Optional, Tuple
+
+import numpy as np
+
+from koapy.backend.kiwoom_open_api_plus.core.KiwoomOpenApiPlusRealType import (
+    KiwoomOpenApiPlusRealType,
+)
+
+
+class KiwoomOpenApiPlusServiceClientSideRealDataDecoder:
+    """
+    실시간 데이터 응답 목록을 필드별 NumPy 배열로 한번에 변환합니다.
+
+    응답마다 abs(float(...)) 등으로 값을 하나씩 변환하는 대신, 응답들을 한번 훑으면서
+    필요한 필드의 문자열만 모아둔 뒤 하나의 배열로 만들어 필드별로 한번에 변환합니다.
+    배치 이터레이터의 batches() 와 함께 사용하는 것을 가정합니다.
+
+    fields 는 {출력 이름: (fid, 변환 방식)} 형태이며 변환 방식은 다음 중 하나입니다.
+
+        - abs: 부호 (등락 구분) 를 제거한 실수
+        - signed: 부호를 유지한 실수
+        - time: HHMMSS 형태의 시간을 자정부터의 초 단위 정수로 변환
+
+    필드 이름은 fid 문자열이나 readable_names 로 받은 이름 모두 지원하며,
+    요청한 필드 중 하나라도 없는 응답 (다른 실시간 타입 등) 은 건너뜁니다.
+    빈 값은 실수 필드에서 nan 으로, 시간 필드에서 MISSING_TIME (-1) 으로 변환됩니다.
+
+    필드 위치는 실시간 타입 (compact_schema 모드에서는 schema_id) 별로 기억하므로 스트림마다 별도의 객체를 사용해야 합니다.
+    """
+
+    ABS = "abs"
+    SIGNED = "signed"
+    TIME = "time"
+
+    MISSING_TIME = -1
+
+    default_fields = {
+        "time": (20, TIME),
+        "price": (10, ABS),
+        "volume": (15, ABS),
+    }
+
+    def __init__(self, fields: Optional[Mapping[str, Tuple[int, str]]] = None):
+        if fields is None:
+            fields = self.default_fields
+        self._fields = dict(fields)
+        for output_name, (_fid, kind) in self._fields.items():
+            if kind not in (self.ABS, self.SIGNED, self.TIME):
+                raise ValueError(
+                    "Unexpected kind %r for field %s" % (kind, output_name)
+                )
+        self._output_names = list(self._fields.keys())
+        self._lookup_names = []
+        for fid, _kind in self._fields.values():
+            name = KiwoomOpenApiPlusRealType.Fid.get_name_by_fid(fid, str(fid))
+            self._lookup_names.append((str(fid), name))
+        self._getter_by_key: Dict[object, Optional[Callable]] = {}
+
+    def _get_getter(self, names) -> Optional[Callable]:
+        index_by_name = {name: i for i, name in enumerate(names)}
+        indices = []
+        for fid_name, readable_name in self._lookup_names:
+            i = index_by_name.get(fid_name)
+            if i is None:
+                i = index_by_name.get(readable_name)
+            if i is None:
+                return None
+            indices.append(i)
+        if len(indices) == 1:
+            i = indices[0]
+            return lambda values: (values[i],)
+        return itemgetter(*indices)
+
+    def _convert(self, kind, values):
+        if kind == self.TIME:
+            is_missing = values == ""
+            hhmmss = np.where(is_missing, "0", values).astype(np.int64)
+            seconds = (
+                (hhmmss // 10000) * 3600 + (hhmmss // 100 % 100) * 60 + hhmmss % 100
+            )
+            seconds[is_missing] = self.MISSING_TIME
+            return seconds
+        values = np.where(values == "", "nan", values).astype(np.float64)
+        if kind == self.ABS:
+            np.abs(values, out=values)
+        return values
+
+    def decode(self, responses: Iterable) -> Dict[str, np.ndarray]:
+        codes = []
+        rows = []
+        getter_by_key = self._getter_by_key
+
+        for response in responses:
+            arguments = response.arguments
+            single_data = response.single_data
+            key = response.schema_id or arguments[1].string_value
+            try:
+                getter = getter_by_key[key]
+            except KeyError:
+                getter = self._get_getter(single_data.names)
+                getter_by_key[key] = getter
+            if getter is None:
+                continue
+            codes.append(arguments[0].string_value)
+            rows.append(getter(single_data.values))
+
+        result = {"code": np.asarray(codes, dtype=str)}
+        table = np.asarray(rows, dtype=str).reshape(len(rows), len(self._fields))
+        for j, (output_name, (_fid, kind)) in enumerate(self._fields.items()):
+            result[output_name] = self._convert(kind, table[:, j])
+        return result
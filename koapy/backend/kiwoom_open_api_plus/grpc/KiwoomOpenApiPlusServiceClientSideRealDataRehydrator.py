@@ -0,0 +1,49 @@
+class KiwoomOpenApiPlusServiceClientSideRealDataRehydrator:
+    """
+    compact_schema 모드로 전달받은 실시간 데이터 응답에 필드 이름을 다시 채워줍니다.
+
+    스키마 메시지는 스트림마다 (실시간 타입, fid 목록) 별로 한번씩만 전달되므로
+    하나의 스트림에 대해 하나의 객체를 사용해야 합니다.
+    """
+
+    def __init__(self):
+        self._schemas = {}
+
+    def get_schema(self, schema_id):
+        return self._schemas.get(schema_id)
+
+    def rehydrate(self, response):
+        if response.HasField("real_data_schema"):
+            schema = response.real_data_schema
+            self._schemas[schema.schema_id] = schema
+        if response.schema_id and not response.single_data.names:
+            schema = self._schemas[response.schema_id]
+            response.single_data.names.extend(schema.names)
+        return response
+
+
+class KiwoomOpenApiPlusServiceClientSideRehydratingIterator:
+    """
+    응답 스트림을 감싸서 각 응답을 꺼내는 시점에 필드 이름을 채워서 반환합니다.
+
+    cancel() 등 나머지 속성들은 감싸고 있는 스트림의 것을 그대로 사용합니다.
+    """
+
+    def __init__(self, responses, rehydrator=None):
+        if rehydrator is None:
+            rehydrator = KiwoomOpenApiPlusServiceClientSideRealDataRehydrator()
+        self._responses = responses
+        self._rehydrator = rehydrator
+
+    @property
+    def rehydrator(self):
+        return self._rehydrator
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return self._rehydrator.rehydrate(next(self._responses))
+
+    def __getattr__(self, name):
+        return getattr(self._responses, name)
@@ -12,10 +12,28 @@ from koapy.backend.kiwoom_open_api_plus.utils.queue.QueueBasedIterableObserver i
 
 
 class KiwoomOpenApiPlusServiceClientSideSignalConnector:
-    def __init__(self, stub, name, executor):
+    """
+    BidirectionalListen RPC 를 통해 서버측 이벤트를 클라이언트측 콜백 함수에 연결합니다.
+
+    window 가 0 인 경우 이벤트마다 콜백 함수 처리가 끝난 뒤 ACK 를 보내며, 서버측 이벤트 핸들러는
+    ACK 를 받을 때까지 대기합니다. 따라서 콜백 함수 내에서 GetCommRealData() 등을 호출하더라도
+    해당 이벤트 시점의 값을 읽을 수 있지만, 이벤트 하나마다 네트워크 왕복 시간만큼 소요됩니다.
+
+    window 가 0 보다 큰 경우 서버는 처리 완료를 기다리지 않고 최대 window 개의 이벤트를 미리 보내며,
+    클라이언트는 window 의 절반씩 처리할 때마다 그만큼의 크레딧을 다시 부여합니다.
+    이 경우 콜백 함수가 호출되는 시점에는 서버측 이벤트 핸들러가 이미 끝나 있을 수 있으므로
+    이벤트 인자만 사용하는 콜백에 적합합니다.
+
+    multiplexer 가 주어진 경우 콜백마다 스트림을 열지 않고 multiplexer 의 단일 스트림을 공유합니다.
+    이 경우 window 는 multiplexer 의 설정을 따릅니다.
+    """
+
+    def __init__(self, stub, name, executor, window=0, multiplexer=None):
         self._stub = stub
         self._name = name
         self._executor = executor
+        self._window = window
+        self._multiplexer = multiplexer
         self._lock = threading.RLock()
         self._observers = {}
 
@@ -54,25 +72,44 @@ class KiwoomOpenApiPlusServiceClientSideSignalConnector:
                 for _callback, observer in observers.items():
                     self._stop_observer(observer)
 
-    def connect(self, callback):
+    def connect(self, callback, window=None):
+        if self._multiplexer is not None and window is None:
+            self._multiplexer.connect(self._name, callback)
+            return
+
+        if window is None:
+            window = self._window
+
         with self._lock:
             observer = self._add_observer(callback)
 
             def fn():
                 request = KiwoomOpenApiPlusService_pb2.BidirectionalListenRequest()
                 request.listen_request.slots.append(self._name)
+                request.listen_request.initial_credits = window
                 observer.on_next(request)
                 observer_iterator = iter(observer)
                 response_iterator = self._stub.BidirectionalListen(observer_iterator)
+                grant_size = max(window // 2, 1)
+                handled_count = 0
                 for response in response_iterator:
                     args = convert_arguments_from_protobuf_to_python(response.arguments)
                     callback(*args)
                     request = KiwoomOpenApiPlusService_pb2.BidirectionalListenRequest()
-                    request.handled_request.time = time.time()
+                    if window > 0:
+                        handled_count += 1
+                        if handled_count < grant_size:
+                            continue
+                        request.grant_request.credits = handled_count
+                        handled_count = 0
+                    else:
+                        request.handled_request.time = time.time()
                     observer.on_next(request)
 
             _future = self._executor.submit(fn)
 
     def disconnect(self, callback):
+        if self._multiplexer is not None:
+            self._multiplexer.disconnect(self._name, callback)
         with self._lock:
             self._remove_observer(callback)
@@ -0,0 +1,146 @@
+import atexit
+import threading
+import time
+
+from typing import Callable, Dict, Tuple
+
+import grpc
+
+from koapy.backend.kiwoom_open_api_plus.grpc import KiwoomOpenApiPlusService_pb2
+from koapy.backend.kiwoom_open_api_plus.grpc.KiwoomOpenApiPlusServiceMessageUtils import (
+    convert_arguments_from_protobuf_to_python,
+)
+from koapy.backend.kiwoom_open_api_plus.utils.queue.QueueBasedIterableObserver import (
+    QueueBasedIterableObserver,
+)
+from koapy.utils.logging.Logging import Logging
+
+
+class KiwoomOpenApiPlusServiceClientSideSignalMultiplexer(Logging):
+    """
+    클라이언트에서 연결한 모든 시그널 콜백들을 하나의 BidirectionalListen 스트림으로 처리합니다.
+
+    콜백마다 스트림을 열면 서버측에서도 스트림마다 작업 스레드를 하나씩 점유하게 되므로,
+    연결된 콜백이 많아지면 서버의 작업 스레드가 부족해져서 다른 RPC 들이 처리되지 못할 수 있습니다.
+    대신 하나의 스트림으로 연결된 모든 이벤트 이름을 구독하고, 받은 이벤트를 이름에 따라 콜백들에 나눠서 전달합니다.
+
+    구독할 이벤트 이름이 바뀌는 경우 같은 스트림으로 listen_request 를 다시 보내서 서버측 구독 목록을 갱신하며,
+    연결된 콜백이 하나도 없는 경우 스트림을 닫습니다.
+
+    서버와의 흐름 제어는 크레딧 방식을 사용하며, window 가 0 인 경우 크레딧을 하나만 부여하고
+    이벤트마다 처리 완료 후 ACK 를 보내므로 이벤트마다 ACK 를 기다리는 기존 방식과 동일하게 동작합니다.
+    """
+
+    def __init__(self, stub, executor, window: int = 0):
+        self._stub = stub
+        self._executor = executor
+        self._window = window
+
+        self._lock = threading.RLock()
+        # 스트림 스레드에서는 락 없이 읽을 수 있도록 값은 항상 새 튜플로 교체함
+        self._callbacks_by_name: Dict[str, Tuple[Callable, ...]] = {}
+
+        self._observer = None
+        self._future = None
+
+        atexit.register(self.shutdown)
+
+    def __del__(self):
+        atexit.unregister(self.shutdown)
+
+    @property
+    def window(self) -> int:
+        return self._window
+
+    def _make_listen_request(self):
+        request = KiwoomOpenApiPlusService_pb2.BidirectionalListenRequest()
+        request.listen_request.slots.extend(sorted(self._callbacks_by_name.keys()))
+        request.listen_request.initial_credits = max(self._window, 1)
+        return request
+
+    def _dispatch(self, response):
+        callbacks = self._callbacks_by_name.get(response.name, ())
+        if not callbacks:
+            return
+        args = convert_arguments_from_protobuf_to_python(response.arguments)
+        for callback in callbacks:
+            try:
+                callback(*args)
+            except Exception:  # pylint: disable=broad-except
+                self.logger.exception(
+                    "Exception raised in callback %s for %s", callback, response.name
+                )
+
+    def _run(self, observer):
+        grant_size = max(self._window // 2, 1)
+        handled_count = 0
+        response_iterator = self._stub.BidirectionalListen(iter(observer))
+        try:
+            for response in response_iterator:
+                self._dispatch(response)
+                request = KiwoomOpenApiPlusService_pb2.BidirectionalListenRequest()
+                if self._window > 0:
+                    handled_count += 1
+                    if handled_count < grant_size:
+                        continue
+                    request.grant_request.credits = handled_count
+                    handled_count = 0
+                else:
+                    request.handled_request.time = time.time()
+                observer.on_next(request)
+        except grpc.RpcError as e:
+            if e.code() != grpc.StatusCode.CANCELLED:  # pylint: disable=no-member
+                self.logger.warning("Listen stream closed unexpectedly: %s", e)
+        finally:
+            with self._lock:
+                if self._observer is observer:
+                    self._observer = None
+                    self._future = None
+
+    def _update_stream(self):
+        if self._callbacks_by_name:
+            request = self._make_listen_request()
+            if self._observer is None:
+                self._observer = QueueBasedIterableObserver()
+                self._observer.on_next(request)
+                self._future = self._executor.submit(self._run, self._observer)
+            else:
+                self._observer.on_next(request)
+        elif self._observer is not None:
+            self._stop_stream()
+
+    def _stop_stream(self):
+        observer = self._observer
+        self._observer = None
+        self._future = None
+        if observer is not None:
+            request = KiwoomOpenApiPlusService_pb2.BidirectionalListenRequest()
+            request.stop_listen_request.time = time.time()
+            observer.on_next(request)
+            observer.on_completed()
+
+    def connect(self, name: str, callback: Callable):
+        with self._lock:
+            callbacks = self._callbacks_by_name.get(name, ())
+            if callback in callbacks:
+                return
+            self._callbacks_by_name[name] = callbacks + (callback,)
+            if not callbacks or self._observer is None:
+                self._update_stream()
+
+    def disconnect(self, name: str, callback: Callable):
+        with self._lock:
+            callbacks = self._callbacks_by_name.get(name, ())
+            if callback not in callbacks:
+                return
+            callbacks = tuple(c for c in callbacks if c is not callback)
+            if callbacks:
+                self._callbacks_by_name[name] = callbacks
+            else:
+                del self._callbacks_by_name[name]
+                self._update_stream()
+
+    def shutdown(self):
+        with self._lock:
+            self._callbacks_by_name.clear()
+            self._stop_stream()
@@ -1,6 +1,8 @@
+import contextlib
 import datetime
 import logging
 import re
+import threading
 
 import pandas as pd
 
@@ -14,15 +16,43 @@ from koapy.backend.kiwoom_open_api_plus.core.KiwoomOpenApiPlusQAxWidgetMixin imp
     KiwoomOpenApiPlusQAxWidgetUniversalMixin,
 )
 from koapy.backend.kiwoom_open_api_plus.grpc import KiwoomOpenApiPlusService_pb2
+from koapy.backend.kiwoom_open_api_plus.grpc.KiwoomOpenApiPlusChartDataCache import (
+    KiwoomOpenApiPlusChartDataCache,
+)
+from koapy.backend.kiwoom_open_api_plus.grpc.KiwoomOpenApiPlusServiceClientSideBatch import (
+    KiwoomOpenApiPlusServiceClientSideBatch,
+)
 from koapy.backend.kiwoom_open_api_plus.grpc.KiwoomOpenApiPlusServiceClientSideDynamicCallable import (
     KiwoomOpenApiPlusServiceClientSideDynamicCallable,
 )
+from koapy.backend.kiwoom_open_api_plus.grpc.KiwoomOpenApiPlusServiceClientSideMasterDataCache import (
+    KiwoomOpenApiPlusServiceClientSideMasterDataCache,
+    KiwoomOpenApiPlusServiceClientSideMasterDataCallable,
+)
+from koapy.backend.kiwoom_open_api_plus.grpc.KiwoomOpenApiPlusServiceClientSideRealDataBatchIterator import (
+    KiwoomOpenApiPlusServiceClientSideRealDataBatchIterator,
+)
+from koapy.backend.kiwoom_open_api_plus.grpc.KiwoomOpenApiPlusServiceClientSideRealDataRehydrator import (
+    KiwoomOpenApiPlusServiceClientSideRealDataRehydrator,
+    KiwoomOpenApiPlusServiceClientSideRehydratingIterator,
+)
 from koapy.backend.kiwoom_open_api_plus.grpc.KiwoomOpenApiPlusServiceClientSideSignalConnector import (
     KiwoomOpenApiPlusServiceClientSideSignalConnector,
 )
+from koapy.backend.kiwoom_open_api_plus.grpc.KiwoomOpenApiPlusServiceClientSideSignalMultiplexer import (
+    KiwoomOpenApiPlusServiceClientSideSignalMultiplexer,
+)
+from koapy.backend.kiwoom_open_api_plus.grpc.KiwoomOpenApiPlusServiceMessageUtils import (
+    convert_columnar_data_from_protobuf_to_python,
+    convert_transaction_priority_from_protobuf_to_python,
+)
 from koapy.backend.kiwoom_open_api_plus.utils.grpc.PipeableMultiThreadedRendezvous import (
     PipeableMultiThreadedRendezvous,
 )
+from koapy.backend.kiwoom_open_api_plus.utils.queue.QueueBasedIterableObserver import (
+    BackpressurePolicy,
+)
+from koapy.config import config
 from koapy.utils.logging.Logging import Logging
 
 
@@ -41,17 +71,56 @@ class KiwoomOpenApiPlusServiceClientStubCoreWrapper(
         self._stub = stub
         self._executor = executor
 
+        # 스레드별로 현재 진행중인 배치를 관리
+        self._batch_local = threading.local()
+
         # Set methods as attributes
         for method_name in self.METHOD_NAMES:
             dynamic_callable = KiwoomOpenApiPlusServiceClientSideDynamicCallable(
-                self._stub, method_name
+                self._stub, method_name, self._GetActiveBatch
             )
             setattr(self, method_name, dynamic_callable)
 
+        # 종목 마스터 데이터 조회 함수들은 거래일 단위로 캐싱된 스냅샷에서 처리
+        self._master_data_cache = None
+
+        if config.get_bool(
+            "koapy.backend.kiwoom_open_api_plus.grpc.client.master_data_cache.enabled",
+            True,
+        ):
+            self._master_data_cache = KiwoomOpenApiPlusServiceClientSideMasterDataCache(
+                self._stub
+            )
+            for method_name in self._master_data_cache.FUNCTION_NAMES + [
+                "GetCodeListByMarket"
+            ]:
+                cached_callable = KiwoomOpenApiPlusServiceClientSideMasterDataCallable(
+                    self._master_data_cache,
+                    method_name,
+                    getattr(self, method_name),
+                    self._GetActiveBatch,
+                )
+                setattr(self, method_name, cached_callable)
+
         # Set signals as attributes
+        signal_window = config.get_int(
+            "koapy.backend.kiwoom_open_api_plus.grpc.client.signal.window", 0
+        )
+        signal_multiplexer = None
+        if config.get_bool(
+            "koapy.backend.kiwoom_open_api_plus.grpc.client.signal.multiplexed", True
+        ):
+            signal_multiplexer = KiwoomOpenApiPlusServiceClientSideSignalMultiplexer(
+                self._stub, self._executor, signal_window
+            )
+        self._signal_multiplexer = signal_multiplexer
         for event_name in self.EVENT_NAMES:
             signal_connector = KiwoomOpenApiPlusServiceClientSideSignalConnector(
-                self._stub, event_name, self._executor
+                self._stub,
+                event_name,
+                self._executor,
+                signal_window,
+                signal_multiplexer,
             )
             setattr(self, event_name, signal_connector)
 
@@ -71,6 +140,52 @@ class KiwoomOpenApiPlusServiceClientStubCoreWrapper(
             *args
         )
 
+    def InvalidateMasterDataCache(self):
+        """
+        캐싱된 종목 마스터 데이터를 무효화해서 다음 조회시 서버에서 다시 받아오도록 합니다.
+        """
+        if self._master_data_cache is not None:
+            self._master_data_cache.invalidate()
+
+    def _GetActiveBatch(self):
+        return getattr(self._batch_local, "batch", None)
+
+    @contextlib.contextmanager
+    def batch(self, max_batch_size=None):
+        """
+        블록 안에서의 함수 호출들을 모아서 BatchCall() RPC 로 한번에 전송합니다.
+
+        블록 안에서 호출된 함수는 결과 대신 Future 를 반환하며, 결과는 블록이 끝난 이후
+        혹은 result() 를 통해 결과를 요청하는 시점에 채워집니다.
+
+        >>> with stub.batch():
+        ...     futures = [stub.GetMasterCodeName(code) for code in codes]
+        >>> names = [future.result() for future in futures]
+        """
+        batch = self._GetActiveBatch()
+        if batch is not None:
+            yield batch
+            return
+        batch = KiwoomOpenApiPlusServiceClientSideBatch(self._stub, max_batch_size)
+        self._batch_local.batch = batch
+        try:
+            with batch:
+                yield batch
+        finally:
+            self._batch_local.batch = None
+
+    def BatchCall(self, calls):
+        """
+        복수개의 함수 호출을 위한 RPC 입니다.
+
+        (함수 이름, 파라미터 목록) 쌍의 목록을 받아 한번의 왕복으로 서버측에서 순서대로 호출하고
+        결과 목록을 반환합니다.
+        """
+        batch = KiwoomOpenApiPlusServiceClientSideBatch(self._stub)
+        results = [batch.submit(name, args) for name, args in calls]
+        batch.flush()
+        return [result.result() for result in results]
+
     def LoginCall(self, credentials=None):
         """
         키움증권 서버 연결 시나리오에 해당하는 RPC 입니다.
@@ -78,6 +193,13 @@ class KiwoomOpenApiPlusServiceClientStubCoreWrapper(
         CommConnect() 메소드 호출 이후 발생하는 OnEventConnect() 이벤트를 처리하고
         클라이언트에도 해당 이벤트 내용을 전달합니다.
         """
+        request = self._CreateLoginRequest(credentials)
+        for response in self._stub.LoginCall(request):
+            errcode = response.arguments[0].long_value
+        return errcode
+
+    @classmethod
+    def _CreateLoginRequest(cls, credentials=None):
         request = KiwoomOpenApiPlusService_pb2.LoginRequest()
         if credentials is not None:
             request.credentials.user_id = credentials.get("user_id")
@@ -87,11 +209,19 @@ class KiwoomOpenApiPlusServiceClientStubCoreWrapper(
             account_passwords = credentials.get("account_passwords")
             for account_no, account_password in account_passwords.items():
                 request.credentials.account_passwords[account_no] = account_password
-        for response in self._stub.LoginCall(request):
-            errcode = response.arguments[0].long_value
-        return errcode
+        return request
 
-    def TransactionCall(self, rqname, trcode, scrno, inputs, stop_condition=None):
+    def TransactionCall(
+        self,
+        rqname,
+        trcode,
+        scrno,
+        inputs,
+        stop_condition=None,
+        columnar=False,
+        typed_values=False,
+        priority=None,
+    ):
         """
         TR 요청에 해당하는 RPC 입니다.
 
@@ -114,7 +244,42 @@ class KiwoomOpenApiPlusServiceClientStubCoreWrapper(
         최초 TR 요청 이후 특정 TR 들에서는 그와 관련된 실시간 데이터가 (OpenAPI+ 레벨에서) 자동으로 등록될 수 있습니다.
         몇몇 상황에서는 해당 실시간 데이터가 유용할 수 있으나 현재 KOAPY 에서는 별도로 사용하진 않고 있으며,
         TR 에 대한 응답처리가 모두 완료된 이후에는 해당 실시간 데이터를 등록 해제하도록 처리하고 있습니다.
+
+        columnar 를 True 로 설정하는 경우 멀티데이터를 행 단위 문자열 목록 (multi_data) 대신
+        열 단위 데이터 (columnar_data) 로 받습니다. 이때 서버측에서 원래 문자열로 그대로 복원 가능한
+        정수/실수 값들만 숫자 타입으로 변환하여 전달하며, 나머지는 문자열 그대로 전달합니다.
+
+        typed_values 를 True 로 설정하는 경우 TR 정보와 fid.csv 를 바탕으로 숫자로 판단되는 필드들을
+        서버측에서 페이지 단위로 한번에 숫자 타입으로 변환하여 전달합니다 (앞자리 0 제거 포함).
+        이때 멀티데이터는 columnar_data 로, 싱글데이터는 typed_single_data 로 전달됩니다.
+
+        priority 는 서버측 CommRqData() 호출 스케줄링에 사용되는 우선순위로 "order", "interactive", "bulk" 중 하나입니다.
+        높은 우선순위의 요청은 낮은 우선순위의 요청들보다 먼저 처리되며, 같은 우선순위 내에서는 클라이언트 별로 번갈아 처리됩니다.
         """
+        request = self._CreateTransactionRequest(
+            rqname,
+            trcode,
+            scrno,
+            inputs,
+            stop_condition,
+            columnar,
+            typed_values,
+            priority,
+        )
+        return self._stub.TransactionCall(request)
+
+    @classmethod
+    def _CreateTransactionRequest(
+        cls,
+        rqname,
+        trcode,
+        scrno,
+        inputs,
+        stop_condition=None,
+        columnar=False,
+        typed_values=False,
+        priority=None,
+    ):
         request = KiwoomOpenApiPlusService_pb2.TransactionRequest()
         request.request_name = rqname
         request.transaction_code = trcode
@@ -132,7 +297,35 @@ class KiwoomOpenApiPlusServiceClientStubCoreWrapper(
                 "==": KiwoomOpenApiPlusService_pb2.TransactionStopConditionCompartor.EQUAL_TO,
                 "!=": KiwoomOpenApiPlusService_pb2.TransactionStopConditionCompartor.NOT_EQUAL_TO,
             }.get(stop_condition.get("comparator", "<="))
-        return self._stub.TransactionCall(request)
+        request.transaction_flags.columnar = columnar
+        request.transaction_flags.typed_values = typed_values
+        if priority is not None:
+            request.transaction_flags.priority = cls._GetTransactionPriority(priority)
+        return request
+
+    _transaction_priorities = {
+        "order": KiwoomOpenApiPlusService_pb2.TransactionPriority.ORDER_RELATED,
+        "interactive": KiwoomOpenApiPlusService_pb2.TransactionPriority.INTERACTIVE,
+        "bulk": KiwoomOpenApiPlusService_pb2.TransactionPriority.BULK,
+    }
+
+    @classmethod
+    def _GetTransactionPriority(cls, priority):
+        if isinstance(priority, str):
+            return cls._transaction_priorities[priority.lower()]
+        return priority
+
+    def EstimateTransactionWaitSeconds(self, priority=None):
+        """
+        지금 주어진 우선순위로 TR 요청을 제출했을때 서버측에서 호출제한 회피를 위해 대기하게 될 것으로 예상되는 시간을 반환합니다.
+        """
+        if priority is None:
+            priority = "interactive"
+        priority = self._GetTransactionPriority(priority)
+        # 서버측 함수는 protobuf 의 TransactionPriority 가 아닌 RateLimitPriority 값을 받음
+        priority = convert_transaction_priority_from_protobuf_to_python(priority)
+        wait_millis = self.Call("EstimateCommRqDataWaitMillis", int(priority), "")
+        return wait_millis / 1000
 
     def OrderCall(
         self,
@@ -220,6 +413,14 @@ class KiwoomOpenApiPlusServiceClientStubCoreWrapper(
         infer_fids=False,
         readable_names=False,
         fast_parse=False,
+        compact_schema=False,
+        max_batch_size=0,
+        max_linger_ms=0,
+        conflate=False,
+        conflate_interval_ms=0,
+        lossless_realtypes=None,
+        queue_maxsize=0,
+        backpressure_policy=None,
     ):
         """
         실시간 데이터 요청에 해당하는 RPC 입니다.
@@ -232,10 +433,78 @@ class KiwoomOpenApiPlusServiceClientStubCoreWrapper(
         추가로 읽어 들인 뒤 알맞은 응답형태로 가공하여 클라이언트에 반환합니다.
         해당 과정에서 GetCommRealData() 메소드를 내부적으로 호출합니다.
 
+        fast_parse 가 참인 경우 GetCommRealData() 호출 대신 이벤트 인자로 넘어오는 원본 데이터에서
+        실시간 타입별 fid 위치에 따라 요청한 fid 들의 값을 바로 꺼냅니다. infer_fids 여부와 관계없이
+        임의의 fid 목록에 대해 동작하며, 해당 실시간 타입에 없는 fid 만 GetCommRealData() 로 읽습니다.
+
         해당 RPC 는 별도의 이벤트 종료 상황이 존재하지 않기 때문에 더이상 사용하지 않는 경우
         클라이언트 측에서 해당 RPC 연결을 해제하는 식으로 더 이상 이벤트를 받지 않을 수 있습니다.
         이 경우 서버에서는 내부적으로 기 등록된 실시간 데이터에 대해 SetRealRemove() 가 호출됩니다.
+
+        compact_schema 가 참인 경우 서버는 필드 이름을 실시간 타입별로 한번만 전달하고
+        이후에는 값들만 전달합니다. 필드 이름은 클라이언트에서 응답을 꺼내는 시점에 다시 채워지며,
+        이 경우 응답의 원본 realdata 인자는 빈 문자열로 전달됩니다.
+
+        max_batch_size 혹은 max_linger_ms 가 주어진 경우 서버는 여러 틱을 하나의 응답으로 묶어서 전달합니다.
+        반환된 이터레이터는 기존처럼 틱 단위로 응답을 반환하며, batches() 를 통해 배치 단위로도 받아볼 수 있습니다.
+
+        conflate 가 참인 경우 서버는 클라이언트가 밀려있는 동안 (종목코드, 실시간 타입) 별로 가장 최근 값만 전달하며,
+        conflate_interval_ms 가 주어진 경우 최대 해당 주기마다 한번씩만 전달합니다.
+        lossless_realtypes 로 주어진 실시간 타입들 (예를 들어 ["주식체결"]) 은 합치지 않고 모두 전달합니다.
+        이 경우 배치 관련 설정은 무시됩니다.
+
+        queue_maxsize 와 backpressure_policy 로 해당 스트림에 대한 서버측 이벤트 큐의 크기와
+        큐가 가득 찼을때의 처리 방식 (block, drop_oldest, drop_newest, conflate, disconnect) 을 지정할 수 있습니다.
+        주어지지 않은 경우 서버 설정을 따르며, 버려진 이벤트 수는 스트림 종료시 trailing metadata 로 전달됩니다.
         """
+        request = self._CreateRealRequest(
+            scrno,
+            codes,
+            fids,
+            opt_type,
+            infer_fids,
+            readable_names,
+            fast_parse,
+            compact_schema,
+            max_batch_size,
+            max_linger_ms,
+            conflate,
+            conflate_interval_ms,
+            lossless_realtypes,
+            queue_maxsize,
+            backpressure_policy,
+        )
+        responses = self._stub.RealCall(request)
+        if not conflate and (max_batch_size > 0 or max_linger_ms > 0):
+            rehydrator = None
+            if compact_schema:
+                rehydrator = KiwoomOpenApiPlusServiceClientSideRealDataRehydrator()
+            responses = KiwoomOpenApiPlusServiceClientSideRealDataBatchIterator(
+                responses, rehydrator
+            )
+        elif compact_schema:
+            responses = KiwoomOpenApiPlusServiceClientSideRehydratingIterator(responses)
+        return responses
+
+    @classmethod
+    def _CreateRealRequest(
+        cls,
+        scrno,
+        codes,
+        fids,
+        opt_type=None,
+        infer_fids=False,
+        readable_names=False,
+        fast_parse=False,
+        compact_schema=False,
+        max_batch_size=0,
+        max_linger_ms=0,
+        conflate=False,
+        conflate_interval_ms=0,
+        lossless_realtypes=None,
+        queue_maxsize=0,
+        backpressure_policy=None,
+    ):
         request = KiwoomOpenApiPlusService_pb2.RealRequest()
         if scrno is None:
             scrnos = []
@@ -253,7 +522,19 @@ class KiwoomOpenApiPlusServiceClientStubCoreWrapper(
         request.flags.infer_fids = infer_fids
         request.flags.readable_names = readable_names
         request.flags.fast_parse = fast_parse
-        return self._stub.RealCall(request)
+        request.flags.compact_schema = compact_schema
+        request.flags.max_batch_size = max_batch_size
+        request.flags.max_linger_ms = max_linger_ms
+        request.flags.conflate = conflate
+        request.flags.conflate_interval_ms = conflate_interval_ms
+        if lossless_realtypes:
+            request.flags.lossless_realtypes.extend(lossless_realtypes)
+        request.flags.queue_maxsize = queue_maxsize
+        if backpressure_policy is not None:
+            request.flags.backpressure_policy = BackpressurePolicy(
+                backpressure_policy
+            ).value
+        return request
 
     def LoadConditionCall(self):
         """
@@ -284,7 +565,29 @@ class KiwoomOpenApiPlusServiceClientStubCoreWrapper(
         SendCondition() 메소드 호출 이후 발생하는 OnReceiveTrCondition() 혹은 OnReceiveRealCondition() 이벤트를
         처리하고 클라이언트에도 해당 이벤트 내용을 전달합니다.
         """
-        request = request = KiwoomOpenApiPlusService_pb2.ConditionRequest()
+        request = self._CreateConditionRequest(
+            scrno,
+            condition_name,
+            condition_index,
+            search_type,
+            with_info,
+            is_future_option,
+            request_name,
+        )
+        return self._stub.ConditionCall(request)
+
+    @classmethod
+    def _CreateConditionRequest(
+        cls,
+        scrno,
+        condition_name,
+        condition_index,
+        search_type,
+        with_info=False,
+        is_future_option=False,
+        request_name=None,
+    ):
+        request = KiwoomOpenApiPlusService_pb2.ConditionRequest()
         request.screen_no = scrno or ""
         request.condition_name = condition_name
         request.condition_index = condition_index
@@ -293,7 +596,7 @@ class KiwoomOpenApiPlusServiceClientStubCoreWrapper(
         request.flags.is_future_option = is_future_option
         if request_name is not None:
             request.request_name = request_name
-        return self._stub.ConditionCall(request)
+        return request
 
     def SetLogLevel(self, level, logger=""):
         """
@@ -393,12 +696,33 @@ class KiwoomOpenApiPlusServiceClientStubExtendedWrapper(
     def _RemoveLeadingZerosForNumbersInValues(self, values, width=0):
         return [self._RemoveLeadingZerosForNumber(value, width) for value in values]
 
+    _chart_data_cache = None
+
+    def _GetChartDataCache(self):
+        if self._chart_data_cache is None:
+            self._chart_data_cache = KiwoomOpenApiPlusChartDataCache()
+        return self._chart_data_cache
+
+    def _ParseColumnarData(self, columnar_data, remove_zeros_width=None):
+        columns = convert_columnar_data_from_protobuf_to_python(columnar_data)
+        for name, values in columns.items():
+            if values.dtype == object:
+                columns[name] = self._RemoveLeadingZerosForNumbersInValues(
+                    values, remove_zeros_width
+                )
+        return pd.DataFrame(columns)
+
     def _ParseTransactionCallResponses(self, responses, remove_zeros_width=None):
         single_output = None
         columns = []
         records = []
+        frames = []
         for response in responses:
-            if single_output is None:
+            if single_output is None and response.HasField("typed_single_data"):
+                single_output = self._ParseColumnarData(
+                    response.typed_single_data, remove_zeros_width
+                ).iloc[0]
+            elif single_output is None:
                 single_output = dict(
                     zip(
                         response.single_data.names,
@@ -407,6 +731,11 @@ class KiwoomOpenApiPlusServiceClientStubExtendedWrapper(
                         ),
                     )
                 )
+            if response.HasField("columnar_data"):
+                frames.append(
+                    self._ParseColumnarData(response.columnar_data, remove_zeros_width)
+                )
+                continue
             if not columns:
                 columns = response.multi_data.names
             for values in response.multi_data.values:
@@ -416,9 +745,44 @@ class KiwoomOpenApiPlusServiceClientStubExtendedWrapper(
                     )
                 )
         single = pd.Series(single_output, dtype=object)
-        multi = pd.DataFrame.from_records(records, columns=columns)
+        if frames:
+            multi = pd.concat(frames, ignore_index=True)
+        else:
+            multi = pd.DataFrame.from_records(records, columns=columns)
         return single, multi
 
+    def _GetChartDataAsDataFrameUsingColumnarResponses(
+        self,
+        rqname,
+        trcode,
+        scrno,
+        inputs,
+        stop_condition,
+        date_column_name,
+        start_date=None,
+    ):
+        frames = [
+            self._ParseColumnarData(response.columnar_data)
+            for response in self.TransactionCall(
+                rqname,
+                trcode,
+                scrno,
+                inputs,
+                stop_condition=stop_condition,
+                columnar=True,
+                priority="bulk",
+            )
+            if response.HasField("columnar_data")
+        ]
+        if not frames:
+            return pd.DataFrame()
+        df = pd.concat(frames, ignore_index=True)
+        if start_date is not None and date_column_name in df.columns:
+            # 기준일자를 INPUT 으로 설정할 수 없는 TR 들은 요청보다 최근 데이터를 버림
+            dates = df[date_column_name].astype(str)
+            df = df[(dates <= start_date).cummax()].reset_index(drop=True)
+        return df
+
     def GetStockBasicInfoAsDict(self, code, rqname=None, scrno=None):
         """
         주식 종목의 기본정보를 딕셔너리 형태로 반환합니다.
@@ -479,6 +843,8 @@ class KiwoomOpenApiPlusServiceClientStubExtendedWrapper(
         adjusted_price=False,
         rqname=None,
         scrno=None,
+        columnar=False,
+        use_cache=False,
     ):
         """
         틱 단위 차트 데이터를 pd.DataFrame 형태로 반환합니다.
@@ -495,6 +861,34 @@ class KiwoomOpenApiPlusServiceClientStubExtendedWrapper(
         if isinstance(start_date, datetime.datetime):
             start_date = start_date.strftime(date_format)
 
+        if use_cache:
+            if isinstance(end_date, datetime.datetime):
+                end_date = end_date.strftime(date_format)
+
+            def fetch(start_date, end_date):
+                return self.GetTickStockDataAsDataFrame(
+                    code,
+                    interval,
+                    start_date,
+                    end_date,
+                    include_end=True,
+                    adjusted_price=adjusted_price,
+                    rqname=rqname,
+                    scrno=scrno,
+                )
+
+            return self._GetChartDataCache().get_or_fetch(
+                fetch,
+                code,
+                "opt10079",
+                date_column_name,
+                start_date,
+                end_date,
+                include_end,
+                interval=interval,
+                adjusted_price=adjusted_price,
+            )
+
         if end_date is not None:
             if isinstance(end_date, datetime.datetime):
                 end_date = end_date.strftime(date_format)
@@ -516,6 +910,17 @@ class KiwoomOpenApiPlusServiceClientStubExtendedWrapper(
             "수정주가구분": "1" if adjusted_price else "0",
         }
 
+        if columnar:
+            return self._GetChartDataAsDataFrameUsingColumnarResponses(
+                rqname,
+                trcode,
+                scrno,
+                inputs,
+                stop_condition,
+                date_column_name,
+                start_date,
+            )
+
         columns = []
         records = []
 
@@ -523,7 +928,12 @@ class KiwoomOpenApiPlusServiceClientStubExtendedWrapper(
         should_compare_start = start_date is not None
 
         for response in self.TransactionCall(
-            rqname, trcode, scrno, inputs, stop_condition=stop_condition
+            rqname,
+            trcode,
+            scrno,
+            inputs,
+            stop_condition=stop_condition,
+            priority="bulk",
         ):
             if not columns:
                 columns = list(response.multi_data.names)
@@ -569,6 +979,8 @@ class KiwoomOpenApiPlusServiceClientStubExtendedWrapper(
         adjusted_price=False,
         rqname=None,
         scrno=None,
+        columnar=False,
+        use_cache=False,
     ):
         """
         분 단위 차트 데이터를 pd.DataFrame 형태로 반환합니다.
@@ -585,6 +997,34 @@ class KiwoomOpenApiPlusServiceClientStubExtendedWrapper(
         if isinstance(start_date, datetime.datetime):
             start_date = start_date.strftime(date_format)
 
+        if use_cache:
+            if isinstance(end_date, datetime.datetime):
+                end_date = end_date.strftime(date_format)
+
+            def fetch(start_date, end_date):
+                return self.GetMinuteStockDataAsDataFrame(
+                    code,
+                    interval,
+                    start_date,
+                    end_date,
+                    include_end=True,
+                    adjusted_price=adjusted_price,
+                    rqname=rqname,
+                    scrno=scrno,
+                )
+
+            return self._GetChartDataCache().get_or_fetch(
+                fetch,
+                code,
+                "opt10080",
+                date_column_name,
+                start_date,
+                end_date,
+                include_end,
+                interval=interval,
+                adjusted_price=adjusted_price,
+            )
+
         if end_date is not None:
             if isinstance(end_date, datetime.datetime):
                 end_date = end_date.strftime(date_format)
@@ -606,6 +1046,17 @@ class KiwoomOpenApiPlusServiceClientStubExtendedWrapper(
             "수정주가구분": "1" if adjusted_price else "0",
         }
 
+        if columnar:
+            return self._GetChartDataAsDataFrameUsingColumnarResponses(
+                rqname,
+                trcode,
+                scrno,
+                inputs,
+                stop_condition,
+                date_column_name,
+                start_date,
+            )
+
         columns = []
         records = []
 
@@ -613,7 +1064,12 @@ class KiwoomOpenApiPlusServiceClientStubExtendedWrapper(
         should_compare_start = start_date is not None
 
         for response in self.TransactionCall(
-            rqname, trcode, scrno, inputs, stop_condition=stop_condition
+            rqname,
+            trcode,
+            scrno,
+            inputs,
+            stop_condition=stop_condition,
+            priority="bulk",
         ):
             if not columns:
                 columns = list(response.multi_data.names)
@@ -658,6 +1114,8 @@ class KiwoomOpenApiPlusServiceClientStubExtendedWrapper(
         adjusted_price=False,
         rqname=None,
         scrno=None,
+        columnar=False,
+        use_cache=False,
     ):
         """
         일 단위 차트 데이터를 pd.DataFrame 형태로 반환합니다.
@@ -670,6 +1128,32 @@ class KiwoomOpenApiPlusServiceClientStubExtendedWrapper(
         if isinstance(start_date, datetime.datetime):
             start_date = start_date.strftime(date_format)
 
+        if use_cache:
+            if isinstance(end_date, datetime.datetime):
+                end_date = end_date.strftime(date_format)
+
+            def fetch(start_date, end_date):
+                return self.GetDailyStockDataAsDataFrame(
+                    code,
+                    start_date,
+                    end_date,
+                    include_end=True,
+                    adjusted_price=adjusted_price,
+                    rqname=rqname,
+                    scrno=scrno,
+                )
+
+            return self._GetChartDataCache().get_or_fetch(
+                fetch,
+                code,
+                "opt10081",
+                date_column_name,
+                start_date,
+                end_date,
+                include_end,
+                adjusted_price=adjusted_price,
+            )
+
         if end_date is not None:
             if isinstance(end_date, datetime.datetime):
                 end_date = end_date.strftime(date_format)
@@ -693,13 +1177,28 @@ class KiwoomOpenApiPlusServiceClientStubExtendedWrapper(
         if start_date is not None:
             inputs["기준일자"] = start_date
 
+        if columnar:
+            return self._GetChartDataAsDataFrameUsingColumnarResponses(
+                rqname,
+                trcode,
+                scrno,
+                inputs,
+                stop_condition,
+                date_column_name,
+            )
+
         columns = []
         records = []
 
         date_column_index = None
 
         for response in self.TransactionCall(
-            rqname, trcode, scrno, inputs, stop_condition=stop_condition
+            rqname,
+            trcode,
+            scrno,
+            inputs,
+            stop_condition=stop_condition,
+            priority="bulk",
         ):
             if not columns:
                 columns = list(response.multi_data.names)
@@ -735,6 +1234,8 @@ class KiwoomOpenApiPlusServiceClientStubExtendedWrapper(
         adjusted_price=False,
         rqname=None,
         scrno=None,
+        columnar=False,
+        use_cache=False,
     ):
         """
         주 단위 차트 데이터를 pd.DataFrame 형태로 반환합니다.
@@ -747,6 +1248,32 @@ class KiwoomOpenApiPlusServiceClientStubExtendedWrapper(
         if isinstance(start_date, datetime.datetime):
             start_date = start_date.strftime(date_format)
 
+        if use_cache:
+            if isinstance(end_date, datetime.datetime):
+                end_date = end_date.strftime(date_format)
+
+            def fetch(start_date, end_date):
+                return self.GetWeeklyStockDataAsDataFrame(
+                    code,
+                    start_date,
+                    end_date,
+                    include_end=True,
+                    adjusted_price=adjusted_price,
+                    rqname=rqname,
+                    scrno=scrno,
+                )
+
+            return self._GetChartDataCache().get_or_fetch(
+                fetch,
+                code,
+                "opt10082",
+                date_column_name,
+                start_date,
+                end_date,
+                include_end,
+                adjusted_price=adjusted_price,
+            )
+
         if end_date is not None:
             if isinstance(end_date, datetime.datetime):
                 end_date = end_date.strftime(date_format)
@@ -772,12 +1299,27 @@ class KiwoomOpenApiPlusServiceClientStubExtendedWrapper(
         if end_date is not None:
             inputs["끝일자"] = end_date  # 딱히 끝일자가 생각하는대로 안먹히는듯...
 
+        if columnar:
+            return self._GetChartDataAsDataFrameUsingColumnarResponses(
+                rqname,
+                trcode,
+                scrno,
+                inputs,
+                stop_condition,
+                date_column_name,
+            )
+
         columns = []
         records = []
         date_column_index = None
 
         for response in self.TransactionCall(
-            rqname, trcode, scrno, inputs, stop_condition=stop_condition
+            rqname,
+            trcode,
+            scrno,
+            inputs,
+            stop_condition=stop_condition,
+            priority="bulk",
         ):
             if not columns:
                 columns = list(response.multi_data.names)
@@ -813,6 +1355,8 @@ class KiwoomOpenApiPlusServiceClientStubExtendedWrapper(
         adjusted_price=False,
         rqname=None,
         scrno=None,
+        columnar=False,
+        use_cache=False,
     ):
         """
         월 단위 차트 데이터를 pd.DataFrame 형태로 반환합니다.
@@ -825,6 +1369,32 @@ class KiwoomOpenApiPlusServiceClientStubExtendedWrapper(
         if isinstance(start_date, datetime.datetime):
             start_date = start_date.strftime(date_format)
 
+        if use_cache:
+            if isinstance(end_date, datetime.datetime):
+                end_date = end_date.strftime(date_format)
+
+            def fetch(start_date, end_date):
+                return self.GetMonthlyStockDataAsDataFrame(
+                    code,
+                    start_date,
+                    end_date,
+                    include_end=True,
+                    adjusted_price=adjusted_price,
+                    rqname=rqname,
+                    scrno=scrno,
+                )
+
+            return self._GetChartDataCache().get_or_fetch(
+                fetch,
+                code,
+                "opt10083",
+                date_column_name,
+                start_date,
+                end_date,
+                include_end,
+                adjusted_price=adjusted_price,
+            )
+
         if end_date is not None:
             if isinstance(end_date, datetime.datetime):
                 end_date = end_date.strftime(date_format)
@@ -850,12 +1420,27 @@ class KiwoomOpenApiPlusServiceClientStubExtendedWrapper(
         if end_date is not None:
             inputs["끝일자"] = end_date  # 딱히 끝일자가 생각하는대로 안먹히는듯...
 
+        if columnar:
+            return self._GetChartDataAsDataFrameUsingColumnarResponses(
+                rqname,
+                trcode,
+                scrno,
+                inputs,
+                stop_condition,
+                date_column_name,
+            )
+
         columns = []
         records = []
         date_column_index = None
 
         for response in self.TransactionCall(
-            rqname, trcode, scrno, inputs, stop_condition=stop_condition
+            rqname,
+            trcode,
+            scrno,
+            inputs,
+            stop_condition=stop_condition,
+            priority="bulk",
         ):
             if not columns:
                 columns = list(response.multi_data.names)
@@ -891,6 +1476,8 @@ class KiwoomOpenApiPlusServiceClientStubExtendedWrapper(
         adjusted_price=False,
         rqname=None,
         scrno=None,
+        columnar=False,
+        use_cache=False,
     ):
         """
         년 단위 차트 데이터를 pd.DataFrame 형태로 반환합니다.
@@ -903,6 +1490,32 @@ class KiwoomOpenApiPlusServiceClientStubExtendedWrapper(
         if isinstance(start_date, datetime.datetime):
             start_date = start_date.strftime(date_format)
 
+        if use_cache:
+            if isinstance(end_date, datetime.datetime):
+                end_date = end_date.strftime(date_format)
+
+            def fetch(start_date, end_date):
+                return self.GetYearlyStockDataAsDataFrame(
+                    code,
+                    start_date,
+                    end_date,
+                    include_end=True,
+                    adjusted_price=adjusted_price,
+                    rqname=rqname,
+                    scrno=scrno,
+                )
+
+            return self._GetChartDataCache().get_or_fetch(
+                fetch,
+                code,
+                "opt10094",
+                date_column_name,
+                start_date,
+                end_date,
+                include_end,
+                adjusted_price=adjusted_price,
+            )
+
         if end_date is not None:
             if isinstance(end_date, datetime.datetime):
                 end_date = end_date.strftime(date_format)
@@ -928,12 +1541,27 @@ class KiwoomOpenApiPlusServiceClientStubExtendedWrapper(
         if end_date is not None:
             inputs["끝일자"] = end_date  # 딱히 끝일자가 생각하는대로 안먹히는듯...
 
+        if columnar:
+            return self._GetChartDataAsDataFrameUsingColumnarResponses(
+                rqname,
+                trcode,
+                scrno,
+                inputs,
+                stop_condition,
+                date_column_name,
+            )
+
         columns = []
         records = []
         date_column_index = None
 
         for response in self.TransactionCall(
-            rqname, trcode, scrno, inputs, stop_condition=stop_condition
+            rqname,
+            trcode,
+            scrno,
+            inputs,
+            stop_condition=stop_condition,
+            priority="bulk",
         ):
             if not columns:
                 columns = list(response.multi_data.names)
@@ -0,0 +1,144 @@
+import functools
+import inspect
+
+import grpc
+
+
+def _get_method_name(method):
+    return method.rsplit("/", 1)[-1]
+
+
+class KiwoomOpenApiPlusServiceCompressionServerInterceptor(grpc.ServerInterceptor):
+    """
+    RPC 이름별로 서버 기본값과 다른 응답 압축 방식을 적용합니다.
+
+    compression_by_method 는 {"TransactionCall": grpc.Compression.Gzip} 처럼 RPC 이름과 압축 방식의 매핑입니다.
+    """
+
+    def __init__(self, compression_by_method):
+        self._compression_by_method = dict(compression_by_method)
+
+    @classmethod
+    def _wrap_behavior(cls, behavior, compression):
+        @functools.wraps(behavior)
+        def wrapper(request, context):
+            context.set_compression(compression)
+            return behavior(request, context)
+
+        return wrapper
+
+    @classmethod
+    def _wrap_handler(cls, handler, compression):
+        behaviors = {}
+        for name in ["unary_unary", "unary_stream", "stream_unary", "stream_stream"]:
+            behavior = getattr(handler, name)
+            if behavior is not None:
+                behaviors[name] = cls._wrap_behavior(behavior, compression)
+        return handler._replace(**behaviors)
+
+    def intercept_service(self, continuation, handler_call_details):
+        handler = continuation(handler_call_details)
+        compression = self._compression_by_method.get(
+            _get_method_name(handler_call_details.method)
+        )
+        if handler is None or compression is None:
+            return handler
+        return self._wrap_handler(handler, compression)
+
+
+class KiwoomOpenApiPlusServiceCompressionAsyncServerInterceptor(
+    grpc.aio.ServerInterceptor
+):
+    """
+    grpc.aio 서버를 위한 KiwoomOpenApiPlusServiceCompressionServerInterceptor 입니다.
+
+    grpc.aio 는 핸들러가 코루틴 혹은 비동기 제너레이터 함수인지에 따라 처리 방식이 달라지므로
+    감싸는 함수도 원래 핸들러와 같은 종류로 만들어 줍니다.
+    """
+
+    def __init__(self, compression_by_method):
+        self._compression_by_method = dict(compression_by_method)
+
+    @classmethod
+    def _wrap_behavior(cls, behavior, compression):
+        if inspect.isasyncgenfunction(behavior):
+
+            @functools.wraps(behavior)
+            async def wrapper(request, context):
+                context.set_compression(compression)
+                async for response in behavior(request, context):
+                    yield response
+
+        elif inspect.iscoroutinefunction(behavior):
+
+            @functools.wraps(behavior)
+            async def wrapper(request, context):
+                context.set_compression(compression)
+                return await behavior(request, context)
+
+        else:
+            return KiwoomOpenApiPlusServiceCompressionServerInterceptor._wrap_behavior(
+                behavior, compression
+            )
+
+        return wrapper
+
+    @classmethod
+    def _wrap_handler(cls, handler, compression):
+        behaviors = {}
+        for name in ["unary_unary", "unary_stream", "stream_unary", "stream_stream"]:
+            behavior = getattr(handler, name)
+            if behavior is not None:
+                behaviors[name] = cls._wrap_behavior(behavior, compression)
+        return handler._replace(**behaviors)
+
+    async def intercept_service(self, continuation, handler_call_details):
+        handler = await continuation(handler_call_details)
+        compression = self._compression_by_method.get(
+            _get_method_name(handler_call_details.method)
+        )
+        if handler is None or compression is None:
+            return handler
+        return self._wrap_handler(handler, compression)
+
+
+class KiwoomOpenApiPlusServiceClientSideCompressedCallable:
+    """
+    Stub 의 RPC 호출시 compression 이 주어지지 않은 경우 지정된 압축 방식을 사용하도록 합니다.
+
+    future(), with_call() 등 나머지 호출 방식에도 동일하게 적용됩니다.
+    """
+
+    def __init__(self, multi_callable, compression):
+        self._multi_callable = multi_callable
+        self._compression = compression
+
+    def __call__(self, *args, **kwargs):
+        kwargs.setdefault("compression", self._compression)
+        return self._multi_callable(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return functools.partial(
+            getattr(self._multi_callable, name), compression=self._compression
+        )
+
+
+class KiwoomOpenApiPlusServiceClientSideCompressedStub:
+    """
+    RPC 이름별로 채널 기본값과 다른 요청 압축 방식을 적용하도록 Stub 을 감싸줍니다.
+
+    동기 Stub 과 grpc.aio Stub 모두에 사용할 수 있습니다.
+    """
+
+    def __init__(self, stub, compression_by_method):
+        self._stub = stub
+        self._compression_by_method = dict(compression_by_method)
+
+    def __getattr__(self, name):
+        multi_callable = getattr(self._stub, name)
+        compression = self._compression_by_method.get(name)
+        if compression is None:
+            return multi_callable
+        return KiwoomOpenApiPlusServiceClientSideCompressedCallable(
+            multi_callable, compression
+        )
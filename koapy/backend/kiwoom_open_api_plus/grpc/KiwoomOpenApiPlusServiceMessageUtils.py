@@ -1,3 +1,14 @@
+import re
+
+import numpy as np
+
+from koapy.backend.kiwoom_open_api_plus.core.KiwoomOpenApiPlusFieldType import (
+    KiwoomOpenApiPlusFieldType,
+)
+from koapy.backend.kiwoom_open_api_plus.grpc import KiwoomOpenApiPlusService_pb2
+from koapy.utils.rate_limiting.PriorityFairQueue import RateLimitPriority
+
+
 def convert_arguments_from_protobuf_to_python(arguments):
     args = []
     for argument in arguments:
@@ -23,3 +34,142 @@ def convert_arguments_from_python_to_protobuf(arguments, arguments_message):
         else:
             raise TypeError("Unexpected type for argument %d: %s" % (i, type(arg)))
     return arguments_message
+
+
+# only convert values that can be restored back to the exact same strings (except for the plus sign),
+# so that zero-padded values like codes or account numbers would remain as strings
+_integer_value_pattern = re.compile(r"^[+-]?(0|[1-9][0-9]{0,17})$")
+_float_value_pattern = re.compile(r"^[+-]?(0|[1-9][0-9]{0,17})\.[0-9]+$")
+
+
+def _is_integer_value(value):
+    return _integer_value_pattern.match(value) is not None
+
+
+def _is_float_value(value):
+    return (
+        _float_value_pattern.match(value) is not None
+        or _integer_value_pattern.match(value) is not None
+    )
+
+
+def convert_rows_from_python_to_columnar_data(names, rows, columnar_data):
+    if rows:
+        columns = list(zip(*rows))
+    else:
+        columns = [() for _ in names]
+    for name, values in zip(names, columns):
+        column = columnar_data.columns.add()
+        column.name = name
+        if values and all(_is_integer_value(value) for value in values):
+            column.long_values.values.extend([int(value) for value in values])
+        elif values and all(_is_float_value(value) for value in values):
+            column.double_values.values.extend([float(value) for value in values])
+        else:
+            column.string_values.SetInParent()
+            column.string_values.values.extend(values)
+    return columnar_data
+
+
+def convert_columnar_data_from_protobuf_to_python(columnar_data):
+    columns = {}
+    for column in columnar_data.columns:
+        kind = column.WhichOneof("values")
+        if kind == "long_values":
+            values = np.array(column.long_values.values, dtype=np.int64)
+        elif kind == "double_values":
+            values = np.array(column.double_values.values, dtype=np.float64)
+        elif kind == "string_values":
+            values = np.array(column.string_values.values, dtype=object)
+        else:
+            values = np.array([], dtype=object)
+        columns[column.name] = values
+    return columns
+
+
+def _parse_numbers(values):
+    array = np.char.strip(np.asarray(values, dtype=str))
+    empty = array == ""
+    try:
+        if empty.any() or (np.char.find(array, ".") >= 0).any():
+            return np.where(empty, "nan", array).astype(np.float64)
+        return array.astype(np.int64)
+    except (ValueError, OverflowError):
+        return None
+
+
+def convert_rows_from_python_to_typed_columnar_data(names, types, rows, columnar_data):
+    if rows:
+        columns = list(zip(*rows))
+    else:
+        columns = [() for _ in names]
+    for name, type_, values in zip(names, types, columns):
+        column = columnar_data.columns.add()
+        column.name = name
+        parsed = None
+        if values and type_ == KiwoomOpenApiPlusFieldType.NUMBER:
+            parsed = _parse_numbers(values)
+        if parsed is None:
+            column.string_values.SetInParent()
+            column.string_values.values.extend(values)
+        elif parsed.dtype == np.int64:
+            column.long_values.values.extend(parsed.tolist())
+        else:
+            column.double_values.values.extend(parsed.tolist())
+    return columnar_data
+
+
+def convert_transaction_priority_from_protobuf_to_python(priority):
+    return {
+        KiwoomOpenApiPlusService_pb2.TransactionPriority.INTERACTIVE: RateLimitPriority.INTERACTIVE,
+        KiwoomOpenApiPlusService_pb2.TransactionPriority.ORDER_RELATED: RateLimitPriority.ORDER_RELATED,
+        KiwoomOpenApiPlusService_pb2.TransactionPriority.BULK: RateLimitPriority.BULK,
+    }.get(priority, RateLimitPriority.INTERACTIVE)
+
+
+MASTER_SNAPSHOT_MARKETS = ["0", "10", "3", "8", "50", "4", "5", "6", "9", "30"]
+
+MASTER_SNAPSHOT_FUNCTION_NAMES = [
+    "GetMasterCodeName",
+    "GetMasterListedStockCnt",
+    "GetMasterConstruction",
+    "GetMasterListedStockDate",
+    "GetMasterLastPrice",
+    "GetMasterStockState",
+]
+
+
+def convert_master_snapshot_from_python_to_protobuf(
+    code_lists, codes, values, response
+):
+    for market, code_list in code_lists.items():
+        response.code_lists[market] = code_list
+    column = response.master_data.columns.add()
+    column.name = "code"
+    column.string_values.SetInParent()
+    column.string_values.values.extend(codes)
+    for name, column_values in values.items():
+        column = response.master_data.columns.add()
+        column.name = name
+        if column_values and all(isinstance(value, int) for value in column_values):
+            column.long_values.values.extend(column_values)
+        else:
+            column.string_values.SetInParent()
+            column.string_values.values.extend(column_values)
+    return response
+
+
+def convert_master_snapshot_from_protobuf_to_python(response):
+    code_lists = dict(response.code_lists)
+    codes = []
+    values = {}
+    for column in response.master_data.columns:
+        column_values = list(getattr(column, column.WhichOneof("values")).values)
+        if column.name == "code":
+            codes = column_values
+        else:
+            values[column.name] = column_values
+    values = {
+        name: dict(zip(codes, column_values)) for name, column_values in values.items()
+    }
+    return code_lists, values
@@ -5,6 +5,12 @@ from concurrent.futures import ThreadPoolExecutor
 import grpc
 
 from koapy.backend.kiwoom_open_api_plus.grpc import KiwoomOpenApiPlusService_pb2_grpc
+from koapy.backend.kiwoom_open_api_plus.grpc.KiwoomOpenApiPlusServiceChannelOptions import (
+    KiwoomOpenApiPlusServiceChannelOptions,
+)
+from koapy.backend.kiwoom_open_api_plus.grpc.KiwoomOpenApiPlusServiceCompression import (
+    KiwoomOpenApiPlusServiceCompressionServerInterceptor,
+)
 from koapy.backend.kiwoom_open_api_plus.grpc.KiwoomOpenApiPlusServiceServicer import (
     KiwoomOpenApiPlusServiceServicer,
 )
@@ -58,6 +64,20 @@ class KiwoomOpenApiPlusServiceServer(Logging):
         grpc_server_bound_arguments = grpc_server_signature.bind_partial(
             **grpc_server_kwargs
         )
+
+        # 설정 파일의 채널 옵션과 압축 방식 적용
+        channel_options = KiwoomOpenApiPlusServiceChannelOptions("server")
+        channel_options.update_arguments(grpc_server_bound_arguments.arguments)
+        compression_by_method = channel_options.compression_by_method()
+        if compression_by_method:
+            interceptors = grpc_server_bound_arguments.arguments.get("interceptors")
+            interceptors = list(interceptors or [])
+            interceptors.append(
+                KiwoomOpenApiPlusServiceCompressionServerInterceptor(
+                    compression_by_method
+                )
+            )
+            grpc_server_bound_arguments.arguments["interceptors"] = interceptors
         if grpc_server_bound_arguments.arguments.get("thread_pool") is None:
             thread_pool_signature = inspect.signature(ThreadPoolExecutor)
             thread_pool_params = list(thread_pool_signature.parameters.keys())
@@ -126,6 +146,7 @@ class KiwoomOpenApiPlusServiceServer(Logging):
             self.reinitialize_server()
         if not self._server_started:
             self._server.start()
+            self._servicer.start()
             self._server_started = True
 
     def wait_for_termination(self, timeout=None):
@@ -136,6 +157,7 @@ class KiwoomOpenApiPlusServiceServer(Logging):
 
     def stop(self, grace=None):
         event = self._server.stop(grace)
+        self._servicer.close()
         self._server_stopped = True
         return event
 
@@ -3,6 +3,9 @@ import logging
 from koapy.backend.kiwoom_open_api_plus.core.KiwoomOpenApiPlusEventHandler import (
     KiwoomOpenApiPlusEventHandler,
 )
+from koapy.backend.kiwoom_open_api_plus.core.KiwoomOpenApiPlusRealDataRecorder import (
+    KiwoomOpenApiPlusRealDataRecorder,
+)
 from koapy.backend.kiwoom_open_api_plus.core.KiwoomOpenApiPlusScreenManager import (
     KiwoomOpenApiPlusScreenManager,
 )
@@ -31,6 +34,9 @@ from koapy.backend.kiwoom_open_api_plus.grpc.event.KiwoomOpenApiPlusOrderEventHa
     KiwoomOpenApiPlusAllOrderEventHandler,
     KiwoomOpenApiPlusOrderEventHandler,
 )
+from koapy.backend.kiwoom_open_api_plus.grpc.event.KiwoomOpenApiPlusRealDataHub import (
+    KiwoomOpenApiPlusRealDataHub,
+)
 from koapy.backend.kiwoom_open_api_plus.grpc.event.KiwoomOpenApiPlusRealEventHandler import (
     KiwoomOpenApiPlusBidirectionalRealEventHandler,
     KiwoomOpenApiPlusRealEventHandler,
@@ -39,8 +45,12 @@ from koapy.backend.kiwoom_open_api_plus.grpc.event.KiwoomOpenApiPlusTrEventHandl
     KiwoomOpenApiPlusTrEventHandler,
 )
 from koapy.backend.kiwoom_open_api_plus.grpc.KiwoomOpenApiPlusServiceMessageUtils import (
+    MASTER_SNAPSHOT_FUNCTION_NAMES,
+    MASTER_SNAPSHOT_MARKETS,
     convert_arguments_from_protobuf_to_python,
+    convert_master_snapshot_from_python_to_protobuf,
 )
+from koapy.config import config
 
 
 class KiwoomOpenApiPlusServiceServicer(
@@ -56,6 +66,25 @@ class KiwoomOpenApiPlusServiceServicer(
         self._control = control
         self._screen_manager = KiwoomOpenApiPlusScreenManager(self._control)
 
+        self._real_data_hub = None
+        if config.get_bool(
+            "koapy.backend.kiwoom_open_api_plus.grpc.server.real_data_hub.enabled",
+            True,
+        ):
+            self._real_data_hub = KiwoomOpenApiPlusRealDataHub(
+                self._control, self._screen_manager
+            )
+
+        # 나중에 재생할 수 있도록 실시간 이벤트를 원본 그대로 기록
+        self._real_data_recorder = None
+        recorder_filename = config.get_string(
+            "koapy.backend.kiwoom_open_api_plus.grpc.server.recorder.filename", None
+        )
+        if recorder_filename:
+            self._real_data_recorder = KiwoomOpenApiPlusRealDataRecorder(
+                self._control, recorder_filename
+            )
+
     @property
     def control(self):
         return self._control
@@ -64,6 +93,121 @@ class KiwoomOpenApiPlusServiceServicer(
     def screen_manager(self):
         return self._screen_manager
 
+    @property
+    def real_data_hub(self):
+        return self._real_data_hub
+
+    def start(self):
+        """
+        서버가 시작될 때 호출되며, 설정된 경우 실시간 이벤트 기록을 시작합니다.
+        """
+        if self._real_data_recorder is not None:
+            self._real_data_recorder.start()
+
+    def close(self):
+        """
+        서버가 종료될 때 호출되며, 기록중인 실시간 이벤트들을 마저 파일에 쓰고 파일을 닫습니다.
+        """
+        if self._real_data_recorder is not None:
+            self._real_data_recorder.stop()
+
+    # 0. event handlers for each rpc, shared with KiwoomOpenApiPlusServiceAsyncServicer
+
+    def _CreateListenHandler(self, request, context):
+        return KiwoomOpenApiPlusSomeEventHandler(self.control, request, context)
+
+    def _CreateBidirectionalListenHandler(self, request_iterator, context):
+        return KiwoomOpenApiPlusSomeBidirectionalEventHandler(
+            self.control, request_iterator, context
+        )
+
+    def _CreateLoginCallHandler(self, request, context):
+        return KiwoomOpenApiPlusLoginEventHandler(self.control, request, context)
+
+    def _CreateTransactionCallHandler(self, request, context):
+        trcode = request.transaction_code.upper()
+        if trcode in ["OPTKWFID", "OPTFOFID"]:
+            return KiwoomOpenApiPlusKwTrEventHandler(
+                self.control, request, context, self.screen_manager
+            )
+        return KiwoomOpenApiPlusTrEventHandler(
+            self.control, request, context, self.screen_manager
+        )
+
+    def _CreateOrderCallHandler(self, request, context):
+        return KiwoomOpenApiPlusOrderEventHandler(
+            self.control, request, context, self.screen_manager
+        )
+
+    def _CreateRealCallHandler(self, request, context):
+        real_data_hub = self.real_data_hub if len(request.screen_no) == 0 else None
+        return KiwoomOpenApiPlusRealEventHandler(
+            self.control, request, context, self.screen_manager, real_data_hub
+        )
+
+    def _CreateLoadConditionCallHandler(self, request, context):
+        return KiwoomOpenApiPlusLoadConditionEventHandler(
+            self.control, request, context
+        )
+
+    def _CreateConditionCallHandler(self, request, context):
+        return KiwoomOpenApiPlusConditionEventHandler(
+            self.control, request, context, self.screen_manager
+        )
+
+    def _CreateBidirectionalRealCallHandler(self, request_iterator, context):
+        return KiwoomOpenApiPlusBidirectionalRealEventHandler(
+            self.control,
+            request_iterator,
+            context,
+            self.screen_manager,
+            self.real_data_hub,
+        )
+
+    def _CreateOrderListenHandler(self, request, context):
+        return KiwoomOpenApiPlusAllOrderEventHandler(self.control, context)
+
+    def _CreateCustomHandler(self, code, class_name, request, context):
+        if code and class_name:
+            global_vars = {}
+            local_vars = {}
+            exec(code, global_vars, local_vars)  # pylint: disable=exec-used
+            handler = eval(class_name, global_vars, local_vars)(
+                self.control, request, context
+            )  # pylint: disable=eval-used
+            assert isinstance(handler, KiwoomOpenApiPlusEventHandler)
+        else:
+            handler = KiwoomOpenApiPlusAllEventHandler(self.control, context)
+        return handler
+
+    def _CreateCustomListenHandler(self, request, context):
+        return self._CreateCustomHandler(
+            request.code, request.class_name, request, context
+        )
+
+    def _CreateCustomCallAndListenHandler(self, request, context):
+        return self._CreateCustomHandler(
+            request.listen_request.code,
+            request.listen_request.class_name,
+            request,
+            context,
+        )
+
+    def _MakeCallAndListenResponse(self, result):
+        response = KiwoomOpenApiPlusService_pb2.CallAndListenResponse()
+        if isinstance(result, str):
+            response.call_response.return_value.string_value = result
+        elif isinstance(result, int):
+            response.call_response.return_value.long_value = result
+        elif result is None:
+            pass
+        else:
+            raise TypeError(
+                "Unexpected return value type from server side dynamicCall(): %s"
+                % type(result)
+            )
+        return response
+
     # 1. rpcs for general function calls
 
     def Call(self, request, context):
@@ -75,11 +219,55 @@ class KiwoomOpenApiPlusServiceServicer(
 
         함수의 파라미터와 리턴값은 문자열/숫자/불리언 등의 단순한 타입만 지원합니다.
         """
+        response = KiwoomOpenApiPlusService_pb2.CallResponse()
+        self._HandleCallRequest(request, response)
+        return response
+
+    def BatchCall(self, request, context):
+        """
+        복수개의 함수 호출을 한번의 RPC 로 처리합니다.
+
+        각 호출은 Call() 과 동일하게 요청된 순서대로 처리되며 결과도 같은 순서로 전달됩니다.
+        종목명 조회처럼 가벼운 호출을 여러번 반복하는 경우 왕복 횟수를 줄이기 위해 사용합니다.
+        """
+        response = KiwoomOpenApiPlusService_pb2.BatchCallResponse()
+        for call_request in request.calls:
+            self._HandleCallRequest(call_request, response.responses.add())
+        return response
+
+    def MasterSnapshotCall(self, request, context):
+        """
+        전체 시장의 종목코드 목록과 종목별 종목명, 상장주식수, 감리구분, 상장일, 전일가, 종목상태를
+        한번에 전달합니다.
+
+        클라이언트는 이를 거래일 단위로 캐싱해두고 GetMasterXXX() 함수들을 로컬에서 처리합니다.
+        """
+        markets = list(request.markets) or MASTER_SNAPSHOT_MARKETS
+        code_lists = {}
+        codes = []
+        seen = set()
+        for market in markets:
+            code_list = self.control.GetCodeListByMarket(market)
+            code_lists[market] = code_list
+            for code in code_list.split(";"):
+                if code and code not in seen:
+                    seen.add(code)
+                    codes.append(code)
+        values = {}
+        for name in MASTER_SNAPSHOT_FUNCTION_NAMES:
+            function = getattr(self.control, name)
+            values[name] = [function(code) for code in codes]
+        response = KiwoomOpenApiPlusService_pb2.MasterSnapshotResponse()
+        convert_master_snapshot_from_python_to_protobuf(
+            code_lists, codes, values, response
+        )
+        return response
+
+    def _HandleCallRequest(self, request, response):
         name = request.name
         arguments = convert_arguments_from_protobuf_to_python(request.arguments)
         function = getattr(self.control, name)
         result = function(*arguments)
-        response = KiwoomOpenApiPlusService_pb2.CallResponse()
         if isinstance(result, str):
             response.return_value.string_value = result
         elif isinstance(result, bool):
@@ -93,7 +281,6 @@ class KiwoomOpenApiPlusServiceServicer(
                 "Unexpected return value type from server side dynamicCall(): %s"
                 % type(result)
             )
-        return response
 
     # 2. rpcs for listening and handling events
 
@@ -106,9 +293,7 @@ class KiwoomOpenApiPlusServiceServicer(
 
         서버측의 이벤트 핸들러 함수는 해당 이벤트를 클라이언트에 전송한 이후 즉시 종료됩니다.
         """
-        with KiwoomOpenApiPlusSomeEventHandler(
-            self.control, request, context
-        ) as handler:
+        with self._CreateListenHandler(request, context) as handler:
             for response in handler:
                 yield response
 
@@ -123,9 +308,13 @@ class KiwoomOpenApiPlusServiceServicer(
         다시 클라이언트 측에서 ACK 요청을 줄 때 까지 서버측 이벤트 핸들러 함수 내에서 대기합니다.
         따라서 클라이언트는 서버측 이벤트 핸들러 함수 컨텍스트 내에서 이벤트를 처리할 수 있고
         처리를 완료하면 다시 서버측으로 ACK 요청을 보내 서버측 이벤트 핸들러가 완료될 수 있도록 해야 합니다.
+
+        첫 요청의 initial_credits 가 0 보다 큰 경우 서버는 해당 개수만큼은 ACK 를 기다리지 않고 이벤트를 전달하며,
+        클라이언트는 grant_request 로 크레딧을 추가로 부여합니다. 이 경우 스트림 중간에 listen_request 를 다시 보내서
+        구독할 이벤트 목록을 바꿀 수 있으므로, 하나의 스트림으로 여러 이벤트를 구독하고 클라이언트에서 나눠서 처리할 수 있습니다.
         """
-        with KiwoomOpenApiPlusSomeBidirectionalEventHandler(
-            self.control, request_iterator, context
+        with self._CreateBidirectionalListenHandler(
+            request_iterator, context
         ) as handler:
             for response in handler:
                 yield response
@@ -139,9 +328,7 @@ class KiwoomOpenApiPlusServiceServicer(
         CommConnect() 메소드 호출 이후 발생하는 OnEventConnect() 이벤트를 처리하고
         클라이언트에도 해당 이벤트 내용을 전달합니다.
         """
-        with KiwoomOpenApiPlusLoginEventHandler(
-            self.control, request, context
-        ) as handler:
+        with self._CreateLoginCallHandler(request, context) as handler:
             for response in handler:
                 yield response
 
@@ -169,18 +356,7 @@ class KiwoomOpenApiPlusServiceServicer(
         몇몇 상황에서는 해당 실시간 데이터가 유용할 수 있으나 현재 KOAPY 에서는 별도로 사용하진 않고 있으며,
         TR 에 대한 응답처리가 모두 완료된 이후에는 해당 실시간 데이터를 등록 해제하도록 처리하고 있습니다.
         """
-        trcode = request.transaction_code.upper()
-
-        if trcode in ["OPTKWFID", "OPTFOFID"]:
-            handler = KiwoomOpenApiPlusKwTrEventHandler(
-                self.control, request, context, self.screen_manager
-            )
-        else:
-            handler = KiwoomOpenApiPlusTrEventHandler(
-                self.control, request, context, self.screen_manager
-            )
-
-        with handler:
+        with self._CreateTransactionCallHandler(request, context) as handler:
             for response in handler:
                 yield response
 
@@ -201,9 +377,7 @@ class KiwoomOpenApiPlusServiceServicer(
 
         기본적으로 매수/매도 주문의 경우 주문받은 수량이 모두 체결될때까지 이벤트를 처리해 전달합니다.
         """
-        with KiwoomOpenApiPlusOrderEventHandler(
-            self.control, request, context, self.screen_manager
-        ) as handler:
+        with self._CreateOrderCallHandler(request, context) as handler:
             for response in handler:
                 yield response
 
@@ -222,10 +396,11 @@ class KiwoomOpenApiPlusServiceServicer(
         해당 RPC 는 별도의 이벤트 종료 상황이 존재하지 않기 때문에 더이상 사용하지 않는 경우
         클라이언트 측에서 해당 RPC 연결을 해제하는 식으로 더 이상 이벤트를 받지 않을 수 있습니다.
         이 경우 서버에서는 내부적으로 기 등록된 실시간 데이터에 대해 SetRealRemove() 가 호출됩니다.
+
+        화면번호를 직접 지정하지 않은 요청들은 실시간 데이터 허브를 통해 같은 종목의 등록을 서로 공유하며,
+        이 경우 SetRealRemove() 는 해당 종목을 구독하는 마지막 스트림이 종료될 때 호출됩니다.
         """
-        with KiwoomOpenApiPlusRealEventHandler(
-            self.control, request, context, self.screen_manager
-        ) as handler:
+        with self._CreateRealCallHandler(request, context) as handler:
             for response in handler:
                 yield response
 
@@ -236,9 +411,7 @@ class KiwoomOpenApiPlusServiceServicer(
         GetConditionLoad() 메소드 호출 이후 발생하는 OnReceiveConditionVer() 이벤트를 처리하고
         클라이언트에도 해당 이벤트 내용을 전달합니다.
         """
-        with KiwoomOpenApiPlusLoadConditionEventHandler(
-            self.control, request, context
-        ) as handler:
+        with self._CreateLoadConditionCallHandler(request, context) as handler:
             for response in handler:
                 yield response
 
@@ -249,9 +422,7 @@ class KiwoomOpenApiPlusServiceServicer(
         SendCondition() 메소드 호출 이후 발생하는 OnReceiveTrCondition() 혹은 OnReceiveRealCondition() 이벤트를
         처리하고 클라이언트에도 해당 이벤트 내용을 전달합니다.
         """
-        with KiwoomOpenApiPlusConditionEventHandler(
-            self.control, request, context, self.screen_manager
-        ) as handler:
+        with self._CreateConditionCallHandler(request, context) as handler:
             for response in handler:
                 yield response
 
@@ -265,8 +436,8 @@ class KiwoomOpenApiPlusServiceServicer(
         새로운 BidirectionalRealCall() 에서는 최초 설정된 이벤트 스트림을 계속 유지하면서
         신규 실시간 데이터 등록 혹은 해지를 추가로 요청해 반영할 수 있습니다.
         """
-        with KiwoomOpenApiPlusBidirectionalRealEventHandler(
-            self.control, request_iterator, context, self.screen_manager
+        with self._CreateBidirectionalRealCallHandler(
+            request_iterator, context
         ) as handler:
             for response in handler:
                 yield response
@@ -278,7 +449,7 @@ class KiwoomOpenApiPlusServiceServicer(
         기존의 OrderCall() RPC 는 특정 주문을 수행하고 해당 주문과 관련된 이벤트들만 반환했다면
         해당 RPC 는 특정 주문 수행 없이 모든 주문관련 이벤트를 듣고 싶을때 사용할 수 있습니다.
         """
-        with KiwoomOpenApiPlusAllOrderEventHandler(self.control, context) as handler:
+        with self._CreateOrderListenHandler(request, context) as handler:
             for response in handler:
                 yield response
 
@@ -293,19 +464,7 @@ class KiwoomOpenApiPlusServiceServicer(
 
         내부적으로 exec() 및 eval() 을 사용하기 때문에 실행될 코드의 보안 및 안정성에 주의가 필요합니다.
         """
-        code = request.code
-        class_name = request.class_name
-        if code and class_name:
-            global_vars = {}
-            local_vars = {}
-            exec(code, global_vars, local_vars)  # pylint: disable=exec-used
-            handler = eval(class_name, global_vars, local_vars)(
-                self.control, request, context
-            )  # pylint: disable=eval-used
-            assert isinstance(handler, KiwoomOpenApiPlusEventHandler)
-        else:
-            handler = KiwoomOpenApiPlusAllEventHandler(self.control, context)
-        with handler:
+        with self._CreateCustomListenHandler(request, context) as handler:
             for response in handler:
                 yield response
 
@@ -323,33 +482,9 @@ class KiwoomOpenApiPlusServiceServicer(
         name = request.name
         arguments = convert_arguments_from_protobuf_to_python(request.arguments)
         function = getattr(self.control, name)
-        code = request.listen_request.code
-        class_name = request.listen_request.class_name
-        if code and class_name:
-            global_vars = {}
-            local_vars = {}
-            exec(code, global_vars, local_vars)  # pylint: disable=exec-used
-            handler = eval(class_name, global_vars, local_vars)(
-                self.control, request, context
-            )  # pylint: disable=eval-used
-            assert isinstance(handler, KiwoomOpenApiPlusEventHandler)
-        else:
-            handler = KiwoomOpenApiPlusAllEventHandler(self.control, context)
-        with handler:
+        with self._CreateCustomCallAndListenHandler(request, context) as handler:
             result = function(*arguments)
-            response = KiwoomOpenApiPlusService_pb2.CallAndListenResponse()
-            if isinstance(result, str):
-                response.call_response.return_value.string_value = result
-            elif isinstance(result, int):
-                response.call_response.return_value.long_value = result
-            elif result is None:
-                pass
-            else:
-                raise TypeError(
-                    "Unexpected return value type from server side dynamicCall(): %s"
-                    % type(result)
-                )
-            yield response
+            yield self._MakeCallAndListenResponse(result)
             for listen_response in handler:
                 response = KiwoomOpenApiPlusService_pb2.CallAndListenResponse()
                 response.listen_response = listen_response
@@ -12,19 +12,23 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\nFkoapy/backend/kiwoom_open_api_plus/grpc/KiwoomOpenApiPlusService.proto\x12\'koapy.backend.kiwoom_open_api_plus.grpc\"W\n\x08\x41rgument\x12\x16\n\x0cstring_value\x18\x01 \x01(\tH\x00\x12\x14\n\nlong_value\x18\x02 \x01(\x03H\x00\x12\x14\n\nbool_value\x18\x03 \x01(\x08H\x00\x42\x07\n\x05value\"a\n\x0b\x43\x61llRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x44\n\targuments\x18\x02 \x03(\x0b\x32\x31.koapy.backend.kiwoom_open_api_plus.grpc.Argument\"Z\n\x0bReturnValue\x12\x16\n\x0cstring_value\x18\x01 \x01(\tH\x00\x12\x14\n\nlong_value\x18\x02 \x01(\x03H\x00\x12\x14\n\nbool_value\x18\x03 \x01(\x08H\x00\x42\x07\n\x05value\"Z\n\x0c\x43\x61llResponse\x12J\n\x0creturn_value\x18\x01 \x01(\x0b\x32\x34.koapy.backend.kiwoom_open_api_plus.grpc.ReturnValue\"L\n\rListenRequest\x12\n\n\x02id\x18\x01 \x01(\t\x12\r\n\x05slots\x18\x02 \x03(\t\x12\x0c\n\x04\x63ode\x18\x03 \x01(\t\x12\x12\n\nclass_name\x18\x04 \x01(\t\"\x1e\n\x0eHandledRequest\x12\x0c\n\x04time\x18\x01 \x01(\x02\"!\n\x11StopListenRequest\x12\x0c\n\x04time\x18\x01 \x01(\x02\"\xa8\x02\n\x1a\x42idirectionalListenRequest\x12P\n\x0elisten_request\x18\x01 \x01(\x0b\x32\x36.koapy.backend.kiwoom_open_api_plus.grpc.ListenRequestH\x00\x12R\n\x0fhandled_request\x18\x02 \x01(\x0b\x32\x37.koapy.backend.kiwoom_open_api_plus.grpc.HandledRequestH\x00\x12Y\n\x13stop_listen_request\x18\x03 \x01(\x0b\x32:.koapy.backend.kiwoom_open_api_plus.grpc.StopListenRequestH\x00\x42\t\n\x07request\"+\n\nSingleData\x12\r\n\x05names\x18\x01 \x03(\t\x12\x0e\n\x06values\x18\x02 \x03(\t\" \n\x0eRepeatedString\x12\x0e\n\x06values\x18\x01 \x03(\t\"c\n\tMultiData\x12\r\n\x05names\x18\x01 \x03(\t\x12G\n\x06values\x18\x02 \x03(\x0b\x32\x37.koapy.backend.kiwoom_open_api_plus.grpc.RepeatedString\"\xf6\x01\n\x0eListenResponse\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x44\n\targuments\x18\x02 \x03(\x0b\x32\x31.koapy.backend.kiwoom_open_api_plus.grpc.Argument\x12H\n\x0bsingle_data\x18\x03 \x01(\x0b\x32\x33.koapy.backend.kiwoom_open_api_plus.grpc.SingleData\x12\x46\n\nmulti_data\x18\x04 \x01(\x0b\x32\x32.koapy.backend.kiwoom_open_api_plus.grpc.MultiData\"\xb2\x01\n\x14\x43\x61llAndListenRequest\x12J\n\x0c\x63\x61ll_request\x18\x01 \x01(\x0b\x32\x34.koapy.backend.kiwoom_open_api_plus.grpc.CallRequest\x12N\n\x0elisten_request\x18\x02 \x01(\x0b\x32\x36.koapy.backend.kiwoom_open_api_plus.grpc.ListenRequest\"\xc7\x01\n\x15\x43\x61llAndListenResponse\x12N\n\rcall_response\x18\x01 \x01(\x0b\x32\x35.koapy.backend.kiwoom_open_api_plus.grpc.CallResponseH\x00\x12R\n\x0flisten_response\x18\x02 \x01(\x0b\x32\x37.koapy.backend.kiwoom_open_api_plus.grpc.ListenResponseH\x00\x42\n\n\x08response\"\x8d\x02\n\x10LoginCredentials\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\x15\n\ruser_password\x18\x02 \x01(\t\x12\x15\n\rcert_password\x18\x03 \x01(\t\x12\x15\n\ris_simulation\x18\x04 \x01(\x08\x12j\n\x11\x61\x63\x63ount_passwords\x18\x05 \x03(\x0b\x32O.koapy.backend.kiwoom_open_api_plus.grpc.LoginCredentials.AccountPasswordsEntry\x1a\x37\n\x15\x41\x63\x63ountPasswordsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"^\n\x0cLoginRequest\x12N\n\x0b\x63redentials\x18\x01 \x01(\x0b\x32\x39.koapy.backend.kiwoom_open_api_plus.grpc.LoginCredentials\"R\n\x10RealRequestFlags\x12\x12\n\ninfer_fids\x18\x01 \x01(\x08\x12\x16\n\x0ereadable_names\x18\x02 \x01(\x08\x12\x12\n\nfast_parse\x18\x03 \x01(\x08\"\xa1\x01\n\x0bRealRequest\x12\x11\n\tscreen_no\x18\x01 \x03(\t\x12\x11\n\tcode_list\x18\x02 \x03(\t\x12\x10\n\x08\x66id_list\x18\x03 \x03(\x05\x12\x10\n\x08opt_type\x18\x04 \x01(\t\x12H\n\x05\x66lags\x18\x05 \x01(\x0b\x32\x39.koapy.backend.kiwoom_open_api_plus.grpc.RealRequestFlags\"\x97\x01\n\x18TransactionStopCondition\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t\x12^\n\ncomparator\x18\x03 \x01(\x0e\x32J.koapy.backend.kiwoom_open_api_plus.grpc.TransactionStopConditionCompartor\"\x84\x03\n\x12TransactionRequest\x12\x14\n\x0crequest_name\x18\x01 \x01(\t\x12\x18\n\x10transaction_code\x18\x02 \x01(\t\x12\x11\n\tscreen_no\x18\x03 \x01(\t\x12W\n\x06inputs\x18\x04 \x03(\x0b\x32G.koapy.backend.kiwoom_open_api_plus.grpc.TransactionRequest.InputsEntry\x12Y\n\x0estop_condition\x18\x05 \x01(\x0b\x32\x41.koapy.backend.kiwoom_open_api_plus.grpc.TransactionStopCondition\x12H\n\x05\x66lags\x18\x06 \x01(\x0b\x32\x39.koapy.backend.kiwoom_open_api_plus.grpc.RealRequestFlags\x1a-\n\x0bInputsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"]\n\x17OrderSubscriptionTarget\x12\x0b\n\x03RET\x18\x01 \x01(\x08\x12\n\n\x02TR\x18\x02 \x01(\x08\x12\x0c\n\x04REAL\x18\x03 \x01(\x08\x12\x0b\n\x03MSG\x18\x04 \x01(\x08\x12\x0e\n\x06\x43HEJAN\x18\x05 \x01(\x08\"\x8f\x02\n\x0cOrderRequest\x12\x14\n\x0crequest_name\x18\x01 \x01(\t\x12\x11\n\tscreen_no\x18\x02 \x01(\t\x12\x12\n\naccount_no\x18\x03 \x01(\t\x12\x12\n\norder_type\x18\x04 \x01(\x03\x12\x0c\n\x04\x63ode\x18\x05 \x01(\t\x12\x10\n\x08quantity\x18\x06 \x01(\x03\x12\r\n\x05price\x18\x07 \x01(\x03\x12\x12\n\nquote_type\x18\x08 \x01(\t\x12\x19\n\x11original_order_no\x18\t \x01(\t\x12P\n\x06target\x18\n \x01(\x0b\x32@.koapy.backend.kiwoom_open_api_plus.grpc.OrderSubscriptionTarget\"\x16\n\x14LoadConditionRequest\"D\n\x15\x43onditionRequestFlags\x12\x11\n\twith_info\x18\x01 \x01(\x08\x12\x18\n\x10is_future_option\x18\x02 \x01(\x08\"\xd0\x01\n\x10\x43onditionRequest\x12\x11\n\tscreen_no\x18\x01 \x01(\t\x12\x16\n\x0e\x63ondition_name\x18\x02 \x01(\t\x12\x17\n\x0f\x63ondition_index\x18\x03 \x01(\x05\x12\x13\n\x0bsearch_type\x18\x04 \x01(\x05\x12\x14\n\x0crequest_name\x18\x05 \x01(\t\x12M\n\x05\x66lags\x18\x06 \x01(\x0b\x32>.koapy.backend.kiwoom_open_api_plus.grpc.ConditionRequestFlags\"3\n\x12SetLogLevelRequest\x12\r\n\x05level\x18\x01 \x01(\x05\x12\x0e\n\x06logger\x18\x02 \x01(\t\"\x15\n\x13SetLogLevelResponse\"\x80\x01\n\"BidirectionalRealInitializeRequest\x12\x10\n\x08\x66id_list\x18\x01 \x03(\x05\x12H\n\x05\x66lags\x18\x02 \x01(\x0b\x32\x39.koapy.backend.kiwoom_open_api_plus.grpc.RealRequestFlags\"G\n BidirectionalRealRegisterRequest\x12\x11\n\tcode_list\x18\x01 \x03(\t\x12\x10\n\x08\x66id_list\x18\x02 \x03(\x05\"3\n\x1e\x42idirectionalRealRemoveRequest\x12\x11\n\tcode_list\x18\x01 \x03(\t\"\x1e\n\x1c\x42idirectionalRealStopRequest\"\xb9\x03\n\x18\x42idirectionalRealRequest\x12i\n\x12initialize_request\x18\x01 \x01(\x0b\x32K.koapy.backend.kiwoom_open_api_plus.grpc.BidirectionalRealInitializeRequestH\x00\x12\x65\n\x10register_request\x18\x02 \x01(\x0b\x32I.koapy.backend.kiwoom_open_api_plus.grpc.BidirectionalRealRegisterRequestH\x00\x12\x61\n\x0eremove_request\x18\x03 \x01(\x0b\x32G.koapy.backend.kiwoom_open_api_plus.grpc.BidirectionalRealRemoveRequestH\x00\x12]\n\x0cstop_request\x18\x04 \x01(\x0b\x32\x45.koapy.backend.kiwoom_open_api_plus.grpc.BidirectionalRealStopRequestH\x00\x42\t\n\x07request*\x9d\x01\n!TransactionStopConditionCompartor\x12\x19\n\x15LESS_THAN_OR_EQUAL_TO\x10\x00\x12\r\n\tLESS_THAN\x10\x01\x12\x1c\n\x18GREATER_THAN_OR_EQUAL_TO\x10\x02\x12\x10\n\x0cGREATER_THAN\x10\x03\x12\x0c\n\x08\x45QUAL_TO\x10\x04\x12\x10\n\x0cNOT_EQUAL_TO\x10\x05\x32\xa6\x0f\n\x18KiwoomOpenApiPlusService\x12u\n\x04\x43\x61ll\x12\x34.koapy.backend.kiwoom_open_api_plus.grpc.CallRequest\x1a\x35.koapy.backend.kiwoom_open_api_plus.grpc.CallResponse\"\x00\x12}\n\x06Listen\x12\x36.koapy.backend.kiwoom_open_api_plus.grpc.ListenRequest\x1a\x37.koapy.backend.kiwoom_open_api_plus.grpc.ListenResponse\"\x00\x30\x01\x12\x99\x01\n\x13\x42idirectionalListen\x12\x43.koapy.backend.kiwoom_open_api_plus.grpc.BidirectionalListenRequest\x1a\x37.koapy.backend.kiwoom_open_api_plus.grpc.ListenResponse\"\x00(\x01\x30\x01\x12\x7f\n\tLoginCall\x12\x35.koapy.backend.kiwoom_open_api_plus.grpc.LoginRequest\x1a\x37.koapy.backend.kiwoom_open_api_plus.grpc.ListenResponse\"\x00\x30\x01\x12\x8b\x01\n\x0fTransactionCall\x12;.koapy.backend.kiwoom_open_api_plus.grpc.TransactionRequest\x1a\x37.koapy.backend.kiwoom_open_api_plus.grpc.ListenResponse\"\x00\x30\x01\x12\x7f\n\tOrderCall\x12\x35.koapy.backend.kiwoom_open_api_plus.grpc.OrderRequest\x1a\x37.koapy.backend.kiwoom_open_api_plus.grpc.ListenResponse\"\x00\x30\x01\x12}\n\x08RealCall\x12\x34.koapy.backend.kiwoom_open_api_plus.grpc.RealRequest\x1a\x37.koapy.backend.kiwoom_open_api_plus.grpc.ListenResponse\"\x00\x30\x01\x12\x8f\x01\n\x11LoadConditionCall\x12=.koapy.backend.kiwoom_open_api_plus.grpc.LoadConditionRequest\x1a\x37.koapy.backend.kiwoom_open_api_plus.grpc.ListenResponse\"\x00\x30\x01\x12\x87\x01\n\rConditionCall\x12\x39.koapy.backend.kiwoom_open_api_plus.grpc.ConditionRequest\x1a\x37.koapy.backend.kiwoom_open_api_plus.grpc.ListenResponse\"\x00\x30\x01\x12\x99\x01\n\x15\x42idirectionalRealCall\x12\x41.koapy.backend.kiwoom_open_api_plus.grpc.BidirectionalRealRequest\x1a\x37.koapy.backend.kiwoom_open_api_plus.grpc.ListenResponse\"\x00(\x01\x30\x01\x12\x82\x01\n\x0bOrderListen\x12\x36.koapy.backend.kiwoom_open_api_plus.grpc.ListenRequest\x1a\x37.koapy.backend.kiwoom_open_api_plus.grpc.ListenResponse\"\x00\x30\x01\x12\x83\x01\n\x0c\x43ustomListen\x12\x36.koapy.backend.kiwoom_open_api_plus.grpc.ListenRequest\x1a\x37.koapy.backend.kiwoom_open_api_plus.grpc.ListenResponse\"\x00\x30\x01\x12\x98\x01\n\x13\x43ustomCallAndListen\x12=.koapy.backend.kiwoom_open_api_plus.grpc.CallAndListenRequest\x1a>.koapy.backend.kiwoom_open_api_plus.grpc.CallAndListenResponse\"\x00\x30\x01\x12\x8a\x01\n\x0bSetLogLevel\x12;.koapy.backend.kiwoom_open_api_plus.grpc.SetLogLevelRequest\x1a<.koapy.backend.kiwoom_open_api_plus.grpc.SetLogLevelResponse\"\x00\x62\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\nFkoapy/backend/kiwoom_open_api_plus/grpc/KiwoomOpenApiPlusService.proto\x12\'koapy.backend.kiwoom_open_api_plus.grpc\"W\n\x08\x41rgument\x12\x16\n\x0cstring_value\x18\x01 \x01(\tH\x00\x12\x14\n\nlong_value\x18\x02 \x01(\x03H\x00\x12\x14\n\nbool_value\x18\x03 \x01(\x08H\x00\x42\x07\n\x05value\"a\n\x0b\x43\x61llRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x44\n\targuments\x18\x02 \x03(\x0b\x32\x31.koapy.backend.kiwoom_open_api_plus.grpc.Argument\"Z\n\x0bReturnValue\x12\x16\n\x0cstring_value\x18\x01 \x01(\tH\x00\x12\x14\n\nlong_value\x18\x02 \x01(\x03H\x00\x12\x14\n\nbool_value\x18\x03 \x01(\x08H\x00\x42\x07\n\x05value\"Z\n\x0c\x43\x61llResponse\x12J\n\x0creturn_value\x18\x01 \x01(\x0b\x32\x34.koapy.backend.kiwoom_open_api_plus.grpc.ReturnValue\"W\n\x10\x42\x61tchCallRequest\x12\x43\n\x05\x63\x61lls\x18\x01 \x03(\x0b\x32\x34.koapy.backend.kiwoom_open_api_plus.grpc.CallRequest\"]\n\x11\x42\x61tchCallResponse\x12H\n\tresponses\x18\x01 \x03(\x0b\x32\x35.koapy.backend.kiwoom_open_api_plus.grpc.CallResponse\"(\n\x15MasterSnapshotRequest\x12\x0f\n\x07markets\x18\x01 \x03(\t\"\xfa\x01\n\x16MasterSnapshotResponse\x12\x62\n\ncode_lists\x18\x01 \x03(\x0b\x32N.koapy.backend.kiwoom_open_api_plus.grpc.MasterSnapshotResponse.CodeListsEntry\x12J\n\x0bmaster_data\x18\x02 \x01(\x0b\x32\x35.koapy.backend.kiwoom_open_api_plus.grpc.ColumnarData\x1a\x30\n\x0e\x43odeListsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"e\n\rListenRequest\x12\n\n\x02id\x18\x01 \x01(\t\x12\r\n\x05slots\x18\x02 \x03(\t\x12\x0c\n\x04\x63ode\x18\x03 \x01(\t\x12\x12\n\nclass_name\x18\x04 \x01(\t\x12\x17\n\x0finitial_credits\x18\x05 \x01(\x05\"\x1e\n\x0eHandledRequest\x12\x0c\n\x04time\x18\x01 \x01(\x02\"!\n\x11StopListenRequest\x12\x0c\n\x04time\x18\x01 \x01(\x02\"\x1f\n\x0cGrantRequest\x12\x0f\n\x07\x63redits\x18\x01 \x01(\x05\"\xf8\x02\n\x1a\x42idirectionalListenRequest\x12P\n\x0elisten_request\x18\x01 \x01(\x0b\x32\x36.koapy.backend.kiwoom_open_api_plus.grpc.ListenRequestH\x00\x12R\n\x0fhandled_request\x18\x02 \x01(\x0b\x32\x37.koapy.backend.kiwoom_open_api_plus.grpc.HandledRequestH\x00\x12Y\n\x13stop_listen_request\x18\x03 \x01(\x0b\x32:.koapy.backend.kiwoom_open_api_plus.grpc.StopListenRequestH\x00\x12N\n\rgrant_request\x18\x04 \x01(\x0b\x32\x35.koapy.backend.kiwoom_open_api_plus.grpc.GrantRequestH\x00\x42\t\n\x07request\"+\n\nSingleData\x12\r\n\x05names\x18\x01 \x03(\t\x12\x0e\n\x06values\x18\x02 \x03(\t\" \n\x0eRepeatedString\x12\x0e\n\x06values\x18\x01 \x03(\t\"c\n\tMultiData\x12\r\n\x05names\x18\x01 \x03(\t\x12G\n\x06values\x18\x02 \x03(\x0b\x32\x37.koapy.backend.kiwoom_open_api_plus.grpc.RepeatedString\"\x1c\n\nInt64Array\x12\x0e\n\x06values\x18\x01 \x03(\x03\"\x1d\n\x0b\x44oubleArray\x12\x0e\n\x06values\x18\x01 \x03(\x01\"\x8d\x02\n\x06\x43olumn\x12\x0c\n\x04name\x18\x01 \x01(\t\x12P\n\rstring_values\x18\x02 \x01(\x0b\x32\x37.koapy.backend.kiwoom_open_api_plus.grpc.RepeatedStringH\x00\x12J\n\x0blong_values\x18\x03 \x01(\x0b\x32\x33.koapy.backend.kiwoom_open_api_plus.grpc.Int64ArrayH\x00\x12M\n\rdouble_values\x18\x04 \x01(\x0b\x32\x34.koapy.backend.kiwoom_open_api_plus.grpc.DoubleArrayH\x00\x42\x08\n\x06values\"P\n\x0c\x43olumnarData\x12@\n\x07\x63olumns\x18\x01 \x03(\x0b\x32/.koapy.backend.kiwoom_open_api_plus.grpc.Column\"\xc5\x04\n\x0eListenResponse\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x44\n\targuments\x18\x02 \x03(\x0b\x32\x31.koapy.backend.kiwoom_open_api_plus.grpc.Argument\x12H\n\x0bsingle_data\x18\x03 \x01(\x0b\x32\x33.koapy.backend.kiwoom_open_api_plus.grpc.SingleData\x12\x46\n\nmulti_data\x18\x04 \x01(\x0b\x32\x32.koapy.backend.kiwoom_open_api_plus.grpc.MultiData\x12L\n\rcolumnar_data\x18\x05 \x01(\x0b\x32\x35.koapy.backend.kiwoom_open_api_plus.grpc.ColumnarData\x12P\n\x11typed_single_data\x18\x06 \x01(\x0b\x32\x35.koapy.backend.kiwoom_open_api_plus.grpc.ColumnarData\x12Q\n\x10real_data_schema\x18\x07 \x01(\x0b\x32\x37.koapy.backend.kiwoom_open_api_plus.grpc.RealDataSchema\x12\x11\n\tschema_id\x18\x08 \x01(\x05\x12G\n\x06\x65vents\x18\t \x03(\x0b\x32\x37.koapy.backend.kiwoom_open_api_plus.grpc.ListenResponse\"\xb2\x01\n\x14\x43\x61llAndListenRequest\x12J\n\x0c\x63\x61ll_request\x18\x01 \x01(\x0b\x32\x34.koapy.backend.kiwoom_open_api_plus.grpc.CallRequest\x12N\n\x0elisten_request\x18\x02 \x01(\x0b\x32\x36.koapy.backend.kiwoom_open_api_plus.grpc.ListenRequest\"\xc7\x01\n\x15\x43\x61llAndListenResponse\x12N\n\rcall_response\x18\x01 \x01(\x0b\x32\x35.koapy.backend.kiwoom_open_api_plus.grpc.CallResponseH\x00\x12R\n\x0flisten_response\x18\x02 \x01(\x0b\x32\x37.koapy.backend.kiwoom_open_api_plus.grpc.ListenResponseH\x00\x42\n\n\x08response\"\x8d\x02\n\x10LoginCredentials\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\x15\n\ruser_password\x18\x02 \x01(\t\x12\x15\n\rcert_password\x18\x03 \x01(\t\x12\x15\n\ris_simulation\x18\x04 \x01(\x08\x12j\n\x11\x61\x63\x63ount_passwords\x18\x05 \x03(\x0b\x32O.koapy.backend.kiwoom_open_api_plus.grpc.LoginCredentials.AccountPasswordsEntry\x1a\x37\n\x15\x41\x63\x63ountPasswordsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"^\n\x0cLoginRequest\x12N\n\x0b\x63redentials\x18\x01 \x01(\x0b\x32\x39.koapy.backend.kiwoom_open_api_plus.grpc.LoginCredentials\"\x99\x02\n\x10RealRequestFlags\x12\x12\n\ninfer_fids\x18\x01 \x01(\x08\x12\x16\n\x0ereadable_names\x18\x02 \x01(\x08\x12\x12\n\nfast_parse\x18\x03 \x01(\x08\x12\x16\n\x0e\x63ompact_schema\x18\x04 \x01(\x08\x12\x16\n\x0emax_batch_size\x18\x05 \x01(\x05\x12\x15\n\rmax_linger_ms\x18\x06 \x01(\x05\x12\x10\n\x08\x63onflate\x18\x07 \x01(\x08\x12\x1c\n\x14\x63onflate_interval_ms\x18\x08 \x01(\x05\x12\x1a\n\x12lossless_realtypes\x18\t \x03(\t\x12\x15\n\rqueue_maxsize\x18\n \x01(\x05\x12\x1b\n\x13\x62\x61\x63kpressure_policy\x18\x0b \x01(\t\"R\n\x0eRealDataSchema\x12\x11\n\tschema_id\x18\x01 \x01(\x05\x12\x10\n\x08realtype\x18\x02 \x01(\t\x12\x0c\n\x04\x66ids\x18\x03 \x03(\x05\x12\r\n\x05names\x18\x04 \x03(\t\"\xa1\x01\n\x0bRealRequest\x12\x11\n\tscreen_no\x18\x01 \x03(\t\x12\x11\n\tcode_list\x18\x02 \x03(\t\x12\x10\n\x08\x66id_list\x18\x03 \x03(\x05\x12\x10\n\x08opt_type\x18\x04 \x01(\t\x12H\n\x05\x66lags\x18\x05 \x01(\x0b\x32\x39.koapy.backend.kiwoom_open_api_plus.grpc.RealRequestFlags\"\x97\x01\n\x18TransactionStopCondition\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t\x12^\n\ncomparator\x18\x03 \x01(\x0e\x32J.koapy.backend.kiwoom_open_api_plus.grpc.TransactionStopConditionCompartor\"\x91\x01\n\x17TransactionRequestFlags\x12\x10\n\x08\x63olumnar\x18\x01 \x01(\x08\x12\x14\n\x0ctyped_values\x18\x02 \x01(\x08\x12N\n\x08priority\x18\x03 \x01(\x0e\x32<.koapy.backend.kiwoom_open_api_plus.grpc.TransactionPriority\"\xe1\x03\n\x12TransactionRequest\x12\x14\n\x0crequest_name\x18\x01 \x01(\t\x12\x18\n\x10transaction_code\x18\x02 \x01(\t\x12\x11\n\tscreen_no\x18\x03 \x01(\t\x12W\n\x06inputs\x18\x04 \x03(\x0b\x32G.koapy.backend.kiwoom_open_api_plus.grpc.TransactionRequest.InputsEntry\x12Y\n\x0estop_condition\x18\x05 \x01(\x0b\x32\x41.koapy.backend.kiwoom_open_api_plus.grpc.TransactionStopCondition\x12H\n\x05\x66lags\x18\x06 \x01(\x0b\x32\x39.koapy.backend.kiwoom_open_api_plus.grpc.RealRequestFlags\x12[\n\x11transaction_flags\x18\x07 \x01(\x0b\x32@.koapy.backend.kiwoom_open_api_plus.grpc.TransactionRequestFlags\x1a-\n\x0bInputsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"]\n\x17OrderSubscriptionTarget\x12\x0b\n\x03RET\x18\x01 \x01(\x08\x12\n\n\x02TR\x18\x02 \x01(\x08\x12\x0c\n\x04REAL\x18\x03 \x01(\x08\x12\x0b\n\x03MSG\x18\x04 \x01(\x08\x12\x0e\n\x06\x43HEJAN\x18\x05 \x01(\x08\"\x8f\x02\n\x0cOrderRequest\x12\x14\n\x0crequest_name\x18\x01 \x01(\t\x12\x11\n\tscreen_no\x18\x02 \x01(\t\x12\x12\n\naccount_no\x18\x03 \x01(\t\x12\x12\n\norder_type\x18\x04 \x01(\x03\x12\x0c\n\x04\x63ode\x18\x05 \x01(\t\x12\x10\n\x08quantity\x18\x06 \x01(\x03\x12\r\n\x05price\x18\x07 \x01(\x03\x12\x12\n\nquote_type\x18\x08 \x01(\t\x12\x19\n\x11original_order_no\x18\t \x01(\t\x12P\n\x06target\x18\n \x01(\x0b\x32@.koapy.backend.kiwoom_open_api_plus.grpc.OrderSubscriptionTarget\"\x16\n\x14LoadConditionRequest\"D\n\x15\x43onditionRequestFlags\x12\x11\n\twith_info\x18\x01 \x01(\x08\x12\x18\n\x10is_future_option\x18\x02 \x01(\x08\"\xd0\x01\n\x10\x43onditionRequest\x12\x11\n\tscreen_no\x18\x01 \x01(\t\x12\x16\n\x0e\x63ondition_name\x18\x02 \x01(\t\x12\x17\n\x0f\x63ondition_index\x18\x03 \x01(\x05\x12\x13\n\x0bsearch_type\x18\x04 \x01(\x05\x12\x14\n\x0crequest_name\x18\x05 \x01(\t\x12M\n\x05\x66lags\x18\x06 \x01(\x0b\x32>.koapy.backend.kiwoom_open_api_plus.grpc.ConditionRequestFlags\"3\n\x12SetLogLevelRequest\x12\r\n\x05level\x18\x01 \x01(\x05\x12\x0e\n\x06logger\x18\x02 \x01(\t\"\x15\n\x13SetLogLevelResponse\"\x80\x01\n\"BidirectionalRealInitializeRequest\x12\x10\n\x08\x66id_list\x18\x01 \x03(\x05\x12H\n\x05\x66lags\x18\x02 \x01(\x0b\x32\x39.koapy.backend.kiwoom_open_api_plus.grpc.RealRequestFlags\"G\n BidirectionalRealRegisterRequest\x12\x11\n\tcode_list\x18\x01 \x03(\t\x12\x10\n\x08\x66id_list\x18\x02 \x03(\x05\"3\n\x1e\x42idirectionalRealRemoveRequest\x12\x11\n\tcode_list\x18\x01 \x03(\t\"\x1e\n\x1c\x42idirectionalRealStopRequest\"\xb9\x03\n\x18\x42idirectionalRealRequest\x12i\n\x12initialize_request\x18\x01 \x01(\x0b\x32K.koapy.backend.kiwoom_open_api_plus.grpc.BidirectionalRealInitializeRequestH\x00\x12\x65\n\x10register_request\x18\x02 \x01(\x0b\x32I.koapy.backend.kiwoom_open_api_plus.grpc.BidirectionalRealRegisterRequestH\x00\x12\x61\n\x0eremove_request\x18\x03 \x01(\x0b\x32G.koapy.backend.kiwoom_open_api_plus.grpc.BidirectionalRealRemoveRequestH\x00\x12]\n\x0cstop_request\x18\x04 \x01(\x0b\x32\x45.koapy.backend.kiwoom_open_api_plus.grpc.BidirectionalRealStopRequestH\x00\x42\t\n\x07request*\x9d\x01\n!TransactionStopConditionCompartor\x12\x19\n\x15LESS_THAN_OR_EQUAL_TO\x10\x00\x12\r\n\tLESS_THAN\x10\x01\x12\x1c\n\x18GREATER_THAN_OR_EQUAL_TO\x10\x02\x12\x10\n\x0cGREATER_THAN\x10\x03\x12\x0c\n\x08\x45QUAL_TO\x10\x04\x12\x10\n\x0cNOT_EQUAL_TO\x10\x05*C\n\x13TransactionPriority\x12\x0f\n\x0bINTERACTIVE\x10\x00\x12\x11\n\rORDER_RELATED\x10\x01\x12\x08\n\x04\x42ULK\x10\x02\x32\xc7\x11\n\x18KiwoomOpenApiPlusService\x12u\n\x04\x43\x61ll\x12\x34.koapy.backend.kiwoom_open_api_plus.grpc.CallRequest\x1a\x35.koapy.backend.kiwoom_open_api_plus.grpc.CallResponse\"\x00\x12\x84\x01\n\tBatchCall\x12\x39.koapy.backend.kiwoom_open_api_plus.grpc.BatchCallRequest\x1a:.koapy.backend.kiwoom_open_api_plus.grpc.BatchCallResponse\"\x00\x12\x97\x01\n\x12MasterSnapshotCall\x12>.koapy.backend.kiwoom_open_api_plus.grpc.MasterSnapshotRequest\x1a?.koapy.backend.kiwoom_open_api_plus.grpc.MasterSnapshotResponse\"\x00\x12}\n\x06Listen\x12\x36.koapy.backend.kiwoom_open_api_plus.grpc.ListenRequest\x1a\x37.koapy.backend.kiwoom_open_api_plus.grpc.ListenResponse\"\x00\x30\x01\x12\x99\x01\n\x13\x42idirectionalListen\x12\x43.koapy.backend.kiwoom_open_api_plus.grpc.BidirectionalListenRequest\x1a\x37.koapy.backend.kiwoom_open_api_plus.grpc.ListenResponse\"\x00(\x01\x30\x01\x12\x7f\n\tLoginCall\x12\x35.koapy.backend.kiwoom_open_api_plus.grpc.LoginRequest\x1a\x37.koapy.backend.kiwoom_open_api_plus.grpc.ListenResponse\"\x00\x30\x01\x12\x8b\x01\n\x0fTransactionCall\x12;.koapy.backend.kiwoom_open_api_plus.grpc.TransactionRequest\x1a\x37.koapy.backend.kiwoom_open_api_plus.grpc.ListenResponse\"\x00\x30\x01\x12\x7f\n\tOrderCall\x12\x35.koapy.backend.kiwoom_open_api_plus.grpc.OrderRequest\x1a\x37.koapy.backend.kiwoom_open_api_plus.grpc.ListenResponse\"\x00\x30\x01\x12}\n\x08RealCall\x12\x34.koapy.backend.kiwoom_open_api_plus.grpc.RealRequest\x1a\x37.koapy.backend.kiwoom_open_api_plus.grpc.ListenResponse\"\x00\x30\x01\x12\x8f\x01\n\x11LoadConditionCall\x12=.koapy.backend.kiwoom_open_api_plus.grpc.LoadConditionRequest\x1a\x37.koapy.backend.kiwoom_open_api_plus.grpc.ListenResponse\"\x00\x30\x01\x12\x87\x01\n\rConditionCall\x12\x39.koapy.backend.kiwoom_open_api_plus.grpc.ConditionRequest\x1a\x37.koapy.backend.kiwoom_open_api_plus.grpc.ListenResponse\"\x00\x30\x01\x12\x99\x01\n\x15\x42idirectionalRealCall\x12\x41.koapy.backend.kiwoom_open_api_plus.grpc.BidirectionalRealRequest\x1a\x37.koapy.backend.kiwoom_open_api_plus.grpc.ListenResponse\"\x00(\x01\x30\x01\x12\x82\x01\n\x0bOrderListen\x12\x36.koapy.backend.kiwoom_open_api_plus.grpc.ListenRequest\x1a\x37.koapy.backend.kiwoom_open_api_plus.grpc.ListenResponse\"\x00\x30\x01\x12\x83\x01\n\x0c\x43ustomListen\x12\x36.koapy.backend.kiwoom_open_api_plus.grpc.ListenRequest\x1a\x37.koapy.backend.kiwoom_open_api_plus.grpc.ListenResponse\"\x00\x30\x01\x12\x98\x01\n\x13\x43ustomCallAndListen\x12=.koapy.backend.kiwoom_open_api_plus.grpc.CallAndListenRequest\x1a>.koapy.backend.kiwoom_open_api_plus.grpc.CallAndListenResponse\"\x00\x30\x01\x12\x8a\x01\n\x0bSetLogLevel\x12;.koapy.backend.kiwoom_open_api_plus.grpc.SetLogLevelRequest\x1a<.koapy.backend.kiwoom_open_api_plus.grpc.SetLogLevelResponse\"\x00\x62\x06proto3')
 
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'koapy.backend.kiwoom_open_api_plus.grpc.KiwoomOpenApiPlusService_pb2', globals())
 if _descriptor._USE_C_DESCRIPTORS == False:
 
   DESCRIPTOR._options = None
+  _MASTERSNAPSHOTRESPONSE_CODELISTSENTRY._options = None
+  _MASTERSNAPSHOTRESPONSE_CODELISTSENTRY._serialized_options = b'8\001'
   _LOGINCREDENTIALS_ACCOUNTPASSWORDSENTRY._options = None
   _LOGINCREDENTIALS_ACCOUNTPASSWORDSENTRY._serialized_options = b'8\001'
   _TRANSACTIONREQUEST_INPUTSENTRY._options = None
   _TRANSACTIONREQUEST_INPUTSENTRY._serialized_options = b'8\001'
-  _TRANSACTIONSTOPCONDITIONCOMPARTOR._serialized_start=4388
-  _TRANSACTIONSTOPCONDITIONCOMPARTOR._serialized_end=4545
+  _TRANSACTIONSTOPCONDITIONCOMPARTOR._serialized_start=6280
+  _TRANSACTIONSTOPCONDITIONCOMPARTOR._serialized_end=6437
+  _TRANSACTIONPRIORITY._serialized_start=6439
+  _TRANSACTIONPRIORITY._serialized_end=6506
   _ARGUMENT._serialized_start=115
   _ARGUMENT._serialized_end=202
   _CALLREQUEST._serialized_start=204
@@ -33,66 +37,90 @@ if _descriptor._USE_C_DESCRIPTORS == False:
   _RETURNVALUE._serialized_end=393
   _CALLRESPONSE._serialized_start=395
   _CALLRESPONSE._serialized_end=485
-  _LISTENREQUEST._serialized_start=487
-  _LISTENREQUEST._serialized_end=563
-  _HANDLEDREQUEST._serialized_start=565
-  _HANDLEDREQUEST._serialized_end=595
-  _STOPLISTENREQUEST._serialized_start=597
-  _STOPLISTENREQUEST._serialized_end=630
-  _BIDIRECTIONALLISTENREQUEST._serialized_start=633
-  _BIDIRECTIONALLISTENREQUEST._serialized_end=929
-  _SINGLEDATA._serialized_start=931
-  _SINGLEDATA._serialized_end=974
-  _REPEATEDSTRING._serialized_start=976
-  _REPEATEDSTRING._serialized_end=1008
-  _MULTIDATA._serialized_start=1010
-  _MULTIDATA._serialized_end=1109
-  _LISTENRESPONSE._serialized_start=1112
-  _LISTENRESPONSE._serialized_end=1358
-  _CALLANDLISTENREQUEST._serialized_start=1361
-  _CALLANDLISTENREQUEST._serialized_end=1539
-  _CALLANDLISTENRESPONSE._serialized_start=1542
-  _CALLANDLISTENRESPONSE._serialized_end=1741
-  _LOGINCREDENTIALS._serialized_start=1744
-  _LOGINCREDENTIALS._serialized_end=2013
-  _LOGINCREDENTIALS_ACCOUNTPASSWORDSENTRY._serialized_start=1958
-  _LOGINCREDENTIALS_ACCOUNTPASSWORDSENTRY._serialized_end=2013
-  _LOGINREQUEST._serialized_start=2015
-  _LOGINREQUEST._serialized_end=2109
-  _REALREQUESTFLAGS._serialized_start=2111
-  _REALREQUESTFLAGS._serialized_end=2193
-  _REALREQUEST._serialized_start=2196
-  _REALREQUEST._serialized_end=2357
-  _TRANSACTIONSTOPCONDITION._serialized_start=2360
-  _TRANSACTIONSTOPCONDITION._serialized_end=2511
-  _TRANSACTIONREQUEST._serialized_start=2514
-  _TRANSACTIONREQUEST._serialized_end=2902
-  _TRANSACTIONREQUEST_INPUTSENTRY._serialized_start=2857
-  _TRANSACTIONREQUEST_INPUTSENTRY._serialized_end=2902
-  _ORDERSUBSCRIPTIONTARGET._serialized_start=2904
-  _ORDERSUBSCRIPTIONTARGET._serialized_end=2997
-  _ORDERREQUEST._serialized_start=3000
-  _ORDERREQUEST._serialized_end=3271
-  _LOADCONDITIONREQUEST._serialized_start=3273
-  _LOADCONDITIONREQUEST._serialized_end=3295
-  _CONDITIONREQUESTFLAGS._serialized_start=3297
-  _CONDITIONREQUESTFLAGS._serialized_end=3365
-  _CONDITIONREQUEST._serialized_start=3368
-  _CONDITIONREQUEST._serialized_end=3576
-  _SETLOGLEVELREQUEST._serialized_start=3578
-  _SETLOGLEVELREQUEST._serialized_end=3629
-  _SETLOGLEVELRESPONSE._serialized_start=3631
-  _SETLOGLEVELRESPONSE._serialized_end=3652
-  _BIDIRECTIONALREALINITIALIZEREQUEST._serialized_start=3655
-  _BIDIRECTIONALREALINITIALIZEREQUEST._serialized_end=3783
-  _BIDIRECTIONALREALREGISTERREQUEST._serialized_start=3785
-  _BIDIRECTIONALREALREGISTERREQUEST._serialized_end=3856
-  _BIDIRECTIONALREALREMOVEREQUEST._serialized_start=3858
-  _BIDIRECTIONALREALREMOVEREQUEST._serialized_end=3909
-  _BIDIRECTIONALREALSTOPREQUEST._serialized_start=3911
-  _BIDIRECTIONALREALSTOPREQUEST._serialized_end=3941
-  _BIDIRECTIONALREALREQUEST._serialized_start=3944
-  _BIDIRECTIONALREALREQUEST._serialized_end=4385
-  _KIWOOMOPENAPIPLUSSERVICE._serialized_start=4548
-  _KIWOOMOPENAPIPLUSSERVICE._serialized_end=6506
+  _BATCHCALLREQUEST._serialized_start=487
+  _BATCHCALLREQUEST._serialized_end=574
+  _BATCHCALLRESPONSE._serialized_start=576
+  _BATCHCALLRESPONSE._serialized_end=669
+  _MASTERSNAPSHOTREQUEST._serialized_start=671
+  _MASTERSNAPSHOTREQUEST._serialized_end=711
+  _MASTERSNAPSHOTRESPONSE._serialized_start=714
+  _MASTERSNAPSHOTRESPONSE._serialized_end=964
+  _MASTERSNAPSHOTRESPONSE_CODELISTSENTRY._serialized_start=916
+  _MASTERSNAPSHOTRESPONSE_CODELISTSENTRY._serialized_end=964
+  _LISTENREQUEST._serialized_start=966
+  _LISTENREQUEST._serialized_end=1067
+  _HANDLEDREQUEST._serialized_start=1069
+  _HANDLEDREQUEST._serialized_end=1099
+  _STOPLISTENREQUEST._serialized_start=1101
+  _STOPLISTENREQUEST._serialized_end=1134
+  _GRANTREQUEST._serialized_start=1136
+  _GRANTREQUEST._serialized_end=1167
+  _BIDIRECTIONALLISTENREQUEST._serialized_start=1170
+  _BIDIRECTIONALLISTENREQUEST._serialized_end=1546
+  _SINGLEDATA._serialized_start=1548
+  _SINGLEDATA._serialized_end=1591
+  _REPEATEDSTRING._serialized_start=1593
+  _REPEATEDSTRING._serialized_end=1625
+  _MULTIDATA._serialized_start=1627
+  _MULTIDATA._serialized_end=1726
+  _INT64ARRAY._serialized_start=1728
+  _INT64ARRAY._serialized_end=1756
+  _DOUBLEARRAY._serialized_start=1758
+  _DOUBLEARRAY._serialized_end=1787
+  _COLUMN._serialized_start=1790
+  _COLUMN._serialized_end=2059
+  _COLUMNARDATA._serialized_start=2061
+  _COLUMNARDATA._serialized_end=2141
+  _LISTENRESPONSE._serialized_start=2144
+  _LISTENRESPONSE._serialized_end=2725
+  _CALLANDLISTENREQUEST._serialized_start=2728
+  _CALLANDLISTENREQUEST._serialized_end=2906
+  _CALLANDLISTENRESPONSE._serialized_start=2909
+  _CALLANDLISTENRESPONSE._serialized_end=3108
+  _LOGINCREDENTIALS._serialized_start=3111
+  _LOGINCREDENTIALS._serialized_end=3380
+  _LOGINCREDENTIALS_ACCOUNTPASSWORDSENTRY._serialized_start=3325
+  _LOGINCREDENTIALS_ACCOUNTPASSWORDSENTRY._serialized_end=3380
+  _LOGINREQUEST._serialized_start=3382
+  _LOGINREQUEST._serialized_end=3476
+  _REALREQUESTFLAGS._serialized_start=3479
+  _REALREQUESTFLAGS._serialized_end=3760
+  _REALDATASCHEMA._serialized_start=3762
+  _REALDATASCHEMA._serialized_end=3844
+  _REALREQUEST._serialized_start=3847
+  _REALREQUEST._serialized_end=4008
+  _TRANSACTIONSTOPCONDITION._serialized_start=4011
+  _TRANSACTIONSTOPCONDITION._serialized_end=4162
+  _TRANSACTIONREQUESTFLAGS._serialized_start=4165
+  _TRANSACTIONREQUESTFLAGS._serialized_end=4310
+  _TRANSACTIONREQUEST._serialized_start=4313
+  _TRANSACTIONREQUEST._serialized_end=4794
+  _TRANSACTIONREQUEST_INPUTSENTRY._serialized_start=4749
+  _TRANSACTIONREQUEST_INPUTSENTRY._serialized_end=4794
+  _ORDERSUBSCRIPTIONTARGET._serialized_start=4796
+  _ORDERSUBSCRIPTIONTARGET._serialized_end=4889
+  _ORDERREQUEST._serialized_start=4892
+  _ORDERREQUEST._serialized_end=5163
+  _LOADCONDITIONREQUEST._serialized_start=5165
+  _LOADCONDITIONREQUEST._serialized_end=5187
+  _CONDITIONREQUESTFLAGS._serialized_start=5189
+  _CONDITIONREQUESTFLAGS._serialized_end=5257
+  _CONDITIONREQUEST._serialized_start=5260
+  _CONDITIONREQUEST._serialized_end=5468
+  _SETLOGLEVELREQUEST._serialized_start=5470
+  _SETLOGLEVELREQUEST._serialized_end=5521
+  _SETLOGLEVELRESPONSE._serialized_start=5523
+  _SETLOGLEVELRESPONSE._serialized_end=5544
+  _BIDIRECTIONALREALINITIALIZEREQUEST._serialized_start=5547
+  _BIDIRECTIONALREALINITIALIZEREQUEST._serialized_end=5675
+  _BIDIRECTIONALREALREGISTERREQUEST._serialized_start=5677
+  _BIDIRECTIONALREALREGISTERREQUEST._serialized_end=5748
+  _BIDIRECTIONALREALREMOVEREQUEST._serialized_start=5750
+  _BIDIRECTIONALREALREMOVEREQUEST._serialized_end=5801
+  _BIDIRECTIONALREALSTOPREQUEST._serialized_start=5803
+  _BIDIRECTIONALREALSTOPREQUEST._serialized_end=5833
+  _BIDIRECTIONALREALREQUEST._serialized_start=5836
+  _BIDIRECTIONALREALREQUEST._serialized_end=6277
+  _KIWOOMOPENAPIPLUSSERVICE._serialized_start=6509
+  _KIWOOMOPENAPIPLUSSERVICE._serialized_end=8756
 # @@protoc_insertion_point(module_scope)
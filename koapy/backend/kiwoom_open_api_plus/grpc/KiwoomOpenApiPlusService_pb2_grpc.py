@@ -19,6 +19,16 @@ class KiwoomOpenApiPlusServiceStub:
                 request_serializer=koapy_dot_backend_dot_kiwoom__open__api__plus_dot_grpc_dot_KiwoomOpenApiPlusService__pb2.CallRequest.SerializeToString,
                 response_deserializer=koapy_dot_backend_dot_kiwoom__open__api__plus_dot_grpc_dot_KiwoomOpenApiPlusService__pb2.CallResponse.FromString,
                 )
+        self.BatchCall = channel.unary_unary(
+                '/koapy.backend.kiwoom_open_api_plus.grpc.KiwoomOpenApiPlusService/BatchCall',
+                request_serializer=koapy_dot_backend_dot_kiwoom__open__api__plus_dot_grpc_dot_KiwoomOpenApiPlusService__pb2.BatchCallRequest.SerializeToString,
+                response_deserializer=koapy_dot_backend_dot_kiwoom__open__api__plus_dot_grpc_dot_KiwoomOpenApiPlusService__pb2.BatchCallResponse.FromString,
+                )
+        self.MasterSnapshotCall = channel.unary_unary(
+                '/koapy.backend.kiwoom_open_api_plus.grpc.KiwoomOpenApiPlusService/MasterSnapshotCall',
+                request_serializer=koapy_dot_backend_dot_kiwoom__open__api__plus_dot_grpc_dot_KiwoomOpenApiPlusService__pb2.MasterSnapshotRequest.SerializeToString,
+                response_deserializer=koapy_dot_backend_dot_kiwoom__open__api__plus_dot_grpc_dot_KiwoomOpenApiPlusService__pb2.MasterSnapshotResponse.FromString,
+                )
         self.Listen = channel.unary_stream(
                 '/koapy.backend.kiwoom_open_api_plus.grpc.KiwoomOpenApiPlusService/Listen',
                 request_serializer=koapy_dot_backend_dot_kiwoom__open__api__plus_dot_grpc_dot_KiwoomOpenApiPlusService__pb2.ListenRequest.SerializeToString,
@@ -100,6 +110,22 @@ class KiwoomOpenApiPlusServiceServicer:
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def BatchCall(self, request, context):
+        """unary rpc for multiple function calls in a single round trip,
+        each call is handled in order just like Call() rpc and results are returned in the same order
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def MasterSnapshotCall(self, request, context):
+        """unary rpc for fetching the whole master table (code lists, names, states, ...) of all markets at once,
+        client would cache the result for the trading session instead of calling GetMasterXXX() functions one code at a time
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def Listen(self, request, context):
         """2. rpcs for listening and handling events
 
@@ -234,6 +260,16 @@ def add_KiwoomOpenApiPlusServiceServicer_to_server(servicer, server):
                     request_deserializer=koapy_dot_backend_dot_kiwoom__open__api__plus_dot_grpc_dot_KiwoomOpenApiPlusService__pb2.CallRequest.FromString,
                     response_serializer=koapy_dot_backend_dot_kiwoom__open__api__plus_dot_grpc_dot_KiwoomOpenApiPlusService__pb2.CallResponse.SerializeToString,
             ),
+            'BatchCall': grpc.unary_unary_rpc_method_handler(
+                    servicer.BatchCall,
+                    request_deserializer=koapy_dot_backend_dot_kiwoom__open__api__plus_dot_grpc_dot_KiwoomOpenApiPlusService__pb2.BatchCallRequest.FromString,
+                    response_serializer=koapy_dot_backend_dot_kiwoom__open__api__plus_dot_grpc_dot_KiwoomOpenApiPlusService__pb2.BatchCallResponse.SerializeToString,
+            ),
+            'MasterSnapshotCall': grpc.unary_unary_rpc_method_handler(
+                    servicer.MasterSnapshotCall,
+                    request_deserializer=koapy_dot_backend_dot_kiwoom__open__api__plus_dot_grpc_dot_KiwoomOpenApiPlusService__pb2.MasterSnapshotRequest.FromString,
+                    response_serializer=koapy_dot_backend_dot_kiwoom__open__api__plus_dot_grpc_dot_KiwoomOpenApiPlusService__pb2.MasterSnapshotResponse.SerializeToString,
+            ),
             'Listen': grpc.unary_stream_rpc_method_handler(
                     servicer.Listen,
                     request_deserializer=koapy_dot_backend_dot_kiwoom__open__api__plus_dot_grpc_dot_KiwoomOpenApiPlusService__pb2.ListenRequest.FromString,
@@ -326,6 +362,40 @@ class KiwoomOpenApiPlusService:
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
+    @staticmethod
+    def BatchCall(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/koapy.backend.kiwoom_open_api_plus.grpc.KiwoomOpenApiPlusService/BatchCall',
+            koapy_dot_backend_dot_kiwoom__open__api__plus_dot_grpc_dot_KiwoomOpenApiPlusService__pb2.BatchCallRequest.SerializeToString,
+            koapy_dot_backend_dot_kiwoom__open__api__plus_dot_grpc_dot_KiwoomOpenApiPlusService__pb2.BatchCallResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def MasterSnapshotCall(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/koapy.backend.kiwoom_open_api_plus.grpc.KiwoomOpenApiPlusService/MasterSnapshotCall',
+            koapy_dot_backend_dot_kiwoom__open__api__plus_dot_grpc_dot_KiwoomOpenApiPlusService__pb2.MasterSnapshotRequest.SerializeToString,
+            koapy_dot_backend_dot_kiwoom__open__api__plus_dot_grpc_dot_KiwoomOpenApiPlusService__pb2.MasterSnapshotResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
     @staticmethod
     def Listen(request,
             target,
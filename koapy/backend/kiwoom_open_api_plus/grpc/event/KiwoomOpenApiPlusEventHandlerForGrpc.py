@@ -1,15 +1,50 @@
 from koapy.backend.kiwoom_open_api_plus.core.KiwoomOpenApiPlusEventHandler import (
     KiwoomOpenApiPlusEventHandler,
 )
+from koapy.config import config
+from koapy.utils.logging.Logging import Logging
 
 
-class KiwoomOpenApiPlusEventHandlerForGrpc(KiwoomOpenApiPlusEventHandler):
+class KiwoomOpenApiPlusEventHandlerForGrpc(KiwoomOpenApiPlusEventHandler, Logging):
     def __init__(self, control, context):
         super().__init__(control)
 
         self._context = context
         self._context.add_callback(self.stop)
 
+        # 클라이언트가 밀리는 경우 서버 메모리가 계속 늘어나지 않도록 이벤트 큐 크기를 제한할 수 있음
+        self.set_backpressure(
+            config.get_int(
+                "koapy.backend.kiwoom_open_api_plus.grpc.server.event_queue.maxsize", 0
+            ),
+            config.get_string(
+                "koapy.backend.kiwoom_open_api_plus.grpc.server.event_queue.policy",
+                "block",
+            ),
+        )
+
     @property
     def context(self):
         return self._context
+
+    def set_backpressure(self, maxsize=None, policy=None, key=None, retain=None):
+        self.observer.set_backpressure(maxsize, policy, key, retain)
+
+    def exit(self, exc_type=None, exc_value=None, traceback=None):
+        super().exit(exc_type, exc_value, traceback)
+        dropped_count = self.observer.dropped_count
+        conflated_count = self.observer.conflated_count
+        if dropped_count > 0 or conflated_count > 0:
+            self.logger.warning(
+                "%s dropped %d and conflated %d events due to backpressure (policy=%s)",
+                self.__class__.__name__,
+                dropped_count,
+                conflated_count,
+                self.observer.policy.value,
+            )
+            self._context.set_trailing_metadata(
+                (
+                    ("koapy-dropped-events", str(dropped_count)),
+                    ("koapy-conflated-events", str(conflated_count)),
+                )
+            )
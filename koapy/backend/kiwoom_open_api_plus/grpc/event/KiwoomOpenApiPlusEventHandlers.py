@@ -1,3 +1,7 @@
+import threading
+
+import grpc
+
 from koapy.backend.kiwoom_open_api_plus.core.KiwoomOpenApiPlusError import (
     KiwoomOpenApiPlusError,
 )
@@ -11,6 +15,9 @@ from koapy.backend.kiwoom_open_api_plus.grpc import KiwoomOpenApiPlusService_pb2
 from koapy.backend.kiwoom_open_api_plus.grpc.event.KiwoomOpenApiPlusEventHandlerForGrpc import (
     KiwoomOpenApiPlusEventHandlerForGrpc,
 )
+from koapy.backend.kiwoom_open_api_plus.grpc.event.KiwoomOpenApiPlusRealDataSchema import (
+    KiwoomOpenApiPlusRealDataSchemaCache,
+)
 from koapy.utils.logging.Logging import Logging
 from koapy.utils.notimplemented import isimplemented
 
@@ -104,6 +111,11 @@ class KiwoomOpenApiPlusLazyAllEventHandler(
 class KiwoomOpenApiPlusEagerAllEventHandler(
     KiwoomOpenApiPlusEventHandlerForGrpc, Logging
 ):
+
+    _real_data_schemas = KiwoomOpenApiPlusRealDataSchemaCache(
+        infer_fids=True, readable_names=True
+    )
+
     def OnReceiveTrData(
         self,
         scrnno,
@@ -157,26 +169,20 @@ class KiwoomOpenApiPlusEagerAllEventHandler(
         self.observer.on_next(response)
 
     def OnReceiveRealData(self, code, realtype, realdata):
-        response = KiwoomOpenApiPlusService_pb2.ListenResponse()
-        response.name = "OnReceiveRealData"
-        response.arguments.add().string_value = code
-        response.arguments.add().string_value = realtype
-        response.arguments.add().string_value = realdata
-
-        fids = KiwoomOpenApiPlusRealType.get_fids_by_realtype_name(realtype)
+        schema = self._real_data_schemas.get(realtype)
 
-        if fids is None:
+        if schema is None:
             self.logger.error("Cannot find fids for realtype %s", realtype)
+            response = KiwoomOpenApiPlusService_pb2.ListenResponse()
+            response.name = "OnReceiveRealData"
+            response.arguments.add().string_value = code
+            response.arguments.add().string_value = realtype
+            response.arguments.add().string_value = realdata
+            self.observer.on_next(response)
+            return
 
-        names = [
-            KiwoomOpenApiPlusRealType.Fid.get_name_by_fid(fid, str(fid)) for fid in fids
-        ]
-        values = [self.control.GetCommRealData(code, fid) for fid in fids]
-
-        assert len(names) == len(values)
-
-        response.single_data.names.extend(names)
-        response.single_data.values.extend(values)
+        values = [self.control.GetCommRealData(code, fid) for fid in schema.fids]
+        response = schema.make_response(code, realtype, realdata, values)
 
         self.observer.on_next(response)
 
@@ -294,6 +300,18 @@ class KiwoomOpenApiPlusSomeEventHandler(KiwoomOpenApiPlusEagerSomeEventHandler):
 class KiwoomOpenApiPlusSomeBidirectionalEventHandler(
     KiwoomOpenApiPlusLazySomeEventHandler
 ):
+    """
+    이벤트를 전달한 뒤 클라이언트의 처리 완료 여부에 따라 이벤트 핸들러 함수를 대기시키는 핸들러 입니다.
+
+    listen_request 의 initial_credits 가 0 인 경우 이벤트마다 클라이언트의 handled_request 를 기다립니다.
+    0 보다 큰 경우 클라이언트가 부여한 크레딧 만큼은 기다리지 않고 이벤트를 전달하며,
+    크레딧을 모두 사용한 경우에만 클라이언트가 grant_request 로 크레딧을 추가로 부여할 때까지 기다립니다.
+    이 경우 요청 메시지들은 별도의 스레드에서 읽으며, handled_request 는 크레딧 하나로 취급합니다.
+    또한 스트림 중간에 listen_request 를 다시 받으면 구독할 이벤트 목록을 해당 목록으로 갱신합니다.
+    """
+
+    _await_credits_timeout = 1.0
+
     def __init__(self, control, request_iterator, context):
         self._request_iterator = request_iterator
         self._first_request = next(self._request_iterator)
@@ -301,8 +319,92 @@ class KiwoomOpenApiPlusSomeBidirectionalEventHandler(
         self._request = request = self._first_request.listen_request
         super().__init__(control, request, context)
 
+        self._credits = request.initial_credits
+        self._uses_credits = self._credits > 0
+        self._credits_condition = threading.Condition()
+        self._request_iterator_consumer = None
+        self._request_iterator_consumed = False
+
+    @property
+    def uses_credits(self):
+        return self._uses_credits
+
+    def _grant(self, credits):
+        with self._credits_condition:
+            self._credits += credits
+            self._credits_condition.notify_all()
+
+    def _finish_credits(self):
+        with self._credits_condition:
+            self._request_iterator_consumed = True
+            self._credits_condition.notify_all()
+
+    def consume_request_iterator(self):
+        try:
+            for request in self._request_iterator:
+                if request.HasField("grant_request"):
+                    self._grant(request.grant_request.credits)
+                elif request.HasField("handled_request"):
+                    self._grant(1)
+                elif request.HasField("stop_listen_request"):
+                    self.observer.on_completed()
+                    break
+                elif request.HasField("listen_request"):
+                    self.update_slots(request.listen_request.slots)
+                else:
+                    self.observer.on_error(KiwoomOpenApiPlusError("Unexpected request"))
+                    break
+        except grpc.RpcError:
+            pass
+        finally:
+            self._finish_credits()
+
+    def update_slots(self, names):
+        """
+        구독중인 이벤트 목록을 주어진 이름들로 갱신합니다. 새로 추가된 이벤트만 연결하고 빠진 이벤트만 연결을 해제합니다.
+        """
+        with self._lock:
+            previous_slots = dict(self.slots())
+            request = KiwoomOpenApiPlusService_pb2.ListenRequest()
+            request.CopyFrom(self._request)
+            del request.slots[:]
+            request.slots.extend(names)
+            self._request = request
+            slots = dict(self.slots())
+            if not self._should_exit:
+                return
+            for name, slot in previous_slots.items():
+                if name not in slots:
+                    getattr(self.control, name).disconnect(slot)
+            for name, slot in slots.items():
+                if name not in previous_slots:
+                    getattr(self.control, name).connect(slot)
+        self.logger.debug("Updated listening slots to %s", list(slots.keys()))
+
+    def on_enter(self):
+        super().on_enter()
+        if self._uses_credits:
+            self._request_iterator_consumer = threading.Thread(
+                target=self.consume_request_iterator, daemon=True
+            )
+            self._request_iterator_consumer.start()
+            self.add_callback(self._finish_credits)
+
+    def await_credits(self):
+        with self._credits_condition:
+            self._credits -= 1
+            while self._credits <= 0 and not self._request_iterator_consumed:
+                self._credits_condition.wait(self._await_credits_timeout)
+
     def await_handled(self):
-        request = next(self._request_iterator)
+        if self._uses_credits:
+            self.await_credits()
+            return
+        try:
+            request = next(self._request_iterator)
+        except (StopIteration, grpc.RpcError):
+            self.observer.on_completed()
+            return
         if request.HasField("handled_request"):
             pass
         elif request.HasField("stop_listen_request"):
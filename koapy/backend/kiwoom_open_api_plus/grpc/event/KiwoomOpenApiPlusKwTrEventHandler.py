@@ -12,6 +12,9 @@ from koapy.backend.kiwoom_open_api_plus.grpc import KiwoomOpenApiPlusService_pb2
 from koapy.backend.kiwoom_open_api_plus.grpc.event.KiwoomOpenApiPlusEventHandlerForGrpc import (
     KiwoomOpenApiPlusEventHandlerForGrpc,
 )
+from koapy.backend.kiwoom_open_api_plus.grpc.KiwoomOpenApiPlusServiceMessageUtils import (
+    convert_transaction_priority_from_protobuf_to_python,
+)
 from koapy.utils.itertools import chunk
 from koapy.utils.logging.Logging import Logging
 
@@ -29,6 +32,10 @@ class KiwoomOpenApiPlusKwTrEventHandler(KiwoomOpenApiPlusEventHandlerForGrpc, Lo
         self._trcode = request.transaction_code.upper()
         self._scrnno = request.screen_no
         self._inputs = request.inputs
+        self._priority = convert_transaction_priority_from_protobuf_to_python(
+            request.transaction_flags.priority
+        )
+        self._client_key = context.peer()
 
         assert self._trcode in ["OPTKWFID", "OPTFOFID"]
 
@@ -92,7 +99,9 @@ class KiwoomOpenApiPlusKwTrEventHandler(KiwoomOpenApiPlusEventHandlerForGrpc, Lo
             self.add_callback(self._screen_manager.return_screen, scrnno)
             self.add_callback(self.control.DisconnectRealData, scrnno)
             KiwoomOpenApiPlusError.try_or_raise(
-                self.control.RateLimitedCommKwRqData.queuedCall(
+                self.control.RateLimitedCommKwRqData.prioritizedQueuedCall(
+                    self._priority,
+                    self._client_key,
                     ";".join(codes),
                     0,
                     len(codes),
@@ -0,0 +1,115 @@
+import threading
+import time
+
+from typing import Callable, Optional
+
+from koapy.backend.kiwoom_open_api_plus.grpc import KiwoomOpenApiPlusService_pb2
+from koapy.backend.kiwoom_open_api_plus.utils.queue.QueueBasedIterableObserver import (
+    QueueBasedIterableObserver,
+)
+from koapy.utils.logging.Logging import Logging
+
+
+class KiwoomOpenApiPlusRealDataBatcher(Logging):
+    """
+    실시간 데이터 응답들을 모아서 하나의 ListenResponse (events) 로 묶어 전달합니다.
+
+    모인 응답은 max_batch_size 만큼 쌓였거나, 배치의 첫 응답 이후 max_linger 초가 지났을때 전달되며
+    후자는 별도의 스레드에서 처리합니다. max_batch_size 가 0 이하인 경우 크기 제한을 두지 않습니다.
+
+    응답을 복사하지 않도록 add() 에서는 배치 메시지 안에 새로 추가한 응답을 직접 채우도록 합니다.
+    """
+
+    _default_max_linger = 0.01
+
+    def __init__(
+        self,
+        on_batch: Callable[[KiwoomOpenApiPlusService_pb2.ListenResponse], None],
+        max_batch_size: int = 0,
+        max_linger: Optional[float] = None,
+    ):
+        if max_linger is None or max_linger <= 0:
+            max_linger = self._default_max_linger
+
+        self._on_batch = on_batch
+        self._max_batch_size = max_batch_size
+        self._max_linger = max_linger
+
+        self._condition = threading.Condition(threading.Lock())
+        self._batch = KiwoomOpenApiPlusService_pb2.ListenResponse()
+        self._deadline = None
+        self._closed = False
+        self._thread = None
+
+    @classmethod
+    def from_flags(cls, on_batch, flags):
+        if flags.max_batch_size <= 0 and flags.max_linger_ms <= 0:
+            return None
+        return cls(on_batch, flags.max_batch_size, flags.max_linger_ms / 1000)
+
+    def _ensure_started(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def _emit_locked(self):
+        # 배치 순서가 뒤바뀌지 않도록 전달도 락 안에서 처리
+        batch = self._batch
+        self._batch = KiwoomOpenApiPlusService_pb2.ListenResponse()
+        self._deadline = None
+        if len(batch.events) > 0:
+            self._on_batch(batch)
+
+    def add(
+        self,
+        fill: Callable[..., KiwoomOpenApiPlusService_pb2.ListenResponse],
+        *args,
+    ):
+        """
+        배치에 새 응답을 추가하고 fill(*args, response=응답) 을 호출해 내용을 채웁니다.
+        """
+        with self._condition:
+            if self._closed:
+                return
+            self._ensure_started()
+            events = self._batch.events
+            fill(*args, response=events.add())
+            if 0 < self._max_batch_size <= len(events):
+                self._emit_locked()
+            elif self._deadline is None:
+                self._deadline = time.monotonic() + self._max_linger
+                self._condition.notify()
+
+    def on_next(self, response: KiwoomOpenApiPlusService_pb2.ListenResponse):
+        self.add(self._copy, response)
+
+    @staticmethod
+    def _copy(source, response):
+        response.CopyFrom(source)
+        return response
+
+    def _run(self):
+        with QueueBasedIterableObserver.nonblocking(), self._condition:
+            while not self._closed:
+                if self._deadline is None:
+                    self._condition.wait()
+                    continue
+                remaining = self._deadline - time.monotonic()
+                if remaining > 0:
+                    self._condition.wait(remaining)
+                    continue
+                self._emit_locked()
+
+    def flush(self):
+        with self._condition:
+            self._emit_locked()
+
+    def close(self):
+        with self._condition:
+            if self._closed:
+                return
+            self._emit_locked()
+            self._closed = True
+            self._condition.notify()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
@@ -0,0 +1,108 @@
+import threading
+
+from collections import OrderedDict
+from typing import Iterable, Optional
+
+from koapy.backend.kiwoom_open_api_plus.grpc import KiwoomOpenApiPlusService_pb2
+from koapy.backend.kiwoom_open_api_plus.utils.queue.QueueBasedIterableObserver import (
+    QueueBasedIterableObserver,
+)
+from koapy.utils.logging.Logging import Logging
+
+
+class KiwoomOpenApiPlusRealDataConflater(Logging):
+    """
+    소비자가 밀려있는 동안 (종목코드, 실시간 타입) 별로 가장 최근 응답 하나만 남겨두었다가 전달합니다.
+
+    interval 이 주어지지 않은 경우 소비자가 준비된 상태 (observer 의 큐가 비어있는 상태) 라면 바로 전달하고,
+    그렇지 않다면 최신 값만 남겨두었다가 큐가 비는 시점에 한번에 전달합니다.
+    interval 이 주어진 경우 남겨둔 값들을 interval 마다 최대 한번씩, 소비자가 준비된 경우에만 전달합니다.
+
+    lossless_realtypes 에 해당하는 실시간 타입 (예를 들어 주식체결) 의 응답은 합치지 않고 모두 바로 전달하므로
+    남겨둔 다른 타입의 응답들보다 먼저 전달될 수 있습니다.
+    """
+
+    _default_poll_interval = 0.01
+
+    def __init__(
+        self,
+        observer,
+        interval: Optional[float] = None,
+        lossless_realtypes: Optional[Iterable[str]] = None,
+    ):
+        self._observer = observer
+        self._interval = interval if interval and interval > 0 else None
+        self._lossless_realtypes = set(lossless_realtypes or [])
+
+        self._lock = threading.Lock()
+        self._pending = OrderedDict()
+        self._closed = threading.Event()
+        self._thread = None
+
+    @classmethod
+    def from_flags(cls, observer, flags):
+        if not flags.conflate:
+            return None
+        return cls(
+            observer,
+            flags.conflate_interval_ms / 1000,
+            flags.lossless_realtypes,
+        )
+
+    def _ensure_started(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def _is_consumer_ready(self):
+        return self._observer.queue.empty()
+
+    def on_next(
+        self,
+        code: str,
+        realtype: str,
+        response: KiwoomOpenApiPlusService_pb2.ListenResponse,
+    ):
+        if realtype in self._lossless_realtypes:
+            self._observer.on_next(response)
+            return
+        with self._lock:
+            if self._closed.is_set():
+                return
+            self._ensure_started()
+            if (
+                self._interval is None
+                and not self._pending
+                and self._is_consumer_ready()
+            ):
+                self._observer.on_next(response)
+                return
+            key = (code, realtype)
+            previous = self._pending.get(key)
+            if previous is not None and previous.HasField("real_data_schema"):
+                # compact_schema 모드에서 한번만 전달되는 스키마는 버리지 않고 새 응답으로 옮김
+                response.real_data_schema.CopyFrom(previous.real_data_schema)
+            self._pending[key] = response
+
+    def _flush_locked(self):
+        pending = self._pending
+        self._pending = OrderedDict()
+        for response in pending.values():
+            self._observer.on_next(response)
+
+    def _run(self):
+        interval = self._interval or self._default_poll_interval
+        with QueueBasedIterableObserver.nonblocking():
+            while not self._closed.wait(interval):
+                with self._lock:
+                    if self._pending and self._is_consumer_ready():
+                        self._flush_locked()
+
+    def close(self):
+        with self._lock:
+            if self._closed.is_set():
+                return
+            self._closed.set()
+            self._pending.clear()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
@@ -0,0 +1,279 @@
+import threading
+
+from typing import Dict, List, Sequence, Tuple
+
+from koapy.backend.kiwoom_open_api_plus.core.KiwoomOpenApiPlusError import (
+    KiwoomOpenApiPlusError,
+)
+from koapy.utils.itertools import chunk
+from koapy.utils.logging.Logging import Logging
+
+
+class KiwoomOpenApiPlusRealDataHub(Logging):
+    """
+    여러 실시간 데이터 스트림이 공유하는 실시간 등록 및 이벤트 처리 허브 입니다.
+
+    (종목코드, fid 목록) 단위로 구독 수를 세서 처음 구독하는 시점에만 SetRealReg() 를,
+    마지막 구독이 해지되는 시점에만 SetRealRemove() 를 호출합니다.
+    화면번호는 fid 목록별로 화면당 최대 100 종목씩 채워서 사용하므로, fid 목록이 다른 등록들은
+    서로 다른 화면을 사용하게 되어 SetRealRemove() 가 다른 등록에 영향을 주지 않습니다.
+    구독이 해지되어 드문드문 채워진 화면은 같은 fid 목록의 다른 화면들로 옮겨서 반납합니다.
+
+    OnReceiveRealData() 이벤트는 허브에서 한번만 받아서 값들을 한번만 읽고,
+    응답 형태가 같은 구독자들 (real_data_share_key 가 같은 구독자들) 에게는 같은 응답 메시지를 전달합니다.
+
+    구독자는 real_data_share_key, get_real_data_schema(), uses_fast_parse, deliver_real_data() 를 구현해야 합니다.
+    """
+
+    _num_codes_per_screen = 100
+    _num_codes_per_screen_to_compact = 50
+    _opt_type_new = "0"
+    _opt_type_add = "1"
+
+    def __init__(self, control, screen_manager):
+        self._control = control
+        self._screen_manager = screen_manager
+
+        self._lock = threading.RLock()
+        self._connected = False
+
+        # 이벤트 스레드에서는 락 없이 읽을 수 있도록 값은 항상 새 튜플로 교체함
+        self._subscribers_by_code: Dict[str, Tuple] = {}
+        self._fid_key_by_code_by_subscriber: Dict[object, Dict[str, Tuple[int]]] = {}
+
+        self._refcount_by_registration: Dict[Tuple[str, Tuple[int]], int] = {}
+        self._screen_by_registration: Dict[Tuple[str, Tuple[int]], str] = {}
+        self._codes_by_screen: Dict[str, List[str]] = {}
+        self._screens_by_fid_key: Dict[Tuple[int], List[str]] = {}
+
+    @property
+    def control(self):
+        return self._control
+
+    @classmethod
+    def _get_fid_key(cls, fids: Sequence[int]) -> Tuple[int]:
+        return tuple(sorted({int(fid) for fid in fids}))
+
+    def get_refcount(self, code: str, fids: Sequence[int]) -> int:
+        return self._refcount_by_registration.get((code, self._get_fid_key(fids)), 0)
+
+    def get_screens(self) -> List[str]:
+        with self._lock:
+            return list(self._codes_by_screen.keys())
+
+    def _ensure_connected(self):
+        if not self._connected:
+            self.control.OnReceiveRealData.connect(self.OnReceiveRealData)
+            self._connected = True
+
+    def _register(self, codes: List[str], fid_key: Tuple[int]):
+        fid_list_joined = ";".join(str(fid) for fid in fid_key)
+        screens = self._screens_by_fid_key.setdefault(fid_key, [])
+        remaining = list(codes)
+
+        def set_real_reg(screen_no, screen_codes, opt_type):
+            KiwoomOpenApiPlusError.try_or_raise(
+                self.control.SetRealReg.queuedCall(
+                    screen_no, ";".join(screen_codes), fid_list_joined, opt_type
+                ).result()
+            )
+            self._codes_by_screen[screen_no].extend(screen_codes)
+            for code in screen_codes:
+                self._screen_by_registration[(code, fid_key)] = screen_no
+
+        for screen_no in screens:
+            if not remaining:
+                break
+            room = self._num_codes_per_screen - len(self._codes_by_screen[screen_no])
+            if room > 0:
+                screen_codes, remaining = remaining[:room], remaining[room:]
+                set_real_reg(screen_no, screen_codes, self._opt_type_add)
+
+        for screen_codes in chunk(remaining, self._num_codes_per_screen):
+            screen_no = self._screen_manager.borrow_screen()
+            screens.append(screen_no)
+            self._codes_by_screen[screen_no] = []
+            try:
+                set_real_reg(screen_no, list(screen_codes), self._opt_type_new)
+            except KiwoomOpenApiPlusError:
+                del self._codes_by_screen[screen_no]
+                screens.remove(screen_no)
+                self._screen_manager.return_screen(screen_no)
+                raise
+
+    def _unregister(self, code: str, fid_key: Tuple[int]):
+        screen_no = self._screen_by_registration.pop((code, fid_key), None)
+        if screen_no is None:
+            return
+        self.logger.debug("Removing code %s from screen %s", code, screen_no)
+        self.control.SetRealRemove.queuedCall(screen_no, code)
+        screen_codes = self._codes_by_screen[screen_no]
+        screen_codes.remove(code)
+        if not screen_codes:
+            del self._codes_by_screen[screen_no]
+            self._screens_by_fid_key[fid_key].remove(screen_no)
+            if not self._screens_by_fid_key[fid_key]:
+                del self._screens_by_fid_key[fid_key]
+            self._screen_manager.return_screen(screen_no)
+
+    def _compact_screens(self, fid_key: Tuple[int]):
+        """
+        종목 수가 절반 이하인 화면의 종목들을 같은 fid 목록의 다른 화면의 빈 자리로 옮길 수 있는 경우 옮기고 해당 화면을 반납합니다.
+
+        옮길 종목들은 다른 화면에 먼저 등록한 뒤 기존 화면을 해제하므로 중간에 데이터가 끊기지 않습니다.
+        """
+        screens = self._screens_by_fid_key.get(fid_key, [])
+        while len(screens) > 1:
+            sparsest_screen_no = min(
+                screens, key=lambda screen_no: len(self._codes_by_screen[screen_no])
+            )
+            codes = self._codes_by_screen[sparsest_screen_no]
+            if len(codes) > self._num_codes_per_screen_to_compact:
+                break
+            room_elsewhere = sum(
+                self._num_codes_per_screen - len(self._codes_by_screen[screen_no])
+                for screen_no in screens
+                if screen_no != sparsest_screen_no
+            )
+            if len(codes) > room_elsewhere:
+                break
+            self.logger.debug(
+                "Compacting screen %s with %d codes", sparsest_screen_no, len(codes)
+            )
+            screens.remove(sparsest_screen_no)
+            del self._codes_by_screen[sparsest_screen_no]
+            try:
+                self._register(codes, fid_key)
+            except KiwoomOpenApiPlusError:
+                # 옮기지 못한 종목들은 기존 화면에 그대로 남겨둠
+                self.logger.warning("Failed to compact screen %s", sparsest_screen_no)
+                remaining_codes = []
+                for code in codes:
+                    registration = (code, fid_key)
+                    if self._screen_by_registration[registration] == sparsest_screen_no:
+                        remaining_codes.append(code)
+                    else:
+                        self.control.SetRealRemove.queuedCall(sparsest_screen_no, code)
+                screens.append(sparsest_screen_no)
+                self._codes_by_screen[sparsest_screen_no] = remaining_codes
+                break
+            self.control.DisconnectRealData.queuedCall(sparsest_screen_no)
+            self._screen_manager.return_screen(sparsest_screen_no)
+
+    def _add_subscriber_to_code(self, subscriber, code: str):
+        subscribers = self._subscribers_by_code.get(code, ())
+        if subscriber not in subscribers:
+            self._subscribers_by_code[code] = subscribers + (subscriber,)
+
+    def _remove_subscriber_from_code(self, subscriber, code: str):
+        subscribers = tuple(
+            s for s in self._subscribers_by_code.get(code, ()) if s is not subscriber
+        )
+        if subscribers:
+            self._subscribers_by_code[code] = subscribers
+        else:
+            self._subscribers_by_code.pop(code, None)
+
+    def _release(self, subscriber, code: str, fid_key: Tuple[int]):
+        registration = (code, fid_key)
+        refcount = self._refcount_by_registration.get(registration, 0) - 1
+        if refcount > 0:
+            self._refcount_by_registration[registration] = refcount
+        else:
+            self._refcount_by_registration.pop(registration, None)
+            self._unregister(code, fid_key)
+        self._remove_subscriber_from_code(subscriber, code)
+
+    def subscribe(self, subscriber, codes: Sequence[str], fids: Sequence[int]):
+        fid_key = self._get_fid_key(fids)
+        with self._lock:
+            self._ensure_connected()
+            fid_key_by_code = self._fid_key_by_code_by_subscriber.setdefault(
+                subscriber, {}
+            )
+            codes_changed = []
+            codes_to_register = []
+            released_fid_keys = set()
+            for code in codes:
+                previous_fid_key = fid_key_by_code.get(code)
+                if previous_fid_key == fid_key:
+                    continue
+                if previous_fid_key is not None:
+                    self._release(subscriber, code, previous_fid_key)
+                    released_fid_keys.add(previous_fid_key)
+                fid_key_by_code[code] = fid_key
+                codes_changed.append(code)
+                registration = (code, fid_key)
+                refcount = self._refcount_by_registration.get(registration, 0)
+                self._refcount_by_registration[registration] = refcount + 1
+                if refcount == 0:
+                    codes_to_register.append(code)
+                self._add_subscriber_to_code(subscriber, code)
+            if codes_to_register:
+                self.logger.debug(
+                    "Registering %d codes with fids %s", len(codes_to_register), fid_key
+                )
+                try:
+                    self._register(codes_to_register, fid_key)
+                except KiwoomOpenApiPlusError:
+                    # 이미 같은 fid 목록으로 구독중이던 종목들은 그대로 두고 이번 호출로 추가된 구독만 되돌림
+                    self.unsubscribe(subscriber, codes_changed)
+                    raise
+            for released_fid_key in released_fid_keys:
+                self._compact_screens(released_fid_key)
+
+    def unsubscribe(self, subscriber, codes: Sequence[str] = None):
+        with self._lock:
+            fid_key_by_code = self._fid_key_by_code_by_subscriber.get(subscriber, {})
+            if codes is None:
+                codes = list(fid_key_by_code.keys())
+            released_fid_keys = set()
+            for code in codes:
+                fid_key = fid_key_by_code.pop(code, None)
+                if fid_key is not None:
+                    self._release(subscriber, code, fid_key)
+                    released_fid_keys.add(fid_key)
+            if not fid_key_by_code:
+                self._fid_key_by_code_by_subscriber.pop(subscriber, None)
+            for fid_key in released_fid_keys:
+                self._compact_screens(fid_key)
+
+    def OnReceiveRealData(self, code, realtype, realdata):
+        subscribers = self._subscribers_by_code.get(code)
+
+        if not subscribers:
+            return
+
+        split_values = None
+        values_by_fid = {}
+        responses = {}
+
+        for subscriber in subscribers:
+            share_key = subscriber.real_data_share_key
+            try:
+                response = responses[share_key]
+            except KeyError:
+                schema = subscriber.get_real_data_schema(realtype)
+                if schema is None:
+                    self.logger.error("Cannot find fids for realtype %s", realtype)
+                    response = None
+                else:
+                    if subscriber.uses_fast_parse:
+                        if split_values is None:
+                            split_values = realdata.split("\t")
+                        values = schema.pick_values(
+                            code, realtype, split_values, self.control.GetCommRealData
+                        )
+                    else:
+                        values = []
+                        for fid in schema.fids:
+                            try:
+                                value = values_by_fid[fid]
+                            except KeyError:
+                                value = self.control.GetCommRealData(code, fid)
+                                values_by_fid[fid] = value
+                            values.append(value)
+                    response = schema.make_response(code, realtype, realdata, values)
+                responses[share_key] = response
+            if response is not None:
+                subscriber.deliver_real_data(code, realtype, response)
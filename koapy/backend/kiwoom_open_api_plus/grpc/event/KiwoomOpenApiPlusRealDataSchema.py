@@ -0,0 +1,208 @@
+from operator import itemgetter
+from typing import Callable, Dict, List, Optional, Sequence
+
+from koapy.backend.kiwoom_open_api_plus.core.KiwoomOpenApiPlusRealType import (
+    KiwoomOpenApiPlusRealType,
+)
+from koapy.backend.kiwoom_open_api_plus.grpc import KiwoomOpenApiPlusService_pb2
+
+
+class KiwoomOpenApiPlusRealDataSchema:
+    """
+    하나의 실시간 타입에 대해 미리 계산해둔 필드 정보와 응답 메시지 템플릿 입니다.
+
+    매 틱마다 fid 목록과 필드 이름을 다시 계산하지 않고, 이름이 채워진 템플릿을 복사한 뒤
+    값만 채워서 응답을 만듭니다.
+
+    compact 인 경우 필드 이름은 처음 응답에만 스키마 메시지로 한번 전달하고
+    이후에는 schema_id 와 값들만 전달합니다.
+
+    fast_parse 를 사용하는 경우 pick_values() 로 원본 문자열을 나눈 값들 중에서 요청한 fid 들의 값만 골라냅니다.
+    원본 문자열은 실시간 타입의 fid 목록 순서대로 값이 들어있으므로, 실시간 타입별로 각 fid 의 위치를
+    한번만 계산해두고 이후에는 위치로만 값을 꺼냅니다. 해당 실시간 타입에 없는 fid 는 GetCommRealData() 로 읽습니다.
+    """
+
+    __slots__ = [
+        "realtype",
+        "fids",
+        "names",
+        "fid_index",
+        "schema_id",
+        "compact",
+        "_template",
+        "_schema_sent",
+        "_pickers",
+    ]
+
+    def __init__(
+        self,
+        realtype: str,
+        fids: Sequence[int],
+        readable_names: bool,
+        schema_id: int = 0,
+        compact: bool = False,
+    ):
+        self.realtype = realtype
+        self.fids = list(fids)
+        self.schema_id = schema_id
+        self.compact = compact
+
+        if readable_names:
+            self.names = [
+                KiwoomOpenApiPlusRealType.Fid.get_name_by_fid(fid, str(fid))
+                for fid in self.fids
+            ]
+        else:
+            self.names = [str(fid) for fid in self.fids]
+
+        self.fid_index = {fid: i for i, fid in enumerate(self.fids)}
+
+        template = KiwoomOpenApiPlusService_pb2.ListenResponse()
+        template.name = "OnReceiveRealData"
+        template.arguments.add().string_value = ""
+        template.arguments.add().string_value = realtype
+        template.arguments.add().string_value = ""
+        if self.compact:
+            template.schema_id = self.schema_id
+        else:
+            template.single_data.names.extend(self.names)
+        self._template = template
+        self._schema_sent = False
+        self._pickers: Dict[str, Callable] = {}
+
+    def to_protobuf(self, message=None) -> KiwoomOpenApiPlusService_pb2.RealDataSchema:
+        if message is None:
+            message = KiwoomOpenApiPlusService_pb2.RealDataSchema()
+        message.schema_id = self.schema_id
+        message.realtype = self.realtype
+        message.fids.extend(self.fids)
+        message.names.extend(self.names)
+        return message
+
+    def _create_picker(self, realtype: str) -> Callable:
+        layout = KiwoomOpenApiPlusRealType.get_fids_by_realtype_name(realtype) or []
+        if self.fids == layout:
+            # 실시간 타입의 전체 fid 를 그대로 요청한 경우 나눈 값들을 그대로 사용
+            return lambda code, values, get_comm_real_data: values
+        position_by_fid = {fid: i for i, fid in enumerate(layout)}
+        positions = [position_by_fid.get(fid) for fid in self.fids]
+        if positions and None not in positions:
+            getter = itemgetter(*positions)
+            if len(positions) == 1:
+                return lambda code, values, get_comm_real_data: [getter(values)]
+            return lambda code, values, get_comm_real_data: getter(values)
+        fids_and_positions = list(zip(self.fids, positions))
+
+        def picker(code, values, get_comm_real_data):
+            return [
+                values[i] if i is not None else get_comm_real_data(code, fid)
+                for fid, i in fids_and_positions
+            ]
+
+        return picker
+
+    def pick_values(
+        self,
+        code: str,
+        realtype: str,
+        values: Sequence[str],
+        get_comm_real_data: Callable[[str, int], str],
+    ) -> Sequence[str]:
+        try:
+            picker = self._pickers[realtype]
+        except KeyError:
+            picker = self._create_picker(realtype)
+            self._pickers[realtype] = picker
+        return picker(code, values, get_comm_real_data)
+
+    def make_response(
+        self,
+        code: str,
+        realtype: str,
+        realdata: str,
+        values: Sequence[str],
+        response: Optional[KiwoomOpenApiPlusService_pb2.ListenResponse] = None,
+    ) -> KiwoomOpenApiPlusService_pb2.ListenResponse:
+        assert len(self.names) == len(values)
+        if response is None:
+            response = KiwoomOpenApiPlusService_pb2.ListenResponse()
+        response.CopyFrom(self._template)
+        arguments = response.arguments
+        arguments[0].string_value = code
+        arguments[1].string_value = realtype
+        if self.compact:
+            # 원본 문자열은 값들과 중복되므로 compact 인 경우 생략
+            if not self._schema_sent:
+                self.to_protobuf(response.real_data_schema)
+                self._schema_sent = True
+        else:
+            arguments[2].string_value = realdata
+        response.single_data.values.extend(values)
+        return response
+
+
+class KiwoomOpenApiPlusRealDataSchemaCache:
+    """
+    실시간 타입별 KiwoomOpenApiPlusRealDataSchema 를 처음 수신된 시점에 만들어두고 재사용합니다.
+
+    infer_fids 가 False 인 경우 모든 실시간 타입에 대해 주어진 fid 목록을 사용하므로
+    하나의 스키마만 사용합니다.
+
+    compact 인 경우 스키마마다 1 부터 시작하는 schema_id 를 부여하며, 스키마 메시지는
+    캐시 (스트림) 단위로 한번씩만 전달되므로 스트림마다 별도의 캐시를 사용해야 합니다.
+    """
+
+    def __init__(
+        self,
+        fid_list: Optional[Sequence[int]] = None,
+        infer_fids: bool = False,
+        readable_names: bool = False,
+        compact: bool = False,
+    ):
+        self._fid_list = list(fid_list or [])
+        self._infer_fids = infer_fids
+        self._readable_names = readable_names
+        self._compact = compact
+
+        self._schemas: Dict[str, KiwoomOpenApiPlusRealDataSchema] = {}
+        self._fixed_schema: Optional[KiwoomOpenApiPlusRealDataSchema] = None
+        self._last_schema_id = 0
+
+        if not self._infer_fids:
+            self._fixed_schema = self._create_schema("", self._fid_list)
+
+    def _create_schema(
+        self, realtype: str, fids: Sequence[int]
+    ) -> KiwoomOpenApiPlusRealDataSchema:
+        self._last_schema_id += 1
+        return KiwoomOpenApiPlusRealDataSchema(
+            realtype,
+            fids,
+            self._readable_names,
+            self._last_schema_id,
+            self._compact,
+        )
+
+    @property
+    def infer_fids(self) -> bool:
+        return self._infer_fids
+
+    def _build(self, realtype: str) -> Optional[KiwoomOpenApiPlusRealDataSchema]:
+        fids = KiwoomOpenApiPlusRealType.get_fids_by_realtype_name(realtype)
+        if fids is None:
+            return None
+        schema = self._create_schema(realtype, fids)
+        self._schemas[realtype] = schema
+        return schema
+
+    def get(self, realtype: str) -> Optional[KiwoomOpenApiPlusRealDataSchema]:
+        if self._fixed_schema is not None:
+            return self._fixed_schema
+        try:
+            return self._schemas[realtype]
+        except KeyError:
+            return self._build(realtype)
+
+    def get_fids(self, realtype: str) -> List[int]:
+        schema = self.get(realtype)
+        return schema.fids if schema is not None else []
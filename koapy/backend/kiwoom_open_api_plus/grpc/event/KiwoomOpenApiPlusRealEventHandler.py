@@ -9,13 +9,19 @@ from koapy.backend.kiwoom_open_api_plus.core.KiwoomOpenApiPlusError import (
     KiwoomOpenApiPlusError,
     KiwoomOpenApiPlusNegativeReturnCodeError,
 )
-from koapy.backend.kiwoom_open_api_plus.core.KiwoomOpenApiPlusRealType import (
-    KiwoomOpenApiPlusRealType,
-)
 from koapy.backend.kiwoom_open_api_plus.grpc import KiwoomOpenApiPlusService_pb2
 from koapy.backend.kiwoom_open_api_plus.grpc.event.KiwoomOpenApiPlusEventHandlerForGrpc import (
     KiwoomOpenApiPlusEventHandlerForGrpc,
 )
+from koapy.backend.kiwoom_open_api_plus.grpc.event.KiwoomOpenApiPlusRealDataBatcher import (
+    KiwoomOpenApiPlusRealDataBatcher,
+)
+from koapy.backend.kiwoom_open_api_plus.grpc.event.KiwoomOpenApiPlusRealDataConflater import (
+    KiwoomOpenApiPlusRealDataConflater,
+)
+from koapy.backend.kiwoom_open_api_plus.grpc.event.KiwoomOpenApiPlusRealDataSchema import (
+    KiwoomOpenApiPlusRealDataSchemaCache,
+)
 from koapy.backend.kiwoom_open_api_plus.utils.queue.QueueBasedBufferedIterator import (
     QueueBasedBufferedIterator,
 )
@@ -28,10 +34,11 @@ class KiwoomOpenApiPlusRealEventHandler(KiwoomOpenApiPlusEventHandlerForGrpc, Lo
     _num_codes_per_screen = 100
     _default_opt_type = "0"
 
-    def __init__(self, control, request, context, screen_manager):
+    def __init__(self, control, request, context, screen_manager, real_data_hub=None):
         super().__init__(control, context)
         self._request = request
         self._screen_manager = screen_manager
+        self._real_data_hub = real_data_hub
 
         self._screen_no = request.screen_no
         self._code_list = request.code_list
@@ -41,7 +48,9 @@ class KiwoomOpenApiPlusRealEventHandler(KiwoomOpenApiPlusEventHandlerForGrpc, Lo
         self._infer_fids = request.flags.infer_fids
         self._readable_names = request.flags.readable_names
         self._fast_parse = request.flags.fast_parse
+        self._compact_schema = request.flags.compact_schema
 
+        self._code_set = set(self._code_list)
         self._code_lists = [
             codes for codes in chunk(self._code_list, self._num_codes_per_screen)
         ]
@@ -59,7 +68,114 @@ class KiwoomOpenApiPlusRealEventHandler(KiwoomOpenApiPlusEventHandlerForGrpc, Lo
         self._fid_list_joined = ";".join([str(fid) for fid in self._fid_list])
         self._opt_type_final = self._opt_type or self._default_opt_type
 
+        self._real_data_schemas = KiwoomOpenApiPlusRealDataSchemaCache(
+            self._fid_list, self._infer_fids, self._readable_names, self._compact_schema
+        )
+
+        self._real_data_batcher = None
+        self._real_data_conflater = None
+        self._configure_real_data_delivery(request.flags)
+        self._update_real_data_share_key()
+
+    def _update_real_data_share_key(self):
+        if self._compact_schema:
+            # 스키마 전달 여부가 스트림마다 다르므로 응답을 공유하지 않음
+            self._real_data_share_key = ("stream", id(self))
+        else:
+            self._real_data_share_key = (
+                self._infer_fids,
+                tuple(self._fid_list),
+                self._readable_names,
+                self.uses_fast_parse,
+            )
+
+    @property
+    def real_data_share_key(self):
+        return self._real_data_share_key
+
+    @property
+    def uses_fast_parse(self):
+        return self._fast_parse
+
+    def get_real_data_schema(self, realtype):
+        return self._real_data_schemas.get(realtype)
+
+    def deliver_real_data(self, code, realtype, response):
+        # initialize_request 처리 중에 다른 스레드에서 교체될 수 있으므로 한번만 읽어서 사용
+        real_data_batcher = self._real_data_batcher
+        real_data_conflater = self._real_data_conflater
+        if real_data_batcher is not None:
+            real_data_batcher.on_next(response)
+        elif real_data_conflater is not None:
+            real_data_conflater.on_next(code, realtype, response)
+        else:
+            self.observer.on_next(response)
+
+    def slots(self):
+        names_and_slots = super().slots()
+        if self._real_data_hub is not None:
+            # 허브를 사용하는 경우 실시간 이벤트는 허브에서 한번만 받아서 전달함
+            names_and_slots = [
+                (name, slot)
+                for name, slot in names_and_slots
+                if name != "OnReceiveRealData"
+            ]
+        return names_and_slots
+
+    def _on_real_data_batch(self, batch):
+        self.observer.on_next(batch)
+
+    def _close_real_data_delivery(self):
+        real_data_batcher = self._real_data_batcher
+        real_data_conflater = self._real_data_conflater
+        self._real_data_batcher = None
+        self._real_data_conflater = None
+        if real_data_batcher is not None:
+            real_data_batcher.close()
+        if real_data_conflater is not None:
+            real_data_conflater.close()
+
+    @classmethod
+    def _get_real_data_key(cls, response):
+        if response.name == "OnReceiveRealData":
+            return (
+                response.arguments[0].string_value,
+                response.arguments[1].string_value,
+            )
+        return None
+
+    @classmethod
+    def _has_real_data_schema(cls, response):
+        # compact_schema 모드에서 한번만 전달되는 스키마는 큐가 가득 차더라도 버리지 않음
+        return response.HasField("real_data_schema") or any(
+            event.HasField("real_data_schema") for event in response.events
+        )
+
+    def _configure_real_data_delivery(self, flags):
+        self._close_real_data_delivery()
+        self.set_backpressure(
+            flags.queue_maxsize or None,
+            flags.backpressure_policy or None,
+            self._get_real_data_key,
+            self._has_real_data_schema,
+        )
+        self._real_data_conflater = KiwoomOpenApiPlusRealDataConflater.from_flags(
+            self.observer, flags
+        )
+        if self._real_data_conflater is not None:
+            if flags.max_batch_size > 0 or flags.max_linger_ms > 0:
+                self.logger.warning("Batching is ignored when conflating real data")
+        else:
+            self._real_data_batcher = KiwoomOpenApiPlusRealDataBatcher.from_flags(
+                self._on_real_data_batch, flags
+            )
+
     def on_enter(self):
+        self.add_callback(self._close_real_data_delivery)
+        if self._real_data_hub is not None:
+            self.add_callback(self._real_data_hub.unsubscribe, self)
+            self._real_data_hub.subscribe(self, self._code_list, self._fid_list)
+            return
         for screen_no, code_list in zip(self._screen_nos, self._code_lists):
             code_list_joined = ";".join(code_list)
             screen_no = self._screen_manager.borrow_screen(screen_no)
@@ -78,37 +194,30 @@ class KiwoomOpenApiPlusRealEventHandler(KiwoomOpenApiPlusEventHandlerForGrpc, Lo
             )
 
     def OnReceiveRealData(self, code, realtype, realdata):
-        if code in self._code_list:
-            response = KiwoomOpenApiPlusService_pb2.ListenResponse()
-            response.name = "OnReceiveRealData"
-            response.arguments.add().string_value = code
-            response.arguments.add().string_value = realtype
-            response.arguments.add().string_value = realdata
-
-            if self._infer_fids:
-                fids = KiwoomOpenApiPlusRealType.get_fids_by_realtype_name(realtype)
-            else:
-                fids = self._fid_list
-
-            if self._readable_names:
-                names = [
-                    KiwoomOpenApiPlusRealType.Fid.get_name_by_fid(fid, str(fid))
-                    for fid in fids
-                ]
-            else:
-                names = [str(fid) for fid in fids]
+        if code not in self._code_set:
+            return
 
-            if self._infer_fids and self._fast_parse:
-                values = realdata.split("\t")
-            else:
-                values = [self.control.GetCommRealData(code, fid) for fid in fids]
+        schema = self._real_data_schemas.get(realtype)
 
-            assert len(names) == len(values)
+        if schema is None:
+            self.logger.error("Cannot find fids for realtype %s", realtype)
+            return
 
-            response.single_data.names.extend(names)
-            response.single_data.values.extend(values)
+        if self.uses_fast_parse:
+            values = schema.pick_values(
+                code, realtype, realdata.split("\t"), self.control.GetCommRealData
+            )
+        else:
+            values = [self.control.GetCommRealData(code, fid) for fid in schema.fids]
 
-            self.observer.on_next(response)
+        real_data_batcher = self._real_data_batcher
+        if real_data_batcher is not None:
+            real_data_batcher.add(
+                schema.make_response, code, realtype, realdata, values
+            )
+        else:
+            response = schema.make_response(code, realtype, realdata, values)
+            self.deliver_real_data(code, realtype, response)
 
     def OnEventConnect(self, errcode):
         if errcode < 0:
@@ -120,9 +229,14 @@ class KiwoomOpenApiPlusRealEventHandler(KiwoomOpenApiPlusEventHandlerForGrpc, Lo
 class KiwoomOpenApiPlusBidirectionalRealEventHandler(
     KiwoomOpenApiPlusRealEventHandler, Logging
 ):
-    def __init__(self, control, request_iterator, context, screen_manager):
+
+    _num_codes_per_screen_to_compact = 50
+
+    def __init__(
+        self, control, request_iterator, context, screen_manager, real_data_hub=None
+    ):
         request = KiwoomOpenApiPlusService_pb2.RealRequest()
-        super().__init__(control, request, context, screen_manager)
+        super().__init__(control, request, context, screen_manager, real_data_hub)
 
         self._request_iterator = request_iterator
         self._buffered_request_iterator = QueueBasedBufferedIterator(
@@ -133,45 +247,23 @@ class KiwoomOpenApiPlusBidirectionalRealEventHandler(
         self._fid_list_joined = ";".join(str(fid) for fid in self._fid_list)
 
         self._screen_by_code = {}
-        self._code_list_by_screen = {}
-        self._code_list = []
+        self._code_set_by_screen = {}
+        self._screens_with_room = {}
+        self._fid_list_joined_by_code = {}
+        self._code_set = set()
 
         self._request_iterator_consumer = None
         self._request_iterator_consumer_should_stop = False
         self._request_iterator_consumer_timeout = 2.0
 
-    def register_code(self, code, fid_list=None):
-        if code in self._screen_by_code:
-            screen_no = self._screen_by_code[code]
-            opt_type = "1"
-        else:
-            screen_no = None
-            opt_type = "0"
-
-            for (
-                existing_screen_no,
-                screen_code_list,
-            ) in self._code_list_by_screen.items():
-                if len(screen_code_list) < self._num_codes_per_screen:
-                    screen_no = existing_screen_no
-                    opt_type = "1"
-                    break
-
-            if screen_no is None:
-                screen_no = self._screen_manager.borrow_screen()
-                opt_type = "0"
-
-            self._screen_by_code[code] = screen_no
-            self._code_list_by_screen.setdefault(screen_no, []).append(code)
-            self._code_list.append(code)
-
-        if fid_list:
-            fid_list_joined = ";".join(str(fid) for fid in fid_list)
-        else:
-            fid_list_joined = self._fid_list_joined
+    def _set_real_reg(self, screen_no, codes, fid_list_joined, opt_type):
+        code_list_joined = ";".join(codes)
 
         self.logger.debug(
-            "Registering code %s to screen %s with type %s", code, screen_no, opt_type
+            "Registering %d codes to screen %s with type %s",
+            len(codes),
+            screen_no,
+            opt_type,
         )
 
         def try_to_register(retry=2, timeout=3.0):
@@ -180,7 +272,7 @@ class KiwoomOpenApiPlusBidirectionalRealEventHandler(
             def call():
                 KiwoomOpenApiPlusError.try_or_raise(
                     self.control.SetRealReg.queuedCall(
-                        screen_no, code, fid_list_joined, opt_type
+                        screen_no, code_list_joined, fid_list_joined, opt_type
                     ),
                     except_callback=on_error,
                 )
@@ -188,11 +280,11 @@ class KiwoomOpenApiPlusBidirectionalRealEventHandler(
             def on_error(e):
                 nonlocal retry_count
                 if isinstance(e, KiwoomOpenApiPlusError):
+                    error_message = f"Failed to register codes={code_list_joined!r}. Reason: {e} ({e.code})."
+                else:
                     error_message = (
-                        f"Failed to register {code=}. Reason: {e} ({e.code})."
+                        f"Failed to register codes={code_list_joined!r}. Reason: {e}."
                     )
-                else:
-                    error_message = f"Failed to register {code=}. Reason: {e}."
                 if retry_count < retry:
                     retry_count += 1
                     self.logger.warning(
@@ -210,36 +302,158 @@ class KiwoomOpenApiPlusBidirectionalRealEventHandler(
 
         try_to_register()
 
-    def remove_code(self, code):
-        if code in self._screen_by_code:
-            screen_no = self._screen_by_code[code]
-            self.logger.debug("Removing code %s from screen %s", code, screen_no)
-            self.control.SetRealRemove.queuedCall(screen_no, code)
-            self._screen_by_code.pop(code)
-            self._code_list_by_screen[screen_no].remove(code)
-            self._code_list.remove(code)
+    def _update_screen_room(self, screen_no):
+        if len(self._code_set_by_screen[screen_no]) < self._num_codes_per_screen:
+            self._screens_with_room[screen_no] = None
+        else:
+            self._screens_with_room.pop(screen_no, None)
+
+    def _add_codes_to_screens(self, codes, fid_list_joined):
+        """
+        주어진 종목들을 여유가 있는 화면부터 채워넣고, 화면별로 SetRealReg() 를 한번씩만 호출합니다.
+        """
+        codes = list(codes)
+        while codes:
+            if self._screens_with_room:
+                screen_no = next(iter(self._screens_with_room))
+                opt_type = "1"
+            else:
+                screen_no = self._screen_manager.borrow_screen()
+                self._code_set_by_screen[screen_no] = set()
+                opt_type = "0"
+            screen_code_set = self._code_set_by_screen[screen_no]
+            room = self._num_codes_per_screen - len(screen_code_set)
+            screen_codes, codes = codes[:room], codes[room:]
+            for code in screen_codes:
+                self._screen_by_code[code] = screen_no
+                self._fid_list_joined_by_code[code] = fid_list_joined
+            screen_code_set.update(screen_codes)
+            self._update_screen_room(screen_no)
+            self._set_real_reg(screen_no, screen_codes, fid_list_joined, opt_type)
+
+    def register_codes(self, codes, fid_list=None):
+        if self._real_data_hub is not None:
+            self.logger.debug("Subscribing %d codes", len(codes))
+            self._real_data_hub.subscribe(self, codes, fid_list or self._fid_list)
+            self._code_set.update(codes)
+            return
+
+        if fid_list:
+            fid_list_joined = ";".join(str(fid) for fid in fid_list)
         else:
-            self.logger.warning(
-                "Given code %s is not in managed code list and cannot be removed", code
+            fid_list_joined = self._fid_list_joined
+
+        new_codes = []
+        existing_codes_by_screen = {}
+        for code in dict.fromkeys(codes):
+            if code in self._screen_by_code:
+                screen_no = self._screen_by_code[code]
+                existing_codes_by_screen.setdefault(screen_no, []).append(code)
+            else:
+                new_codes.append(code)
+
+        # 이미 등록된 종목들은 기존 화면에 fid 목록만 갱신
+        for screen_no, screen_codes in existing_codes_by_screen.items():
+            for code in screen_codes:
+                self._fid_list_joined_by_code[code] = fid_list_joined
+            self._set_real_reg(screen_no, screen_codes, fid_list_joined, "1")
+
+        if new_codes:
+            self._code_set.update(new_codes)
+            self._add_codes_to_screens(new_codes, fid_list_joined)
+
+    def register_code(self, code, fid_list=None):
+        self.register_codes([code], fid_list)
+
+    def _compact_screens(self):
+        """
+        종목 수가 절반 이하인 화면의 종목들을 다른 화면의 빈 자리로 옮길 수 있는 경우 옮기고 해당 화면을 반납합니다.
+
+        종목들이 자주 추가되고 제거되는 경우 드문드문 채워진 화면들이 계속 늘어나지 않도록 합니다.
+        옮길 종목들은 새 화면에 먼저 등록한 뒤 기존 화면에서 제거하므로 중간에 데이터가 끊기지 않습니다.
+        """
+        while len(self._code_set_by_screen) > 1:
+            sparsest_screen_no = min(
+                self._code_set_by_screen,
+                key=lambda screen_no: len(self._code_set_by_screen[screen_no]),
+            )
+            screen_code_set = self._code_set_by_screen[sparsest_screen_no]
+            if len(screen_code_set) > self._num_codes_per_screen_to_compact:
+                break
+            room_elsewhere = sum(
+                self._num_codes_per_screen - len(self._code_set_by_screen[screen_no])
+                for screen_no in self._screens_with_room
+                if screen_no != sparsest_screen_no
             )
+            if len(screen_code_set) > room_elsewhere:
+                break
+            self.logger.debug(
+                "Compacting screen %s with %d codes",
+                sparsest_screen_no,
+                len(screen_code_set),
+            )
+            del self._code_set_by_screen[sparsest_screen_no]
+            self._screens_with_room.pop(sparsest_screen_no, None)
+            codes_by_fid_list_joined = {}
+            for code in sorted(screen_code_set):
+                fid_list_joined = self._fid_list_joined_by_code[code]
+                codes_by_fid_list_joined.setdefault(fid_list_joined, []).append(code)
+            for fid_list_joined, codes in codes_by_fid_list_joined.items():
+                self._add_codes_to_screens(codes, fid_list_joined)
+            self.control.DisconnectRealData.queuedCall(sparsest_screen_no)
+            self._screen_manager.return_screen(sparsest_screen_no)
+
+    def remove_codes(self, codes):
+        if self._real_data_hub is not None:
+            codes_to_remove = [code for code in codes if code in self._code_set]
+            for code in codes:
+                if code not in self._code_set:
+                    self.logger.warning(
+                        "Given code %s is not in managed code list and cannot be removed",
+                        code,
+                    )
+            self._real_data_hub.unsubscribe(self, codes_to_remove)
+            self._code_set.difference_update(codes_to_remove)
+            return
+
+        for code in codes:
+            screen_no = self._screen_by_code.pop(code, None)
+            if screen_no is None:
+                self.logger.warning(
+                    "Given code %s is not in managed code list and cannot be removed",
+                    code,
+                )
+                continue
+            self.logger.debug("Removing code %s from screen %s", code, screen_no)
+            self.control.SetRealRemove.queuedCall(screen_no, code)
+            self._fid_list_joined_by_code.pop(code, None)
+            self._code_set.discard(code)
+            screen_code_set = self._code_set_by_screen[screen_no]
+            screen_code_set.discard(code)
+            if screen_code_set:
+                self._update_screen_room(screen_no)
+            else:
+                del self._code_set_by_screen[screen_no]
+                self._screens_with_room.pop(screen_no, None)
+                self._screen_manager.return_screen(screen_no)
+
+        self._compact_screens()
+
+    def remove_code(self, code):
+        self.remove_codes([code])
 
     def remove_all_codes(self):
-        code_list = list(
-            self._code_list
-        )  # copy in order to prevent "modification while iteration"
-        for code in code_list:
-            self.remove_code(code)
+        self.remove_codes(list(self._code_set))
 
     def remove_all_screens(self):
         self.remove_all_codes()
-        screen_nos = list(self._code_list_by_screen.keys())
+        screen_nos = list(self._code_set_by_screen.keys())
         for screen_no in screen_nos:
-            self.control.DisconnectRealData(
-                screen_no
-            )  # ensure although already removed in remove_all_codes()
+            self.control.DisconnectRealData(screen_no)
             self._screen_manager.return_screen(screen_no)
-            code_list = self._code_list_by_screen.pop(screen_no)
-            assert len(code_list) == 0
+            code_set = self._code_set_by_screen.pop(screen_no)
+            assert len(code_set) == 0
+        self._screens_with_room.clear()
 
     def consume_request_iterator(self):
         while not self._request_iterator_consumer_should_stop:
@@ -255,12 +469,10 @@ class KiwoomOpenApiPlusBidirectionalRealEventHandler(
                 if request.HasField("register_request"):
                     code_list = request.register_request.code_list
                     fid_list = request.register_request.fid_list
-                    for code in code_list:
-                        self.register_code(code, fid_list)
+                    self.register_codes(code_list, fid_list)
                 elif request.HasField("remove_request"):
                     code_list = request.remove_request.code_list
-                    for code in code_list:
-                        self.remove_code(code)
+                    self.remove_codes(code_list)
                 elif request.HasField("stop_request"):
                     self.stop()
                     break
@@ -273,6 +485,17 @@ class KiwoomOpenApiPlusBidirectionalRealEventHandler(
                         request.initialize_request.flags.readable_names
                     )
                     self._fast_parse = request.initialize_request.flags.fast_parse
+                    self._compact_schema = (
+                        request.initialize_request.flags.compact_schema
+                    )
+                    self._real_data_schemas = KiwoomOpenApiPlusRealDataSchemaCache(
+                        self._fid_list,
+                        self._infer_fids,
+                        self._readable_names,
+                        self._compact_schema,
+                    )
+                    self._configure_real_data_delivery(request.initialize_request.flags)
+                    self._update_real_data_share_key()
                     self.remove_all_codes()
                 else:
                     raise KiwoomOpenApiPlusError("Unexpected request")
@@ -299,36 +522,4 @@ class KiwoomOpenApiPlusBidirectionalRealEventHandler(
     def on_exit(self, exc_type=None, exc_value=None, traceback=None):
         self.stop_request_iterator_consumer()
         self.remove_all_screens()
-
-    def OnReceiveRealData(self, code, realtype, realdata):
-        if code in self._code_list:
-            response = KiwoomOpenApiPlusService_pb2.ListenResponse()
-            response.name = "OnReceiveRealData"
-            response.arguments.add().string_value = code
-            response.arguments.add().string_value = realtype
-            response.arguments.add().string_value = realdata
-
-            if self._infer_fids:
-                fids = KiwoomOpenApiPlusRealType.get_fids_by_realtype_name(realtype)
-            else:
-                fids = self._fid_list
-
-            if self._readable_names:
-                names = [
-                    KiwoomOpenApiPlusRealType.Fid.get_name_by_fid(fid, str(fid))
-                    for fid in fids
-                ]
-            else:
-                names = [str(fid) for fid in fids]
-
-            if self._infer_fids and self._fast_parse:
-                values = realdata.split("\t")
-            else:
-                values = [self.control.GetCommRealData(code, fid) for fid in fids]
-
-            assert len(names) == len(values)
-
-            response.single_data.names.extend(names)
-            response.single_data.values.extend(values)
-
-            self.observer.on_next(response)
+        self._close_real_data_delivery()
@@ -5,6 +5,9 @@ from koapy.backend.kiwoom_open_api_plus.core.KiwoomOpenApiPlusError import (
     KiwoomOpenApiPlusError,
     KiwoomOpenApiPlusNegativeReturnCodeError,
 )
+from koapy.backend.kiwoom_open_api_plus.core.KiwoomOpenApiPlusFieldType import (
+    KiwoomOpenApiPlusFieldType,
+)
 from koapy.backend.kiwoom_open_api_plus.core.KiwoomOpenApiPlusTrInfo import (
     KiwoomOpenApiPlusTrInfo,
 )
@@ -12,10 +15,21 @@ from koapy.backend.kiwoom_open_api_plus.grpc import KiwoomOpenApiPlusService_pb2
 from koapy.backend.kiwoom_open_api_plus.grpc.event.KiwoomOpenApiPlusEventHandlerForGrpc import (
     KiwoomOpenApiPlusEventHandlerForGrpc,
 )
+from koapy.backend.kiwoom_open_api_plus.grpc.KiwoomOpenApiPlusServiceMessageUtils import (
+    convert_rows_from_python_to_columnar_data,
+    convert_rows_from_python_to_typed_columnar_data,
+    convert_transaction_priority_from_protobuf_to_python,
+)
 from koapy.utils.logging.Logging import Logging
 
 
 class KiwoomOpenApiPlusTrEventHandler(KiwoomOpenApiPlusEventHandlerForGrpc, Logging):
+
+    # GetCommDataEx() is documented to be available for chart TRs only,
+    # which are the ones having names like SCHART, UPCHART, FCHART and OCHART in their TR infos
+    _use_comm_data_ex = True
+    _comm_data_ex_tr_name_suffix = "CHART"
+
     def __init__(self, control, request, context, screen_manager):
         super().__init__(control, context)
         self._request = request
@@ -25,6 +39,12 @@ class KiwoomOpenApiPlusTrEventHandler(KiwoomOpenApiPlusEventHandlerForGrpc, Logg
         self._trcode = request.transaction_code
         self._scrnno = request.screen_no
         self._inputs = request.inputs
+        self._columnar = request.transaction_flags.columnar
+        self._typed_values = request.transaction_flags.typed_values
+        self._priority = convert_transaction_priority_from_protobuf_to_python(
+            request.transaction_flags.priority
+        )
+        self._client_key = context.peer()
 
         self._trinfo = KiwoomOpenApiPlusTrInfo.get_trinfo_by_code(self._trcode)
 
@@ -36,6 +56,19 @@ class KiwoomOpenApiPlusTrEventHandler(KiwoomOpenApiPlusEventHandlerForGrpc, Logg
         self._single_names = self._trinfo.get_single_output_names()
         self._multi_names = self._trinfo.get_multi_output_names()
 
+        self._single_types = KiwoomOpenApiPlusFieldType.from_trinfo(
+            self._trinfo, multi=False
+        )
+        self._multi_types = KiwoomOpenApiPlusFieldType.from_trinfo(
+            self._trinfo, multi=True
+        )
+
+        self._should_use_comm_data_ex = (
+            self._use_comm_data_ex
+            and self._trinfo.tr_name is not None
+            and self._trinfo.tr_name.upper().endswith(self._comm_data_ex_tr_name_suffix)
+        )
+
         stop_condition = request.stop_condition
         stop_condition_is_valid = (
             stop_condition is not None
@@ -73,13 +106,64 @@ class KiwoomOpenApiPlusTrEventHandler(KiwoomOpenApiPlusEventHandlerForGrpc, Logg
 
         self._is_stop_condition = is_stop_condition
 
+    def get_multi_rows_using_comm_data(self, trcode, recordname, repeat_cnt):
+        rows = [
+            [
+                self.control.GetCommData(trcode, recordname, i, name).strip()
+                for name in self._multi_names
+            ]
+            for i in range(repeat_cnt)
+        ]
+        return rows
+
+    def get_multi_rows_using_comm_data_ex(self, trcode, recordname, repeat_cnt):
+        try:
+            data = self.control.GetCommDataEx(trcode, recordname)
+        except Exception:  # pylint: disable=broad-except
+            self.logger.exception("Exception while calling GetCommDataEx()")
+            return None
+        num_columns = len(self._multi_names)
+        is_valid_shape = (
+            isinstance(data, (list, tuple))
+            and len(data) == repeat_cnt
+            and all(
+                isinstance(row, (list, tuple)) and len(row) == num_columns
+                for row in data
+            )
+        )
+        if not is_valid_shape:
+            self.logger.warning(
+                "Unexpected data shape from GetCommDataEx() for trcode %s, fallback to GetCommData()",
+                trcode,
+            )
+            return None
+        rows = [[str(value).strip() for value in row] for row in data]
+        return rows
+
+    def get_multi_rows(self, trcode, recordname, repeat_cnt):
+        if self._should_use_comm_data_ex:
+            rows = self.get_multi_rows_using_comm_data_ex(
+                trcode, recordname, repeat_cnt
+            )
+            if rows is not None:
+                return rows
+            # do not try again for the following pages once it has failed
+            self._should_use_comm_data_ex = False
+        return self.get_multi_rows_using_comm_data(trcode, recordname, repeat_cnt)
+
     def on_enter(self):
         self._scrnno = self._screen_manager.borrow_screen(self._scrnno)
         self.add_callback(self._screen_manager.return_screen, self._scrnno)
         self.add_callback(self.control.DisconnectRealData, self._scrnno)
         KiwoomOpenApiPlusError.try_or_raise(
-            self.control.RateLimitedCommRqData.queuedCall(
-                self._rqname, self._trcode, 0, self._scrnno, self._inputs
+            self.control.RateLimitedCommRqData.prioritizedQueuedCall(
+                self._priority,
+                self._client_key,
+                self._rqname,
+                self._trcode,
+                0,
+                self._scrnno,
+                self._inputs,
             ),
             except_callback=self.observer.on_error,
         )
@@ -117,30 +201,48 @@ class KiwoomOpenApiPlusTrEventHandler(KiwoomOpenApiPlusEventHandlerForGrpc, Logg
                         self._multi_names,
                         self._single_names,
                     )
+                    self._single_types, self._multi_types = (
+                        self._multi_types,
+                        self._single_types,
+                    )
                 if len(self._multi_names) > 0:
-                    rows = [
-                        [
-                            self.control.GetCommData(
-                                trcode, recordname, i, name
-                            ).strip()
-                            for name in self._multi_names
-                        ]
-                        for i in range(repeat_cnt)
-                    ]
-                    response.multi_data.names.extend(self._multi_names)
-                    for row in rows:
+                    rows = self.get_multi_rows(trcode, recordname, repeat_cnt)
+                    for i, row in enumerate(rows):
                         if self._is_stop_condition(row):
                             should_stop = True
+                            rows = rows[:i]
                             break
-                        response.multi_data.values.add().values.extend(row)
+                    if self._typed_values:
+                        convert_rows_from_python_to_typed_columnar_data(
+                            self._multi_names,
+                            self._multi_types,
+                            rows,
+                            response.columnar_data,
+                        )
+                    elif self._columnar:
+                        convert_rows_from_python_to_columnar_data(
+                            self._multi_names, rows, response.columnar_data
+                        )
+                    else:
+                        response.multi_data.names.extend(self._multi_names)
+                        for row in rows:
+                            response.multi_data.values.add().values.extend(row)
 
             if len(self._single_names) > 0:
                 values = [
                     self.control.GetCommData(trcode, recordname, 0, name).strip()
                     for name in self._single_names
                 ]
-                response.single_data.names.extend(self._single_names)
-                response.single_data.values.extend(values)
+                if self._typed_values:
+                    convert_rows_from_python_to_typed_columnar_data(
+                        self._single_names,
+                        self._single_types,
+                        [values],
+                        response.typed_single_data,
+                    )
+                else:
+                    response.single_data.names.extend(self._single_names)
+                    response.single_data.values.extend(values)
 
             self.observer.on_next(response)
 
@@ -148,8 +250,14 @@ class KiwoomOpenApiPlusTrEventHandler(KiwoomOpenApiPlusEventHandlerForGrpc, Logg
                 self.observer.on_completed()
             else:
                 KiwoomOpenApiPlusError.try_or_raise(
-                    self.control.RateLimitedCommRqData.queuedCall(
-                        rqname, trcode, int(prevnext), scrnno, self._inputs
+                    self.control.RateLimitedCommRqData.prioritizedQueuedCall(
+                        self._priority,
+                        self._client_key,
+                        rqname,
+                        trcode,
+                        int(prevnext),
+                        scrnno,
+                        self._inputs,
                     ),
                     except_callback=self.observer.on_error,
                 )
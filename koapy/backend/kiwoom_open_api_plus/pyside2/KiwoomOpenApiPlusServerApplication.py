@@ -11,6 +11,9 @@ import grpc
 from koapy.backend.kiwoom_open_api_plus.core.KiwoomOpenApiPlusQAxWidget import (
     KiwoomOpenApiPlusQAxWidget,
 )
+from koapy.backend.kiwoom_open_api_plus.grpc.KiwoomOpenApiPlusServiceAsyncServer import (
+    KiwoomOpenApiPlusServiceAsyncServer,
+)
 from koapy.backend.kiwoom_open_api_plus.grpc.KiwoomOpenApiPlusServiceServer import (
     KiwoomOpenApiPlusServiceServer,
 )
@@ -201,8 +204,13 @@ class KiwoomOpenApiPlusServerApplication(QObjectLogging):
         # Create OpenAPI control object
         self._control = KiwoomOpenApiPlusQAxWidget()
 
-        # Create gRPC server
-        self._server = KiwoomOpenApiPlusServiceServer(
+        # Create gRPC server (grpc.aio based one if configured)
+        server_class = KiwoomOpenApiPlusServiceServer
+        if config.get_bool(
+            "koapy.backend.kiwoom_open_api_plus.grpc.server.asyncio", False
+        ):
+            server_class = KiwoomOpenApiPlusServiceAsyncServer
+        self._server = server_class(
             control=self._control,
             host=self._bind_address,
             port=self._port,
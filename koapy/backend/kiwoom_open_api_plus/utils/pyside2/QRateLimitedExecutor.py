@@ -2,13 +2,11 @@ from __future__ import annotations
 
 import atexit
 import queue
-import time
 
 from concurrent.futures import Executor, Future
 from functools import update_wrapper
-from queue import Queue
 from threading import RLock
-from typing import Any, Callable, Dict, Optional, Sequence
+from typing import Any, Callable, Dict, Hashable, Optional, Sequence
 
 from koapy.backend.kiwoom_open_api_plus.utils.pyside2.QSlotLikeExecutor import (
     QSlotLikeCallable,
@@ -16,6 +14,10 @@ from koapy.backend.kiwoom_open_api_plus.utils.pyside2.QSlotLikeExecutor import (
 from koapy.compat.pyside2.QtCore import QObject
 from koapy.utils.logging.Logging import Logging
 from koapy.utils.logging.pyside2.QThreadLogging import QThreadLogging
+from koapy.utils.rate_limiting.PriorityFairQueue import (
+    PriorityFairQueue,
+    RateLimitPriority,
+)
 from koapy.utils.rate_limiting.RateLimiter import RateLimiter
 
 
@@ -74,15 +76,13 @@ class QRateLimitedExecutorDecoratedFunction(Logging):
 
     def _checkAndSleepIfNecessary(self, *args, **kwargs):
         sleep_seconds = self._limiter.check_sleep_seconds(*args, **kwargs)
-        if sleep_seconds > 0:
-            if sleep_seconds > 1:
-                self.logger.debug(
-                    "Rate limiting function call %s(...), sleeping for %f seconds...",
-                    self._func.__name__,
-                    sleep_seconds,
-                )
-            time.sleep(sleep_seconds)
-        self._limiter.add_call_history(*args, **kwargs)
+        if sleep_seconds > 1:
+            self.logger.debug(
+                "Rate limiting function call %s(...), sleeping for %f seconds...",
+                self._func.__name__,
+                sleep_seconds,
+            )
+        self._limiter.acquire(*args, **kwargs)
 
     def _directCallFn(self, *args, **kwargs):
         self._checkAndSleepIfNecessary(*args, **kwargs)
@@ -98,6 +98,14 @@ class QRateLimitedExecutorDecoratedFunction(Logging):
     def queuedCall(self, *args, **kwargs):
         return self._executor.submit(self._queuedCallFn, *args, **kwargs)
 
+    def prioritizedQueuedCall(self, priority, key, *args, **kwargs):
+        return self._executor.submitWithPriority(
+            priority, key, self._queuedCallFn, *args, **kwargs
+        )
+
+    def estimateWaitSeconds(self, priority=None, key=None):
+        return self._executor.estimateWaitSeconds(priority, key)
+
     def __call__(self, *args, **kwargs):
         return self.directCall(*args, **kwargs)
 
@@ -106,6 +114,10 @@ class QRateLimitedExecutorDecoratedFunction(Logging):
 
 
 class QRateLimitedExecutor(QThreadLogging, Executor):
+
+    # 종료 시점에 이미 대기중인 요청들은 모두 처리한 후에 종료하도록 가장 낮은 우선순위를 사용
+    _sentinel_priority = max(RateLimitPriority) + 1
+
     def __init__(self, limiter: RateLimiter, parent: Optional[QObject] = None):
         QThreadLogging.__init__(self, parent)
         Executor.__init__(self)
@@ -113,8 +125,9 @@ class QRateLimitedExecutor(QThreadLogging, Executor):
         self._limiter = limiter
         self._parent = parent
 
-        self._runnable_queue: Queue = Queue()
+        self._runnable_queue = PriorityFairQueue()
         self._sentinel = object()
+        self._running = 0
 
         self._shutdown = False
         self._shutdown_lock = RLock()
@@ -128,20 +141,45 @@ class QRateLimitedExecutor(QThreadLogging, Executor):
         while True:
             runnable = self._runnable_queue.get()
             if runnable is not self._sentinel:
-                runnable.run()
+                self._running = 1
+                try:
+                    runnable.run()
+                finally:
+                    self._running = 0
                 continue
             if self._shutdown:
                 return
 
-    def submit(self, fn: Callable, /, *args, **kwargs):
+    def submitWithPriority(
+        self,
+        priority: Optional[int],
+        key: Optional[Hashable],
+        fn: Callable,
+        /,
+        *args,
+        **kwargs,
+    ):
         with self._shutdown_lock:
             if self._shutdown:
                 raise RuntimeError("Cannot schedule new futures after shutdown")
             future = Future()
             runnable = QRateLimitedExecutorRunnable(future, fn, args, kwargs)
-            self._runnable_queue.put(runnable)
+            self._runnable_queue.put(runnable, priority=priority, key=key)
             return future
 
+    def submit(self, fn: Callable, /, *args, **kwargs):
+        return self.submitWithPriority(None, None, fn, *args, **kwargs)
+
+    def estimateWaitSeconds(
+        self, priority: Optional[int] = None, key: Optional[Hashable] = None
+    ) -> float:
+        """
+        주어진 우선순위와 키로 지금 요청을 제출했을때 실제 호출까지 걸릴 것으로 예상되는 시간을 계산합니다.
+        """
+        queued_calls = self._runnable_queue.count_ahead(priority, key)
+        queued_calls += self._running
+        return self._limiter.estimate_wait_seconds(queued_calls)
+
     def shutdown(
         self, wait: bool = True, cancel_futures: bool = False
     ):  # pylint: disable=arguments-differ
@@ -155,7 +193,7 @@ class QRateLimitedExecutor(QThreadLogging, Executor):
                         break
                     if runnable is not self._sentinel:
                         runnable.cancel()
-            self._runnable_queue.put(self._sentinel)
+            self._runnable_queue.put(self._sentinel, priority=self._sentinel_priority)
         if wait:
             self.wait()
 
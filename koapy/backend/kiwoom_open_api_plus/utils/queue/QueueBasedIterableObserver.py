@@ -1,4 +1,9 @@
-from queue import Empty, Queue
+import asyncio
+import contextlib
+import threading
+
+from enum import Enum
+from queue import Empty, Full, Queue
 
 from rx.core.typing import Observer
 
@@ -7,6 +12,31 @@ from koapy.backend.kiwoom_open_api_plus.utils.queue.QueueIterator import (
 )
 
 
+class BackpressurePolicy(Enum):
+
+    """
+    큐가 가득 찼을때 새 값을 처리하는 방식입니다.
+
+    BLOCK 은 큐에 자리가 날 때까지 기다리지만 Qt 이벤트 스레드 (메인 스레드) 나 nonblocking() 으로
+    표시된 스레드에서는 기다리지 않고 DROP_OLDEST 처럼 동작합니다.
+    CONFLATE 는 같은 키를 가진 값이 큐에 남아있다면 그 값을 새 값으로 교체하고, 없다면 DROP_OLDEST 처럼 동작합니다.
+    DISCONNECT 는 큐를 비우고 QueueOverflowError 를 전달해 스트림을 종료합니다.
+
+    DISCONNECT 를 제외한 정책들은 retain 함수가 참을 반환하는 값을 버리거나 교체하지 않습니다.
+    큐에 retain 대상인 값들만 남아있는 경우 해당 값들은 maxsize 를 넘어서 큐에 들어갈 수 있습니다.
+    """
+
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+    DROP_NEWEST = "drop_newest"
+    CONFLATE = "conflate"
+    DISCONNECT = "disconnect"
+
+
+class QueueOverflowError(Exception):
+    pass
+
+
 class QueueBasedIterableObserverIterator(BufferedQueueIterator):
     def __init__(self, queue, sentinel):
         self._queue = queue
@@ -30,38 +60,279 @@ class QueueBasedIterableObserverIterator(BufferedQueueIterator):
         return value
 
 
+class QueueBasedIterableObserverAsyncIterator:
+    """
+    QueueBasedIterableObserver 의 큐를 asyncio 이벤트 루프에서 읽기 위한 비동기 이터레이터 입니다.
+
+    큐가 비어있는 동안에는 스레드를 점유해서 기다리는 대신 asyncio.Event 를 기다리며,
+    옵저버에 값이 들어올 때 이벤트 루프를 깨웁니다. 이벤트 루프를 깨우는 비용을 줄이기 위해
+    실제로 기다리고 있는 경우에만 깨우도록 합니다. 옵저버의 stop() 이 호출된 경우에도 이벤트 루프를 깨워서
+    이터레이션을 종료합니다.
+    """
+
+    def __init__(self, observer, iterator, loop=None):
+        if loop is None:
+            loop = asyncio.get_running_loop()
+        self._observer = observer
+        self._iterator = iterator
+        self._loop = loop
+        self._event = asyncio.Event()
+        self._waiting = False
+        self._observer.set_listener(self._notify)
+
+    def _notify(self):
+        if self._waiting:
+            self._loop.call_soon_threadsafe(self._event.set)
+
+    def _next_nowait(self):
+        # 블로킹 방식으로 읽을 때처럼 stop() 이 호출되면 큐에 남은 값과 관계없이 종료
+        if self._iterator.should_stop:
+            raise StopAsyncIteration
+        try:
+            return self._iterator.next(block=False)
+        except StopIteration as e:
+            raise StopAsyncIteration from e
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        while True:
+            try:
+                return self._next_nowait()
+            except Empty:
+                pass
+            self._event.clear()
+            self._waiting = True
+            try:
+                # 기다리기로 표시한 이후에 들어온 값을 놓치지 않도록 한번 더 확인
+                try:
+                    return self._next_nowait()
+                except Empty:
+                    pass
+                await self._event.wait()
+            finally:
+                self._waiting = False
+
+
 class QueueBasedIterableObserver(Observer):
 
     _default_maxsize = 0
+    _default_policy = BackpressurePolicy.BLOCK
     _queue_get_timeout = 2
 
-    def __init__(self, queue=None, maxsize=None):
+    _nonblocking_local = threading.local()
+
+    def __init__(self, queue=None, maxsize=None, policy=None, key=None, retain=None):
         if queue is None:
             if maxsize is None:
                 maxsize = self._default_maxsize
             queue = Queue(maxsize)
+        if policy is None:
+            policy = self._default_policy
 
         self._queue = queue
         self._maxsize = maxsize
+        self._policy = BackpressurePolicy(policy)
+        self._key = key
+        self._retain = retain
         self._sentinel = object()
 
+        self._dropped_count = 0
+        self._conflated_count = 0
+        self._disconnected = False
+
+        self._listener = None
+
         self._iterator = QueueBasedIterableObserverIterator(self._queue, self._sentinel)
 
+    @classmethod
+    @contextlib.contextmanager
+    def nonblocking(cls):
+        """
+        해당 블록 안에서 현재 스레드가 BLOCK 정책으로 인해 기다리지 않도록 합니다.
+
+        이벤트 스레드와 락을 공유하는 스레드에서 값을 전달하는 경우 사용합니다.
+        """
+        previous = getattr(cls._nonblocking_local, "enabled", False)
+        cls._nonblocking_local.enabled = True
+        try:
+            yield
+        finally:
+            cls._nonblocking_local.enabled = previous
+
     @property
     def queue(self):
         return self._queue
 
+    @property
+    def policy(self):
+        return self._policy
+
+    @property
+    def dropped_count(self):
+        return self._dropped_count
+
+    @property
+    def conflated_count(self):
+        return self._conflated_count
+
+    def set_backpressure(self, maxsize=None, policy=None, key=None, retain=None):
+        if maxsize is not None:
+            with self._queue.mutex:
+                self._queue.maxsize = maxsize
+                self._queue.not_full.notify_all()
+            self._maxsize = maxsize
+        if policy is not None:
+            self._policy = BackpressurePolicy(policy)
+        if key is not None:
+            self._key = key
+        if retain is not None:
+            self._retain = retain
+
+    def set_listener(self, listener):
+        """
+        값이 큐에 들어갈 때마다 호출할 함수를 설정합니다.
+
+        asyncio 이벤트 루프처럼 큐를 블로킹 방식으로 읽지 않는 소비자에게 알리는 용도로 사용합니다.
+        """
+        self._listener = listener
+
+    def _notify_listener(self):
+        listener = self._listener
+        if listener is not None:
+            listener()
+
+    def _can_block(self):
+        return threading.current_thread() is not threading.main_thread() and not (
+            getattr(self._nonblocking_local, "enabled", False)
+        )
+
+    def _is_retained(self, item):
+        value, error = item
+        return (
+            self._retain is not None
+            and error is None
+            and value is not self._sentinel
+            and self._retain(value)
+        )
+
+    def _drop_oldest_retained_and_put(self, item):
+        # 버릴 수 없는 값들을 제외하고 가장 오래된 값을 버린 뒤 넣음
+        with self._queue.mutex:
+            entries = self._queue.queue
+            is_full = 0 < self._queue.maxsize <= len(entries)
+            for i, entry in enumerate(entries if is_full else []):
+                if not self._is_retained(entry):
+                    del entries[i]
+                    self._queue.unfinished_tasks -= 1
+                    self._dropped_count += 1
+                    break
+            entries.append(item)
+            self._queue.unfinished_tasks += 1
+            self._queue.not_empty.notify()
+
+    def _drop_oldest_and_put(self, item):
+        if self._retain is not None:
+            self._drop_oldest_retained_and_put(item)
+            return
+        while True:
+            try:
+                self._queue.put_nowait(item)
+                return
+            except Full:
+                pass
+            try:
+                self._queue.get_nowait()
+                self._queue.task_done()
+            except Empty:
+                pass
+            else:
+                self._dropped_count += 1
+
+    def _replace_same_key(self, item):
+        key = self._key(item[0])
+        if key is None:
+            return False
+        with self._queue.mutex:
+            entries = self._queue.queue
+            for i in range(len(entries) - 1, -1, -1):
+                value, error = entries[i]
+                if error is None and value is not self._sentinel:
+                    if self._key(value) == key:
+                        if self._is_retained(entries[i]):
+                            return False
+                        entries[i] = item
+                        return True
+        return False
+
+    def _put(self, item):
+        try:
+            self._queue.put_nowait(item)
+            return
+        except Full:
+            pass
+
+        policy = self._policy
+
+        if policy == BackpressurePolicy.BLOCK:
+            if self._can_block():
+                self._queue.put(item)
+            else:
+                self._drop_oldest_and_put(item)
+        elif policy == BackpressurePolicy.DROP_OLDEST:
+            self._drop_oldest_and_put(item)
+        elif policy == BackpressurePolicy.DROP_NEWEST:
+            if self._is_retained(item):
+                self._drop_oldest_and_put(item)
+            else:
+                self._dropped_count += 1
+        elif policy == BackpressurePolicy.CONFLATE:
+            if self._key is not None and self._replace_same_key(item):
+                self._conflated_count += 1
+            else:
+                self._drop_oldest_and_put(item)
+        elif policy == BackpressurePolicy.DISCONNECT:
+            self._disconnected = True
+            with self._queue.mutex:
+                self._dropped_count += len(self._queue.queue) + 1
+                self._queue.queue.clear()
+                self._queue.unfinished_tasks = 0
+                self._queue.all_tasks_done.notify_all()
+            error = QueueOverflowError(
+                "Event queue overflowed (maxsize=%d)" % self._queue.maxsize
+            )
+            self._drop_oldest_and_put((None, error))
+
     def on_next(self, value):
-        self._queue.put((value, None))
+        if self._disconnected:
+            self._dropped_count += 1
+            return
+        self._put((value, None))
+        self._notify_listener()
+
+    def _put_control(self, item):
+        # 에러와 종료 신호는 버리지 않고 전달하되, 이벤트 스레드는 기다리지 않도록 함
+        if self._can_block():
+            self._queue.put(item)
+        else:
+            self._drop_oldest_and_put(item)
 
     def on_error(self, error):
-        self._queue.put((None, error))
+        self._put_control((None, error))
+        self._notify_listener()
 
     def on_completed(self):
-        self._queue.put((self._sentinel, None))
+        self._put_control((self._sentinel, None))
+        self._notify_listener()
 
     def __iter__(self):
         return self._iterator
 
+    def __aiter__(self):
+        return QueueBasedIterableObserverAsyncIterator(self, self._iterator)
+
     def stop(self):
-        return self._iterator.stop()
+        self._iterator.stop()
+        # 비동기 이터레이터가 기다리고 있다면 깨워서 종료하도록 함
+        self._notify_listener()
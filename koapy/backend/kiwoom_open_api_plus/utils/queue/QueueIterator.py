@@ -20,6 +20,10 @@ class QueueIterator:
     def queue(self):
         return self._queue
 
+    @property
+    def should_stop(self):
+        return self._should_stop
+
     def next(self, block=True, timeout=None):
         if block and timeout is None:
             timeout = self._check_timeout
@@ -13,6 +13,9 @@ from koapy.backend.kiwoom_open_api_plus.core.KiwoomOpenApiPlusRealType import (
     KiwoomOpenApiPlusRealType,
 )
 from koapy.backend.kiwoom_open_api_plus.grpc import KiwoomOpenApiPlusService_pb2
+from koapy.backend.kiwoom_open_api_plus.grpc.KiwoomOpenApiPlusServiceClientSideRealDataBatchIterator import (
+    KiwoomOpenApiPlusServiceClientSideRealDataBatchIterator,
+)
 from koapy.backend.kiwoom_open_api_plus.utils.queue.QueueBasedBufferedIterator import (
     QueueBasedBufferedIterator,
 )
@@ -32,8 +35,10 @@ class KiwoomOpenApiPlusPriceEventChannel(Logging):
 
         self._request_observer = QueueBasedIterableObserver()
         self._request_iterator = iter(self._request_observer)
-        self._response_iterator = self._stub.BidirectionalRealCall(
-            self._request_iterator
+        self._response_iterator = (
+            KiwoomOpenApiPlusServiceClientSideRealDataBatchIterator(
+                self._stub.BidirectionalRealCall(self._request_iterator)
+            )
         )
         self._response_subject = Subject()
         self._response_scheduler_max_workers = 8
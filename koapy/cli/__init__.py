@@ -9,6 +9,7 @@ from koapy.cli.commands.enable import enable
 from koapy.cli.commands.generate import generate
 from koapy.cli.commands.get import get
 from koapy.cli.commands.install import install
+from koapy.cli.commands.replay import replay
 from koapy.cli.commands.serve import serve
 from koapy.cli.commands.show import show
 from koapy.cli.commands.uninstall import uninstall
@@ -38,6 +39,7 @@ cli.add_command(enable)
 cli.add_command(generate)
 cli.add_command(get)
 cli.add_command(install)
+cli.add_command(replay)
 cli.add_command(serve)
 cli.add_command(show)
 cli.add_command(uninstall)
@@ -100,7 +100,9 @@ def stockcode(names, markets, port):
                         except EOFError:
                             break
 
-            all_names = [context.GetMasterCodeName(code) for code in codes]
+            all_names = context.BatchCall(
+                [("GetMasterCodeName", (code,)) for code in codes]
+            )
             codes_by_name = dict(zip(all_names, codes))
 
             for name in get_names():
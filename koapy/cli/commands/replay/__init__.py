@@ -0,0 +1,45 @@
+import click
+
+from koapy.cli.utils.grpc_options import server_bind_address_option, server_port_option
+from koapy.cli.utils.verbose_option import verbose_option
+
+
+@click.command(short_help="Start grpc server replaying recorded real data.")
+@click.argument("filename", type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    "-s",
+    "--speed",
+    type=float,
+    default=1.0,
+    show_default=True,
+    help="Replay speed multiplier, 0 for maximum speed.",
+)
+@click.option(
+    "--no-wait",
+    is_flag=True,
+    help="Start replaying immediately instead of waiting for the first registration.",
+)
+@server_bind_address_option
+@server_port_option
+@verbose_option(default=5, show_default=True)
+def replay(filename, speed, no_wait, bind_address, port):
+    from koapy.backend.kiwoom_open_api_plus.core.KiwoomOpenApiPlusReplayControl import (
+        KiwoomOpenApiPlusReplayControl,
+    )
+    from koapy.backend.kiwoom_open_api_plus.grpc.KiwoomOpenApiPlusServiceServer import (
+        KiwoomOpenApiPlusServiceServer,
+    )
+
+    control = KiwoomOpenApiPlusReplayControl(
+        filename, speed=speed, wait_for_registration=not no_wait
+    )
+    if no_wait:
+        control.start()
+
+    with KiwoomOpenApiPlusServiceServer(
+        control, host=bind_address, port=port
+    ) as server:
+        try:
+            server.wait_for_termination()
+        except KeyboardInterrupt:
+            control.stop()
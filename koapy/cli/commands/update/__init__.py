@@ -17,6 +17,7 @@ def trinfo():
     )
 
     KiwoomOpenApiPlusTrInfo.dump_trinfo_by_code()
+    KiwoomOpenApiPlusTrInfo.dump_trinfo_by_code_indexed()
 
 
 @update.command(short_help="Update openapi realtype metadata.")
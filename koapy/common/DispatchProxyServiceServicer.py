@@ -1,21 +1,160 @@
 import atexit
+import threading
 
-from queue import Queue
-from typing import Iterator, Union
+from collections import deque
+from typing import TYPE_CHECKING, Iterator, Union
+
+import grpc
 
 from grpc import ServicerContext
-from pywintypes import IID
 
 from koapy.common import DispatchProxyService_pb2, DispatchProxyService_pb2_grpc
-from koapy.common.Dispatch import Dispatch
 from koapy.common.DispatchProxyServiceMessageUtils import AssignValue, ExtractValue
 from koapy.common.EventInstance import EventInstance
 
+if TYPE_CHECKING:
+    from pywintypes import IID
+
+    from koapy.common.Dispatch import Dispatch
+
+
+class DispatchProxyServiceEventSubscriber:
+    """
+    ConnectEvent 스트림 하나에 대응하는 이벤트 구독자 입니다.
+
+    establish_request 의 initial_credits 가 0 인 경우 이벤트마다 클라이언트의 ack_request 를 기다리는 기존 방식으로 동작합니다.
+    0 보다 큰 경우 클라이언트가 부여한 크레딧 만큼은 ACK 를 기다리지 않고 이벤트를 전달하며,
+    클라이언트는 grant_request 로 여러 이벤트에 대한 크레딧을 한번에 부여합니다.
+    이 경우 요청 메시지들은 별도의 스레드에서 읽으며, 아직 보내지 못한 이벤트가 크레딧 만큼 쌓이면
+    이벤트 슬롯을 호출한 스레드를 대기시킵니다.
+    이전 클라이언트들은 ack_request 를 설정하지 않은 빈 요청을 보내므로, grant_request 가 아닌 요청은 모두 ACK (크레딧 하나) 로 취급합니다.
+
+    coalesce 가 설정된 경우 아직 보내지 못한 이벤트들 중에 인자가 같은 이벤트가 이미 있으면 새 이벤트는 버리며,
+    이벤트 슬롯을 호출한 스레드를 대기시키지 않습니다. 인자가 없는 Received 이벤트처럼 최신 데이터가 있음을 알리기만 하는
+    이벤트들은 클라이언트가 밀리는 동안 하나로 합쳐지게 됩니다. 합쳐지지 않는 이벤트는 보내지 못한 이벤트가 크레딧 만큼
+    쌓여있는 동안 자리가 날 때까지 대기시킵니다. strict 모드에서는 무시됩니다.
+    """
+
+    def __init__(self, request_iterator, credits: int = 0, coalesce: bool = False):
+        self._request_iterator = request_iterator
+        self._credits = credits
+        self._window = credits
+        self._uses_credits = credits > 0
+        self._coalesce = coalesce and self._uses_credits
+
+        self._condition = threading.Condition()
+        self._pending = deque()
+        self._pending_keys = set()
+        self._closed = False
+        self._coalesced_count = 0
+
+        self._request_iterator_consumer = None
+
+    @property
+    def uses_credits(self) -> bool:
+        return self._uses_credits
+
+    @property
+    def coalesced_count(self) -> int:
+        return self._coalesced_count
+
+    def start(self):
+        if self._uses_credits:
+            self._request_iterator_consumer = threading.Thread(
+                target=self.consume_request_iterator, daemon=True
+            )
+            self._request_iterator_consumer.start()
+
+    def close(self):
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    def _grant(self, credits):
+        with self._condition:
+            self._credits += credits
+            self._condition.notify_all()
+
+    def consume_request_iterator(self):
+        try:
+            for request in self._request_iterator:
+                if request.HasField("grant_request"):
+                    self._grant(request.grant_request.credits)
+                else:
+                    self._grant(1)
+        except grpc.RpcError:
+            pass
+        finally:
+            self.close()
+
+    def _await_ack(self):
+        try:
+            next(self._request_iterator)
+        except (StopIteration, grpc.RpcError):
+            self.close()
+
+    def slot(self, *args, **_kwargs):
+        with self._condition:
+            if self._closed:
+                return
+            key = None
+            if self._coalesce:
+                try:
+                    if args in self._pending_keys:
+                        self._coalesced_count += 1
+                        return
+                    key = args
+                except TypeError:
+                    pass
+                # 합쳐지지 않는 이벤트들이 끝없이 쌓이지 않도록 자리가 날 때까지 대기
+                while len(self._pending) >= self._window and not self._closed:
+                    self._condition.wait()
+                    if key is not None and key in self._pending_keys:
+                        self._coalesced_count += 1
+                        return
+                if self._closed:
+                    return
+                if key is not None:
+                    self._pending_keys.add(key)
+            self._pending.append((key, args))
+            self._condition.notify_all()
+            if self._uses_credits and not self._coalesce:
+                while len(self._pending) >= self._window and not self._closed:
+                    self._condition.wait()
+        if not self._uses_credits:
+            self._await_ack()
+
+    def __iter__(self):
+        while True:
+            with self._condition:
+                while not self._closed and not (
+                    self._pending and (not self._uses_credits or self._credits > 0)
+                ):
+                    self._condition.wait()
+                if self._closed:
+                    return
+                key, args = self._pending.popleft()
+                if key is not None:
+                    self._pending_keys.discard(key)
+                if self._uses_credits:
+                    self._credits -= 1
+                self._condition.notify_all()
+            yield args
+
 
 class DispatchProxyServiceServicer(
     DispatchProxyService_pb2_grpc.DispatchProxyServiceServicer
 ):
-    def _GetDispatch(self, iid: Union[IID, str]) -> Dispatch:
+    def _NormalizeIID(self, iid: str) -> str:
+        from pywintypes import IID
+
+        iid = IID(iid)
+        iid = str(iid)
+        return iid
+
+    def _GetDispatch(self, iid: Union["IID", str]) -> "Dispatch":
+        from koapy.common.Dispatch import Dispatch
+
         return Dispatch(iid)
 
     def GetDispatch(
@@ -23,9 +162,7 @@ class DispatchProxyServiceServicer(
         request: DispatchProxyService_pb2.GetDispatchRequest,
         context: ServicerContext,
     ) -> DispatchProxyService_pb2.GetDispatchResponse:
-        iid = request.iid
-        iid = IID(iid)
-        iid = str(iid)
+        iid = self._NormalizeIID(request.iid)
         response = DispatchProxyService_pb2.GetDispatchResponse()
         response.iid = iid
         return response
@@ -81,37 +218,28 @@ class DispatchProxyServiceServicer(
         assert request.HasField("establish_request")
 
         request = request.establish_request
-        iid = request.iid
-        iid = IID(iid)
-        iid = str(iid)
+        iid = self._NormalizeIID(request.iid)
         name = request.name
         dispatch = self._GetDispatch(iid)
         event_instance: EventInstance = getattr(dispatch, name)
-        queue = Queue()
-        sentinel = object()
-
-        def slot(*args, **_kwargs):
-            queue.put(args)
-            request = next(request_iterator)
-            assert request.HasField("ack_request")
-
-        def put_sentinel():
-            queue.put(sentinel)
+        subscriber = DispatchProxyServiceEventSubscriber(
+            request_iterator, request.initial_credits, request.coalesce
+        )
 
         def callback():
-            event_instance.disconnect(slot)
-            atexit.unregister(put_sentinel)
-            queue.put(sentinel)
+            event_instance.disconnect(subscriber.slot)
+            atexit.unregister(subscriber.close)
+            subscriber.close()
 
-        context.add_callabck(callback)
-        atexit.register(put_sentinel)
-        event_instance.connect(slot)
+        context.add_callback(callback)
+        atexit.register(subscriber.close)
+        subscriber.start()
+        event_instance.connect(subscriber.slot)
 
-        for args in iter(queue.get, sentinel):
+        for args in subscriber:
             response = DispatchProxyService_pb2.ConnectEventResponse()
             response.iid = iid
             response.name = name
             for arg in args:
                 AssignValue(response.arguments.add().value, arg)
-            queue.task_done()
             yield response
@@ -12,7 +12,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\'koapy/common/DispatchProxyService.proto\"!\n\x12GetDispatchRequest\x12\x0b\n\x03iid\x18\x01 \x01(\t\"\"\n\x13GetDispatchResponse\x12\x0b\n\x03iid\x18\x01 \x01(\t\"\xdf\x01\n\x05Value\x12\x16\n\x0cstring_value\x18\x01 \x01(\tH\x00\x12\x15\n\x0bshort_value\x18\x02 \x01(\x05H\x00\x12\x13\n\tint_value\x18\x03 \x01(\x05H\x00\x12\x14\n\nlong_value\x18\x04 \x01(\x03H\x00\x12\x14\n\nbool_value\x18\x05 \x01(\x08H\x00\x12\x16\n\x0c\x64ouble_value\x18\x06 \x01(\x01H\x00\x12!\n\nlist_value\x18\x07 \x01(\x0b\x32\x0b.ValueArrayH\x00\x12\"\n\x0btuple_value\x18\x08 \x01(\x0b\x32\x0b.ValueArrayH\x00\x42\x07\n\x05value\"$\n\nValueArray\x12\x16\n\x06values\x18\x01 \x03(\x0b\x32\x06.Value\"+\n\x0eGetAttrRequest\x12\x0b\n\x03iid\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\"(\n\x0fGetAttrResponse\x12\x15\n\x05value\x18\x01 \x01(\x0b\x32\x06.Value\"B\n\x0eSetAttrRequest\x12\x0b\n\x03iid\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x15\n\x05value\x18\x03 \x01(\x0b\x32\x06.Value\"\x11\n\x0fSetAttrResponse\"!\n\x08\x41rgument\x12\x15\n\x05value\x18\x01 \x01(\x0b\x32\x06.Value\"L\n\x11\x43\x61llMethodRequest\x12\x0b\n\x03iid\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x1c\n\targuments\x18\x03 \x03(\x0b\x32\t.Argument\"2\n\x12\x43\x61llMethodResponse\x12\x1c\n\x0creturn_value\x18\x01 \x01(\x0b\x32\x06.Value\"9\n\x1c\x43onnectEventEstablishRequest\x12\x0b\n\x03iid\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\"\x18\n\x16\x43onnectEventAckRequest\"\x8c\x01\n\x13\x43onnectEventRequest\x12:\n\x11\x65stablish_request\x18\x01 \x01(\x0b\x32\x1d.ConnectEventEstablishRequestH\x00\x12.\n\x0b\x61\x63k_request\x18\x02 \x01(\x0b\x32\x17.ConnectEventAckRequestH\x00\x42\t\n\x07request\"O\n\x14\x43onnectEventResponse\x12\x0b\n\x03iid\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x1c\n\targuments\x18\x03 \x03(\x0b\x32\t.Argument2\xae\x02\n\x14\x44ispatchProxyService\x12:\n\x0bGetDispatch\x12\x13.GetDispatchRequest\x1a\x14.GetDispatchResponse\"\x00\x12.\n\x07GetAttr\x12\x0f.GetAttrRequest\x1a\x10.GetAttrResponse\"\x00\x12.\n\x07SetAttr\x12\x0f.SetAttrRequest\x1a\x10.SetAttrResponse\"\x00\x12\x37\n\nCallMethod\x12\x12.CallMethodRequest\x1a\x13.CallMethodResponse\"\x00\x12\x41\n\x0c\x43onnectEvent\x12\x14.ConnectEventRequest\x1a\x15.ConnectEventResponse\"\x00(\x01\x30\x01\x62\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\'koapy/common/DispatchProxyService.proto\"!\n\x12GetDispatchRequest\x12\x0b\n\x03iid\x18\x01 \x01(\t\"\"\n\x13GetDispatchResponse\x12\x0b\n\x03iid\x18\x01 \x01(\t\"\xdf\x01\n\x05Value\x12\x16\n\x0cstring_value\x18\x01 \x01(\tH\x00\x12\x15\n\x0bshort_value\x18\x02 \x01(\x05H\x00\x12\x13\n\tint_value\x18\x03 \x01(\x05H\x00\x12\x14\n\nlong_value\x18\x04 \x01(\x03H\x00\x12\x14\n\nbool_value\x18\x05 \x01(\x08H\x00\x12\x16\n\x0c\x64ouble_value\x18\x06 \x01(\x01H\x00\x12!\n\nlist_value\x18\x07 \x01(\x0b\x32\x0b.ValueArrayH\x00\x12\"\n\x0btuple_value\x18\x08 \x01(\x0b\x32\x0b.ValueArrayH\x00\x42\x07\n\x05value\"$\n\nValueArray\x12\x16\n\x06values\x18\x01 \x03(\x0b\x32\x06.Value\"+\n\x0eGetAttrRequest\x12\x0b\n\x03iid\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\"(\n\x0fGetAttrResponse\x12\x15\n\x05value\x18\x01 \x01(\x0b\x32\x06.Value\"B\n\x0eSetAttrRequest\x12\x0b\n\x03iid\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x15\n\x05value\x18\x03 \x01(\x0b\x32\x06.Value\"\x11\n\x0fSetAttrResponse\"!\n\x08\x41rgument\x12\x15\n\x05value\x18\x01 \x01(\x0b\x32\x06.Value\"L\n\x11\x43\x61llMethodRequest\x12\x0b\n\x03iid\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x1c\n\targuments\x18\x03 \x03(\x0b\x32\t.Argument\"2\n\x12\x43\x61llMethodResponse\x12\x1c\n\x0creturn_value\x18\x01 \x01(\x0b\x32\x06.Value\"d\n\x1c\x43onnectEventEstablishRequest\x12\x0b\n\x03iid\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x17\n\x0finitial_credits\x18\x03 \x01(\x05\x12\x10\n\x08\x63oalesce\x18\x04 \x01(\x08\"\x18\n\x16\x43onnectEventAckRequest\"+\n\x18\x43onnectEventGrantRequest\x12\x0f\n\x07\x63redits\x18\x01 \x01(\x05\"\xc0\x01\n\x13\x43onnectEventRequest\x12:\n\x11\x65stablish_request\x18\x01 \x01(\x0b\x32\x1d.ConnectEventEstablishRequestH\x00\x12.\n\x0b\x61\x63k_request\x18\x02 \x01(\x0b\x32\x17.ConnectEventAckRequestH\x00\x12\x32\n\rgrant_request\x18\x03 \x01(\x0b\x32\x19.ConnectEventGrantRequestH\x00\x42\t\n\x07request\"O\n\x14\x43onnectEventResponse\x12\x0b\n\x03iid\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x1c\n\targuments\x18\x03 \x03(\x0b\x32\t.Argument2\xae\x02\n\x14\x44ispatchProxyService\x12:\n\x0bGetDispatch\x12\x13.GetDispatchRequest\x1a\x14.GetDispatchResponse\"\x00\x12.\n\x07GetAttr\x12\x0f.GetAttrRequest\x1a\x10.GetAttrResponse\"\x00\x12.\n\x07SetAttr\x12\x0f.SetAttrRequest\x1a\x10.SetAttrResponse\"\x00\x12\x37\n\nCallMethod\x12\x12.CallMethodRequest\x1a\x13.CallMethodResponse\"\x00\x12\x41\n\x0c\x43onnectEvent\x12\x14.ConnectEventRequest\x1a\x15.ConnectEventResponse\"\x00(\x01\x30\x01\x62\x06proto3')
 
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'koapy.common.DispatchProxyService_pb2', globals())
@@ -42,13 +42,15 @@ if _descriptor._USE_C_DESCRIPTORS == False:
   _CALLMETHODRESPONSE._serialized_start=665
   _CALLMETHODRESPONSE._serialized_end=715
   _CONNECTEVENTESTABLISHREQUEST._serialized_start=717
-  _CONNECTEVENTESTABLISHREQUEST._serialized_end=774
-  _CONNECTEVENTACKREQUEST._serialized_start=776
-  _CONNECTEVENTACKREQUEST._serialized_end=800
-  _CONNECTEVENTREQUEST._serialized_start=803
-  _CONNECTEVENTREQUEST._serialized_end=943
-  _CONNECTEVENTRESPONSE._serialized_start=945
-  _CONNECTEVENTRESPONSE._serialized_end=1024
-  _DISPATCHPROXYSERVICE._serialized_start=1027
-  _DISPATCHPROXYSERVICE._serialized_end=1329
+  _CONNECTEVENTESTABLISHREQUEST._serialized_end=817
+  _CONNECTEVENTACKREQUEST._serialized_start=819
+  _CONNECTEVENTACKREQUEST._serialized_end=843
+  _CONNECTEVENTGRANTREQUEST._serialized_start=845
+  _CONNECTEVENTGRANTREQUEST._serialized_end=888
+  _CONNECTEVENTREQUEST._serialized_start=891
+  _CONNECTEVENTREQUEST._serialized_end=1083
+  _CONNECTEVENTRESPONSE._serialized_start=1085
+  _CONNECTEVENTRESPONSE._serialized_end=1164
+  _DISPATCHPROXYSERVICE._serialized_start=1167
+  _DISPATCHPROXYSERVICE._serialized_end=1469
 # @@protoc_insertion_point(module_scope)
@@ -1,2 +1,19 @@
-from .Dispatch import Dispatch
 from .EventInstance import EventInstance
+
+__all__ = [
+    "Dispatch",
+    "EventInstance",
+]
+
+
+# lazily import Dispatch on attribute access since it requires pywin32
+# https://www.python.org/dev/peps/pep-0562/
+def __getattr__(name):
+    if name == "Dispatch":
+        import importlib
+
+        module = importlib.import_module(".Dispatch", __name__)
+        # importing the submodule binds it to this package's namespace, replace it with the class
+        globals()[name] = module.Dispatch
+        return module.Dispatch
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,128 @@
+import collections
+import queue
+import threading
+import time
+
+from enum import IntEnum
+from typing import Any, Deque, Dict, Hashable, Optional
+
+
+class RateLimitPriority(IntEnum):
+
+    """
+    호출제한이 걸린 요청들의 우선순위 입니다. 값이 작을수록 먼저 처리됩니다.
+    """
+
+    ORDER_RELATED = 0
+    INTERACTIVE = 1
+    BULK = 2
+
+
+class PriorityFairQueue:
+
+    """
+    우선순위 단위로는 엄격하게 높은 우선순위부터, 같은 우선순위 내에서는 키 (클라이언트) 별로
+    돌아가며 하나씩 꺼내는 큐 입니다.
+
+    queue.Queue 의 put(), get(), get_nowait(), qsize(), empty() 인터페이스를 따르므로
+    기존 Queue 를 대체해서 사용할 수 있습니다.
+    """
+
+    def __init__(self, default_priority: int = RateLimitPriority.INTERACTIVE):
+        self._default_priority = default_priority
+
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+
+        # priority -> key -> items, 키들의 순서가 곧 라운드로빈 순서
+        self._queues: Dict[int, Dict[Hashable, Deque[Any]]] = {}
+        self._size = 0
+
+    def put(
+        self,
+        item: Any,
+        block: bool = True,
+        timeout: Optional[float] = None,
+        priority: Optional[int] = None,
+        key: Optional[Hashable] = None,
+    ):
+        # pylint: disable=unused-argument
+        if priority is None:
+            priority = self._default_priority
+        with self._not_empty:
+            queues = self._queues.setdefault(priority, collections.OrderedDict())
+            if key not in queues:
+                queues[key] = collections.deque()
+            queues[key].append(item)
+            self._size += 1
+            self._not_empty.notify()
+
+    def put_nowait(self, item: Any, priority=None, key=None):
+        return self.put(item, False, priority=priority, key=key)
+
+    def _get(self):
+        priority = min(self._queues)
+        queues = self._queues[priority]
+        key, items = next(iter(queues.items()))
+        item = items.popleft()
+        if items:
+            queues.move_to_end(key)
+        else:
+            del queues[key]
+            if not queues:
+                del self._queues[priority]
+        self._size -= 1
+        return item
+
+    def get(self, block: bool = True, timeout: Optional[float] = None):
+        with self._not_empty:
+            if not block:
+                if not self._size:
+                    raise queue.Empty
+            elif timeout is None:
+                while not self._size:
+                    self._not_empty.wait()
+            else:
+                if timeout < 0:
+                    raise ValueError("'timeout' must be a non-negative number")
+                endtime = time.monotonic() + timeout
+                while not self._size:
+                    remaining = endtime - time.monotonic()
+                    if remaining <= 0.0:
+                        raise queue.Empty
+                    self._not_empty.wait(remaining)
+            return self._get()
+
+    def get_nowait(self):
+        return self.get(False)
+
+    def qsize(self) -> int:
+        with self._lock:
+            return self._size
+
+    def empty(self) -> bool:
+        return self.qsize() == 0
+
+    def count_ahead(
+        self, priority: Optional[int] = None, key: Optional[Hashable] = None
+    ) -> int:
+        """
+        주어진 우선순위와 키로 지금 새로 넣은 아이템이 꺼내지기 전에 먼저 꺼내질 아이템 수를 계산합니다.
+        """
+        if priority is None:
+            priority = self._default_priority
+        with self._lock:
+            count = 0
+            for other_priority, queues in self._queues.items():
+                if other_priority < priority:
+                    count += sum(len(items) for items in queues.values())
+                elif other_priority == priority:
+                    # 라운드로빈이므로 다른 키들은 최대 (내 키의 대기건수 + 1) 개까지만 앞서게 됨
+                    own = len(queues.get(key, ()))
+                    count += own
+                    count += sum(
+                        min(len(items), own + 1)
+                        for other_key, items in queues.items()
+                        if other_key != key
+                    )
+            return count
@@ -1,3 +1,4 @@
+import asyncio
 import collections
 import threading
 import time
@@ -14,6 +15,37 @@ class RateLimiter:
     def add_call_history(self, *args, **kwargs):
         pass
 
+    def try_acquire(self, *args, **kwargs):
+        """
+        대기 없이 바로 호출 가능한 경우에만 호출 기록을 남기고 True 를 반환합니다.
+        """
+        if self.check_sleep_seconds(*args, **kwargs) > 0:
+            return False
+        self.add_call_history(*args, **kwargs)
+        return True
+
+    def acquire(self, *args, **kwargs):
+        # 대기하는 동안에는 잠금을 잡고 있지 않으므로 다른 호출자들이 서로 막히지 않음
+        while not self.try_acquire(*args, **kwargs):
+            sleep_seconds = self.check_sleep_seconds(*args, **kwargs)
+            if sleep_seconds > 0:
+                time.sleep(sleep_seconds)
+
+    async def acquire_async(self, *args, **kwargs):
+        while not self.try_acquire(*args, **kwargs):
+            sleep_seconds = self.check_sleep_seconds(*args, **kwargs)
+            await asyncio.sleep(max(sleep_seconds, 0))
+
+    def estimate_wait_seconds(self, queued_calls=0, *args, **kwargs):
+        # pylint: disable=keyword-arg-before-vararg,unused-argument
+        return max(0, self.check_sleep_seconds(*args, **kwargs))
+
+    def get_state(self):
+        return None
+
+    def set_state(self, state):
+        pass
+
     def sleep_if_necessary(self, *args, **kwargs):
         sleep_seconds = self.check_sleep_seconds(*args, **kwargs)
         if sleep_seconds > 0:
@@ -35,6 +67,11 @@ class TimeWindowRateLimiter(RateLimiter, Logging):
 
         self._call_history = collections.deque(maxlen=self._calls)
 
+    def _next_call_time(self):
+        if len(self._call_history) < self._calls:
+            return float("-inf")
+        return self._call_history[0] + self._period
+
     def check_sleep_seconds(self, *args, **kwargs):
         with self._lock:
             if len(self._call_history) < self._calls:
@@ -47,11 +84,45 @@ class TimeWindowRateLimiter(RateLimiter, Logging):
         with self._lock:
             return self._call_history.append(self._clock())
 
-    def sleep_if_necessary(self, *args, **kwargs):
+    def try_acquire(self, *args, **kwargs):
         with self._lock:
-            sleep_seconds = self.check_sleep_seconds(*args, **kwargs)
-            if sleep_seconds > 0:
-                time.sleep(sleep_seconds)
+            clock = self._clock()
+            if self._next_call_time() > clock:
+                return False
+            self._call_history.append(clock)
+            return True
+
+    def estimate_wait_seconds(self, queued_calls=0, *args, **kwargs):
+        # pylint: disable=keyword-arg-before-vararg
+        with self._lock:
+            now = self._clock()
+            history = collections.deque(self._call_history, maxlen=self._calls)
+        clock = now
+        for _ in range(queued_calls + 1):
+            if len(history) < self._calls:
+                call_time = clock
+            else:
+                call_time = max(clock, history[0] + self._period)
+            history.append(call_time)
+            clock = call_time
+        return clock - now
+
+    def get_state(self):
+        # 프로세스 재시작 이후에도 사용할 수 있도록 호출기록을 벽시계 기준 시각으로 변환
+        with self._lock:
+            offset = time.time() - self._clock()
+            return [clock + offset for clock in self._call_history]
+
+    def set_state(self, state):
+        with self._lock:
+            offset = time.time() - self._clock()
+            self._call_history.clear()
+            self._call_history.extend(clock - offset for clock in sorted(state))
+
+    def sleep_if_necessary(self, *args, **kwargs):
+        sleep_seconds = self.check_sleep_seconds(*args, **kwargs)
+        if sleep_seconds > 0:
+            time.sleep(sleep_seconds)
 
 
 class CompositeTimeWindowRateLimiter(RateLimiter):
@@ -61,7 +132,26 @@ class CompositeTimeWindowRateLimiter(RateLimiter):
         self._lock = threading.RLock()
         self._limiters = limiters
 
+        # 모든 하위 제한이 TimeWindowRateLimiter 인 경우 다음 호출 가능 시점을 미리 계산해두고
+        # 호출 가능 여부 확인시에는 해당 값 하나만 비교함
+        self._is_time_window_only = all(
+            isinstance(limiter, TimeWindowRateLimiter) for limiter in self._limiters
+        )
+        self._clock = time.monotonic
+        self._next_call_time = float("-inf")
+
+        if self._is_time_window_only:
+            self._clock = self._limiters[0]._clock
+            self._update_next_call_time()
+
+    def _update_next_call_time(self):
+        self._next_call_time = max(
+            limiter._next_call_time() for limiter in self._limiters
+        )
+
     def check_sleep_seconds(self, *args, **kwargs):
+        if self._is_time_window_only:
+            return self._next_call_time - self._clock()
         with self._lock:
             return max(
                 limiter.check_sleep_seconds(*args, **kwargs)
@@ -70,11 +160,163 @@ class CompositeTimeWindowRateLimiter(RateLimiter):
 
     def add_call_history(self, *args, **kwargs):
         with self._lock:
+            if self._is_time_window_only:
+                clock = self._clock()
+                for limiter in self._limiters:
+                    limiter._call_history.append(clock)
+                self._update_next_call_time()
+            else:
+                for limiter in self._limiters:
+                    limiter.add_call_history(*args, **kwargs)
+
+    def try_acquire(self, *args, **kwargs):
+        if not self._is_time_window_only:
+            with self._lock:
+                return super().try_acquire(*args, **kwargs)
+        with self._lock:
+            clock = self._clock()
+            if self._next_call_time > clock:
+                return False
             for limiter in self._limiters:
-                limiter.add_call_history(*args, **kwargs)
+                limiter._call_history.append(clock)
+            self._update_next_call_time()
+            return True
+
+    def estimate_wait_seconds(self, queued_calls=0, *args, **kwargs):
+        # pylint: disable=keyword-arg-before-vararg
+        with self._lock:
+            if not self._is_time_window_only:
+                return max(
+                    limiter.estimate_wait_seconds(queued_calls, *args, **kwargs)
+                    for limiter in self._limiters
+                )
+            # 모든 윈도우를 함께 고려해야 각 호출 시점이 정확해짐
+            now = self._clock()
+            histories = [
+                collections.deque(limiter._call_history, maxlen=limiter._calls)
+                for limiter in self._limiters
+            ]
+        clock = now
+        for _ in range(queued_calls + 1):
+            call_time = clock
+            for limiter, history in zip(self._limiters, histories):
+                if len(history) >= limiter._calls:
+                    call_time = max(call_time, history[0] + limiter._period)
+            for history in histories:
+                history.append(call_time)
+            clock = call_time
+        return clock - now
+
+    def get_state(self):
+        with self._lock:
+            return [limiter.get_state() for limiter in self._limiters]
+
+    def set_state(self, state):
+        with self._lock:
+            for limiter, limiter_state in zip(self._limiters, state):
+                limiter.set_state(limiter_state)
+            if self._is_time_window_only:
+                self._update_next_call_time()
 
     def sleep_if_necessary(self, *args, **kwargs):
+        sleep_seconds = self.check_sleep_seconds(*args, **kwargs)
+        if sleep_seconds > 0:
+            time.sleep(sleep_seconds)
+
+
+class GcraRateLimiter(RateLimiter):
+    """
+    GCRA (Generic Cell Rate Algorithm) 기반의 제한입니다.
+
+    period 동안 평균 calls 회의 호출을 허용하며 최대 calls 회까지 한번에 몰아서 호출할 수 있는
+    토큰 버킷과 동일하게 동작합니다. 상태로 이론적 도착시간 (TAT) 하나만 관리합니다.
+
+    TimeWindowRateLimiter 와 달리 버스트 이후에도 평균 속도만큼은 계속 호출을 허용하므로,
+    정확한 슬라이딩 윈도우 제한이 필요한 경우에는 TimeWindowRateLimiter 를 사용해야 합니다.
+    """
+
+    def __init__(self, period, calls):
+        super().__init__()
+
+        self._period = period
+        self._calls = calls
+
+        self._emission_interval = period / calls
+        self._tolerance = period - self._emission_interval
+
+        self._lock = threading.Lock()
+        self._clock = time.monotonic
+        self._tat = float("-inf")
+
+    def _next_call_time(self):
+        return self._tat - self._tolerance
+
+    def _record(self, clock):
+        self._tat = max(self._tat, clock) + self._emission_interval
+
+    def check_sleep_seconds(self, *args, **kwargs):
+        return self._next_call_time() - self._clock()
+
+    def add_call_history(self, *args, **kwargs):
         with self._lock:
-            sleep_seconds = self.check_sleep_seconds(*args, **kwargs)
-            if sleep_seconds > 0:
-                time.sleep(sleep_seconds)
+            self._record(self._clock())
+
+    def try_acquire(self, *args, **kwargs):
+        with self._lock:
+            clock = self._clock()
+            if self._next_call_time() > clock:
+                return False
+            self._record(clock)
+            return True
+
+    def estimate_wait_seconds(self, queued_calls=0, *args, **kwargs):
+        # pylint: disable=keyword-arg-before-vararg
+        clock = self._clock()
+        tat = max(self._tat, clock) + queued_calls * self._emission_interval
+        return max(0, tat - self._tolerance - clock)
+
+
+class CompositeGcraRateLimiter(RateLimiter):
+    """
+    복수개의 GcraRateLimiter 를 모두 만족해야 하는 제한입니다.
+
+    다음 호출 가능 시점을 미리 계산해두기 때문에 호출 가능 여부 확인은 하위 제한 개수와 무관하게 O(1) 입니다.
+    하위 제한들의 상태는 해당 객체를 통해서만 갱신되어야 합니다.
+    """
+
+    def __init__(self, limiters: List[GcraRateLimiter]):
+        super().__init__()
+
+        self._lock = threading.Lock()
+        self._limiters = limiters
+        self._clock = time.monotonic
+        self._next_call_time = float("-inf")
+
+    def _record(self, clock):
+        for limiter in self._limiters:
+            limiter._record(clock)
+        self._next_call_time = max(
+            limiter._next_call_time() for limiter in self._limiters
+        )
+
+    def check_sleep_seconds(self, *args, **kwargs):
+        return self._next_call_time - self._clock()
+
+    def add_call_history(self, *args, **kwargs):
+        with self._lock:
+            self._record(self._clock())
+
+    def try_acquire(self, *args, **kwargs):
+        with self._lock:
+            clock = self._clock()
+            if self._next_call_time > clock:
+                return False
+            self._record(clock)
+            return True
+
+    def estimate_wait_seconds(self, queued_calls=0, *args, **kwargs):
+        # pylint: disable=keyword-arg-before-vararg
+        return max(
+            limiter.estimate_wait_seconds(queued_calls, *args, **kwargs)
+            for limiter in self._limiters
+        )
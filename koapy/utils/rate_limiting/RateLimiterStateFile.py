@@ -0,0 +1,56 @@
+import json
+import os
+import tempfile
+
+from pathlib import Path
+
+from koapy.utils.logging.Logging import Logging
+
+
+class RateLimiterStateFile(Logging):
+    """
+    RateLimiter 의 상태 (호출기록) 를 로컬 파일에 저장하고 불러옵니다.
+
+    저장시에는 임시파일에 먼저 쓴 다음 교체하기 때문에 저장 도중 프로세스가 종료되더라도
+    이전에 저장된 상태가 손상되지 않습니다.
+    """
+
+    def __init__(self, filename):
+        self._filename = Path(filename)
+
+    @property
+    def filename(self):
+        return self._filename
+
+    def load(self, limiter):
+        if not self._filename.exists():
+            return False
+        try:
+            with open(self._filename, "r", encoding="utf-8") as f:
+                state = json.load(f)
+            limiter.set_state(state)
+        except (OSError, ValueError, TypeError):
+            self.logger.warning(
+                "Failed to load rate limiter state from %s", self._filename
+            )
+            return False
+        return True
+
+    def save(self, limiter):
+        state = limiter.get_state()
+        self._filename.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_filename = tempfile.mkstemp(
+            prefix=self._filename.name + ".", dir=self._filename.parent
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(state, f)
+            os.replace(tmp_filename, self._filename)
+        except OSError:
+            self.logger.warning(
+                "Failed to save rate limiter state to %s", self._filename
+            )
+            try:
+                os.remove(tmp_filename)
+            except OSError:
+                pass
@@ -0,0 +1,102 @@
+"""
+Concurrent stream benchmark for the grpc.aio based KiwoomOpenApiPlusServiceAsyncServer.
+
+Starts an in-process async server over KiwoomOpenApiPlusReplayControl with a small
+worker pool, opens many RealCall streams at once through the async client and replays
+real data until every stream has received --ticks events. The threaded server would
+need one worker per open stream; here workers are only used while a stream is being
+set up or torn down, so the number of threads stays flat as streams are added.
+
+Usage:
+    python -m tests.benchmarks.benchmark_async_streams
+"""
+
+import argparse
+import asyncio
+import threading
+import time
+
+from koapy.backend.kiwoom_open_api_plus.core.KiwoomOpenApiPlusRealDataRecorder import (
+    KiwoomOpenApiPlusRealDataRecord,
+)
+from koapy.backend.kiwoom_open_api_plus.core.KiwoomOpenApiPlusRealType import (
+    KiwoomOpenApiPlusRealType,
+)
+from koapy.backend.kiwoom_open_api_plus.core.KiwoomOpenApiPlusReplayControl import (
+    KiwoomOpenApiPlusReplayControl,
+)
+from koapy.backend.kiwoom_open_api_plus.grpc.KiwoomOpenApiPlusServiceAsyncClient import (
+    KiwoomOpenApiPlusServiceAsyncClient,
+)
+from koapy.backend.kiwoom_open_api_plus.grpc.KiwoomOpenApiPlusServiceAsyncServer import (
+    KiwoomOpenApiPlusServiceAsyncServer,
+)
+
+
+def generate_records(done, interval, code="005930"):
+    fids = KiwoomOpenApiPlusRealType.get_fids_by_realtype_name("주식체결")
+    realdata = "\t".join(str(fid) for fid in fids)
+    while not done.is_set():
+        yield KiwoomOpenApiPlusRealDataRecord(
+            time.time(), "OnReceiveRealData", [code, "주식체결", realdata]
+        )
+        time.sleep(interval)
+
+
+async def receive(client, scrno, num_ticks):
+    stream = client.RealCall(scrno, ["005930"], ["10"])
+    count = 0
+    async for _response in stream:
+        count += 1
+        if count >= num_ticks:
+            break
+    stream.cancel()
+    return count
+
+
+async def run(port, num_streams, num_ticks):
+    async with KiwoomOpenApiPlusServiceAsyncClient(port=port) as client:
+        start = time.perf_counter()
+        tasks = [
+            asyncio.ensure_future(receive(client, "%04d" % (i + 1), num_ticks))
+            for i in range(num_streams)
+        ]
+        # 모든 스트림이 열려있는 시점의 스레드 수를 확인
+        await asyncio.sleep(0.5)
+        num_threads = threading.active_count()
+        counts = await asyncio.gather(*tasks)
+        elapsed = time.perf_counter() - start
+    return sum(counts), elapsed, num_threads
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--streams", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--ticks", type=int, default=10)
+    parser.add_argument("--interval", type=float, default=0.01)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    for num_streams in args.streams:
+        done = threading.Event()
+        control = KiwoomOpenApiPlusReplayControl(
+            records=generate_records(done, args.interval), speed=0
+        )
+        with KiwoomOpenApiPlusServiceAsyncServer(
+            control, host="localhost", port=0, max_workers=args.workers
+        ) as server:
+            try:
+                received, elapsed, num_threads = asyncio.run(
+                    run(server.get_port(), num_streams, args.ticks)
+                )
+            finally:
+                done.set()
+                control.stop()
+        print(
+            "%6d streams %10.0f events/s %6d threads"
+            % (num_streams, received / elapsed, num_threads)
+        )
+
+
+if __name__ == "__main__":
+    main()
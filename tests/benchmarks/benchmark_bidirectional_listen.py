@@ -0,0 +1,100 @@
+"""
+Event throughput benchmark for BidirectionalListen flow control.
+
+Starts an in-process gRPC server over KiwoomOpenApiPlusReplayControl, connects a
+KiwoomOpenApiPlusServiceClientSideSignalConnector to OnReceiveMsg and fires events
+from a separate thread the way the control's event thread would. In strict mode the
+firing thread waits for an ACK after every event, so throughput is bounded by one
+round trip per event. With a credit window the server sends up to the window ahead
+and the client grants credits back in bulk.
+
+Usage:
+    python -m tests.benchmarks.benchmark_bidirectional_listen
+"""
+
+import argparse
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+import grpc
+
+from koapy.backend.kiwoom_open_api_plus.core.KiwoomOpenApiPlusReplayControl import (
+    KiwoomOpenApiPlusReplayControl,
+)
+from koapy.backend.kiwoom_open_api_plus.grpc import KiwoomOpenApiPlusService_pb2_grpc
+from koapy.backend.kiwoom_open_api_plus.grpc.KiwoomOpenApiPlusServiceClientSideSignalConnector import (
+    KiwoomOpenApiPlusServiceClientSideSignalConnector,
+)
+from koapy.backend.kiwoom_open_api_plus.grpc.KiwoomOpenApiPlusServiceServer import (
+    KiwoomOpenApiPlusServiceServer,
+)
+
+
+class Counter:
+    def __init__(self, total):
+        self.total = total
+        self.count = 0
+        self.done = threading.Event()
+
+    def __call__(self, *args):
+        self.count += 1
+        if self.count == self.total:
+            self.done.set()
+
+
+def run(stub, control, executor, window, num_events):
+    counter = Counter(num_events)
+    connector = KiwoomOpenApiPlusServiceClientSideSignalConnector(
+        stub, "OnReceiveMsg", executor, window
+    )
+    connector.connect(counter)
+
+    # 서버측 핸들러가 연결될 때까지 대기
+    deadline = time.monotonic() + 10
+    while not control.OnReceiveMsg._slots:  # pylint: disable=protected-access
+        assert time.monotonic() < deadline, "Listen handler was not connected"
+        time.sleep(0.01)
+
+    def fire():
+        for i in range(num_events):
+            control.OnReceiveMsg("0001", "rqname", "opt10001", "message %d" % i)
+
+    start = time.perf_counter()
+    thread = threading.Thread(target=fire, daemon=True)
+    thread.start()
+    assert counter.done.wait(60), "Only %d events received" % counter.count
+    elapsed = time.perf_counter() - start
+
+    connector.disconnect(counter)
+    thread.join()
+    return num_events / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--events", type=int, default=5000)
+    parser.add_argument("--windows", type=int, nargs="+", default=[0, 16, 256])
+    args = parser.parse_args()
+
+    executor = ThreadPoolExecutor()
+
+    for window in args.windows:
+        control = KiwoomOpenApiPlusReplayControl(records=[])
+        with KiwoomOpenApiPlusServiceServer(
+            control, host="localhost", port=0
+        ) as server:
+            with grpc.insecure_channel("localhost:%d" % server.get_port()) as channel:
+                stub = KiwoomOpenApiPlusService_pb2_grpc.KiwoomOpenApiPlusServiceStub(
+                    channel
+                )
+                rate = run(stub, control, executor, window, args.events)
+        label = "strict ack" if window == 0 else "window=%d" % window
+        print("%-12s %10.0f events/s" % (label, rate))
+
+    executor.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,229 @@
+"""
+Bytes on the wire benchmark for a chart pull with different compression settings.
+
+Starts an in-process gRPC server whose TransactionCall replays synthetic daily chart
+pages (opt10081 like, --rows rows per page) and pulls them through a local TCP relay
+that counts the bytes flowing from the server to the client. Compression is applied
+per RPC through KiwoomOpenApiPlusServiceCompressionServerInterceptor, the same way
+compression_by_method in the server channel config does. Both row-wise multi_data and
+columnar responses are measured.
+
+Usage:
+    python -m tests.benchmarks.benchmark_channel_compression
+"""
+
+import argparse
+import random
+import socket
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+import grpc
+
+from koapy.backend.kiwoom_open_api_plus.grpc import (
+    KiwoomOpenApiPlusService_pb2,
+    KiwoomOpenApiPlusService_pb2_grpc,
+)
+from koapy.backend.kiwoom_open_api_plus.grpc.KiwoomOpenApiPlusServiceCompression import (
+    KiwoomOpenApiPlusServiceCompressionServerInterceptor,
+)
+from koapy.backend.kiwoom_open_api_plus.grpc.KiwoomOpenApiPlusServiceMessageUtils import (
+    convert_rows_from_python_to_columnar_data,
+)
+
+NAMES = [
+    "종목코드",
+    "현재가",
+    "거래량",
+    "거래대금",
+    "일자",
+    "시가",
+    "고가",
+    "저가",
+    "수정주가구분",
+    "수정비율",
+    "대업종구분",
+    "소업종구분",
+    "종목정보",
+    "수정주가이벤트",
+    "전일종가",
+]
+
+
+def make_rows(num_rows, seed=0):
+    rnd = random.Random(seed)
+    price = 60000
+    rows = []
+    for i in range(num_rows):
+        price = max(100, price + rnd.randint(-1500, 1500) // 100 * 100)
+        low = price - rnd.randint(0, 20) * 100
+        high = price + rnd.randint(0, 20) * 100
+        volume = rnd.randint(5000000, 30000000)
+        rows.append(
+            [
+                "005930" if i == 0 else "",
+                str(price),
+                str(volume),
+                str(volume * price // 1000000),
+                "%04d%02d%02d" % (2021 - i // 250, 12 - i // 21 % 12, 28 - i % 21),
+                str(rnd.randint(low, high) // 100 * 100),
+                str(high),
+                str(low),
+                "",
+                "",
+                "",
+                "",
+                "",
+                "",
+                "",
+            ]
+        )
+    return rows
+
+
+def make_responses(num_pages, num_rows, columnar):
+    responses = []
+    for page in range(num_pages):
+        rows = make_rows(num_rows, seed=page)
+        response = KiwoomOpenApiPlusService_pb2.ListenResponse()
+        response.name = "OnReceiveTrData"
+        if columnar:
+            convert_rows_from_python_to_columnar_data(
+                NAMES, rows, response.columnar_data
+            )
+        else:
+            response.multi_data.names.extend(NAMES)
+            for row in rows:
+                response.multi_data.values.add().values.extend(row)
+        responses.append(response)
+    return responses
+
+
+class ChartServicer(KiwoomOpenApiPlusService_pb2_grpc.KiwoomOpenApiPlusServiceServicer):
+    def __init__(self, responses_by_columnar):
+        self._responses_by_columnar = responses_by_columnar
+
+    def TransactionCall(self, request, context):
+        columnar = request.transaction_flags.columnar
+        for response in self._responses_by_columnar[columnar]:
+            yield response
+
+
+class CountingRelay:
+    def __init__(self, target_port):
+        self._target_port = target_port
+        self._listener = socket.socket()
+        self._listener.bind(("localhost", 0))
+        self._listener.listen()
+        self.port = self._listener.getsockname()[1]
+        self.received = 0
+        self._lock = threading.Lock()
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def _pump(self, source, sink, count):
+        try:
+            while True:
+                data = source.recv(65536)
+                if not data:
+                    break
+                if count:
+                    with self._lock:
+                        self.received += len(data)
+                sink.sendall(data)
+        except OSError:
+            pass
+        finally:
+            for sock in (source, sink):
+                try:
+                    sock.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+
+    def _accept(self):
+        while True:
+            try:
+                client, _address = self._listener.accept()
+            except OSError:
+                return
+            server = socket.create_connection(("localhost", self._target_port))
+            threading.Thread(
+                target=self._pump, args=(client, server, False), daemon=True
+            ).start()
+            threading.Thread(
+                target=self._pump, args=(server, client, True), daemon=True
+            ).start()
+
+    def close(self):
+        self._listener.close()
+
+
+def run(responses_by_columnar, compression, columnar):
+    interceptors = []
+    if compression is not None:
+        interceptors.append(
+            KiwoomOpenApiPlusServiceCompressionServerInterceptor(
+                {"TransactionCall": compression}
+            )
+        )
+    server = grpc.server(ThreadPoolExecutor(max_workers=4), interceptors=interceptors)
+    KiwoomOpenApiPlusService_pb2_grpc.add_KiwoomOpenApiPlusServiceServicer_to_server(
+        ChartServicer(responses_by_columnar), server
+    )
+    port = server.add_insecure_port("localhost:0")
+    server.start()
+    relay = CountingRelay(port)
+
+    with grpc.insecure_channel("localhost:%d" % relay.port) as channel:
+        stub = KiwoomOpenApiPlusService_pb2_grpc.KiwoomOpenApiPlusServiceStub(channel)
+        grpc.channel_ready_future(channel).result(timeout=10)
+        baseline = relay.received
+        request = KiwoomOpenApiPlusService_pb2.TransactionRequest()
+        request.transaction_flags.columnar = columnar
+        start = time.perf_counter()
+        payload = 0
+        for response in stub.TransactionCall(request):
+            payload += response.ByteSize()
+        elapsed = time.perf_counter() - start
+        wire = relay.received - baseline
+
+    relay.close()
+    server.stop(None)
+    return payload, wire, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, default=10)
+    parser.add_argument("--rows", type=int, default=600)
+    args = parser.parse_args()
+
+    responses_by_columnar = {
+        columnar: make_responses(args.pages, args.rows, columnar)
+        for columnar in [False, True]
+    }
+    compressions = [
+        ("none", None),
+        ("deflate", grpc.Compression.Deflate),
+        ("gzip", grpc.Compression.Gzip),
+    ]
+
+    for columnar in [False, True]:
+        for label, compression in compressions:
+            payload, wire, elapsed = run(responses_by_columnar, compression, columnar)
+            print(
+                "%-10s %-8s %10d payload bytes %10d wire bytes %6.1f%% %8.1f ms"
+                % (
+                    "columnar" if columnar else "rows",
+                    label,
+                    payload,
+                    wire,
+                    100.0 * wire / payload,
+                    elapsed * 1000,
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Event throughput benchmark for the DispatchProxyService ConnectEvent stream.
+
+Starts an in-process gRPC server over a DispatchProxyServiceServicer whose dispatch is
+a fake object with a Received event, so it runs without Cybos Plus or pywin32. Events
+are fired from a separate thread the way the COM event thread would. In strict mode
+the firing thread waits for an ACK after every event. With a credit window the client
+grants credits back every window/2 events. With coalescing, pending events with the
+same arguments (one of --keys values) are merged instead of blocking the firing
+thread, so fewer events than fired are delivered.
+
+Usage:
+    python -m tests.benchmarks.benchmark_dispatch_proxy_events
+"""
+
+import argparse
+import queue
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+import grpc
+
+from koapy.common import DispatchProxyService_pb2, DispatchProxyService_pb2_grpc
+from koapy.common.DispatchProxyServiceServicer import DispatchProxyServiceServicer
+from koapy.common.EventInstance import EventInstance
+
+
+class FakeDispatch:
+    def __init__(self):
+        self.Received = EventInstance()
+
+
+class FakeDispatchProxyServiceServicer(DispatchProxyServiceServicer):
+    def __init__(self):
+        self.dispatch = FakeDispatch()
+
+    def _NormalizeIID(self, iid):
+        return iid
+
+    def _GetDispatch(self, iid):
+        return self.dispatch
+
+
+def run(stub, event_instance, window, coalesce, num_events, num_keys):
+    requests = queue.Queue()
+    request = DispatchProxyService_pb2.ConnectEventRequest()
+    request.establish_request.iid = "fake"
+    request.establish_request.name = "Received"
+    request.establish_request.initial_credits = window
+    request.establish_request.coalesce = coalesce
+    requests.put(request)
+    call = stub.ConnectEvent(iter(requests.get, None))
+
+    # 서버측 슬롯이 연결될 때까지 대기
+    deadline = time.monotonic() + 10
+    while not event_instance._slots:  # pylint: disable=protected-access
+        assert time.monotonic() < deadline, "Event slot was not connected"
+        time.sleep(0.01)
+
+    def fire():
+        for i in range(num_events):
+            event_instance(i % num_keys)
+        event_instance("end")
+
+    start = time.perf_counter()
+    thread = threading.Thread(target=fire, daemon=True)
+    thread.start()
+
+    grant_size = max(window // 2, 1)
+    handled_count = 0
+    received = 0
+    for response in call:
+        if response.arguments[0].value.string_value == "end":
+            break
+        received += 1
+        request = DispatchProxyService_pb2.ConnectEventRequest()
+        if window > 0:
+            handled_count += 1
+            if handled_count >= grant_size:
+                request.grant_request.credits = handled_count
+                handled_count = 0
+                requests.put(request)
+        else:
+            request.ack_request.SetInParent()
+            requests.put(request)
+    elapsed = time.perf_counter() - start
+
+    # 마지막 이벤트의 ACK 를 기다리는 이벤트 스레드는 스트림을 닫으면 풀려남
+    call.cancel()
+    requests.put(None)
+    thread.join()
+    return num_events / elapsed, received
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--events", type=int, default=5000)
+    parser.add_argument("--keys", type=int, default=100)
+    parser.add_argument("--windows", type=int, nargs="+", default=[0, 16, 256])
+    args = parser.parse_args()
+
+    modes = [(window, False) for window in args.windows]
+    modes += [(window, True) for window in args.windows if window > 0]
+
+    for window, coalesce in modes:
+        servicer = FakeDispatchProxyServiceServicer()
+        server = grpc.server(ThreadPoolExecutor(max_workers=4))
+        DispatchProxyService_pb2_grpc.add_DispatchProxyServiceServicer_to_server(
+            servicer, server
+        )
+        port = server.add_insecure_port("localhost:0")
+        server.start()
+        with grpc.insecure_channel("localhost:%d" % port) as channel:
+            stub = DispatchProxyService_pb2_grpc.DispatchProxyServiceStub(channel)
+            rate, received = run(
+                stub,
+                servicer.dispatch.Received,
+                window,
+                coalesce,
+                args.events,
+                args.keys,
+            )
+        server.stop(None)
+        label = "strict ack" if window == 0 else "window=%d" % window
+        if coalesce:
+            label += " coalesce"
+        print("%-22s %10.0f events/s %8d delivered" % (label, rate, received))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Microbenchmark for the rate limiters in koapy.utils.rate_limiting.
+
+Drives each limiter with paced try_acquire() calls at a fixed target rate
+(10k acquisitions/sec by default) from one or more threads, and reports the
+achieved rate along with the per-call cpu overhead of try_acquire().
+
+Limits are set high enough that the limiter itself is never the bottleneck,
+so the numbers reflect bookkeeping and lock overhead only.
+
+Usage:
+    python -m tests.benchmarks.benchmark_rate_limiter
+"""
+
+import argparse
+import threading
+import time
+
+from koapy.utils.rate_limiting.RateLimiter import (
+    CompositeGcraRateLimiter,
+    CompositeTimeWindowRateLimiter,
+    GcraRateLimiter,
+    TimeWindowRateLimiter,
+)
+
+# same shape as KiwoomOpenApiPlusCommRqDataRateLimiter, scaled up for the target rate
+WINDOWS = [(18, 5), (90, 25), (180, 50), (3600, 1000)]
+
+
+def make_limiters(scale):
+    windows = [(period, calls * scale) for period, calls in WINDOWS]
+    return [
+        (
+            "CompositeTimeWindowRateLimiter",
+            CompositeTimeWindowRateLimiter(
+                [TimeWindowRateLimiter(period, calls) for period, calls in windows]
+            ),
+        ),
+        (
+            "CompositeGcraRateLimiter",
+            CompositeGcraRateLimiter(
+                [GcraRateLimiter(period, calls) for period, calls in windows]
+            ),
+        ),
+    ]
+
+
+def run_paced(limiter, rate, seconds, threads):
+    interval = threads / rate
+    acquired = [0] * threads
+    overhead = [0.0] * threads
+    start = time.perf_counter() + 0.05
+    deadline = start + seconds
+
+    def worker(index):
+        next_time = start + index / rate
+        count = 0
+        spent = 0.0
+        while next_time < deadline:
+            now = time.perf_counter()
+            if now < next_time:
+                continue
+            # thread cpu time excludes time spent waiting for the GIL held by other spinning workers
+            before = time.thread_time()
+            if limiter.try_acquire():
+                count += 1
+            spent += time.thread_time() - before
+            next_time += interval
+        acquired[index] = count
+        overhead[index] = spent
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+
+    total = sum(acquired)
+    return total / seconds, sum(overhead) / max(total, 1)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rate", type=float, default=10000)
+    parser.add_argument("--seconds", type=float, default=2.0)
+    parser.add_argument("--threads", type=int, default=1)
+    args = parser.parse_args()
+
+    scale = int(args.rate * 3600 / 1000) + 1
+
+    for label, limiter in make_limiters(scale):
+        achieved, per_call = run_paced(limiter, args.rate, args.seconds, args.threads)
+        print(
+            "%-32s %9.0f acquisitions/s, %6.2f us/try_acquire"
+            % (label, achieved, per_call * 1e6)
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+"""
+Tick-rate benchmark for OnReceiveRealData handling in KiwoomOpenApiPlusRealEventHandler.
+
+A fake control replays synthesized real data ticks for a set of codes and feeds them
+to the handler, the same way the OCX would fire OnReceiveRealData. Reports handled
+ticks per second for the compiled schema path, compared against the previous
+per-tick implementation that re-resolved fids and field names on every tick,
+for the compact_schema mode that sends field names once per realtype,
+and for batching mode that packs up to max_batch_size ticks into one response.
+
+Each response goes through a queue put/get and is serialized as it would be for
+the wire, like the servicer streaming responses out of the handler, so timings
+include that per-message overhead and protobuf encoding. The average encoded size
+per tick and the number of messages sent are reported as well.
+
+Usage:
+    python -m tests.benchmarks.benchmark_real_data
+"""
+
+import argparse
+import itertools
+import queue
+import time
+
+from koapy.backend.kiwoom_open_api_plus.core.KiwoomOpenApiPlusRealType import (
+    KiwoomOpenApiPlusRealType,
+)
+from koapy.backend.kiwoom_open_api_plus.grpc import KiwoomOpenApiPlusService_pb2
+from koapy.backend.kiwoom_open_api_plus.grpc.event.KiwoomOpenApiPlusRealEventHandler import (
+    KiwoomOpenApiPlusRealEventHandler,
+)
+
+
+class FakeContext:
+    def add_callback(self, callback):
+        pass
+
+
+class SerializingObserver:
+    def __init__(self):
+        self.queue = queue.Queue()
+        self.count = 0
+        self.messages = 0
+        self.bytes = 0
+
+    def on_next(self, value):
+        self.queue.put((value, None))
+
+    def drain(self):
+        while True:
+            try:
+                value, _ = self.queue.get_nowait()
+            except queue.Empty:
+                break
+            self.count += len(value.events) or 1
+            self.messages += 1
+            self.bytes += len(value.SerializeToString())
+
+
+class FakeControl:
+    """
+    Replays (code, realtype, realdata) ticks, serving GetCommRealData() from the tick being delivered.
+    """
+
+    def __init__(self, codes, realtypes, num_ticks):
+        self._ticks = []
+        self._values_by_fid = {}
+        for i, (code, realtype) in zip(
+            range(num_ticks), itertools.cycle(itertools.product(codes, realtypes))
+        ):
+            fids = KiwoomOpenApiPlusRealType.get_fids_by_realtype_name(realtype)
+            values = ["%+d" % (i * 7 + j) for j in range(len(fids))]
+            realdata = "\t".join(values)
+            self._ticks.append((code, realtype, realdata, dict(zip(fids, values))))
+
+    def GetCommRealData(self, code, fid):  # pylint: disable=unused-argument
+        return self._values_by_fid.get(fid, "")
+
+    def replay(self, handler):
+        for code, realtype, realdata, values_by_fid in self._ticks:
+            self._values_by_fid = values_by_fid
+            handler.OnReceiveRealData(code, realtype, realdata)
+        return len(self._ticks)
+
+
+class PerTickLookupRealEventHandler(KiwoomOpenApiPlusRealEventHandler):
+    """
+    Previous implementation, resolving fids and names and scanning the code list on every tick.
+    """
+
+    def OnReceiveRealData(self, code, realtype, realdata):
+        if code in self._code_list:
+            response = KiwoomOpenApiPlusService_pb2.ListenResponse()
+            response.name = "OnReceiveRealData"
+            response.arguments.add().string_value = code
+            response.arguments.add().string_value = realtype
+            response.arguments.add().string_value = realdata
+
+            if self._infer_fids:
+                fids = KiwoomOpenApiPlusRealType.get_fids_by_realtype_name(realtype)
+            else:
+                fids = self._fid_list
+
+            if self._readable_names:
+                names = [
+                    KiwoomOpenApiPlusRealType.Fid.get_name_by_fid(fid, str(fid))
+                    for fid in fids
+                ]
+            else:
+                names = [str(fid) for fid in fids]
+
+            if self._infer_fids and self._fast_parse:
+                values = realdata.split("\t")
+            else:
+                values = [self.control.GetCommRealData(code, fid) for fid in fids]
+
+            assert len(names) == len(values)
+
+            response.single_data.names.extend(names)
+            response.single_data.values.extend(values)
+
+            self.observer.on_next(response)
+
+
+def make_handler(
+    handler_class, control, codes, fast_parse, compact_schema, max_batch_size=0
+):
+    request = KiwoomOpenApiPlusService_pb2.RealRequest()
+    request.code_list.extend(codes)
+    request.flags.infer_fids = True
+    request.flags.readable_names = True
+    request.flags.fast_parse = fast_parse
+    request.flags.compact_schema = compact_schema
+    request.flags.max_batch_size = max_batch_size
+    request.flags.max_linger_ms = 1000 if max_batch_size else 0
+    handler = handler_class(control, request, FakeContext(), None)
+    handler._observer = SerializingObserver()  # pylint: disable=protected-access
+    return handler
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--codes", type=int, default=1000)
+    parser.add_argument("--ticks", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    codes = ["%06d" % i for i in range(args.codes)]
+    realtypes = ["주식체결", "주식호가잔량"]
+    control = FakeControl(codes, realtypes, args.ticks)
+
+    for fast_parse in [False, True]:
+        for label, handler_class, compact_schema, max_batch_size in [
+            ("per-tick lookup", PerTickLookupRealEventHandler, False, 0),
+            ("compiled schema", KiwoomOpenApiPlusRealEventHandler, False, 0),
+            ("compact schema", KiwoomOpenApiPlusRealEventHandler, True, 0),
+            ("compact batched", KiwoomOpenApiPlusRealEventHandler, True, 100),
+        ]:
+            handler = make_handler(
+                handler_class,
+                control,
+                codes,
+                fast_parse,
+                compact_schema,
+                max_batch_size,
+            )
+            batcher = getattr(handler, "_real_data_batcher", None)
+            timings = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                ticks = control.replay(handler)
+                if batcher is not None:
+                    batcher.flush()
+                handler.observer.drain()
+                timings.append(time.perf_counter() - start)
+            if batcher is not None:
+                batcher.close()
+            observer = handler.observer
+            assert observer.count == ticks * args.repeat
+            print(
+                "fast_parse=%-5s %-16s %10.0f ticks/s %8.1f bytes/tick %8d messages"
+                % (
+                    fast_parse,
+                    label,
+                    ticks / min(timings),
+                    observer.bytes / observer.count,
+                    observer.messages // args.repeat,
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+"""
+Benchmark for fast_parse with an explicit fid subset and for client side NumPy decoding.
+
+Server side, a RealCall style handler subscribes to a few fids (not the whole realtype)
+without infer_fids. Without fast_parse every fid costs a GetCommRealData() call, which
+is a COM call on the real control, so the number of calls per tick is reported along
+with ticks per second. With fast_parse the values are picked by position from the
+realdata argument instead.
+
+Client side, responses are converted to (time, price, volume) either one by one with
+per-field float() calls (with and without strptime() for the time field, the former
+being what the backtrader price channel does), or a batch at a time
+into NumPy arrays with KiwoomOpenApiPlusServiceClientSideRealDataDecoder.
+
+Usage:
+    python -m tests.benchmarks.benchmark_real_data_fast_parse
+"""
+
+import argparse
+import datetime
+import time
+
+from koapy.backend.kiwoom_open_api_plus.grpc import KiwoomOpenApiPlusService_pb2
+from koapy.backend.kiwoom_open_api_plus.grpc.event.KiwoomOpenApiPlusRealEventHandler import (
+    KiwoomOpenApiPlusRealEventHandler,
+)
+from koapy.backend.kiwoom_open_api_plus.grpc.KiwoomOpenApiPlusServiceClientSideRealDataDecoder import (
+    KiwoomOpenApiPlusServiceClientSideRealDataDecoder,
+)
+from tests.benchmarks.benchmark_real_data import (
+    FakeContext,
+    FakeControl,
+    SerializingObserver,
+)
+
+
+class CountingFakeControl(FakeControl):
+    def __init__(self, codes, realtypes, num_ticks):
+        super().__init__(codes, realtypes, num_ticks)
+        self.calls = 0
+
+    def GetCommRealData(self, code, fid):
+        self.calls += 1
+        return super().GetCommRealData(code, fid)
+
+
+def make_handler(control, codes, fids, fast_parse):
+    request = KiwoomOpenApiPlusService_pb2.RealRequest()
+    request.code_list.extend(codes)
+    request.fid_list.extend(fids)
+    request.flags.fast_parse = fast_parse
+    handler = KiwoomOpenApiPlusRealEventHandler(control, request, FakeContext(), None)
+    handler._observer = SerializingObserver()  # pylint: disable=protected-access
+    return handler
+
+
+def per_event_decode(responses):
+    results = []
+    for response in responses:
+        single_data = dict(zip(response.single_data.names, response.single_data.values))
+        hhmmss = single_data["20"]
+        results.append(
+            {
+                "time": int(hhmmss[:2]) * 3600
+                + int(hhmmss[2:4]) * 60
+                + int(hhmmss[4:]),
+                "price": abs(float(single_data["10"])),
+                "volume": abs(float(single_data["15"])),
+            }
+        )
+    return results
+
+
+def event_to_dict_decode(responses):
+    # KiwoomOpenApiPlusPriceEventChannel.event_to_dict() 와 같은 방식
+    results = []
+    for response in responses:
+        single_data = dict(zip(response.single_data.names, response.single_data.values))
+        tm = datetime.datetime.strptime(single_data["20"], "%H%M%S").time()
+        results.append(
+            {
+                "time": tm,
+                "price": abs(float(single_data["10"])),
+                "volume": abs(float(single_data["15"])),
+            }
+        )
+    return results
+
+
+def make_responses(num_ticks):
+    responses = []
+    for i in range(num_ticks):
+        response = KiwoomOpenApiPlusService_pb2.ListenResponse()
+        response.name = "OnReceiveRealData"
+        response.arguments.add().string_value = "%06d" % (i % 100)
+        response.arguments.add().string_value = "주식체결"
+        response.arguments.add().string_value = ""
+        response.single_data.names.extend(["20", "10", "11", "15", "27", "28"])
+        seconds = 32400 + i % 23400
+        response.single_data.values.extend(
+            [
+                "%02d%02d%02d" % (seconds // 3600, seconds // 60 % 60, seconds % 60),
+                "%+d" % (50000 + i % 100),
+                "%+d" % (i % 100),
+                "%+d" % (i % 1000 - 500),
+                "%+d" % (50100 + i % 100),
+                "%+d" % (49900 + i % 100),
+            ]
+        )
+        responses.append(response)
+    return responses
+
+
+def bench(function, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--codes", type=int, default=1000)
+    parser.add_argument("--ticks", type=int, default=100000)
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    codes = ["%06d" % i for i in range(args.codes)]
+    fids = [20, 10, 11, 15, 27, 28]
+
+    for fast_parse in [False, True]:
+        control = CountingFakeControl(codes, ["주식체결"], args.ticks)
+        handler = make_handler(control, codes, fids, fast_parse)
+
+        def replay():
+            control.replay(handler)
+            handler.observer.drain()
+
+        elapsed = bench(replay, args.repeat)
+        print(
+            "fast_parse=%-5s fids=%d %10.0f ticks/s %6.1f GetCommRealData/tick"
+            % (
+                fast_parse,
+                len(fids),
+                args.ticks / elapsed,
+                control.calls / (args.ticks * args.repeat),
+            )
+        )
+
+    responses = make_responses(args.ticks)
+    batches = [
+        responses[i : i + args.batch_size]
+        for i in range(0, len(responses), args.batch_size)
+    ]
+    decoder = KiwoomOpenApiPlusServiceClientSideRealDataDecoder()
+
+    def decode_per_event():
+        for batch in batches:
+            per_event_decode(batch)
+
+    def decode_event_to_dict():
+        for batch in batches:
+            event_to_dict_decode(batch)
+
+    def decode_batches():
+        for batch in batches:
+            decoder.decode(batch)
+
+    expected = per_event_decode(responses)
+    decoded = decoder.decode(responses)
+    assert [r["price"] for r in expected] == decoded["price"].tolist()
+    assert [r["time"] for r in expected] == decoded["time"].tolist()
+
+    for label, function in [
+        ("event_to_dict()", decode_event_to_dict),
+        ("per-event float()", decode_per_event),
+        ("numpy decoder", decode_batches),
+    ]:
+        elapsed = bench(function, args.repeat)
+        print("%-18s %10.0f ticks/s" % (label, args.ticks / elapsed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Fan-out benchmark for KiwoomOpenApiPlusRealDataHub.
+
+Several RealCall streams subscribe to the same codes. Without the hub every stream
+has its own handler that is connected to OnReceiveRealData, so each tick is decoded
+once per stream. With the hub the tick is decoded once and the same response is
+delivered to every stream. Also reports how many SetRealReg calls and screens are
+used in each case.
+
+Usage:
+    python -m tests.benchmarks.benchmark_real_data_hub
+"""
+
+import argparse
+import time
+
+from concurrent.futures import Future
+
+from koapy.backend.kiwoom_open_api_plus.core.KiwoomOpenApiPlusScreenManager import (
+    KiwoomOpenApiPlusScreenManager,
+)
+from koapy.backend.kiwoom_open_api_plus.grpc.event.KiwoomOpenApiPlusRealDataHub import (
+    KiwoomOpenApiPlusRealDataHub,
+)
+from koapy.backend.kiwoom_open_api_plus.grpc.event.KiwoomOpenApiPlusRealEventHandler import (
+    KiwoomOpenApiPlusRealEventHandler,
+)
+from tests.benchmarks.benchmark_real_data import FakeControl, make_handler
+
+
+class FakeQueuedFunction:
+    def __init__(self, calls, name):
+        self._calls = calls
+        self._name = name
+
+    def queuedCall(self, *args):
+        self._calls.append((self._name, args))
+        future = Future()
+        future.set_result(0)
+        return future
+
+
+class FakeSignal:
+    def __init__(self):
+        self._slots = []
+
+    def connect(self, slot):
+        self._slots.append(slot)
+
+    def emit(self, *args):
+        for slot in self._slots:
+            slot(*args)
+
+    __call__ = emit
+
+
+class FakeHubControl(FakeControl):
+    def __init__(self, codes, realtypes, num_ticks):
+        super().__init__(codes, realtypes, num_ticks)
+        self.calls = []
+        self.SetRealReg = FakeQueuedFunction(self.calls, "SetRealReg")
+        self.SetRealRemove = FakeQueuedFunction(self.calls, "SetRealRemove")
+        self.OnReceiveRealData = FakeSignal()
+
+
+def run(control, handlers, args):
+    for handler in handlers:
+        handler.observer.drain()
+    timings = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        ticks = control.replay(control)
+        for handler in handlers:
+            handler.observer.drain()
+        timings.append(time.perf_counter() - start)
+    for handler in handlers:
+        assert handler.observer.count == ticks * args.repeat
+    return ticks / min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--codes", type=int, default=200)
+    parser.add_argument("--ticks", type=int, default=20000)
+    parser.add_argument("--subscribers", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    codes = ["%06d" % i for i in range(args.codes)]
+    realtypes = ["주식체결", "주식호가잔량"]
+
+    # 핸들러마다 직접 이벤트를 받는 경우
+    control = FakeHubControl(codes, realtypes, args.ticks)
+    handlers = [
+        make_handler(KiwoomOpenApiPlusRealEventHandler, control, codes, True, False)
+        for _ in range(args.subscribers)
+    ]
+    for handler in handlers:
+        control.OnReceiveRealData.connect(handler.OnReceiveRealData)
+    rate = run(control, handlers, args)
+    print(
+        "per-stream handlers %10.0f ticks/s %6d SetRealReg %4d screens"
+        % (
+            rate,
+            args.subscribers * len(range(0, args.codes, 100)),
+            args.subscribers * len(range(0, args.codes, 100)),
+        )
+    )
+
+    # 허브를 통해 공유하는 경우
+    control = FakeHubControl(codes, realtypes, args.ticks)
+    hub = KiwoomOpenApiPlusRealDataHub(control, KiwoomOpenApiPlusScreenManager())
+    handlers = [
+        make_handler(KiwoomOpenApiPlusRealEventHandler, control, codes, True, False)
+        for _ in range(args.subscribers)
+    ]
+    for handler in handlers:
+        hub.subscribe(handler, codes, [])
+    rate = run(control, handlers, args)
+    print(
+        "real data hub       %10.0f ticks/s %6d SetRealReg %4d screens"
+        % (rate, len(control.calls), len(hub.get_screens()))
+    )
+
+
+if __name__ == "__main__":
+    main()
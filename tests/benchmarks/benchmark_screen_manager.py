@@ -0,0 +1,73 @@
+"""
+Benchmark for KiwoomOpenApiPlusScreenManager borrow/return.
+
+Compares the free queue based allocator against the previous implementation that
+built a list of all free screen numbers and picked one with random.choice() on every
+borrow, checking membership against a deque of occupied screens. Screens are borrowed
+up to the given number in use and then borrowed and returned in a rolling fashion,
+like registering codes for real data across screens or issuing many TRs.
+
+Usage:
+    python -m tests.benchmarks.benchmark_screen_manager
+"""
+
+import argparse
+import collections
+import random
+import time
+
+from koapy.backend.kiwoom_open_api_plus.core.KiwoomOpenApiPlusScreenManager import (
+    KiwoomOpenApiPlusScreenManager,
+)
+
+
+class RandomChoiceScreenManager(KiwoomOpenApiPlusScreenManager):
+    """
+    Previous implementation of get_single_free_screen().
+    """
+
+    def get_single_free_screen(self, exclude=None):
+        if exclude is None:
+            exclude = []
+        else:
+            exclude = [self.screen_no_to_number(scrnno) for scrnno in exclude]
+        exclude = set(exclude)
+        with self._lock:
+            occupied_screen_nos = collections.deque(self._borrow_count_by_screen_no)
+            screen_no = random.choice(
+                [
+                    i
+                    for i in range(1, 10000)
+                    if i not in occupied_screen_nos and i not in exclude
+                ]
+            )
+            return self.number_to_screen_no(screen_no)
+
+
+def run(manager, inuse, operations):
+    borrowed = collections.deque()
+    start = time.perf_counter()
+    for _ in range(operations):
+        if len(borrowed) >= inuse:
+            manager.return_screen(borrowed.popleft())
+        borrowed.append(manager.borrow_screen())
+    return operations / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--inuse", type=int, default=150)
+    parser.add_argument("--operations", type=int, default=500)
+    args = parser.parse_args()
+
+    for label, manager_class in [
+        ("random choice", RandomChoiceScreenManager),
+        ("free queue", KiwoomOpenApiPlusScreenManager),
+    ]:
+        manager = manager_class()
+        rate = run(manager, args.inuse, args.operations)
+        print("%-14s %12.0f borrows/s %s" % (label, rate, manager.get_metrics()))
+
+
+if __name__ == "__main__":
+    main()
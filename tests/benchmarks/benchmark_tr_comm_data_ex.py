@@ -0,0 +1,136 @@
+"""
+Benchmark for multi-row TR data extraction in KiwoomOpenApiPlusTrEventHandler.
+
+Compares per-cell GetCommData() calls against a single bulk GetCommDataEx() call
+for a full opt10080 page, using a fake control that simulates COM dispatch latency.
+
+Usage:
+    python -m tests.benchmarks.benchmark_tr_comm_data_ex
+"""
+
+import argparse
+import time
+
+from concurrent.futures import Future
+
+from koapy.backend.kiwoom_open_api_plus.core.KiwoomOpenApiPlusTrInfo import (
+    KiwoomOpenApiPlusTrInfo,
+)
+from koapy.backend.kiwoom_open_api_plus.grpc import KiwoomOpenApiPlusService_pb2
+from koapy.backend.kiwoom_open_api_plus.grpc.event.KiwoomOpenApiPlusTrEventHandler import (
+    KiwoomOpenApiPlusTrEventHandler,
+)
+
+
+def busy_wait(seconds):
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+class FakeContext:
+    def add_callback(self, callback):
+        pass
+
+
+class FakeScreenManager:
+    def borrow_screen(self, screen_no=None):
+        return screen_no or "0001"
+
+    def return_screen(self, screen_no):
+        return True
+
+
+class FakeQueuedCallable:
+    def queuedCall(self, *args, **kwargs):  # pylint: disable=unused-argument
+        future = Future()
+        future.set_result(0)
+        return future
+
+
+class FakeControl:
+    def __init__(self, trcode, num_rows, dispatch_latency):
+        trinfo = KiwoomOpenApiPlusTrInfo.get_trinfo_by_code(trcode)
+        self._names = trinfo.get_multi_output_names()
+        self.num_rows = num_rows
+        self._dispatch_latency = dispatch_latency
+        self._rows = [
+            ["  +%08d" % (i * len(self._names) + j) for j in range(len(self._names))]
+            for i in range(self.num_rows)
+        ]
+        self._index_by_name = {name: j for j, name in enumerate(self._names)}
+        self.dispatch_count = 0
+        self.RateLimitedCommRqData = FakeQueuedCallable()
+
+    def _dispatch(self):
+        self.dispatch_count += 1
+        busy_wait(self._dispatch_latency)
+
+    def GetRepeatCnt(self, trcode, recordname):  # pylint: disable=unused-argument
+        self._dispatch()
+        return self.num_rows
+
+    def GetCommData(self, trcode, recordname, index, name):
+        # pylint: disable=unused-argument
+        self._dispatch()
+        if name in self._index_by_name:
+            return self._rows[index][self._index_by_name[name]]
+        return ""
+
+    def GetCommDataEx(self, trcode, recordname):  # pylint: disable=unused-argument
+        self._dispatch()
+        # single dispatch, but marshalling the whole block is not free either
+        busy_wait(self._dispatch_latency * len(self._rows) * 0.05)
+        return [list(row) for row in self._rows]
+
+    def DisconnectRealData(self, scrnno):
+        pass
+
+
+def run_page(control, trcode, use_comm_data_ex):
+    request = KiwoomOpenApiPlusService_pb2.TransactionRequest()
+    request.request_name = "benchmark"
+    request.transaction_code = trcode
+    request.screen_no = "0001"
+    request.inputs["종목코드"] = "005930"
+    handler = KiwoomOpenApiPlusTrEventHandler(
+        control, request, FakeContext(), FakeScreenManager()
+    )
+    handler._should_use_comm_data_ex = (  # pylint: disable=protected-access
+        use_comm_data_ex
+    )
+    start = time.perf_counter()
+    handler.OnReceiveTrData("0001", "benchmark", trcode, "", "0", 0, 0, "", "")
+    elapsed = time.perf_counter() - start
+    response = next(iter(handler.observer))
+    assert len(response.multi_data.values) == control.num_rows
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--trcode", default="opt10080")
+    parser.add_argument("--rows", type=int, default=900)
+    parser.add_argument("--latency-us", type=float, default=20.0)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    latency = args.latency_us / 1e6
+
+    for label, use_comm_data_ex in [
+        ("GetCommData", False),
+        ("GetCommDataEx", True),
+    ]:
+        control = FakeControl(args.trcode, args.rows, latency)
+        timings = [
+            run_page(control, args.trcode, use_comm_data_ex) for _ in range(args.repeat)
+        ]
+        dispatches = control.dispatch_count // args.repeat
+        print(
+            "%-14s best %8.2f ms/page, %5d dispatches/page"
+            % (label, min(timings) * 1000, dispatches)
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+import asyncio
+import threading
+import time
+
+from koapy.backend.kiwoom_open_api_plus.core.KiwoomOpenApiPlusRealDataRecorder import (
+    KiwoomOpenApiPlusRealDataRecord,
+)
+from koapy.backend.kiwoom_open_api_plus.core.KiwoomOpenApiPlusRealType import (
+    KiwoomOpenApiPlusRealType,
+)
+from koapy.backend.kiwoom_open_api_plus.core.KiwoomOpenApiPlusReplayControl import (
+    KiwoomOpenApiPlusReplayControl,
+)
+from koapy.backend.kiwoom_open_api_plus.grpc import KiwoomOpenApiPlusService_pb2
+from koapy.backend.kiwoom_open_api_plus.grpc.KiwoomOpenApiPlusServiceAsyncClient import (
+    KiwoomOpenApiPlusServiceAsyncClient,
+)
+from koapy.backend.kiwoom_open_api_plus.grpc.KiwoomOpenApiPlusServiceAsyncServer import (
+    KiwoomOpenApiPlusServiceAsyncServer,
+)
+
+
+def generate_records(done, code="005930"):
+    fids = KiwoomOpenApiPlusRealType.get_fids_by_realtype_name("주식체결")
+    realdata = "\t".join(str(fid) for fid in fids)
+    while not done.is_set():
+        yield KiwoomOpenApiPlusRealDataRecord(
+            time.time(), "OnReceiveRealData", [code, "주식체결", realdata]
+        )
+        time.sleep(0.01)
+
+
+def test_many_streams_with_few_workers():
+    done = threading.Event()
+    control = KiwoomOpenApiPlusReplayControl(records=generate_records(done), speed=0)
+    num_streams = 20
+
+    async def receive(client, i):
+        stream = client.RealCall("%04d" % (i + 1), ["005930"], ["10"])
+        async for response in stream:
+            stream.cancel()
+            return response.arguments[0].string_value
+
+    async def run(port):
+        async with KiwoomOpenApiPlusServiceAsyncClient(port=port) as client:
+            assert await client.GetConnectState() == 1
+            # 작업 스레드 수보다 많은 스트림들이 동시에 열려있더라도 모두 처리됨
+            tasks = [receive(client, i) for i in range(num_streams)]
+            return await asyncio.wait_for(asyncio.gather(*tasks), 30)
+
+    with KiwoomOpenApiPlusServiceAsyncServer(
+        control, host="localhost", port=0, max_workers=2
+    ) as server:
+        try:
+            codes = asyncio.run(run(server.get_port()))
+        finally:
+            done.set()
+            control.stop()
+
+    assert codes == ["005930"] * num_streams
+
+
+def test_bidirectional_stop_request_ends_stream():
+    done = threading.Event()
+    control = KiwoomOpenApiPlusReplayControl(records=generate_records(done), speed=0)
+
+    async def run(port):
+        requests = asyncio.Queue()
+
+        async def request_iterator():
+            while True:
+                yield await requests.get()
+
+        request = KiwoomOpenApiPlusService_pb2.BidirectionalRealRequest()
+        request.initialize_request.fid_list.extend([10])
+        requests.put_nowait(request)
+        request = KiwoomOpenApiPlusService_pb2.BidirectionalRealRequest()
+        request.register_request.code_list.extend(["005930"])
+        requests.put_nowait(request)
+
+        async with KiwoomOpenApiPlusServiceAsyncClient(port=port) as client:
+            stream = client.get_grpc_stub().BidirectionalRealCall(request_iterator())
+
+            async def receive():
+                num_responses = 0
+                async for _response in stream:
+                    num_responses += 1
+                    if num_responses == 1:
+                        request = (
+                            KiwoomOpenApiPlusService_pb2.BidirectionalRealRequest()
+                        )
+                        request.stop_request.SetInParent()
+                        requests.put_nowait(request)
+                return num_responses
+
+            # 요청 스트림이 열려있더라도 stop_request 를 받으면 응답 스트림이 종료됨
+            return await asyncio.wait_for(receive(), 30)
+
+    with KiwoomOpenApiPlusServiceAsyncServer(
+        control, host="localhost", port=0, max_workers=2
+    ) as server:
+        try:
+            num_responses = asyncio.run(run(server.get_port()))
+        finally:
+            done.set()
+            control.stop()
+
+    assert num_responses >= 1
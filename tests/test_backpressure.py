@@ -0,0 +1,95 @@
+import pytest
+
+from koapy.backend.kiwoom_open_api_plus.grpc.event.KiwoomOpenApiPlusRealDataSchema import (
+    KiwoomOpenApiPlusRealDataSchemaCache,
+)
+from koapy.backend.kiwoom_open_api_plus.grpc.event.KiwoomOpenApiPlusRealEventHandler import (
+    KiwoomOpenApiPlusRealEventHandler,
+)
+from koapy.backend.kiwoom_open_api_plus.grpc.KiwoomOpenApiPlusServiceClientSideRealDataRehydrator import (
+    KiwoomOpenApiPlusServiceClientSideRealDataRehydrator,
+)
+from koapy.backend.kiwoom_open_api_plus.utils.queue.QueueBasedIterableObserver import (
+    BackpressurePolicy,
+    QueueBasedIterableObserver,
+    QueueOverflowError,
+)
+
+
+def drain(observer):
+    iterator = iter(observer)
+    values = []
+    while iterator.has_next():
+        values.append(iterator.next_nowait())
+    return values
+
+
+def test_drop_oldest():
+    observer = QueueBasedIterableObserver(
+        maxsize=3, policy=BackpressurePolicy.DROP_OLDEST
+    )
+    for i in range(5):
+        observer.on_next(i)
+    assert drain(observer) == [2, 3, 4]
+    assert observer.dropped_count == 2
+
+
+def test_drop_newest():
+    observer = QueueBasedIterableObserver(maxsize=3, policy="drop_newest")
+    for i in range(5):
+        observer.on_next(i)
+    assert drain(observer) == [0, 1, 2]
+    assert observer.dropped_count == 2
+
+
+def test_conflate():
+    observer = QueueBasedIterableObserver(
+        maxsize=2, policy=BackpressurePolicy.CONFLATE, key=lambda value: value[0]
+    )
+    for value in [("a", 1), ("b", 1), ("a", 2), ("b", 2), ("c", 1)]:
+        observer.on_next(value)
+    assert drain(observer) == [("b", 2), ("c", 1)]
+    assert observer.conflated_count == 2
+    assert observer.dropped_count == 1
+
+
+def test_disconnect():
+    observer = QueueBasedIterableObserver(
+        maxsize=2, policy=BackpressurePolicy.DISCONNECT
+    )
+    for i in range(3):
+        observer.on_next(i)
+    observer.on_next(3)
+    with pytest.raises(QueueOverflowError):
+        drain(observer)
+    assert observer.dropped_count == 4
+
+
+def test_block_does_not_block_main_thread():
+    observer = QueueBasedIterableObserver(maxsize=1, policy=BackpressurePolicy.BLOCK)
+    observer.on_next(0)
+    observer.on_next(1)
+    assert drain(observer) == [1]
+    assert observer.dropped_count == 1
+
+
+@pytest.mark.parametrize("policy", ["block", "drop_oldest", "drop_newest", "conflate"])
+def test_compact_schema_is_not_dropped(policy):
+    schemas = KiwoomOpenApiPlusRealDataSchemaCache([10, 15], compact=True)
+    observer = QueueBasedIterableObserver(
+        maxsize=2,
+        policy=policy,
+        key=KiwoomOpenApiPlusRealEventHandler._get_real_data_key,
+        retain=KiwoomOpenApiPlusRealEventHandler._has_real_data_schema,
+    )
+    for i in range(3):
+        schema = schemas.get("주식체결")
+        observer.on_next(
+            schema.make_response("005930", "주식체결", "", [str(i), str(i * 10)])
+        )
+    responses = drain(observer)
+    assert responses[0].HasField("real_data_schema")
+    rehydrator = KiwoomOpenApiPlusServiceClientSideRealDataRehydrator()
+    for response in responses:
+        rehydrator.rehydrate(response)
+        assert list(response.single_data.names) == ["10", "15"]
@@ -0,0 +1,132 @@
+import asyncio
+
+from concurrent.futures import ThreadPoolExecutor
+
+import grpc
+
+from koapy.backend.kiwoom_open_api_plus.grpc import (
+    KiwoomOpenApiPlusService_pb2,
+    KiwoomOpenApiPlusService_pb2_grpc,
+)
+from koapy.backend.kiwoom_open_api_plus.grpc import (
+    KiwoomOpenApiPlusServiceChannelOptions as channel_options_module,
+)
+from koapy.backend.kiwoom_open_api_plus.grpc.KiwoomOpenApiPlusServiceChannelOptions import (
+    KiwoomOpenApiPlusServiceChannelOptions,
+)
+from koapy.backend.kiwoom_open_api_plus.grpc.KiwoomOpenApiPlusServiceCompression import (
+    KiwoomOpenApiPlusServiceClientSideCompressedStub,
+    KiwoomOpenApiPlusServiceCompressionAsyncServerInterceptor,
+    KiwoomOpenApiPlusServiceCompressionServerInterceptor,
+)
+from koapy.config import config_from_dict
+
+COMPRESSION_BY_METHOD = {"TransactionCall": grpc.Compression.Gzip}
+
+
+def make_response(i):
+    response = KiwoomOpenApiPlusService_pb2.ListenResponse()
+    response.name = "OnReceiveTrData"
+    response.multi_data.names.extend(["일자", "현재가"])
+    for j in range(100):
+        response.multi_data.values.add().values.extend(["%08d" % j, str(i * j)])
+    return response
+
+
+class Servicer(KiwoomOpenApiPlusService_pb2_grpc.KiwoomOpenApiPlusServiceServicer):
+    def TransactionCall(self, request, context):
+        for i in range(3):
+            yield make_response(i)
+
+
+class AsyncServicer(KiwoomOpenApiPlusService_pb2_grpc.KiwoomOpenApiPlusServiceServicer):
+    async def TransactionCall(self, request, context):
+        for i in range(3):
+            yield make_response(i)
+
+
+def test_options_from_config(monkeypatch):
+    monkeypatch.setattr(
+        channel_options_module,
+        "config",
+        config_from_dict(
+            {
+                "koapy.backend.kiwoom_open_api_plus.grpc.client.channel": {
+                    "compression": "deflate",
+                    "compression_by_method": {"TransactionCall": "gzip"},
+                    "max_receive_message_length": 64 * 1024 * 1024,
+                    "keepalive": {"time_ms": 60000, "permit_without_calls": True},
+                    "options": {"grpc.http2.max_frame_size": 16384},
+                }
+            }
+        ),
+    )
+    channel_options = KiwoomOpenApiPlusServiceChannelOptions("client")
+    assert channel_options.compression() == grpc.Compression.Deflate
+    assert channel_options.compression_by_method() == COMPRESSION_BY_METHOD
+
+    # 직접 넘겨받은 값들이 설정값보다 우선함
+    arguments = channel_options.update_arguments(
+        {"options": [("grpc.keepalive_time_ms", 10000)], "compression": "none"}
+    )
+    assert dict(arguments["options"]) == {
+        "grpc.max_receive_message_length": 64 * 1024 * 1024,
+        "grpc.keepalive_time_ms": 10000,
+        "grpc.keepalive_permit_without_calls": 1,
+        "grpc.http2.max_frame_size": 16384,
+    }
+    assert arguments["compression"] == grpc.Compression.NoCompression
+
+    server_options = KiwoomOpenApiPlusServiceChannelOptions("server")
+    assert server_options.options() == []
+    assert server_options.compression() is None
+
+
+def test_compression_by_method():
+    server = grpc.server(
+        ThreadPoolExecutor(max_workers=2),
+        interceptors=[
+            KiwoomOpenApiPlusServiceCompressionServerInterceptor(COMPRESSION_BY_METHOD)
+        ],
+    )
+    KiwoomOpenApiPlusService_pb2_grpc.add_KiwoomOpenApiPlusServiceServicer_to_server(
+        Servicer(), server
+    )
+    port = server.add_insecure_port("localhost:0")
+    server.start()
+    with grpc.insecure_channel("localhost:%d" % port) as channel:
+        stub = KiwoomOpenApiPlusServiceClientSideCompressedStub(
+            KiwoomOpenApiPlusService_pb2_grpc.KiwoomOpenApiPlusServiceStub(channel),
+            COMPRESSION_BY_METHOD,
+        )
+        request = KiwoomOpenApiPlusService_pb2.TransactionRequest()
+        responses = list(stub.TransactionCall(request))
+    server.stop(None)
+    assert responses == [make_response(i) for i in range(3)]
+
+
+def test_compression_by_method_async():
+    async def run():
+        server = grpc.aio.server(
+            interceptors=[
+                KiwoomOpenApiPlusServiceCompressionAsyncServerInterceptor(
+                    COMPRESSION_BY_METHOD
+                )
+            ]
+        )
+        KiwoomOpenApiPlusService_pb2_grpc.add_KiwoomOpenApiPlusServiceServicer_to_server(
+            AsyncServicer(), server
+        )
+        port = server.add_insecure_port("localhost:0")
+        await server.start()
+        async with grpc.aio.insecure_channel("localhost:%d" % port) as channel:
+            stub = KiwoomOpenApiPlusServiceClientSideCompressedStub(
+                KiwoomOpenApiPlusService_pb2_grpc.KiwoomOpenApiPlusServiceStub(channel),
+                COMPRESSION_BY_METHOD,
+            )
+            request = KiwoomOpenApiPlusService_pb2.TransactionRequest()
+            responses = [response async for response in stub.TransactionCall(request)]
+        await server.stop(None)
+        return responses
+
+    assert asyncio.run(run()) == [make_response(i) for i in range(3)]
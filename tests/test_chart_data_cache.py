@@ -0,0 +1,123 @@
+import pandas as pd
+
+from koapy.backend.kiwoom_open_api_plus.grpc.KiwoomOpenApiPlusChartDataCache import (
+    KiwoomOpenApiPlusChartDataCache,
+)
+
+DATES = [
+    "%04d%02d01" % (year, month) for year in range(2018, 2021) for month in range(1, 13)
+]
+
+
+class FakeFetcher:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, start_date, end_date):
+        self.calls.append((start_date, end_date))
+        dates = [
+            date
+            for date in reversed(DATES)
+            if (start_date is None or date <= start_date)
+            and (end_date is None or date >= end_date)
+        ]
+        return pd.DataFrame({"일자": dates, "현재가": [date[2:6] for date in dates]})
+
+
+def get_or_fetch(cache, fetch, start_date, end_date):
+    data = cache.get_or_fetch(
+        fetch, "005930", "opt10081", "일자", start_date, end_date, include_end=True
+    )
+    return data["일자"].tolist()
+
+
+def expected(start_date, end_date):
+    return [date for date in reversed(DATES) if end_date <= date <= start_date]
+
+
+def test_older_fetch_does_not_leave_gap(tmp_path):
+    cache = KiwoomOpenApiPlusChartDataCache(tmp_path / "cache.sqlite3")
+    fetch = FakeFetcher()
+
+    assert get_or_fetch(cache, fetch, "20200601", "20200101") == expected(
+        "20200601", "20200101"
+    )
+    assert get_or_fetch(cache, fetch, "20190601", "20190101") == expected(
+        "20190601", "20190101"
+    )
+    # 캐시된 구간의 경계까지 이어서 조회했으므로 사이에 빈 구간이 없어야 함
+    assert fetch.calls[-1] == ("20200101", "20190101")
+
+    assert get_or_fetch(cache, fetch, "20200301", "20190301") == expected(
+        "20200301", "20190301"
+    )
+    assert len(fetch.calls) == 2
+
+    _data, metadata = cache.read("005930", "opt10081")
+    assert metadata["covered_range"] == ["20190101", "20200601"]
+
+
+def test_newer_and_older_sides_are_fetched(tmp_path):
+    cache = KiwoomOpenApiPlusChartDataCache(tmp_path / "cache.sqlite3")
+    fetch = FakeFetcher()
+
+    get_or_fetch(cache, fetch, "20190601", "20190101")
+    assert get_or_fetch(cache, fetch, "20200101", "20180601") == expected(
+        "20200101", "20180601"
+    )
+    assert fetch.calls[1:] == [("20200101", "20190601"), ("20190101", "20180601")]
+
+    calls = len(fetch.calls)
+    get_or_fetch(cache, fetch, "20200101", "20190101")
+    assert len(fetch.calls) == calls
+
+    data = cache.get_or_fetch(fetch, "005930", "opt10081", "일자")
+    assert data["일자"].tolist() == list(reversed(DATES))
+    assert fetch.calls[-2:] == [(None, "20200101"), ("20180601", None)]
+
+    _data, metadata = cache.read("005930", "opt10081")
+    assert metadata["covered_range"] == [None, DATES[-1]]
+
+    calls = len(fetch.calls)
+    assert get_or_fetch(cache, fetch, "20200301", "20170101") == expected(
+        "20200301", "20170101"
+    )
+    assert len(fetch.calls) == calls
+
+
+def test_identical_request_is_cache_hit(tmp_path):
+    cache = KiwoomOpenApiPlusChartDataCache(tmp_path / "cache.sqlite3")
+    fetch = FakeFetcher()
+
+    # 조회 범위의 끝이 봉이 없는 날이더라도 요청한 일자까지 조회한 것으로 기록함
+    for _ in range(2):
+        assert get_or_fetch(cache, fetch, "20200615", "20200101") == expected(
+            "20200615", "20200101"
+        )
+    assert fetch.calls == [("20200615", "20200101")]
+
+
+def test_current_session_is_fetched_again(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        KiwoomOpenApiPlusChartDataCache,
+        "get_session_start",
+        classmethod(lambda cls, trcode, now=None: "20201201"),
+    )
+    cache = KiwoomOpenApiPlusChartDataCache(tmp_path / "cache.sqlite3")
+    fetch = FakeFetcher()
+
+    get_or_fetch(cache, fetch, None, "20200101")
+    get_or_fetch(cache, fetch, None, "20200101")
+    get_or_fetch(cache, fetch, "20201201", "20200101")
+    assert fetch.calls == [
+        (None, "20200101"),
+        (None, "20201101"),
+        ("20201201", "20201101"),
+    ]
+
+    # 완성된 봉들까지의 요청은 다시 조회하지 않음
+    get_or_fetch(cache, fetch, "20201101", "20200101")
+    assert len(fetch.calls) == 3
+
+    _data, metadata = cache.read("005930", "opt10081")
+    assert metadata["covered_range"] == ["20200101", "20201101"]
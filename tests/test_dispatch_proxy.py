@@ -0,0 +1,194 @@
+import queue
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+
+import grpc
+import pytest
+
+from koapy.common import DispatchProxyService_pb2, DispatchProxyService_pb2_grpc
+from koapy.common.DispatchProxyServiceMessageUtils import ExtractValue
+from koapy.common.DispatchProxyServiceServicer import DispatchProxyServiceServicer
+from koapy.common.EventInstance import EventInstance
+
+
+class FakeDispatch:
+    def __init__(self):
+        self.Received = EventInstance()
+
+
+class FakeDispatchProxyServiceServicer(DispatchProxyServiceServicer):
+    def __init__(self):
+        self.dispatch = FakeDispatch()
+
+    def _NormalizeIID(self, iid):
+        return iid
+
+    def _GetDispatch(self, iid):
+        return self.dispatch
+
+
+class EventStream:
+    def __init__(self, stub, initial_credits=0, coalesce=False):
+        self.requests = queue.Queue()
+        self.responses = queue.Queue()
+        request = DispatchProxyService_pb2.ConnectEventRequest()
+        request.establish_request.iid = "fake"
+        request.establish_request.name = "Received"
+        request.establish_request.initial_credits = initial_credits
+        request.establish_request.coalesce = coalesce
+        self.requests.put(request)
+        self.call = stub.ConnectEvent(iter(self.requests.get, None))
+        self.thread = threading.Thread(target=self.receive, daemon=True)
+        self.thread.start()
+
+    def receive(self):
+        try:
+            for response in self.call:
+                args = [ExtractValue(arg.value) for arg in response.arguments]
+                self.responses.put(args)
+        except grpc.RpcError:
+            pass
+
+    def get(self, timeout=5):
+        return self.responses.get(timeout=timeout)
+
+    def assert_empty(self, timeout=0.2):
+        with pytest.raises(queue.Empty):
+            self.responses.get(timeout=timeout)
+
+    def ack(self):
+        request = DispatchProxyService_pb2.ConnectEventRequest()
+        request.ack_request.SetInParent()
+        self.requests.put(request)
+
+    def grant(self, credits):
+        request = DispatchProxyService_pb2.ConnectEventRequest()
+        request.grant_request.credits = credits
+        self.requests.put(request)
+
+    def close(self):
+        self.call.cancel()
+        self.requests.put(None)
+
+
+@pytest.fixture
+def servicer_and_stub():
+    servicer = FakeDispatchProxyServiceServicer()
+    server = grpc.server(ThreadPoolExecutor(max_workers=4))
+    DispatchProxyService_pb2_grpc.add_DispatchProxyServiceServicer_to_server(
+        servicer, server
+    )
+    port = server.add_insecure_port("localhost:0")
+    server.start()
+    with grpc.insecure_channel("localhost:%d" % port) as channel:
+        yield servicer, DispatchProxyService_pb2_grpc.DispatchProxyServiceStub(channel)
+    server.stop(None)
+
+
+def wait_connected(event_instance):
+    # 서버측 슬롯이 연결될 때까지 대기
+    for _ in range(500):
+        if event_instance._slots:  # pylint: disable=protected-access
+            return
+        threading.Event().wait(0.01)
+    raise AssertionError("Event slot was not connected")
+
+
+def fire(event_instance, args_list):
+    thread = threading.Thread(
+        target=lambda: [event_instance(*args) for args in args_list], daemon=True
+    )
+    thread.start()
+    return thread
+
+
+def test_strict_ack(servicer_and_stub):
+    servicer, stub = servicer_and_stub
+    event_instance = servicer.dispatch.Received
+    stream = EventStream(stub)
+    wait_connected(event_instance)
+
+    thread = fire(event_instance, [(i,) for i in range(3)])
+    assert stream.get() == [0]
+    stream.assert_empty()
+    assert thread.is_alive()
+
+    for i in range(1, 3):
+        stream.ack()
+        assert stream.get() == [i]
+    stream.ack()
+    thread.join(5)
+    assert not thread.is_alive()
+    stream.close()
+
+
+def test_windowed_ack(servicer_and_stub):
+    servicer, stub = servicer_and_stub
+    event_instance = servicer.dispatch.Received
+    stream = EventStream(stub, initial_credits=4)
+    wait_connected(event_instance)
+
+    # 크레딧 만큼 보내고, 보내지 못한 이벤트가 크레딧 만큼 쌓이면 이벤트 스레드가 대기함
+    thread = fire(event_instance, [(i,) for i in range(12)])
+    assert [stream.get() for _ in range(4)] == [[i] for i in range(4)]
+    stream.assert_empty()
+    assert thread.is_alive()
+
+    stream.grant(4)
+    assert [stream.get() for _ in range(4)] == [[i] for i in range(4, 8)]
+    stream.grant(4)
+    assert [stream.get() for _ in range(4)] == [[i] for i in range(8, 12)]
+    thread.join(5)
+    assert not thread.is_alive()
+    stream.close()
+
+
+def test_coalesced_events(servicer_and_stub):
+    servicer, stub = servicer_and_stub
+    event_instance = servicer.dispatch.Received
+    stream = EventStream(stub, initial_credits=2, coalesce=True)
+    wait_connected(event_instance)
+
+    event_instance("x")
+    event_instance("y")
+    assert stream.get() == ["x"]
+    assert stream.get() == ["y"]
+
+    # 크레딧이 없는 동안 같은 인자의 이벤트들은 하나로 합쳐지며 이벤트 스레드는 대기하지 않음
+    thread = fire(event_instance, [(), ("A",), (), ("A",), ()])
+    thread.join(5)
+    assert not thread.is_alive()
+    stream.assert_empty()
+
+    stream.grant(10)
+    assert stream.get() == []
+    assert stream.get() == ["A"]
+    stream.assert_empty()
+    stream.close()
+
+
+def test_coalesced_events_are_bounded(servicer_and_stub):
+    servicer, stub = servicer_and_stub
+    event_instance = servicer.dispatch.Received
+    stream = EventStream(stub, initial_credits=2, coalesce=True)
+    wait_connected(event_instance)
+
+    event_instance("x")
+    event_instance("y")
+    assert stream.get() == ["x"]
+    assert stream.get() == ["y"]
+
+    # 합쳐지지 않는 이벤트들은 크레딧 만큼 쌓이면 이벤트 스레드가 대기함
+    thread = fire(event_instance, [(str(i),) for i in range(6)])
+    thread.join(0.5)
+    assert thread.is_alive()
+    stream.assert_empty()
+
+    stream.grant(10)
+    for i in range(6):
+        assert stream.get() == [str(i)]
+    thread.join(5)
+    assert not thread.is_alive()
+    stream.assert_empty()
+    stream.close()
@@ -0,0 +1,140 @@
+import asyncio
+
+from koapy.backend.kiwoom_open_api_plus.grpc.KiwoomOpenApiPlusServiceClientStubWrapper import (
+    KiwoomOpenApiPlusServiceClientStubWrapper,
+)
+from koapy.utils.rate_limiting.PriorityFairQueue import (
+    PriorityFairQueue,
+    RateLimitPriority,
+)
+from koapy.utils.rate_limiting.RateLimiter import (
+    CompositeGcraRateLimiter,
+    CompositeTimeWindowRateLimiter,
+    GcraRateLimiter,
+    TimeWindowRateLimiter,
+)
+from koapy.utils.rate_limiting.RateLimiterStateFile import RateLimiterStateFile
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def with_clock(limiter, clock):
+    limiter._clock = clock
+    return limiter
+
+
+def test_CompositeTimeWindowRateLimiter():
+    clock = FakeClock()
+    limiter = CompositeTimeWindowRateLimiter(
+        [
+            with_clock(TimeWindowRateLimiter(18, 5), clock),
+            with_clock(TimeWindowRateLimiter(90, 25), clock),
+        ]
+    )
+    assert all(limiter.try_acquire() for _ in range(5))
+    assert not limiter.try_acquire()
+    assert limiter.check_sleep_seconds() == 18
+    clock.now = 17.9
+    assert not limiter.try_acquire()
+    clock.now = 18
+    assert limiter.try_acquire()
+    assert limiter.estimate_wait_seconds(4) == 18
+
+
+def test_RateLimiterStateFile(tmp_path):
+    def make_limiter():
+        return CompositeTimeWindowRateLimiter(
+            [TimeWindowRateLimiter(18, 5), TimeWindowRateLimiter(90, 25)]
+        )
+
+    state_file = RateLimiterStateFile(tmp_path / "state.json")
+    limiter = make_limiter()
+    assert not state_file.load(limiter)
+    assert all(limiter.try_acquire() for _ in range(5))
+    state_file.save(limiter)
+
+    restored = make_limiter()
+    assert state_file.load(restored)
+    assert not restored.try_acquire()
+    assert 17 < restored.check_sleep_seconds() <= 18
+
+
+def test_GcraRateLimiter():
+    clock = FakeClock()
+    limiter = with_clock(GcraRateLimiter(1, 5), clock)
+    assert all(limiter.try_acquire() for _ in range(5))
+    assert not limiter.try_acquire()
+    clock.now = 0.2
+    assert limiter.try_acquire()
+    assert not limiter.try_acquire()
+
+
+def test_CompositeGcraRateLimiter():
+    clock = FakeClock()
+    limiter = with_clock(
+        CompositeGcraRateLimiter(
+            [
+                with_clock(GcraRateLimiter(1, 5), clock),
+                with_clock(GcraRateLimiter(10, 6), clock),
+            ]
+        ),
+        clock,
+    )
+    assert all(limiter.try_acquire() for _ in range(5))
+    assert not limiter.try_acquire()
+    clock.now = 1
+    assert limiter.try_acquire()
+    clock.now = 1.5
+    assert not limiter.try_acquire()
+    clock.now = 1 + 10 / 6
+    assert limiter.try_acquire()
+
+
+def test_acquire_async():
+    limiter = GcraRateLimiter(0.05, 1)
+
+    async def acquire_twice():
+        await limiter.acquire_async()
+        await limiter.acquire_async()
+
+    asyncio.run(acquire_twice())
+    assert not limiter.try_acquire()
+
+
+def test_PriorityFairQueue():
+    queue = PriorityFairQueue()
+    for i in range(3):
+        queue.put(("a", i), priority=RateLimitPriority.BULK, key="a")
+    queue.put(("b", 0), priority=RateLimitPriority.BULK, key="b")
+    queue.put(("c", 0), priority=RateLimitPriority.INTERACTIVE, key="c")
+    assert queue.count_ahead(RateLimitPriority.INTERACTIVE, "d") == 1
+    assert queue.count_ahead(RateLimitPriority.BULK, "b") == 4
+    items = [queue.get_nowait() for _ in range(queue.qsize())]
+    assert items == [("c", 0), ("a", 0), ("b", 0), ("a", 1), ("a", 2)]
+
+
+class FakeCallStubWrapper(KiwoomOpenApiPlusServiceClientStubWrapper):
+    def __init__(self):  # pylint: disable=super-init-not-called
+        self.calls = []
+
+    def Call(self, name, *args):
+        self.calls.append((name,) + args)
+        return 1500
+
+
+def test_EstimateTransactionWaitSeconds_priority():
+    wrapper = FakeCallStubWrapper()
+    assert wrapper.EstimateTransactionWaitSeconds() == 1.5
+    wrapper.EstimateTransactionWaitSeconds("order")
+    wrapper.EstimateTransactionWaitSeconds("bulk")
+    assert wrapper.calls == [
+        ("EstimateCommRqDataWaitMillis", RateLimitPriority.INTERACTIVE, ""),
+        ("EstimateCommRqDataWaitMillis", RateLimitPriority.ORDER_RELATED, ""),
+        ("EstimateCommRqDataWaitMillis", RateLimitPriority.BULK, ""),
+    ]
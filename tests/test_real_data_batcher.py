@@ -0,0 +1,73 @@
+import threading
+
+from koapy.backend.kiwoom_open_api_plus.grpc import KiwoomOpenApiPlusService_pb2
+from koapy.backend.kiwoom_open_api_plus.grpc.event.KiwoomOpenApiPlusRealDataBatcher import (
+    KiwoomOpenApiPlusRealDataBatcher,
+)
+
+
+def make_response(i):
+    response = KiwoomOpenApiPlusService_pb2.ListenResponse()
+    response.name = "OnReceiveRealData"
+    response.single_data.values.append(str(i))
+    return response
+
+
+def values(batch):
+    return [event.single_data.values[0] for event in batch.events]
+
+
+class BatchRecorder:
+    def __init__(self):
+        self.batches = []
+        self.received = threading.Event()
+
+    def __call__(self, batch):
+        self.batches.append(values(batch))
+        self.received.set()
+
+
+def test_max_batch_size():
+    recorder = BatchRecorder()
+    batcher = KiwoomOpenApiPlusRealDataBatcher(recorder, 2, max_linger=60)
+    for i in range(5):
+        batcher.on_next(make_response(i))
+    assert recorder.batches == [["0", "1"], ["2", "3"]]
+
+    # 종료할 때 남아있는 응답들을 전달함
+    batcher.close()
+    assert recorder.batches == [["0", "1"], ["2", "3"], ["4"]]
+
+    batcher.on_next(make_response(5))
+    batcher.close()
+    assert len(recorder.batches) == 3
+
+
+def test_max_linger():
+    recorder = BatchRecorder()
+    batcher = KiwoomOpenApiPlusRealDataBatcher(recorder, max_linger=0.05)
+    batcher.on_next(make_response(0))
+    batcher.on_next(make_response(1))
+    assert recorder.batches == []
+    assert recorder.received.wait(5)
+    assert recorder.batches == [["0", "1"]]
+
+    recorder.received.clear()
+    batcher.on_next(make_response(2))
+    assert recorder.received.wait(5)
+    assert recorder.batches == [["0", "1"], ["2"]]
+    batcher.close()
+    assert len(recorder.batches) == 2
+
+
+def test_add_fills_response_in_place():
+    recorder = BatchRecorder()
+    batcher = KiwoomOpenApiPlusRealDataBatcher(recorder, 1)
+
+    def fill(i, response):
+        response.single_data.values.append(str(i))
+        return response
+
+    batcher.add(fill, 0)
+    batcher.close()
+    assert recorder.batches == [["0"]]
@@ -0,0 +1,118 @@
+import time
+
+from koapy.backend.kiwoom_open_api_plus.grpc import KiwoomOpenApiPlusService_pb2
+from koapy.backend.kiwoom_open_api_plus.grpc.event.KiwoomOpenApiPlusRealDataConflater import (
+    KiwoomOpenApiPlusRealDataConflater,
+)
+from koapy.backend.kiwoom_open_api_plus.utils.queue.QueueBasedIterableObserver import (
+    QueueBasedIterableObserver,
+)
+
+
+def make_response(code, realtype, value, schema_id=0):
+    response = KiwoomOpenApiPlusService_pb2.ListenResponse()
+    response.name = "OnReceiveRealData"
+    response.arguments.add().string_value = code
+    response.arguments.add().string_value = realtype
+    response.single_data.values.append(value)
+    if schema_id:
+        response.real_data_schema.schema_id = schema_id
+    return response
+
+
+def drain(observer):
+    iterator = iter(observer)
+    values = []
+    while iterator.has_next():
+        values.append(iterator.next_nowait())
+    return values
+
+
+def summarize(responses):
+    return [
+        (response.arguments[0].string_value, response.single_data.values[0])
+        for response in responses
+    ]
+
+
+def wait_for(observer, count, timeout=5):
+    deadline = time.monotonic() + timeout
+    while observer.queue.qsize() < count:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def test_delivers_immediately_when_consumer_is_ready():
+    observer = QueueBasedIterableObserver()
+    conflater = KiwoomOpenApiPlusRealDataConflater(observer)
+    conflater.on_next("005930", "주식호가잔량", make_response("005930", "호가", "1"))
+    assert summarize(drain(observer)) == [("005930", "1")]
+    conflater.close()
+
+
+def test_keeps_latest_while_consumer_is_busy():
+    observer = QueueBasedIterableObserver()
+    conflater = KiwoomOpenApiPlusRealDataConflater(observer)
+    for i in range(3):
+        for code in ["005930", "000660"]:
+            conflater.on_next(code, "주식호가잔량", make_response(code, "호가", str(i)))
+    # 첫 응답만 바로 전달되고 이후로는 종목별로 가장 최근 값만 남음
+    assert summarize(drain(observer)) == [("005930", "0")]
+    wait_for(observer, 2)
+    assert summarize(drain(observer)) == [("000660", "2"), ("005930", "2")]
+    conflater.close()
+
+
+def test_lossless_realtypes_bypass_conflation():
+    observer = QueueBasedIterableObserver()
+    conflater = KiwoomOpenApiPlusRealDataConflater(
+        observer, lossless_realtypes=["주식체결"]
+    )
+    conflater.on_next("005930", "주식호가잔량", make_response("005930", "호가", "0"))
+    conflater.on_next("005930", "주식호가잔량", make_response("005930", "호가", "1"))
+    for i in range(3):
+        conflater.on_next("005930", "주식체결", make_response("005930", "체결", str(i)))
+    # 합치지 않는 타입의 응답들은 남겨둔 응답보다 먼저 모두 전달됨
+    assert summarize(drain(observer)) == [
+        ("005930", "0"),
+        ("005930", "0"),
+        ("005930", "1"),
+        ("005930", "2"),
+    ]
+    wait_for(observer, 1)
+    assert summarize(drain(observer)) == [("005930", "1")]
+    conflater.close()
+
+
+def test_schema_is_carried_over():
+    observer = QueueBasedIterableObserver()
+    observer.on_next(make_response("000000", "", "busy"))
+    conflater = KiwoomOpenApiPlusRealDataConflater(observer)
+    conflater.on_next("005930", "주식호가잔량", make_response("005930", "호가", "0", 1))
+    conflater.on_next("005930", "주식호가잔량", make_response("005930", "호가", "1"))
+    drain(observer)
+    wait_for(observer, 1)
+    (response,) = drain(observer)
+    assert response.single_data.values[0] == "1"
+    assert response.real_data_schema.schema_id == 1
+    conflater.close()
+
+
+def test_interval():
+    observer = QueueBasedIterableObserver()
+    conflater = KiwoomOpenApiPlusRealDataConflater(observer, interval=0.2)
+    for i in range(3):
+        conflater.on_next("005930", "주식호가잔량", make_response("005930", "호가", str(i)))
+    assert drain(observer) == []
+    wait_for(observer, 1)
+    assert summarize(drain(observer)) == [("005930", "2")]
+    conflater.close()
+
+
+def test_close_discards_pending():
+    observer = QueueBasedIterableObserver()
+    conflater = KiwoomOpenApiPlusRealDataConflater(observer, interval=60)
+    conflater.on_next("005930", "주식호가잔량", make_response("005930", "호가", "0"))
+    conflater.close()
+    conflater.on_next("005930", "주식호가잔량", make_response("005930", "호가", "1"))
+    assert drain(observer) == []
@@ -0,0 +1,115 @@
+import numpy as np
+
+from koapy.backend.kiwoom_open_api_plus.core.KiwoomOpenApiPlusRealType import (
+    KiwoomOpenApiPlusRealType,
+)
+from koapy.backend.kiwoom_open_api_plus.grpc.event.KiwoomOpenApiPlusRealDataSchema import (
+    KiwoomOpenApiPlusRealDataSchema,
+    KiwoomOpenApiPlusRealDataSchemaCache,
+)
+from koapy.backend.kiwoom_open_api_plus.grpc.KiwoomOpenApiPlusServiceClientSideRealDataDecoder import (
+    KiwoomOpenApiPlusServiceClientSideRealDataDecoder,
+)
+from koapy.backend.kiwoom_open_api_plus.grpc.KiwoomOpenApiPlusServiceClientSideRealDataRehydrator import (
+    KiwoomOpenApiPlusServiceClientSideRehydratingIterator,
+)
+
+REALTYPE = "주식체결"
+LAYOUT = KiwoomOpenApiPlusRealType.get_fids_by_realtype_name(REALTYPE)
+ORDERBOOK_LAYOUT = KiwoomOpenApiPlusRealType.get_fids_by_realtype_name("주식호가잔량")
+
+
+def make_values(time="090000", price="+60000", volume="-10"):
+    values = [str(fid) for fid in LAYOUT]
+    values[LAYOUT.index(20)] = time
+    values[LAYOUT.index(10)] = price
+    values[LAYOUT.index(15)] = volume
+    return values
+
+
+class FakeGetCommRealData:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, code, fid):
+        self.calls.append((code, fid))
+        return "comm:%d" % fid
+
+
+def test_pick_values_full_layout():
+    schema = KiwoomOpenApiPlusRealDataSchema(REALTYPE, LAYOUT, False)
+    values = make_values()
+    get_comm_real_data = FakeGetCommRealData()
+    assert schema.pick_values("005930", REALTYPE, values, get_comm_real_data) == values
+    assert get_comm_real_data.calls == []
+
+
+def test_pick_values_subset():
+    schema = KiwoomOpenApiPlusRealDataSchema(REALTYPE, [15, 10], False)
+    get_comm_real_data = FakeGetCommRealData()
+    picked = schema.pick_values("005930", REALTYPE, make_values(), get_comm_real_data)
+    assert list(picked) == ["-10", "+60000"]
+
+    schema = KiwoomOpenApiPlusRealDataSchema(REALTYPE, [10], False)
+    picked = schema.pick_values("005930", REALTYPE, make_values(), get_comm_real_data)
+    assert list(picked) == ["+60000"]
+    assert get_comm_real_data.calls == []
+
+
+def test_pick_values_falls_back_outside_layout():
+    fid = max(LAYOUT) + 1
+    schema = KiwoomOpenApiPlusRealDataSchema(REALTYPE, [10, fid], False)
+    get_comm_real_data = FakeGetCommRealData()
+    picked = schema.pick_values("005930", REALTYPE, make_values(), get_comm_real_data)
+    assert list(picked) == ["+60000", "comm:%d" % fid]
+    assert get_comm_real_data.calls == [("005930", fid)]
+
+
+def make_responses(schemas, rows):
+    responses = []
+    for code, realtype, values in rows:
+        schema = schemas.get(realtype)
+        picked = schema.pick_values(code, realtype, values, FakeGetCommRealData())
+        responses.append(schema.make_response(code, realtype, "", picked))
+    return responses
+
+
+def test_decode():
+    schemas = KiwoomOpenApiPlusRealDataSchemaCache(infer_fids=True)
+    responses = make_responses(
+        schemas,
+        [
+            ("005930", REALTYPE, make_values("090000", "+60000", "-10")),
+            ("000660", "주식호가잔량", [""] * len(ORDERBOOK_LAYOUT)),
+            ("000660", REALTYPE, make_values("153001", "-120500", "+3")),
+        ],
+    )
+    decoder = KiwoomOpenApiPlusServiceClientSideRealDataDecoder(
+        {"time": (20, "time"), "price": (10, "abs"), "change": (10, "signed")}
+    )
+    result = decoder.decode(responses)
+    assert result["code"].tolist() == ["005930", "000660"]
+    assert result["time"].tolist() == [9 * 3600, 15 * 3600 + 30 * 60 + 1]
+    assert result["price"].tolist() == [60000.0, 120500.0]
+    assert result["change"].tolist() == [60000.0, -120500.0]
+
+
+def test_decode_empty_values():
+    schemas = KiwoomOpenApiPlusRealDataSchemaCache(
+        [20, 10, 15], readable_names=True, compact=True
+    )
+    responses = make_responses(
+        schemas,
+        [
+            ("005930", REALTYPE, make_values("", "", "")),
+            ("005930", REALTYPE, make_values("090001", "+60000", "-10")),
+        ],
+    )
+    responses = KiwoomOpenApiPlusServiceClientSideRehydratingIterator(iter(responses))
+    result = KiwoomOpenApiPlusServiceClientSideRealDataDecoder().decode(responses)
+    assert result["time"].tolist() == [
+        KiwoomOpenApiPlusServiceClientSideRealDataDecoder.MISSING_TIME,
+        9 * 3600 + 1,
+    ]
+    assert np.isnan(result["price"][0]) and result["price"][1] == 60000.0
+    assert np.isnan(result["volume"][0]) and result["volume"][1] == 10.0
@@ -0,0 +1,159 @@
+from concurrent.futures import Future
+
+import pytest
+
+from koapy.backend.kiwoom_open_api_plus.core.KiwoomOpenApiPlusError import (
+    KiwoomOpenApiPlusError,
+)
+from koapy.backend.kiwoom_open_api_plus.grpc.event.KiwoomOpenApiPlusRealDataHub import (
+    KiwoomOpenApiPlusRealDataHub,
+)
+
+
+class FakeQueuedFunction:
+    def __init__(self, control, name):
+        self._control = control
+        self._name = name
+
+    def queuedCall(self, *args):
+        self._control.calls.append((self._name,) + args)
+        future = Future()
+        future.set_result(self._control.return_codes.get(self._name, 0))
+        return future
+
+
+class FakeSignal:
+    def connect(self, slot):
+        pass
+
+
+class FakeControl:
+    def __init__(self):
+        self.calls = []
+        self.return_codes = {}
+        self.SetRealReg = FakeQueuedFunction(self, "SetRealReg")
+        self.SetRealRemove = FakeQueuedFunction(self, "SetRealRemove")
+        self.DisconnectRealData = FakeQueuedFunction(self, "DisconnectRealData")
+        self.OnReceiveRealData = FakeSignal()
+
+    def pop_calls(self):
+        calls, self.calls = self.calls, []
+        return calls
+
+
+class FakeScreenManager:
+    def __init__(self):
+        self.last_screen_no = 0
+        self.screens_in_use = set()
+
+    def borrow_screen(self):
+        self.last_screen_no += 1
+        screen_no = "%04d" % self.last_screen_no
+        self.screens_in_use.add(screen_no)
+        return screen_no
+
+    def return_screen(self, screen_no):
+        self.screens_in_use.remove(screen_no)
+        return True
+
+
+class FakeSubscriber:
+    pass
+
+
+@pytest.fixture
+def hub():
+    return KiwoomOpenApiPlusRealDataHub(FakeControl(), FakeScreenManager())
+
+
+def test_shared_subscription(hub):
+    first, second = FakeSubscriber(), FakeSubscriber()
+    hub.subscribe(first, ["005930", "000660"], [10, 15])
+    hub.subscribe(second, ["005930", "000660"], [15, 10])
+    assert hub.control.pop_calls() == [
+        ("SetRealReg", "0001", "005930;000660", "10;15", "0")
+    ]
+    assert hub.get_refcount("005930", [10, 15]) == 2
+
+    hub.unsubscribe(first)
+    assert hub.control.pop_calls() == []
+    assert hub.get_refcount("005930", [10, 15]) == 1
+
+    hub.unsubscribe(second)
+    assert hub.control.pop_calls() == [
+        ("SetRealRemove", "0001", "005930"),
+        ("SetRealRemove", "0001", "000660"),
+    ]
+    assert hub.get_screens() == []
+    assert hub._screen_manager.screens_in_use == set()
+
+
+def test_fid_change_uses_separate_screen(hub):
+    first, second = FakeSubscriber(), FakeSubscriber()
+    hub.subscribe(first, ["005930"], [10])
+    hub.subscribe(second, ["005930"], [10])
+    hub.control.pop_calls()
+
+    hub.subscribe(first, ["005930"], [10, 15])
+    assert hub.control.pop_calls() == [("SetRealReg", "0002", "005930", "10;15", "0")]
+    assert hub.get_refcount("005930", [10]) == 1
+    assert hub.get_refcount("005930", [10, 15]) == 1
+
+    hub.unsubscribe(second)
+    assert hub.control.pop_calls() == [("SetRealRemove", "0001", "005930")]
+    assert hub.get_screens() == ["0002"]
+
+
+def test_registration_failure_keeps_existing_subscriptions(hub):
+    first, second = FakeSubscriber(), FakeSubscriber()
+    hub.subscribe(first, ["005930"], [10])
+    hub.subscribe(second, ["005930"], [10])
+    hub.control.pop_calls()
+
+    hub.control.return_codes["SetRealReg"] = -200
+    with pytest.raises(KiwoomOpenApiPlusError):
+        hub.subscribe(first, ["005930", "000660"], [10])
+    with pytest.raises(KiwoomOpenApiPlusError):
+        hub.subscribe(second, ["005930", "000660"], [10])
+
+    # 이미 구독중이던 종목은 그대로 유지되고 실패한 종목만 되돌려짐
+    assert hub.get_refcount("005930", [10]) == 2
+    assert hub.get_refcount("000660", [10]) == 0
+    assert ("SetRealRemove", "0001", "005930") not in hub.control.pop_calls()
+    assert hub._subscribers_by_code == {"005930": (first, second)}
+    assert hub._screen_manager.screens_in_use == {"0001"}
+
+    hub.control.return_codes.clear()
+    hub.unsubscribe(first)
+    hub.unsubscribe(second)
+    assert hub.control.pop_calls() == [("SetRealRemove", "0001", "005930")]
+    assert hub._screen_manager.screens_in_use == set()
+
+
+def test_sparse_screens_are_compacted(hub):
+    first, second = FakeSubscriber(), FakeSubscriber()
+    codes = ["%06d" % i for i in range(150)]
+    hub.subscribe(first, codes[:100], [10])
+    hub.subscribe(second, codes[100:], [10])
+    hub.subscribe(second, ["900000"], [10, 15])
+    assert hub.get_screens() == ["0001", "0002", "0003"]
+    hub.control.pop_calls()
+
+    # 종목이 절반 이하로 남은 화면은 다른 화면의 빈 자리로 옮긴 뒤 반납함
+    hub.unsubscribe(first, codes[:60])
+    calls = hub.control.pop_calls()
+    assert calls[-2:] == [
+        ("SetRealReg", "0002", ";".join(codes[60:100]), "10", "1"),
+        ("DisconnectRealData", "0001"),
+    ]
+    assert hub.get_screens() == ["0002", "0003"]
+    assert hub._screen_manager.screens_in_use == {"0002", "0003"}
+
+    # 옮겨진 종목들도 새 화면에서 해지됨
+    hub.unsubscribe(first)
+    assert hub.control.pop_calls() == [
+        ("SetRealRemove", "0002", code) for code in codes[60:100]
+    ]
+    hub.unsubscribe(second)
+    assert hub.get_screens() == []
+    assert hub._screen_manager.screens_in_use == set()
@@ -0,0 +1,109 @@
+import pytest
+
+from koapy.backend.kiwoom_open_api_plus.core.KiwoomOpenApiPlusRealDataRecorder import (
+    KiwoomOpenApiPlusRealDataRecorder,
+    KiwoomOpenApiPlusRealDataRecordReader,
+)
+from koapy.backend.kiwoom_open_api_plus.core.KiwoomOpenApiPlusRealType import (
+    KiwoomOpenApiPlusRealType,
+)
+from koapy.backend.kiwoom_open_api_plus.core.KiwoomOpenApiPlusReplayControl import (
+    KiwoomOpenApiPlusReplayControl,
+    KiwoomOpenApiPlusReplaySignal,
+)
+from koapy.backend.kiwoom_open_api_plus.grpc import (
+    KiwoomOpenApiPlusServiceServicer as servicer_module,
+)
+from koapy.backend.kiwoom_open_api_plus.grpc.KiwoomOpenApiPlusServiceAsyncServer import (
+    KiwoomOpenApiPlusServiceAsyncServer,
+)
+from koapy.backend.kiwoom_open_api_plus.grpc.KiwoomOpenApiPlusServiceServer import (
+    KiwoomOpenApiPlusServiceServer,
+)
+from koapy.config import config_from_dict
+
+
+class SourceControl:
+    def __init__(self):
+        self.OnReceiveRealData = KiwoomOpenApiPlusReplaySignal("OnReceiveRealData")
+        self.OnReceiveChejanData = KiwoomOpenApiPlusReplaySignal("OnReceiveChejanData")
+
+    def GetChejanData(self, fid):
+        return "value-%d" % fid
+
+    def GetConnectState(self):
+        return 1
+
+
+def test_record_and_replay(tmp_path):
+    filename = str(tmp_path / "realdata.jsonl.gz")
+    fids = KiwoomOpenApiPlusRealType.get_fids_by_realtype_name("주식체결")
+    source = SourceControl()
+
+    # 같은 파일에 두번에 나눠서 이어서 기록
+    for session in range(2):
+        with KiwoomOpenApiPlusRealDataRecorder(source, filename):
+            for code in ["000001", "000002"]:
+                realdata = "\t".join("%s-%d-%d" % (code, session, fid) for fid in fids)
+                source.OnReceiveRealData(code, "주식체결", realdata)
+            source.OnReceiveChejanData("0", 2, "9201;9203")
+
+    records = list(KiwoomOpenApiPlusRealDataRecordReader(filename))
+    assert [record.name for record in records] == [
+        "OnReceiveRealData",
+        "OnReceiveRealData",
+        "OnReceiveChejanData",
+    ] * 2
+
+    control = KiwoomOpenApiPlusReplayControl(filename, speed=0)
+    received = []
+
+    def OnReceiveRealData(code, realtype, realdata):
+        received.append((code, control.GetCommRealData(code, fids[1])))
+
+    def OnReceiveChejanData(gubun, itemcnt, fidlist):
+        received.append((gubun, control.GetChejanData(9203)))
+
+    control.OnReceiveRealData.connect(OnReceiveRealData)
+    control.OnReceiveChejanData.connect(OnReceiveChejanData)
+    control.SetRealReg.queuedCall("0001", "000002", "", "0").result()
+
+    assert control.wait(10)
+    assert received == [
+        ("000002", "000002-0-%d" % fids[1]),
+        ("0", "value-9203"),
+        ("000002", "000002-1-%d" % fids[1]),
+        ("0", "value-9203"),
+    ]
+    assert control.replayed_count == 4
+    assert control.skipped_count == 2
+
+
+@pytest.mark.parametrize(
+    "server_class",
+    [KiwoomOpenApiPlusServiceServer, KiwoomOpenApiPlusServiceAsyncServer],
+)
+def test_server_stops_recorder(tmp_path, monkeypatch, server_class):
+    filename = str(tmp_path / "realdata.jsonl.gz")
+    monkeypatch.setattr(
+        servicer_module,
+        "config",
+        config_from_dict(
+            {
+                "koapy.backend.kiwoom_open_api_plus.grpc.server.recorder": {
+                    "filename": filename
+                }
+            }
+        ),
+    )
+    source = SourceControl()
+
+    # 서버가 종료될 때 기록중인 이벤트들을 모두 쓰고 파일을 닫음
+    for session in range(2):
+        with server_class(source, host="localhost", port=0, max_workers=2):
+            for i in range(100):
+                source.OnReceiveRealData("%06d" % i, "주식체결", str(session))
+        assert source.OnReceiveRealData._slots == ()
+
+    records = list(KiwoomOpenApiPlusRealDataRecordReader(filename))
+    assert [record.arguments[2] for record in records] == ["0"] * 100 + ["1"] * 100
@@ -0,0 +1,113 @@
+from concurrent.futures import Future
+
+from koapy.backend.kiwoom_open_api_plus.core.KiwoomOpenApiPlusScreenManager import (
+    KiwoomOpenApiPlusScreenManager,
+)
+from koapy.backend.kiwoom_open_api_plus.grpc.event.KiwoomOpenApiPlusRealEventHandler import (
+    KiwoomOpenApiPlusBidirectionalRealEventHandler,
+)
+
+
+def test_returned_screen_is_reused_last():
+    manager = KiwoomOpenApiPlusScreenManager()
+    first = manager.borrow_screen()
+    second = manager.borrow_screen()
+    assert (first, second) == ("0001", "0002")
+    assert manager.return_screen(first)
+    assert manager.borrow_screen() == "0003"
+    assert manager.get_free_screen(2) == ["0004", "0005"]
+
+
+def test_borrow_given_screen():
+    manager = KiwoomOpenApiPlusScreenManager()
+    assert manager.borrow_screen("0001") == "0001"
+    assert manager.borrow_screen("0001") == "0001"
+    assert manager.is_inuse("0001")
+    assert manager.borrow_screen() == "0002"
+    assert manager.return_screen("0001")
+    assert manager.is_inuse("0001")
+    assert manager.return_screen("0001")
+    assert not manager.is_inuse("0001")
+    assert not manager.return_screen("0001")
+
+
+def test_oldest_screen_is_evicted():
+    manager = KiwoomOpenApiPlusScreenManager()
+    maximum = manager.MAXIMUM_NUMBER_OF_SCREENS
+    for _ in range(maximum + 1):
+        manager.borrow_screen()
+    assert not manager.is_inuse("0001")
+    metrics = manager.get_metrics()
+    assert metrics["inuse"] == maximum
+    assert metrics["peak"] == maximum
+    assert metrics["evicted"] == 1
+    assert metrics["pressure"] == 1.0
+
+
+class RecordingFunction:
+    def __init__(self, calls, name):
+        self._calls = calls
+        self._name = name
+
+    def __call__(self, *args):
+        self._calls.append((self._name,) + args)
+        return 0
+
+    def queuedCall(self, *args):
+        future = Future()
+        future.set_result(self(*args))
+        return future
+
+
+class FakeContext:
+    def add_callback(self, callback):
+        pass
+
+
+class RecordingControl:
+    def __init__(self):
+        self.calls = []
+        for name in ["SetRealReg", "SetRealRemove", "DisconnectRealData"]:
+            setattr(self, name, RecordingFunction(self.calls, name))
+
+
+def make_bidirectional_handler():
+    control = RecordingControl()
+    screen_manager = KiwoomOpenApiPlusScreenManager()
+    handler = KiwoomOpenApiPlusBidirectionalRealEventHandler(
+        control, iter([]), FakeContext(), screen_manager
+    )
+    return handler, control, screen_manager
+
+
+def test_register_codes_in_batches():
+    handler, control, screen_manager = make_bidirectional_handler()
+    codes = ["%06d" % i for i in range(250)]
+    handler.register_codes(codes, [10, 20])
+    assert control.calls == [
+        ("SetRealReg", "0001", ";".join(codes[:100]), "10;20", "0"),
+        ("SetRealReg", "0002", ";".join(codes[100:200]), "10;20", "0"),
+        ("SetRealReg", "0003", ";".join(codes[200:]), "10;20", "0"),
+    ]
+    control.calls.clear()
+    handler.register_codes(["000000", "999999"], [10, 20])
+    assert control.calls == [
+        ("SetRealReg", "0001", "000000", "10;20", "1"),
+        ("SetRealReg", "0003", "999999", "10;20", "1"),
+    ]
+    assert screen_manager.get_metrics()["inuse"] == 3
+
+
+def test_sparse_screens_are_compacted():
+    handler, control, screen_manager = make_bidirectional_handler()
+    codes = ["%06d" % i for i in range(200)]
+    handler.register_codes(codes, [10])
+    handler.remove_codes(codes[:60])
+    assert screen_manager.get_metrics()["inuse"] == 2
+    handler.remove_codes(codes[100:170])
+    assert screen_manager.get_metrics()["inuse"] == 1
+    assert ("DisconnectRealData", "0002") in control.calls
+    moved = [call for call in control.calls[-2:] if call[0] == "SetRealReg"]
+    assert moved == [("SetRealReg", "0001", ";".join(codes[170:]), "10", "1")]
+    handler.remove_all_screens()
+    assert screen_manager.get_metrics()["inuse"] == 0
@@ -0,0 +1,84 @@
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+import grpc
+import pytest
+
+from koapy.backend.kiwoom_open_api_plus.core.KiwoomOpenApiPlusReplayControl import (
+    KiwoomOpenApiPlusReplayControl,
+)
+from koapy.backend.kiwoom_open_api_plus.grpc import KiwoomOpenApiPlusService_pb2_grpc
+from koapy.backend.kiwoom_open_api_plus.grpc.KiwoomOpenApiPlusServiceClientSideSignalMultiplexer import (
+    KiwoomOpenApiPlusServiceClientSideSignalMultiplexer,
+)
+from koapy.backend.kiwoom_open_api_plus.grpc.KiwoomOpenApiPlusServiceServer import (
+    KiwoomOpenApiPlusServiceServer,
+)
+
+
+def wait_until(condition, timeout=10):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def num_connected(signal):
+    return len(signal._slots)  # pylint: disable=protected-access
+
+
+@pytest.fixture(params=[0, 8])
+def multiplexed(request):
+    control = KiwoomOpenApiPlusReplayControl(records=[])
+    executor = ThreadPoolExecutor()
+    with KiwoomOpenApiPlusServiceServer(
+        control, host="localhost", port=0, max_workers=2
+    ) as server:
+        with grpc.insecure_channel("localhost:%d" % server.get_port()) as channel:
+            stub = KiwoomOpenApiPlusService_pb2_grpc.KiwoomOpenApiPlusServiceStub(
+                channel
+            )
+            multiplexer = KiwoomOpenApiPlusServiceClientSideSignalMultiplexer(
+                stub, executor, request.param
+            )
+            yield control, multiplexer
+            multiplexer.shutdown()
+    executor.shutdown()
+
+
+def test_single_stream_for_all_callbacks(multiplexed):
+    control, multiplexer = multiplexed
+    received = []
+    done = threading.Event()
+
+    def make_callback(i):
+        def callback(*args):
+            received.append((i, args))
+            if len(received) == 10:
+                done.set()
+
+        return callback
+
+    callbacks = [make_callback(i) for i in range(10)]
+    for i, callback in enumerate(callbacks):
+        name = "OnReceiveMsg" if i % 2 == 0 else "OnEventConnect"
+        multiplexer.connect(name, callback)
+
+    # 서버 작업 스레드가 2개 뿐이더라도 하나의 스트림만 사용
+    wait_until(
+        lambda: num_connected(control.OnReceiveMsg) == 1
+        and num_connected(control.OnEventConnect) == 1
+    )
+
+    control.OnReceiveMsg("0001", "rqname", "opt10001", "message")
+    control.OnEventConnect(0)
+    assert done.wait(10)
+    assert sorted(i for i, _args in received) == list(range(10))
+
+    for i, callback in enumerate(callbacks):
+        if i % 2 == 1:
+            multiplexer.disconnect("OnEventConnect", callback)
+    wait_until(lambda: num_connected(control.OnEventConnect) == 0)
+    assert num_connected(control.OnReceiveMsg) == 1